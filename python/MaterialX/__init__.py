@@ -19,6 +19,44 @@ if sys.platform == "win32" and sys.version_info >= (3, 8):
         if os.path.exists(bindir):
             os.add_dll_directory(bindir)
 
-from .main import *
+# The native modules and Python wrappers are loaded on first use, so that
+# importing the package itself is inexpensive, and so that generator modules
+# such as PyMaterialXGenGlsl are only loaded when they are accessed.
+# Refs.:
+# - https://peps.python.org/pep-0562/
+import importlib
+
+_mainNames = None
+
+def _loadMain():
+    """Import the native core and format modules along with their Python
+       wrappers, and publish their names at the package level."""
+    global _mainNames
+    if _mainNames is None:
+        main = importlib.import_module('.main', __name__)
+        names = [name for name in vars(main) if not name.startswith('_')]
+        globals().update({ name: getattr(main, name) for name in names })
+        globals()['__version__'] = main.getVersionString()
+        _mainNames = names
+    return _mainNames
+
+def __getattr__(name):
+    if name.startswith('PyMaterialX'):
+        try:
+            return importlib.import_module('.' + name, __name__)
+        except ModuleNotFoundError as err:
+            # Report a missing submodule as a missing attribute, so that
+            # hasattr and getattr with a default behave as expected.
+            if err.name != __name__ + '.' + name:
+                raise
+    elif name == '__all__':
+        return list(_loadMain())
+    elif name == '__version__' or not name.startswith('__'):
+        _loadMain()
+        if name in globals():
+            return globals()[name]
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
-__version__ = getVersionString()
+def __dir__():
+    _loadMain()
+    return sorted(globals())
@@ -8,6 +8,7 @@ import warnings
 
 from .PyMaterialXCore import *
 from .PyMaterialXFormat import *
+from .PyMaterialXFormat import _readFromBinaryString
 from .datatype import *
 import os
 
@@ -52,12 +53,22 @@ def _removeChildOfType(self, elementClass, name):
     method = getattr(self.__class__, "_removeChildOfType" + elementClass.__name__)
     method(self, name)
 
+def _reduceElement(self):
+    "Support pickling of elements through their compact binary serialization."
+    return (_createElementFromBinary, (writeToBinaryString(self),))
+
+def _createElementFromBinary(data):
+    "Recreate a pickled element, together with a new document that owns it."
+    doc = createDocument()
+    return readFromBinaryString(doc, data)
+
 Element.isA = _isA
 Element.addChild = _addChild
 Element.getChild = _getChild
 Element.getChildOfType = _getChildOfType
 Element.getChildrenOfType = _getChildrenOfType
 Element.removeChildOfType = _removeChildOfType
+Element.__reduce__ = _reduceElement
 
 
 #
@@ -90,7 +101,11 @@ ValueElement.getDefaultValue = _getDefaultValue
 
 def _setInputValue(self, name, value, typeString = ''):
     """Set the typed value of an input by its name, creating a child element
-       to hold the input if needed."""
+       to hold the input if needed.  NumPy arrays and memoryviews of shape
+       (count) or (count, components) are stored as numeric array types
+       such as floatarray or color3array."""
+    if hasattr(value, '__array_interface__') or isinstance(value, memoryview):
+        return self._setInputValueArray(name, value, typeString)
     method = getattr(self.__class__, "_setInputValue" + getTypeString(value))
     return method(self, name, value, typeString)
 
@@ -293,6 +308,14 @@ stringToValue = _stringToValue
 
 readFromXmlFile = readFromXmlFileBase
 
+def readFromBinaryString(parent, data):
+    """Read an element serialized by writeToBinaryString.  A serialized document
+       is read into the given parent, which must then be an empty document, while
+       any other element is added as a new child of the given parent, which is
+       kept alive for as long as the returned element is referenced."""
+    elem = _readFromBinaryString(parent, data)
+    return parent if elem is None else elem
+
 
 #
 # Default Data Paths
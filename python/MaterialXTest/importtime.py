@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+'''
+Import-time benchmarks and lazy loading tests for MaterialX Python.
+'''
+
+import statistics, subprocess, sys, unittest
+
+_IMPORT_TRIALS = 5
+
+_PRINT_LOADED_MODULES = ('import sys\n'
+                         'print(sorted(m for m in sys.modules if m.startswith("MaterialX.PyMaterialX")))\n')
+
+def _runPython(code):
+    """Run the given code in a fresh interpreter, returning its stripped output."""
+    output = subprocess.check_output([sys.executable, '-c', code])
+    return output.decode('utf-8').strip()
+
+def _measureImport(code):
+    """Return the median time in milliseconds taken to run the given code in
+       a fresh interpreter, excluding interpreter startup."""
+    timedCode = ('import time\n'
+                 'start = time.perf_counter()\n' +
+                 code + '\n'
+                 'print((time.perf_counter() - start) * 1000.0)\n')
+    return statistics.median(float(_runPython(timedCode)) for _ in range(_IMPORT_TRIALS))
+
+class TestImportTime(unittest.TestCase):
+    def test_LazyImport(self):
+        # Importing the package alone does not load any native modules.
+        loadedModules = _PRINT_LOADED_MODULES
+        self.assertEqual(_runPython('import MaterialX\n' + loadedModules), '[]')
+
+        # Accessing the core API loads only the core and format modules.
+        self.assertEqual(_runPython('import MaterialX\nMaterialX.createDocument()\n' + loadedModules),
+                         "['MaterialX.PyMaterialXCore', 'MaterialX.PyMaterialXFormat']")
+
+        # Generator modules are loaded when accessed as package attributes.
+        self.assertEqual(_runPython('import MaterialX\nprint(MaterialX.PyMaterialXGenShader.__name__)'),
+                         'MaterialX.PyMaterialXGenShader')
+
+        # Wildcard imports and the package version remain available.
+        self.assertEqual(_runPython('from MaterialX import *\nprint(createDocument() is not None)'), 'True')
+        self.assertEqual(_runPython('import MaterialX\nprint(MaterialX.__version__ == MaterialX.getVersionString())'), 'True')
+
+        # Missing submodules are reported as missing attributes.
+        self.assertEqual(_runPython('import MaterialX\nprint(hasattr(MaterialX, "PyMaterialXMissing"))'), 'False')
+        self.assertEqual(_runPython('import MaterialX\nprint(getattr(MaterialX, "PyMaterialXMissing", None))'), 'None')
+
+    def test_ImportTime(self):
+        # Each timed step loads only the native modules it requires.
+        timings = [
+            ('import MaterialX', 'import MaterialX', []),
+            ('core API', 'import MaterialX\nMaterialX.createDocument()',
+             ['MaterialX.PyMaterialXCore', 'MaterialX.PyMaterialXFormat']),
+            ('shader generation', 'import MaterialX\nimport MaterialX.PyMaterialXGenShader',
+             ['MaterialX.PyMaterialXGenShader'])
+        ]
+        print()
+        for label, code, expectedModules in timings:
+            elapsed = _measureImport(code)
+            print('Import time (%s): %.2f ms' % (label, elapsed))
+            self.assertEqual(_runPython(code + '\n' + _PRINT_LOADED_MODULES), str(expectedModules))
+
+if __name__ == '__main__':
+    unittest.main()
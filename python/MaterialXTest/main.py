@@ -3,7 +3,8 @@
 Unit tests for MaterialX Python.
 '''
 
-import math, os, unittest
+import array, io, math, os, pickle, unittest
+import concurrent.futures
 
 import MaterialX as mx
 
@@ -101,6 +102,47 @@ class TestMaterialX(unittest.TestCase):
         v4[0] += 1;
         self.assertTrue(v4 != v2)
 
+        # Buffer protocol
+        view = memoryview(v1)
+        self.assertTrue(view.format == 'f' and view.shape == (3,))
+        self.assertTrue(view.tolist() == [1, 2, 3])
+        view[0] = 5
+        self.assertTrue(v1[0] == 5)
+        v1[0] = 1
+        m = mx.Matrix33.createScale(mx.Vector2(2, 3))
+        self.assertTrue(memoryview(m).shape == (3, 3))
+        self.assertTrue(memoryview(m).tolist()[1] == [0, 3, 0])
+
+    def test_ArrayInterop(self):
+        # Bulk conversions
+        points = memoryview(array.array('d', range(12))).cast('B').cast('d', (4, 3))
+        vectors = mx.Vector3.listFromArray(points)
+        self.assertTrue(len(vectors) == 4 and vectors[3] == mx.Vector3(9, 10, 11))
+        self.assertTrue(mx.Vector3.listToArray(vectors).tolist() == points.tolist())
+        matrices = mx.Matrix44.listFromArray(mx.Matrix44.listToArray([mx.Matrix44.IDENTITY] * 2))
+        self.assertTrue(len(matrices) == 2 and matrices[1] == mx.Matrix44.IDENTITY)
+        with self.assertRaises(ValueError):
+            mx.Color3.listFromArray(mx.Color4.listToArray([mx.Color4(1)]))
+
+        # Array inputs
+        doc = mx.createDocument()
+        node = doc.addNode('constant')
+        node.setInputValue('floats', memoryview(array.array('f', [0.5, 1.5])))
+        self.assertTrue(node.getInput('floats').getType() == 'floatarray')
+        self.assertTrue(node.getInputValue('floats') == [0.5, 1.5])
+        node.setInputValue('ints', memoryview(array.array('i', [1, 2, 3])))
+        self.assertTrue(node.getInputValue('ints') == [1, 2, 3])
+        largeInts = memoryview(array.array('i', [16777217, -16777219]))
+        node.setInputValue('largeInts', largeInts)
+        self.assertTrue(node.getInputValueArray('largeInts').format == 'i')
+        self.assertTrue(node.getInputValueArray('largeInts').tolist() == largeInts.tolist())
+        node.setInputValue('strided', memoryview(array.array('d', range(6)))[::2])
+        self.assertTrue(node.getInputValue('strided') == [0, 2, 4])
+        node.setInputValue('colors', points, 'color3array')
+        self.assertTrue(node.getInput('colors').getType() == 'color3array')
+        self.assertTrue(node.getInputValueArray('colors').tolist() == points.tolist())
+        self.assertTrue(node.getInputValueArray('missing') is None)
+
     def test_Matrices(self):
         # Translation and scale
         trans = mx.Matrix44.createTranslation(mx.Vector3(1, 2, 3))
@@ -504,6 +546,28 @@ class TestMaterialX(unittest.TestCase):
             mx.readFromXmlString(doc3, result)    
             self.assertTrue(len(doc3.getNodeDefs()) == 0)   
 
+        # Stream a document to a binary file object.
+        doc = mx.createDocument()
+        mx.readFromXmlFile(doc, _exampleFilenames[0], _searchPath)
+        stream = io.BytesIO()
+        mx.writeToXmlStream(doc, stream)
+        self.assertEqual(stream.getvalue().decode('utf-8'), mx.writeToXmlString(doc))
+
+        # Read a document with XIncludes repeatedly through an XInclude cache.
+        filename = 'StandardSurface/standard_surface_look_brass_tiled.mtlx'
+        readOptions = mx.XmlReadOptions()
+        readOptions.xincludeCache = mx.XIncludeCache.create()
+        uncachedDoc = mx.createDocument()
+        mx.readFromXmlFile(uncachedDoc, filename, _searchPath)
+        for i in range(3):
+            doc = mx.createDocument()
+            mx.readFromXmlFile(doc, filename, _searchPath, readOptions)
+            self.assertTrue(doc == uncachedDoc)
+        cache = readOptions.xincludeCache
+        self.assertTrue(cache.getMissCount() > 0)
+        self.assertEqual(cache.getHitCount(), 2 * cache.getMissCount())
+        self.assertTrue(cache.getSize() <= cache.getMaxSize())
+
         # Read the same document twice, and verify that duplicate elements
         # are skipped.
         doc = mx.createDocument()
@@ -512,6 +576,74 @@ class TestMaterialX(unittest.TestCase):
         mx.readFromXmlFile(doc, filename, _searchPath)
         self.assertTrue(doc.validate()[0])
 
+    def test_Pickle(self):
+        # Pickle values and value types.
+        for value in (1, True, 0.5, 'text', mx.Color3(0.1, 0.2, 0.3), mx.Vector4(1, 2, 3, 4),
+                      mx.Matrix33.IDENTITY, mx.Matrix44.createScale(mx.Vector3(2)), [1.0, 2.0], ['a', 'b']):
+            self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+            mxValue = mx.Value.createValueFromStrings(mx.getValueString(value), mx.getTypeString(value))
+            restored = pickle.loads(pickle.dumps(mxValue))
+            self.assertEqual(type(restored), type(mxValue))
+            self.assertEqual(restored.getData(), value)
+
+        # Pickle documents and elements.
+        for filename in _exampleFilenames:
+            doc = mx.createDocument()
+            mx.readFromXmlFile(doc, filename, _searchPath)
+            restoredDoc = pickle.loads(pickle.dumps(doc))
+            self.assertTrue(isinstance(restoredDoc, mx.Document))
+            self.assertTrue(restoredDoc == doc)
+            for elem in doc.getChildren():
+                restored = pickle.loads(pickle.dumps(elem))
+                self.assertEqual(type(restored), type(elem))
+                self.assertTrue(restored == elem)
+                self.assertTrue(restored.getDocument().getChild(elem.getName()) is not None)
+
+    def test_Threading(self):
+        # Read a shared data library.
+        stdlib = mx.createDocument()
+        for filename in _libraryFilenames:
+            mx.readFromXmlFile(stdlib, filename, _searchPath)
+
+        # Read, validate and serialize example documents on multiple threads.
+        def processDocument(filename):
+            doc = mx.createDocument()
+            mx.readFromXmlFile(doc, filename, _searchPath)
+            doc.setDataLibrary(stdlib)
+            valid, message = doc.validate()
+            return valid, mx.writeToXmlString(doc)
+
+        filenames = _exampleFilenames * 4
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(processDocument, filenames))
+        for filename, (valid, xmlString) in zip(filenames, results):
+            self.assertTrue(valid, filename + ' failed validation on a worker thread')
+            self.assertTrue(xmlString == processDocument(filename)[1])
+
+    def test_IncrementalValidation(self):
+        stdlib = mx.createDocument()
+        for filename in _libraryFilenames:
+            mx.readFromXmlFile(stdlib, filename, _searchPath)
+
+        # Incremental validation matches complete validation after edits to
+        # documents read from file.
+        def checkValidation(doc):
+            valid, message = doc.validate()
+            incrementalValid, incrementalMessage = doc.validateIncremental()
+            self.assertEqual(incrementalValid, valid)
+            self.assertEqual(sorted(incrementalMessage.splitlines()), sorted(message.splitlines()))
+
+        testSuiteDir = os.path.join(_fileDir, '../../resources/Materials/TestSuite/stdlib/adjustment')
+        for filename in sorted(os.listdir(testSuiteDir)):
+            doc = mx.createDocument()
+            mx.readFromXmlFile(doc, os.path.join(testSuiteDir, filename))
+            doc.setDataLibrary(stdlib)
+            checkValidation(doc)
+            inputs = [elem for elem in doc.traverseTree() if elem.isA(mx.Input) and elem.getParent().isA(mx.Node)]
+            for input in inputs[::3]:
+                input.setType('float')
+                checkValidation(doc)
+
 #--------------------------------------------------------------------------------
 if __name__ == '__main__':
     unittest.main()
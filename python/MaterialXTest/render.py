@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+'''
+Unit tests for rendering support in MaterialX Python.
+'''
+
+import unittest
+
+import MaterialX as mx
+import MaterialX.PyMaterialXRender as mx_render
+
+class TestRender(unittest.TestCase):
+    def test_ImageBuffer(self):
+        # Expose an image buffer through the buffer protocol.
+        image = mx_render.Image.create(4, 2, 3, mx_render.BaseType.FLOAT)
+        image.createResourceBuffer()
+        image.setUniformColor(mx.Color4(0.5, 0.25, 1.0, 1.0))
+        view = memoryview(image)
+        self.assertEqual(view.shape, (2, 4, 3))
+        self.assertEqual(view.format, 'f')
+        self.assertEqual(view.strides, (image.getRowStride(), 12, 4))
+        self.assertEqual(view[1, 3, 1], 0.25)
+
+        # Writes through the buffer are visible to the image.
+        view[0, 0, 0] = 0.75
+        self.assertEqual(image.getTexelColor(0, 0)[0], 0.75)
+
+        # Images without a resource buffer cannot be viewed.
+        emptyImage = mx_render.Image.create(4, 2, 3, mx_render.BaseType.FLOAT)
+        with self.assertRaises(BufferError):
+            memoryview(emptyImage)
+
+    def test_ImageFromArray(self):
+        # Adopt the memory of an array without copying.
+        data = bytearray(range(2 * 3 * 4))
+        image = mx_render.Image.fromArray(memoryview(data).cast('B', (2, 3, 4)))
+        self.assertEqual(image.getWidth(), 3)
+        self.assertEqual(image.getHeight(), 2)
+        self.assertEqual(image.getChannelCount(), 4)
+        self.assertEqual(image.getBaseType(), mx_render.BaseType.UINT8)
+        data[4] = 255
+        self.assertEqual(image.getTexelColor(1, 0)[0], 1.0)
+
+        # The exported view is held by the image, so its memory cannot be
+        # released or resized while the image is alive.
+        view = memoryview(data).cast('B', (2, 3, 4))
+        image = mx_render.Image.fromArray(view)
+        with self.assertRaises(BufferError):
+            view.release()
+        del image
+        view.release()
+        data.extend(bytes(4))
+
+        # Single-channel arrays may omit the channel dimension.
+        image = mx_render.Image.fromArray(memoryview(bytearray(6)).cast('B', (2, 3)))
+        self.assertEqual(image.getChannelCount(), 1)
+
+        # Read-only and unsupported arrays are rejected.
+        with self.assertRaises(BufferError):
+            mx_render.Image.fromArray(memoryview(bytes(24)).cast('B', (2, 3, 4)))
+        with self.assertRaises(ValueError):
+            mx_render.Image.fromArray(memoryview(bytearray(48)).cast('d', (2, 3)))
+
+    def test_PythonImageLoader(self):
+        class UniformImageLoader(mx_render.ImageLoader):
+            def __init__(self):
+                super().__init__()
+                self.extensions = { 'png' }
+            def supportedExtensions(self):
+                return self.extensions
+            def loadImage(self, filePath):
+                image = mx_render.Image.create(2, 2, 4, mx_render.BaseType.UINT8)
+                image.createResourceBuffer()
+                image.setUniformColor(mx.Color4(1.0))
+                return image
+
+        doc = mx.createDocument()
+        for i in range(4):
+            image = doc.addNode('image', 'image%i' % i, 'color3')
+            image.setInputValue('file', 'image%i.png' % i, 'filename')
+
+        # Images are loaded by a Python loader on worker threads.
+        loader = UniformImageLoader()
+        handler = mx_render.ImageHandler.create(loader)
+        images = handler.getReferencedImages(doc)
+        self.assertEqual(len(images), 4)
+        self.assertEqual(images[0].getTexelColor(0, 0), mx.Color4(1.0))
+
+        # Prefetched images are acquired once loaded.
+        handler.clearImageCache()
+        handler.prefetchReferencedImages(doc)
+        image = handler.acquireImage('image0.png')
+        self.assertEqual(image.getTexelColor(0, 0), mx.Color4(1.0))
+        future = handler.acquireImagesAsync(['image1.png'])[0]
+        self.assertEqual(future.get().getWidth(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
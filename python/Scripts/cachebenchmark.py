@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+'''
+Measure the cost of interleaving graph edits with definition lookups.
+
+A node graph is built programmatically, one node at a time, with each new
+node connected to its predecessor and its node definition looked up as it
+is added.  Since the document cache is maintained incrementally as elements
+are added and connected, the total time should grow linearly with the
+number of nodes, and the cache should be rebuilt only once.
+'''
+
+import argparse, sys, time
+
+import MaterialX as mx
+
+def buildGraph(doc, nodeCount, reportInterval):
+    graph = doc.addNodeGraph('NG_benchmark')
+    categories = ['add', 'multiply', 'subtract']
+    previous = graph.addNode('constant', 'constant', 'color3')
+    nodeDefCount = 0
+    start = time.perf_counter()
+    for i in range(nodeCount):
+        node = graph.addNode(categories[i % len(categories)], 'node%i' % i, 'color3')
+        node.addInput('in1', 'color3').setConnectedNode(previous)
+        node.setInputValue('in2', mx.Color3(0.5))
+        if node.getNodeDef():
+            nodeDefCount += 1
+        previous = node
+        if reportInterval and (i + 1) % reportInterval == 0:
+            print('%8d nodes: %8.3f s' % (i + 1, time.perf_counter() - start))
+    graph.addOutput('out', 'color3').setConnectedNode(previous)
+    return time.perf_counter() - start, nodeDefCount
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the cost of interleaving graph edits with definition lookups.")
+    parser.add_argument("--count", dest="count", type=int, default=50000, help="Number of nodes to add to the graph. Defaults to 50000.")
+    parser.add_argument("--report", dest="report", type=int, default=10000, help="Interval at which elapsed time is reported. Defaults to 10000 nodes.")
+    parser.add_argument("--maxRebuilds", dest="maxRebuilds", type=int, default=0, help="Exit with an error if the document cache is rebuilt more than this number of times.")
+    opts = parser.parse_args()
+
+    doc = mx.createDocument()
+    doc.setDataLibrary(mx.getSharedDataLibrary(mx.getDefaultDataLibraryFolders(), mx.getDefaultDataSearchPath()))
+
+    elapsed, nodeDefCount = buildGraph(doc, opts.count, opts.report)
+    print('Built a graph of %i nodes in %.3f s (%.1f us per node)' % (opts.count, elapsed, 1e6 * elapsed / max(opts.count, 1)))
+    print('Found node definitions for %i nodes' % nodeDefCount)
+    print('Document cache: %i hits, %i rebuilds' % (doc.getCacheHitCount(), doc.getCacheRebuildCount()))
+
+    if opts.maxRebuilds and doc.getCacheRebuildCount() > opts.maxRebuilds:
+        print('Document cache was rebuilt more than %i times' % opts.maxRebuilds)
+        sys.exit(-1)
+
+if __name__ == '__main__':
+    main()
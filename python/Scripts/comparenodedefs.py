@@ -634,7 +634,9 @@ def parseSpecDocument(specPath, stdlib, geompropNames):
 def loadDataLibrary(mtlxPath):
     '''Load a data library MTLX document. Returns (nodes, defaults).'''
     doc = mx.createDocument()
-    mx.readFromXmlFile(doc, str(mtlxPath))
+    readOptions = mx.XmlReadOptions()
+    readOptions.includeCategories = { 'nodedef', 'typedef' }
+    mx.readFromXmlFile(doc, str(mtlxPath), mx.FileSearchPath(), readOptions)
 
     nodes = {}
     defaults = {}  # (nodeName, signature) -> {portName -> (value, isGeomprop)}
@@ -2,19 +2,29 @@
 '''
 Generate shader code for each renderable element in a MaterialX document or folder.
 The currently supported target languages are GLSL, ESSL, MSL, OSL, and MDL.
+
+Documents may be processed in parallel with the --jobs option, in which case each
+worker process loads the data libraries once and handles a share of the input files.
+A machine-readable summary of all results can be written with the --report option.
+
+With the --dedupe option, elements whose shader graphs share the same topology
+share a single generated shader, and a table of uniform values is written for
+each element instead.
 '''
 
-import sys, os, argparse, subprocess
+import sys, os, argparse, subprocess, json
+import concurrent.futures
 
 import MaterialX as mx
-import MaterialX.PyMaterialXGenGlsl as mx_gen_glsl
-import MaterialX.PyMaterialXGenMdl as mx_gen_mdl
-import MaterialX.PyMaterialXGenMsl as mx_gen_msl
-import MaterialX.PyMaterialXGenOsl as mx_gen_osl
-import MaterialX.PyMaterialXGenSlang as mx_gen_slang
 import MaterialX.PyMaterialXGenShader as mx_gen_shader
 
-def validateCode(sourceCodeFile, codevalidator, codevalidatorArgs):
+# Per-process state, initialized once by initWorker.
+_workerState = {}
+
+def startValidation(sourceCodeFile, codevalidator, codevalidatorArgs, log):
+    """Launch the code validator on the given file, returning a handle that may be
+       passed to finishValidation, or None if no validator was requested.  The
+       validator command is appended to the given log."""
     if codevalidator:
         cmd = codevalidator.split()
         cmd.append(sourceCodeFile)
@@ -23,12 +33,15 @@ def validateCode(sourceCodeFile, codevalidator, codevalidatorArgs):
         cmd_flatten ='----- Run Validator: '
         for c in cmd:
             cmd_flatten += c + ' '
-        print(cmd_flatten)
-        try:
-            output = subprocess.check_output(cmd, stderr=subprocess.STDOUT)
-            return output.decode(encoding='utf-8')
-        except subprocess.CalledProcessError as out:                                                                                                   
-            return (out.output.decode(encoding='utf-8'))
+        log.append(cmd_flatten)
+        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    return None
+
+def finishValidation(process):
+    """Wait for a validator launched by startValidation, returning its output."""
+    if process:
+        output, _ = process.communicate()
+        return output.decode(encoding='utf-8')
     return ""
 
 def getMaterialXFiles(rootPath):
@@ -43,6 +56,178 @@ def getMaterialXFiles(rootPath):
 
     return filelist
 
+def createShaderGenerator(gentarget):
+    # Only the generator module for the requested target is loaded.
+    if gentarget == 'osl':
+        return mx.PyMaterialXGenOsl.OslShaderGenerator.create()
+    elif gentarget == 'mdl':
+        return mx.PyMaterialXGenMdl.MdlShaderGenerator.create()
+    elif gentarget == 'essl':
+        return mx.PyMaterialXGenGlsl.EsslShaderGenerator.create()
+    elif gentarget == 'vulkan':
+        return mx.PyMaterialXGenGlsl.VkShaderGenerator.create()
+    elif gentarget == 'wgsl':
+        return mx.PyMaterialXGenGlsl.WgslShaderGenerator.create()
+    elif gentarget == 'msl':
+        return mx.PyMaterialXGenMsl.MslShaderGenerator.create()
+    elif gentarget == 'slang':
+        return mx.PyMaterialXGenSlang.SlangShaderGenerator.create()
+    return mx.PyMaterialXGenGlsl.GlslShaderGenerator.create()
+
+def initWorker(libraryFolders, searchPathString, opts):
+    """Load the data libraries for this process.  Called once per worker."""
+    searchPath = mx.FileSearchPath(searchPathString)
+    stdlib = mx.createDocument()
+    mx.loadLibraries(libraryFolders, searchPath, stdlib)
+    _workerState['stdlib'] = stdlib
+    _workerState['searchPath'] = searchPathString
+    _workerState['opts'] = opts
+    _workerState['batch'] = mx_gen_shader.ShaderBatch.create() if opts.dedupe else None
+    _workerState['permutationResults'] = {}
+
+def writeSource(filename, source):
+    file = open(filename, 'w+')
+    file.write(source)
+    file.close()
+
+def writeUniformValues(filename, shader, uniformValues):
+    data = { 'shader': shader.getName(),
+             'uniforms': { name: value.getValueString() for name, value in uniformValues.items() } }
+    with open(filename, 'w') as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+
+def generateFile(inputFilename):
+    """Generate and validate shaders for each renderable element in the given document,
+       returning a dictionary describing the results."""
+    stdlib = _workerState['stdlib']
+    opts = _workerState['opts']
+    result = { 'file': inputFilename, 'elements': [], 'error': '', 'log': [] }
+    log = result['log']
+
+    doc = mx.createDocument()
+    try:
+        mx.readFromXmlFile(doc, inputFilename)
+        doc.setDataLibrary(stdlib)
+    except (mx.ExceptionFileMissing, mx.ExceptionParseError) as err:
+        result['error'] = str(err)
+        return result
+
+    log.append('---------- Generate code for file: ' + inputFilename + ' --------------------')
+
+    valid, msg = doc.validate()
+    if not valid:
+        log.append('Validation warnings for input document:')
+        log.append(msg)
+
+    gentarget = opts.target or 'glsl'
+    shadergen = createShaderGenerator(gentarget)
+
+    codeSearchPath = mx.FileSearchPath(_workerState['searchPath'])
+    codeSearchPath.append(os.path.dirname(inputFilename))
+    context = mx_gen_shader.GenContext(shadergen)
+    context.registerSourceCodeSearchPath(codeSearchPath)
+    shadergen.registerTypeDefs(doc);
+
+    # If we're generating Vulkan-compliant GLSL then set the binding context
+    if opts.vulkanCompliantGlsl:
+        bindingContext = mx.PyMaterialXGenGlsl.GlslResourceBindingContext.create(0,0)
+        context.pushUserData('udbinding', bindingContext)
+
+    genoptions = context.getOptions() 
+    if opts.shaderInterfaceType == 0 or opts.shaderInterfaceType == 1:
+        genoptions.shaderInterfaceType = mx_gen_shader.ShaderInterfaceType(opts.shaderInterfaceType)
+    else:
+        genoptions.shaderInterfaceType = mx_gen_shader.ShaderInterfaceType.SHADER_INTERFACE_COMPLETE
+
+    log.append('- Set up CMS ...')
+    cms = mx_gen_shader.DefaultColorManagementSystem.create(shadergen.getTarget())  
+    cms.loadLibrary(doc)
+    shadergen.setColorManagementSystem(cms)  
+
+    log.append('- Set up Units ...')
+    unitsystem = mx_gen_shader.UnitSystem.create(shadergen.getTarget())
+    registry = mx.UnitConverterRegistry.create()
+    distanceTypeDef = doc.getUnitTypeDef('distance')
+    registry.addUnitConverter(distanceTypeDef, mx.LinearUnitConverter.create(distanceTypeDef))
+    angleTypeDef = doc.getUnitTypeDef('angle')
+    registry.addUnitConverter(angleTypeDef, mx.LinearUnitConverter.create(angleTypeDef))
+    unitsystem.loadLibrary(stdlib)
+    unitsystem.setUnitConverterRegistry(registry)
+    shadergen.setUnitSystem(unitsystem)
+    genoptions.targetDistanceUnit = 'meter'
+
+    batch = _workerState['batch']
+    permutationResults = _workerState['permutationResults']
+    pathPrefix = ''
+    if opts.outputPath and os.path.exists(opts.outputPath):
+        pathPrefix = opts.outputPath + os.path.sep
+    else:
+        pathPrefix = os.path.dirname(os.path.abspath(inputFilename))
+    log.append('- Shader output path: ' + pathPrefix)
+
+    for elem in mx_gen_shader.findRenderableElements(doc):
+        elemName = elem.getName()
+        log.append('-- Generate code for element: ' + elemName)
+        elemName = mx.createValidName(elemName)
+        elemResult = { 'element': elemName, 'passed': False, 'errors': '' }
+        result['elements'].append(elemResult)
+        permutation = None
+        try:
+            if batch:
+                permutation = batch.addElement(elemName, elem, context)
+                shader = permutation.getShader() if permutation else None
+            else:
+                shader = shadergen.generate(elemName, elem, context)
+        except LookupError as err:
+            shader = None
+            elemResult['errors'] = str(err)
+        if permutation:
+            filename = pathPrefix + "/" + elemName + "." + gentarget + ".uniforms.json"
+            writeUniformValues(filename, shader, permutation.getUniformValues(permutation.getElementCount() - 1))
+            log.append('--- Wrote uniform values to: ' + filename)
+            elemResult['shader'] = shader.getName()
+            if permutation.getElementCount() > 1:
+                # Reuse the results of the shared shader.
+                sharedResult = permutationResults[permutation.getTopologyKey()]
+                elemResult['passed'] = sharedResult['passed']
+                elemResult['errors'] = sharedResult['errors']
+                log.append('--- Reusing shader ' + shader.getName() + ' for element: ' + elemName)
+                continue
+            permutationResults[permutation.getTopologyKey()] = elemResult
+        if shader:
+            # Use extension of .vert and .frag as it's type is
+            # recognized by glslangValidator.  Validators for each stage
+            # are launched together and run concurrently.
+            if gentarget in ['glsl', 'essl', 'vulkan', 'msl', 'wgsl']:
+                stages = [(mx_gen_shader.PIXEL_STAGE, '.frag', 'pixel'),
+                          (mx_gen_shader.VERTEX_STAGE, '.vert', 'vertex')]
+            else:
+                stages = [(mx_gen_shader.PIXEL_STAGE, '', 'pixel')]
+            processes = []
+            for stage, extension, label in stages:
+                filename = pathPrefix + "/" + shader.getName() + "." + gentarget + extension
+                writeSource(filename, shader.getSourceCode(stage))
+                log.append('--- Wrote ' + label + ' shader to: ' + filename)
+                processes.append(startValidation(filename, opts.validator, opts.validatorArgs, log))
+            errors = ""
+            for process in processes:
+                errors += finishValidation(process)
+
+            if errors != "":
+                log.append("--- Validation failed for element: " + elemName)
+                log.append("----------------------------")
+                log.append('--- Error log: ' + errors)
+                log.append("----------------------------")
+                elemResult['errors'] = errors
+            else:
+                log.append("--- Validation passed for element: " + elemName)
+                elemResult['passed'] = True
+
+        else:
+            log.append("--- Validation failed for element: " + elemName)
+
+    return result
+
 def main():
     parser = argparse.ArgumentParser(description='Generate shader code for each renderable element in a MaterialX document or folder.')
     parser.add_argument('--path', dest='paths', action='append', nargs='+', help='An additional absolute search path location (e.g. "/projects/MaterialX")')
@@ -53,11 +238,13 @@ def main():
     parser.add_argument('--validatorArgs', dest='validatorArgs', nargs='?', const=' ', type=str, help='Optional arguments for code validator.')
     parser.add_argument('--vulkanGlsl', dest='vulkanCompliantGlsl', default=False, type=bool, help='Set to True to generate Vulkan-compliant GLSL when using the genglsl target.')
     parser.add_argument('--shaderInterfaceType', dest='shaderInterfaceType', default=0, type=int, help='Set the type of shader interface to be generated')
+    parser.add_argument('--jobs', dest='jobs', default=1, type=int, help='Number of worker processes used to generate shaders. A value of 0 uses one worker per CPU. Default is 1.')
+    parser.add_argument('--dedupe', dest='dedupe', action='store_true', help='Generate a single shader for elements whose shader graphs share the same topology, writing a table of uniform values for each element. Shaders are shared within each worker process.')
+    parser.add_argument('--report', dest='report', help='Optional path of a JSON file to which per-file and per-element results are written.')
     parser.add_argument(dest='inputFilename', help='Path to input document or folder containing input documents.')
     opts = parser.parse_args()
 
-    # Load standard and custom data libraries.
-    stdlib = mx.createDocument()
+    # Gather standard and custom data library locations.
     searchPath = mx.getDefaultDataSearchPath()
     libraryFolders = []
     if opts.paths:
@@ -69,136 +256,61 @@ def main():
             for library in libraryList:
                 libraryFolders.append(library)
     libraryFolders.extend(mx.getDefaultDataLibraryFolders())
-    mx.loadLibraries(libraryFolders, searchPath, stdlib)
 
-    # Generate shaders for each input document.
-    for inputFilename in getMaterialXFiles(opts.inputFilename):        
-        doc = mx.createDocument()
-        try:
-            mx.readFromXmlFile(doc, inputFilename)
-            doc.setDataLibrary(stdlib)
-        except mx.ExceptionFileMissing as err:
-            print('Generation failed: "', err, '"')
-            sys.exit(-1)
-
-        print('---------- Generate code for file: ', inputFilename, '--------------------')
-
-        valid, msg = doc.validate()
-        if not valid:
-            print('Validation warnings for input document:')
-            print(msg)
-
-        gentarget = 'glsl'
-        if opts.target:
-            gentarget = opts.target
-        if gentarget == 'osl':
-            shadergen = mx_gen_osl.OslShaderGenerator.create()
-        elif gentarget == 'mdl':
-            shadergen = mx_gen_mdl.MdlShaderGenerator.create()
-        elif gentarget == 'essl':
-            shadergen = mx_gen_glsl.EsslShaderGenerator.create()
-        elif gentarget == 'vulkan':
-            shadergen = mx_gen_glsl.VkShaderGenerator.create()
-        elif gentarget == 'wgsl':
-            shadergen = mx_gen_glsl.WgslShaderGenerator.create()
-        elif gentarget == 'msl':
-            shadergen = mx_gen_msl.MslShaderGenerator.create()
-        elif gentarget == 'slang':
-            shadergen = mx_gen_slang.SlangShaderGenerator.create()
-        else:
-            shadergen = mx_gen_glsl.GlslShaderGenerator.create()
-                
-        codeSearchPath = searchPath
-        codeSearchPath.append(os.path.dirname(inputFilename))
-        context = mx_gen_shader.GenContext(shadergen)
-        context.registerSourceCodeSearchPath(codeSearchPath)
-        shadergen.registerTypeDefs(doc);
-
-        # If we're generating Vulkan-compliant GLSL then set the binding context
-        if opts.vulkanCompliantGlsl:
-            bindingContext = mx_gen_glsl.GlslResourceBindingContext.create(0,0)
-            context.pushUserData('udbinding', bindingContext)
-
-        genoptions = context.getOptions() 
-        if opts.shaderInterfaceType == 0 or opts.shaderInterfaceType == 1:
-            genoptions.shaderInterfaceType = mx_gen_shader.ShaderInterfaceType(opts.shaderInterfaceType)
-        else:
-            genoptions.shaderInterfaceType = mx_gen_shader.ShaderInterfaceType.SHADER_INTERFACE_COMPLETE
-
-        print('- Set up CMS ...')
-        cms = mx_gen_shader.DefaultColorManagementSystem.create(shadergen.getTarget())  
-        cms.loadLibrary(doc)
-        shadergen.setColorManagementSystem(cms)  
-
-        print('- Set up Units ...')
-        unitsystem = mx_gen_shader.UnitSystem.create(shadergen.getTarget())
-        registry = mx.UnitConverterRegistry.create()
-        distanceTypeDef = doc.getUnitTypeDef('distance')
-        registry.addUnitConverter(distanceTypeDef, mx.LinearUnitConverter.create(distanceTypeDef))
-        angleTypeDef = doc.getUnitTypeDef('angle')
-        registry.addUnitConverter(angleTypeDef, mx.LinearUnitConverter.create(angleTypeDef))
-        unitsystem.loadLibrary(stdlib)
-        unitsystem.setUnitConverterRegistry(registry)
-        shadergen.setUnitSystem(unitsystem)
-        genoptions.targetDistanceUnit = 'meter'
-
-        pathPrefix = ''
-        if opts.outputPath and os.path.exists(opts.outputPath):
-            pathPrefix = opts.outputPath + os.path.sep
-        else:
-            pathPrefix = os.path.dirname(os.path.abspath(inputFilename))
-        print('- Shader output path: ' + pathPrefix)
-
-        failedShaders = ""
-        for elem in mx_gen_shader.findRenderableElements(doc):
-            elemName = elem.getName()
-            print('-- Generate code for element: ' + elemName)
-            elemName = mx.createValidName(elemName)
-            shader = shadergen.generate(elemName, elem, context)        
-            if shader:
-                # Use extension of .vert and .frag as it's type is
-                # recognized by glslangValidator
-                if gentarget in ['glsl', 'essl', 'vulkan', 'msl', 'wgsl']:
-                    pixelSource = shader.getSourceCode(mx_gen_shader.PIXEL_STAGE)
-                    filename = pathPrefix + "/" + shader.getName() + "." + gentarget + ".frag"
-                    print('--- Wrote pixel shader to: ' + filename)
-                    file = open(filename, 'w+')
-                    file.write(pixelSource)
-                    file.close()
-                    errors = validateCode(filename, opts.validator, opts.validatorArgs)                
-
-                    vertexSource = shader.getSourceCode(mx_gen_shader.VERTEX_STAGE)
-                    filename = pathPrefix + "/" + shader.getName() + "." + gentarget + ".vert"
-                    print('--- Wrote vertex shader to: ' + filename)
-                    file = open(filename, 'w+')
-                    file.write(vertexSource)
-                    file.close()
-                    errors += validateCode(filename, opts.validator, opts.validatorArgs)
-
-                else:
-                    pixelSource = shader.getSourceCode(mx_gen_shader.PIXEL_STAGE)
-                    filename = pathPrefix + "/" + shader.getName() + "." + gentarget
-                    print('--- Wrote pixel shader to: ' + filename)
-                    file = open(filename, 'w+')
-                    file.write(pixelSource)
-                    file.close()
-                    errors = validateCode(filename, opts.validator, opts.validatorArgs)
-
-                if errors != "":
-                    print("--- Validation failed for element: ", elemName)
-                    print("----------------------------")
-                    print('--- Error log: ', errors)
-                    print("----------------------------")
-                    failedShaders += (elemName + ' ')
-                else:
-                    print("--- Validation passed for element:", elemName)
+    inputFilenames = getMaterialXFiles(opts.inputFilename)
+    jobs = opts.jobs if opts.jobs > 0 else (os.cpu_count() or 1)
+    jobs = min(jobs, max(len(inputFilenames), 1))
+    initArgs = (libraryFolders, searchPath.asString(), opts)
 
-            else:
-                print("--- Validation failed for element:", elemName)
-                failedShaders += (elemName + ' ')
+    # Generate shaders for each input document, either in this process or
+    # across a pool of worker processes that each load the libraries once.
+    results = []
+    def reportResult(result):
+        for line in result['log']:
+            print(line)
+        if result['error']:
+            print('Generation failed for file: "', result['file'], '":', result['error'])
+        results.append(result)
+
+    if jobs == 1:
+        initWorker(*initArgs)
+        for inputFilename in inputFilenames:
+            reportResult(generateFile(inputFilename))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, initializer=initWorker, initargs=initArgs) as executor:
+            futures = [executor.submit(generateFile, inputFilename) for inputFilename in inputFilenames]
+            for future in concurrent.futures.as_completed(futures):
+                reportResult(future.result())
+        results.sort(key=lambda result: result['file'])
+
+    # Aggregate a single summary across all documents.
+    failedFiles = [result['file'] for result in results if result['error']]
+    elementResults = [elem for result in results for elem in result['elements']]
+    failedShaders = [elem['element'] for elem in elementResults if not elem['passed']]
+    summary = {
+        'target': opts.target or 'glsl',
+        'files': len(results),
+        'failedFiles': len(failedFiles),
+        'elements': len(elementResults),
+        'failedElements': len(failedShaders),
+        'results': [{ key: value for key, value in result.items() if key != 'log' } for result in results]
+    }
+    print('---------- Summary --------------------')
+    print('- Files processed: %d (%d failed)' % (summary['files'], summary['failedFiles']))
+    print('- Elements generated: %d (%d failed)' % (summary['elements'], summary['failedElements']))
+    if opts.dedupe:
+        summary['shaders'] = len(set(elem['shader'] for elem in elementResults if 'shader' in elem))
+        print('- Distinct shaders generated: %d' % summary['shaders'])
+    if failedShaders:
+        print('- Failed elements: ' + ' '.join(failedShaders))
+
+    if opts.report:
+        with open(opts.report, 'w') as reportFile:
+            json.dump(summary, reportFile, indent=2)
+        print('- Wrote report to: ' + opts.report)
 
-        if failedShaders != "":
-            sys.exit(-1)
+    if failedFiles or failedShaders:
+        sys.exit(-1)
 
 if __name__ == '__main__':
     main()
@@ -3,6 +3,7 @@
 Generate MDL implementation directory based on MaterialX nodedefs
 '''
 
+import concurrent.futures
 import os
 import sys
 
@@ -19,28 +20,34 @@ def usage():
     print ('- By default <module_name>="mymodule" and <version>="1.6"')
 
 def _getSubDirectories(libraryPath):
-    return [name for name in os.listdir(libraryPath)
-            if os.path.isdir(os.path.join(libraryPath, name))]
+    return sorted(name for name in os.listdir(libraryPath)
+                  if os.path.isdir(os.path.join(libraryPath, name)))
 
 def _getMTLXFilesInDirectory(path):
-    for file in os.listdir(path):
+    for file in sorted(os.listdir(path)):
         if file.endswith('.mtlx'):
             yield file
 
-def _loadLibrary(file, doc):
+def _readLibrary(file):
     libDoc = mx.createDocument()
     mx.readFromXmlFile(libDoc, file)
     libDoc.setSourceUri(file)
-    doc.importLibrary(libDoc)
+    return libDoc
 
 def _loadLibraries(doc, searchPath, libraryPath):
     librarySubPaths = _getSubDirectories(libraryPath)
     librarySubPaths.append(libraryPath)
+    filePaths = []
     for path in librarySubPaths:
         filenames = _getMTLXFilesInDirectory(os.path.join(libraryPath, path))
         for filename in filenames:
-            filePath = os.path.join(libraryPath, os.path.join(path, filename))
-            _loadLibrary(filePath, doc)
+            filePaths.append(os.path.join(libraryPath, os.path.join(path, filename)))
+
+    # Parse library files in parallel, since reading releases the GIL, and
+    # import them in a deterministic order.
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        for libDoc in executor.map(_readLibrary, filePaths):
+            doc.importLibrary(libDoc)
 
 def _writeHeader(file, version):
     file.write('mdl ' + version + ';\n')
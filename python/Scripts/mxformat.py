@@ -2,20 +2,108 @@
 '''
 Reformat a folder of MaterialX documents in place, optionally upgrading
 the documents to the latest version of the standard.
+
+Documents are processed one at a time in a pool of worker processes, and a
+document is only rewritten when its formatted content differs from the file
+on disk, with each write made atomic through a temporary file.  When a
+manifest path is given, formatted documents are recorded in the manifest, so
+that subsequent runs only process documents that have been modified since
+the last run.
 '''
 
 import argparse
+import concurrent.futures
+import hashlib
+import json
 import os
+import tempfile
 import xml.etree.ElementTree as ET
 
 import MaterialX as mx
 
+MANIFEST_VERSION = 1
+
 def is_well_formed(xml_string):
     error = ''
     try:
-        ET.fromstring(xml_string)  
+        ET.fromstring(xml_string)
     except ET.ParseError as e:
         error = str(e)
+    return error
+
+def get_file_state(path):
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+def write_file_atomic(path, data):
+    """Write the given bytes to a file through a temporary file in the same
+       folder, so that readers never observe a partially written file."""
+    handle, tempPath = tempfile.mkstemp(dir=os.path.dirname(path) or '.', prefix='.mxformat_', suffix='.tmp')
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            f.write(data)
+        if os.path.exists(path):
+            os.chmod(tempPath, os.stat(path).st_mode & 0o7777)
+        os.replace(tempPath, path)
+    except BaseException:
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+        raise
+
+def format_file(path, upgrade, validate, xml_syntax, dry_run):
+    """Reformat a single document, returning a tuple of the form
+       (path, status, messages, fileState)."""
+    messages = []
+    doc = mx.createDocument()
+    readOptions = mx.XmlReadOptions()
+    readOptions.readComments = True
+    readOptions.readNewlines = True
+    readOptions.upgradeVersion = upgrade
+    try:
+        mx.readFromXmlFile(doc, path, mx.FileSearchPath(), readOptions)
+    except Exception as err:
+        return (path, 'error', ['Skipping "%s" due to exception: %s' % (path, err)], None)
+
+    xml_bytes = mx.writeToXmlString(doc).encode('utf-8')
+    if xml_syntax:
+        errors = is_well_formed(xml_bytes)
+        if errors:
+            messages.append(f'- Warning: Document {path} is not well-formed XML: {errors}')
+    if validate:
+        is_valid, errors = doc.validate()
+        if not is_valid:
+            messages.append(f'- Warning: Document {path} is invalid. Errors {errors}.')
+
+    with open(path, 'rb') as f:
+        unchanged = hashlib.sha256(f.read()).digest() == hashlib.sha256(xml_bytes).digest()
+    if unchanged:
+        status = 'unchanged'
+    else:
+        status = 'formatted'
+        if not dry_run:
+            write_file_atomic(path, xml_bytes)
+
+    # Only documents without warnings are recorded in the manifest, so that
+    # their warnings are reported again on the next run.
+    fileState = get_file_state(path) if not messages and (unchanged or not dry_run) else None
+    return (path, status, messages, fileState)
+
+def format_file_args(args):
+    return format_file(*args)
+
+def load_manifest(manifestPath, optionsKey):
+    try:
+        with open(manifestPath, 'r') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION and manifest.get('options') == optionsKey:
+            return manifest.get('files', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+def save_manifest(manifestPath, optionsKey, files):
+    manifest = { 'version': MANIFEST_VERSION, 'options': optionsKey, 'files': files }
+    write_file_atomic(manifestPath, json.dumps(manifest, indent=0, sort_keys=True).encode('utf-8'))
 
 def main():
     parser = argparse.ArgumentParser(description="Reformat a folder of MaterialX documents in place.")
@@ -23,68 +111,97 @@ def main():
     parser.add_argument('-u', '--upgrade', dest='upgrade', action="store_true", help='Upgrade documents to the latest version of the standard.')
     parser.add_argument('-v', '--validate', dest='validate', action="store_true", help='Perform MaterialX validation on documents after reformatting.')
     parser.add_argument('-x', '--xml_syntax', dest='xml_syntax', action="store_true", help='Check XML syntax after reformatting.')
+    parser.add_argument('-j', '--jobs', dest='jobs', type=int, default=0, help='Number of worker processes to use. Defaults to the number of CPUs.')
+    parser.add_argument('-n', '--dry_run', dest='dry_run', action="store_true", help='Report the documents that would be reformatted without writing them.')
+    parser.add_argument('--manifest', dest='manifest', default='', help='Path of an optional manifest recording formatted documents, allowing subsequent runs to skip unmodified documents.')
     parser.add_argument(dest="inputFolder", help="An input folder to scan for MaterialX documents.")
     opts = parser.parse_args()
 
-    validDocs = dict()
+    mxVersion = mx.getVersionIntegers()
+
+    # Scan for documents, skipping those unmodified since the last run.
+    optionsKey = '%s|upgrade=%i' % (mx.getVersionString(), opts.upgrade)
+    if opts.validate:
+        optionsKey += '|validate'
+    if opts.xml_syntax:
+        optionsKey += '|xml_syntax'
+    manifest = load_manifest(opts.manifest, optionsKey) if opts.manifest else {}
+    updatedManifest = {}
+    filenames = []
     for root, dirs, files in os.walk(opts.inputFolder):
-        for filename in files:
+        dirs.sort()
+        for filename in sorted(files):
             fullpath = os.path.join(root, filename)
-            if fullpath.endswith('.mtlx'):
-                doc = mx.createDocument()
-                try:
-                    readOptions = mx.XmlReadOptions()
-                    readOptions.readComments = True
-                    readOptions.readNewlines = True    
-                    readOptions.upgradeVersion = opts.upgrade
-                    try:
-                        mx.readFromXmlFile(doc, fullpath, mx.FileSearchPath(), readOptions)
-                    except Exception as err:
-                        print('Skipping "' + filename + '" due to exception: ' + str(err))
-                        continue
-                    validDocs[fullpath] = doc
-                except mx.Exception:
-                    pass
-
-    if not validDocs:
-        print('No MaterialX documents were found in "%s"' % (opts.inputFolder))
-        return
+            if not fullpath.endswith('.mtlx'):
+                continue
+            key = os.path.relpath(fullpath, opts.inputFolder)
+            try:
+                state = get_file_state(fullpath)
+            except OSError:
+                continue
+            if manifest.get(key) == state:
+                updatedManifest[key] = state
+            else:
+                filenames.append(fullpath)
 
-    print('Found %s MaterialX files in "%s"' % (len(validDocs), opts.inputFolder))
+    if not filenames:
+        if updatedManifest:
+            print('All %i MaterialX files in "%s" are up to date' % (len(updatedManifest), opts.inputFolder))
+        else:
+            print('No MaterialX documents were found in "%s"' % (opts.inputFolder))
+        return
 
-    mxVersion = mx.getVersionIntegers()
+    print('Found %s MaterialX files in "%s"' % (len(filenames), opts.inputFolder))
+    if updatedManifest:
+        print('- Skipping %i files that are unchanged since the last run' % len(updatedManifest))
 
-    if not opts.yes:
+    if not opts.yes and not opts.dry_run:
         if opts.upgrade:
-            question = 'Would you like to upgrade all %i documents to MaterialX v%i.%i in place (y/n)?' % (len(validDocs), mxVersion[0], mxVersion[1])
+            question = 'Would you like to upgrade all %i documents to MaterialX v%i.%i in place (y/n)?' % (len(filenames), mxVersion[0], mxVersion[1])
         else:
-            question = 'Would you like to reformat all %i documents in place (y/n)?' % len(validDocs)
+            question = 'Would you like to reformat all %i documents in place (y/n)?' % len(filenames)
         answer = input(question)
         if answer != 'y' and answer != 'Y':
             return
 
-    validate = opts.validate
-    if validate:
+    if opts.validate:
         print(f'- Validate documents')
-    xml_syntax = opts.xml_syntax
-    if xml_syntax:
+    if opts.xml_syntax:
         print(f'- Check XML syntax')
-    for (filename, doc) in validDocs.items():
-        if xml_syntax:
-            xml_string = mx.writeToXmlString(doc)
-            errors = is_well_formed(xml_string)
-            if errors:
-                print(f'- Warning: Document {filename} is not well-formed XML: {errors}') 
-        if validate:
-            is_valid, errors = doc.validate()
-            if not is_valid:
-                print(f'- Warning: Document {filename} is invalid. Errors {errors}.')
-        mx.writeToXmlFile(doc, filename)
-
-    if opts.upgrade:
-        print('Upgraded %i documents to MaterialX v%i.%i' % (len(validDocs), mxVersion[0], mxVersion[1]))
+
+    # Process documents, one per task, streaming results as they complete.
+    jobs = opts.jobs if opts.jobs > 0 else (os.cpu_count() or 1)
+    tasks = [(f, opts.upgrade, opts.validate, opts.xml_syntax, opts.dry_run) for f in filenames]
+    counts = { 'formatted': 0, 'unchanged': 0, 'error': 0 }
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        if executor:
+            results = executor.map(format_file_args, tasks, chunksize=max(1, min(64, len(tasks) // (jobs * 4))))
+        else:
+            results = map(format_file_args, tasks)
+        for path, status, messages, state in results:
+            counts[status] += 1
+            for message in messages:
+                print(message)
+            if state:
+                updatedManifest[os.path.relpath(path, opts.inputFolder)] = state
+            if opts.dry_run and status == 'formatted':
+                print('- Would reformat ' + path)
+    finally:
+        if executor:
+            executor.shutdown(cancel_futures=True)
+        if opts.manifest and not opts.dry_run:
+            save_manifest(opts.manifest, optionsKey, updatedManifest)
+
+    processed = counts['formatted'] + counts['unchanged']
+    if opts.dry_run:
+        print('%i of %i documents would be reformatted' % (counts['formatted'], processed))
+    elif opts.upgrade:
+        print('Upgraded %i documents to MaterialX v%i.%i (%i already up to date)' % (counts['formatted'], mxVersion[0], mxVersion[1], counts['unchanged']))
     else:
-        print('Reformatted %i documents ' % len(validDocs))
+        print('Reformatted %i documents (%i already formatted)' % (counts['formatted'], counts['unchanged']))
+    if counts['error']:
+        print('Skipped %i documents due to errors' % counts['error'])
 
 if __name__ == '__main__':
     main()
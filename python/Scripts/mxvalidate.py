@@ -1,9 +1,17 @@
 #!/usr/bin/env python
 '''
 Verify that the given file is a valid MaterialX document.
+
+Given a folder or a glob pattern, all matching documents are validated in
+parallel against a single copy of the data libraries, and the results are
+streamed as JSON lines, followed by a summary line with aggregate counts.
 '''
 
 import argparse
+import concurrent.futures
+import glob
+import json
+import os
 import sys
 
 import MaterialX as mx
@@ -13,19 +21,23 @@ def main():
     parser.add_argument("--resolve", dest="resolve", action="store_true", help="Resolve inheritance and string substitutions.")
     parser.add_argument("--verbose", dest="verbose", action="store_true", help="Print summary of elements found in the document.")
     parser.add_argument("--stdlib", dest="stdlib", action="store_true", help="Import standard MaterialX libraries into the document.")
-    parser.add_argument(dest="inputFilename", help="Filename of the input document.")
+    parser.add_argument("--threads", dest="threads", type=int, default=0, help="Number of worker threads for validating multiple documents. Defaults to the number of CPUs.")
+    parser.add_argument(dest="inputFilename", help="Filename of the input document, or a folder or glob pattern matching multiple documents.")
     opts = parser.parse_args()
 
     # Load standard libraries if requested.
     stdlib = None
     if opts.stdlib:
-        stdlib = mx.createDocument()
         try:
-            mx.loadLibraries(mx.getDefaultDataLibraryFolders(), mx.getDefaultDataSearchPath(), stdlib)            
+            stdlib = mx.getSharedDataLibrary(mx.getDefaultDataLibraryFolders(), mx.getDefaultDataSearchPath())
         except Exception as err:
             print(err)
             sys.exit(0)
 
+    # Validate multiple documents if requested.
+    if os.path.isdir(opts.inputFilename) or glob.has_magic(opts.inputFilename):
+        sys.exit(validateDocuments(opts.inputFilename, stdlib, opts.threads))
+
     # Read and validate the source document.
     doc = mx.createDocument()
     try:
@@ -44,37 +56,79 @@ def main():
 
     # Generate verbose output if requested.
     if opts.verbose:
-        nodegraphs = doc.getNodeGraphs()
-        materials = doc.getMaterialNodes()
-        looks = doc.getLooks()
-        lookgroups = doc.getLookGroups()
-        collections = doc.getCollections()
-        nodedefs = doc.getNodeDefs()
-        implementations = doc.getImplementations()
-        geominfos = doc.getGeomInfos()
-        geompropdefs = doc.getGeomPropDefs()
-        typedefs = doc.getTypeDefs()
-        propsets = doc.getPropertySets()
-        variantsets = doc.getVariantSets()
-        backdrops = doc.getBackdrops()
-
         print("----------------------------------")
         print("Document Version: {}.{:02d}".format(*doc.getVersionIntegers()))
-        print("%4d Custom Type%s%s" % (len(typedefs), pl(typedefs), listContents(typedefs, opts.resolve)))
-        print("%4d Custom GeomProp%s%s" % (len(geompropdefs), pl(geompropdefs), listContents(geompropdefs, opts.resolve)))
-        print("%4d NodeDef%s%s" % (len(nodedefs), pl(nodedefs), listContents(nodedefs, opts.resolve)))
-        print("%4d Implementation%s%s" % (len(implementations), pl(implementations), listContents(implementations, opts.resolve)))
-        print("%4d Nodegraph%s%s" % (len(nodegraphs), pl(nodegraphs), listContents(nodegraphs, opts.resolve)))
-        print("%4d VariantSet%s%s" % (len(variantsets), pl(variantsets), listContents(variantsets, opts.resolve)))
-        print("%4d Material%s%s" % (len(materials), pl(materials), listContents(materials, opts.resolve)))
-        print("%4d Collection%s%s" % (len(collections), pl(collections), listContents(collections, opts.resolve)))
-        print("%4d GeomInfo%s%s" % (len(geominfos), pl(geominfos), listContents(geominfos, opts.resolve)))
-        print("%4d PropertySet%s%s" % (len(propsets), pl(propsets), listContents(propsets, opts.resolve)))
-        print("%4d Look%s%s" % (len(looks), pl(looks), listContents(looks, opts.resolve)))
-        print("%4d LookGroup%s%s" % (len(lookgroups), pl(lookgroups), listContents(lookgroups, opts.resolve)))
-        print("%4d Top-level backdrop%s%s" % (len(backdrops), pl(backdrops), listContents(backdrops, opts.resolve)))
+        for label, elems in getElementGroups(doc):
+            print("%4d %s%s%s" % (len(elems), label, pl(elems), listContents(elems, opts.resolve)))
         print("----------------------------------")
 
+def getElementGroups(doc):
+    """Return a list of (label, elements) pairs summarizing the top-level
+       elements of the given document."""
+    return [("Custom Type", doc.getTypeDefs()),
+            ("Custom GeomProp", doc.getGeomPropDefs()),
+            ("NodeDef", doc.getNodeDefs()),
+            ("Implementation", doc.getImplementations()),
+            ("Nodegraph", doc.getNodeGraphs()),
+            ("VariantSet", doc.getVariantSets()),
+            ("Material", doc.getMaterialNodes()),
+            ("Collection", doc.getCollections()),
+            ("GeomInfo", doc.getGeomInfos()),
+            ("PropertySet", doc.getPropertySets()),
+            ("Look", doc.getLooks()),
+            ("LookGroup", doc.getLookGroups()),
+            ("Top-level backdrop", doc.getBackdrops())]
+
+def getInputFilenames(inputPath):
+    if os.path.isdir(inputPath):
+        filenames = []
+        for root, dirs, files in os.walk(inputPath):
+            dirs.sort()
+            filenames.extend(os.path.join(root, f) for f in sorted(files) if f.endswith('.mtlx'))
+        return filenames
+    return sorted(f for f in glob.glob(inputPath, recursive=True) if os.path.isfile(f))
+
+def validateDocument(filename, stdlib):
+    """Read and validate a single document, returning a dictionary of results."""
+    result = { 'file': filename }
+    doc = mx.createDocument()
+    try:
+        mx.readFromXmlFile(doc, filename)
+    except Exception as err:
+        result.update(valid=False, error=str(err))
+        return result
+    if stdlib:
+        doc.setDataLibrary(stdlib)
+    valid, message = doc.validate()
+    result.update(valid=valid, message=message,
+                  version='{}.{:02d}'.format(*doc.getVersionIntegers()),
+                  counts={ label: len(elems) for label, elems in getElementGroups(doc) })
+    return result
+
+def validateDocuments(inputPath, stdlib, threads):
+    """Validate all documents matching the given folder or glob pattern,
+       printing results as JSON lines and returning the exit code."""
+    filenames = getInputFilenames(inputPath)
+    stats = { 'documents': len(filenames), 'valid': 0, 'invalid': 0, 'errors': 0 }
+
+    # Reading and validation release the global interpreter lock, so worker
+    # threads can share a single copy of the data libraries.
+    threads = threads if threads > 0 else (os.cpu_count() or 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threads) as executor:
+        for result in executor.map(lambda f: validateDocument(f, stdlib), filenames):
+            if 'error' in result:
+                stats['errors'] += 1
+            elif result['valid']:
+                stats['valid'] += 1
+            else:
+                stats['invalid'] += 1
+            print(json.dumps(result), flush=True)
+
+    print(json.dumps({ 'summary': stats, 'version': mx.getVersionString() }))
+    if not filenames:
+        return 2
+    return 0 if stats['valid'] == stats['documents'] else 1
+
 def listContents(elemlist, resolve):
     if len(elemlist) == 0:
         return ''
@@ -22,7 +22,6 @@ Steps:
     - numpy : For numerical operations on image data
     - matplotlib : If image preview is desired.
 """
-import ctypes
 import os
 import argparse
 
@@ -193,15 +192,10 @@ class OiioImageLoader(mx_render.ImageLoader):
                 print(f"Error: Unsupported image format for '{file_path_str}'")
                 return None
             
-            # Create MaterialX image
-            mx_image = mx_render.Image.create(spec.width, spec.height, channels, base_type)
-            mx_image.createResourceBuffer()
-            logger.debug(f"Create buffer with width: {spec.width}, height: {spec.height}, channels: {spec.nchannels} -> {channels}")
-
-            # Read the image data using the correct OIIO Python API (returns a bytes object)
+            # Read the image data using the correct OIIO Python API (returns a NumPy array)
             logger.debug(f"Reading image data from '{file_path_str}' with spec: {spec}")
             data = img_input.read_image(0, 0, 0, channels, spec.format)
-            if len(data) > 0:
+            if data is not None and data.size > 0:
                 logger.debug(f"Done Reading image data from '{file_path_str}' with spec: {spec}")
             else:
                 logger.error(f"Could not read image data.")
@@ -209,16 +203,10 @@ class OiioImageLoader(mx_render.ImageLoader):
 
             self.previewImage("Loaded MaterialX Image", data, spec.width, spec.height, channels, color_space)
 
-            # Steps:
-            # - Copy the OIIO data into the MaterialX image resource buffer            
-            resource_buffer_ptr = mx_image.getResourceBuffer()
-            bytes_per_channel = spec.format.size()
-            total_bytes = spec.width * spec.height * channels * bytes_per_channel
-            logger.info(f"Total bytes read in: {total_bytes} (width: {spec.width}, height: {spec.height}, channels: {channels}, format: {spec.format})")
-            try:
-                ctypes.memmove(resource_buffer_ptr, (ctypes.c_char * total_bytes).from_buffer_copy(data), total_bytes)
-            except Exception as e:
-                logger.error(f"Failed to update image resource buffer: {e}")
+            # Create a MaterialX image that adopts the OIIO pixel data without copying.
+            data = np.ascontiguousarray(data.reshape(spec.height, spec.width, channels))
+            mx_image = mx_render.Image.fromArray(data)
+            logger.info(f"Adopted image data (width: {spec.width}, height: {spec.height}, channels: {channels}, format: {spec.format})")
 
             img_input.close()
 
@@ -230,6 +218,31 @@ class OiioImageLoader(mx_render.ImageLoader):
         
         return None   
 
+    def probeImage(self, filePath):
+        """
+        Read the properties of an image from its header without decoding pixels (MaterialX interface method).
+
+        @param filePath (MaterialX.FilePath): Path to the image file
+        @returns MaterialX.ImageInfo: Image properties, which are invalid if the header cannot be read
+        """
+        info = mx_render.ImageInfo()
+        file_path_str = filePath.asString()
+        img_input = oiio.ImageInput.open(file_path_str)
+        if not img_input:
+            logger.error(f"Could not open '{file_path_str}' - {oiio.geterror()}")
+            return info
+
+        spec = img_input.spec()
+        base_type = self._oiio_to_materialx_type(spec.format.basetype)
+        if base_type is not None:
+            info.width = spec.width
+            info.height = spec.height
+            info.channelCount = min(spec.nchannels, 4)
+            info.baseType = base_type
+            info.colorSpace = spec.getattribute("oiio:ColorSpace") or ""
+        img_input.close()
+        return info
+
     def saveImage(self, filePath, image, verticalFlip=False):
         """
         @brief Saves an image to disk using OpenImageIO (OIIO).
@@ -256,38 +269,17 @@ class OiioImageLoader(mx_render.ImageLoader):
             logger.error(f"Unsupported MaterialX base type for OIIO: {mx_basetype}")
             return False
 
-        buffer_addr = image.getResourceBuffer()
-        np_type = self._materialx_type_to_np_type(mx_basetype)
-        if np_type is None:
-            logger.error(f"No NumPy dtype mapping for base type: {mx_basetype}")
-            return False
-
         try:
             # Steps: 
-            # - Maps the MaterialX base type to OIIO and NumPy types.
-            # - Allocates a NumPy array for the pixel data.
-            # - Copies the raw buffer from the image into the NumPy array.
+            # - Maps the MaterialX base type to OIIO types.
+            # - Views the image resource buffer as a NumPy array without copying.
             # - Optionally previews the image for debugging.
             # - Creates an OIIO ImageOutput and writes the image to disk.
             #
-            base_stride = image.getBaseStride()  # bytes per channel element
-            total_bytes = width * height * src_channels * base_stride
-
-            buf_type = (ctypes.c_char * total_bytes)
-            buf = buf_type.from_address(buffer_addr)
-
-            np_buffer = np.frombuffer(buf, dtype=np_type)
-
-            # Validate total elements before reshape to catch mismatches early
-            expected_elems = width * height * src_channels
-            if np_buffer.size != expected_elems:
-                logger.error(f"Buffer element count mismatch: got {np_buffer.size}, expected {expected_elems}.")
-                return False
-
-            np_buffer = np_buffer.reshape((height, width, src_channels))
+            np_buffer = np.asarray(image)
 
             # Keep only up to RGBA
-            pixels = np_buffer[..., :channels].copy()
+            pixels = np_buffer[..., :channels]
 
             if verticalFlip:
                 logger.info("Applying vertical flip before saving image.")
@@ -357,18 +349,6 @@ class OiioImageLoader(mx_render.ImageLoader):
         logger.debug(f"MaterialX type mapping: {mx_basetype} to {return_val}")
         return return_val
 
-    def _materialx_type_to_np_type(self, mx_basetype):
-        """Map MaterialX base type to NumPy dtype with explicit widths."""
-        type_mapping = {
-            mx_render.BaseType.UINT8:  np.uint8,
-            mx_render.BaseType.UINT16: np.uint16,
-            mx_render.BaseType.INT8:   np.int8,
-            mx_render.BaseType.INT16:  np.int16,
-            mx_render.BaseType.HALF:   np.float16,
-            mx_render.BaseType.FLOAT:  np.float32,
-        }
-        return type_mapping.get(mx_basetype, None)
-
 
 def test_load_save():
     """
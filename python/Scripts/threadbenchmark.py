@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+'''
+Measure how MaterialX document processing scales across Python threads.
+
+Each task reads a document, validates it against a shared data library, and
+generates GLSL shaders for its renderable elements.  The tasks are run through
+a ThreadPoolExecutor at increasing thread counts, and the speedup over a single
+thread is reported for each count.  Since these calls release the Python global
+interpreter lock, the speedup should approach the number of available cores.
+'''
+
+import sys, os, argparse, time, threading
+import concurrent.futures
+
+import MaterialX as mx
+import MaterialX.PyMaterialXGenShader as mx_gen_shader
+import MaterialX.PyMaterialXGenGlsl as mx_gen_glsl
+
+# Per-thread shader generator and context, created on first use by each worker thread.
+_threadState = threading.local()
+
+def getGenContext(searchPath):
+    context = getattr(_threadState, 'context', None)
+    if context is None:
+        _threadState.generator = mx_gen_glsl.GlslShaderGenerator.create()
+        context = mx_gen_shader.GenContext(_threadState.generator)
+        context.registerSourceCodeSearchPath(searchPath)
+        _threadState.context = context
+    return _threadState.generator, context
+
+def processDocument(filename, stdlib, searchPath):
+    """Read, validate and generate shaders for a single document, returning
+       the number of shaders generated."""
+    doc = mx.createDocument()
+    mx.readFromXmlFile(doc, filename)
+    doc.setDataLibrary(stdlib)
+    doc.validate()
+
+    generator, context = getGenContext(searchPath)
+    shaderCount = 0
+    for elem in mx_gen_shader.findRenderableElements(doc):
+        try:
+            if generator.generate(elem.getName(), elem, context):
+                shaderCount += 1
+        except LookupError:
+            pass
+    return shaderCount
+
+def runBenchmark(filenames, stdlib, searchPath, threadCount):
+    start = time.perf_counter()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=threadCount) as executor:
+        shaderCount = sum(executor.map(lambda f: processDocument(f, stdlib, searchPath), filenames))
+    return time.perf_counter() - start, shaderCount
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure how MaterialX document processing scales across Python threads.")
+    parser.add_argument("--path", dest="paths", action='append', nargs='+', help="An additional absolute search path location (e.g. '/projects/MaterialX')")
+    parser.add_argument("--library", dest="libraries", action='append', nargs='+', help="An additional relative path to a custom data library folder (e.g. 'libraries/custom')")
+    parser.add_argument("--count", dest="count", type=int, default=64, help="Number of documents to process per run, repeating the inputs as needed. Defaults to 64.")
+    parser.add_argument("--threads", dest="threads", type=int, default=0, help="Maximum number of threads to measure. Defaults to the number of CPUs.")
+    parser.add_argument("--minSpeedup", dest="minSpeedup", type=float, default=0.0, help="Exit with an error if the speedup at the maximum thread count is below this value.")
+    parser.add_argument(dest="inputPath", help="Filename of a document, or folder of documents, to process.")
+    opts = parser.parse_args()
+
+    # Gather input documents.
+    filenames = []
+    if os.path.isdir(opts.inputPath):
+        for root, dirs, files in os.walk(opts.inputPath):
+            filenames.extend(os.path.join(root, f) for f in sorted(files) if f.endswith('.mtlx'))
+    else:
+        filenames.append(opts.inputPath)
+    if not filenames:
+        print('No documents found at: ' + opts.inputPath)
+        sys.exit(-1)
+    filenames = [filenames[i % len(filenames)] for i in range(max(opts.count, 1))]
+
+    # Load the shared data library once.
+    searchPath = mx.getDefaultDataSearchPath()
+    if opts.paths:
+        for pathList in opts.paths:
+            for path in pathList:
+                searchPath.append(path)
+    libraryFolders = mx.getDefaultDataLibraryFolders()
+    if opts.libraries:
+        for libraryList in opts.libraries:
+            for library in libraryList:
+                libraryFolders.append(library)
+    stdlib = mx.getSharedDataLibrary(libraryFolders, searchPath)
+
+    # Measure each thread count, doubling up to the maximum.
+    maxThreads = opts.threads if opts.threads > 0 else (os.cpu_count() or 1)
+    threadCounts = []
+    threadCount = 1
+    while threadCount < maxThreads:
+        threadCounts.append(threadCount)
+        threadCount *= 2
+    threadCounts.append(maxThreads)
+
+    print('Processing %d documents with up to %d threads' % (len(filenames), maxThreads))
+    baseTime = None
+    speedup = 1.0
+    for threadCount in threadCounts:
+        elapsed, shaderCount = runBenchmark(filenames, stdlib, searchPath, threadCount)
+        baseTime = baseTime or elapsed
+        speedup = baseTime / elapsed
+        print('%3d threads: %8.3f s, %5d shaders, speedup %.2fx' % (threadCount, elapsed, shaderCount, speedup))
+
+    if speedup < opts.minSpeedup:
+        print('Speedup of %.2fx is below the required %.2fx' % (speedup, opts.minSpeedup))
+        sys.exit(-1)
+
+if __name__ == '__main__':
+    main()
@@ -69,8 +69,8 @@ def main():
         resolver = doc.createStringResolver()
         resolver.setUdimString(udimSet[0])
         imageHandler.setFilenameResolver(resolver)
-    imageVec = imageHandler.getReferencedImages(doc)
-    bakeWidth, bakeHeight = mx_render.getMaxDimensions(imageVec)
+    imageInfoVec = imageHandler.getReferencedImageInfo(doc)
+    bakeWidth, bakeHeight = mx_render.getMaxDimensions(imageInfoVec)
 
     # Apply baking resolution settings.
     if opts.width > 0:
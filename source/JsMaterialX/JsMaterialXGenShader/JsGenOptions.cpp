@@ -37,6 +37,7 @@ EMSCRIPTEN_BINDINGS(GenOptions)
         .property("addUpstreamDependencies", &mx::GenOptions::addUpstreamDependencies)
         .property("emitColorTransforms", &mx::GenOptions::emitColorTransforms)
         .property("elideConstantNodes", &mx::GenOptions::elideConstantNodes)
+        .property("foldConstantNodes", &mx::GenOptions::foldConstantNodes)
         .property("premultipliedBsdfAdd", &mx::GenOptions::premultipliedBsdfAdd)
         .property("distributeLayerOverBsdfMix", &mx::GenOptions::distributeLayerOverBsdfMix)
         .property("hwTransparency", &mx::GenOptions::hwTransparency)
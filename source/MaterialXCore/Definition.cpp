@@ -131,11 +131,11 @@ StringMap NodeDef::getInputHints() const
     return hints;
 }
 
-bool NodeDef::validate(string* message) const
+bool NodeDef::validateLocal(string* message) const
 {
     bool res = true;
     validateRequire(!hasType(), res, message, "Nodedef should not have a type but an explicit output");
-    return InterfaceElement::validate(message) && res;
+    return InterfaceElement::validateLocal(message) && res;
 }
 
 bool NodeDef::isVersionCompatible(const string& version) const
@@ -177,11 +177,11 @@ NodeDefPtr Implementation::getNodeDef() const
     return resolveNameReference<NodeDef>(getNodeDefString());
 }
 
-bool Implementation::validate(string* message) const
+bool Implementation::validateLocal(string* message) const
 {
     bool res = true;
     validateRequire(!hasVersionString(), res, message, "Implementation elements do not support version strings");
-    return InterfaceElement::validate(message) && res;
+    return InterfaceElement::validateLocal(message) && res;
 }
 
 ConstInterfaceElementPtr Implementation::getDeclaration(const string&) const
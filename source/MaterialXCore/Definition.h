@@ -160,9 +160,9 @@ class MX_CORE_API NodeDef : public InterfaceElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
     /// @name Utility
@@ -288,9 +288,9 @@ class MX_CORE_API Implementation : public InterfaceElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
     /// @name Utility
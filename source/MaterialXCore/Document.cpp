@@ -5,8 +5,11 @@
 
 #include <MaterialXCore/Document.h>
 
+#include <algorithm>
+#include <atomic>
 #include <mutex>
 #include <shared_mutex>
+#include <unordered_set>
 
 MATERIALX_NAMESPACE_BEGIN
 
@@ -22,6 +25,43 @@ DocumentPtr createDocument()
     return Document::createDocument<Document>();
 }
 
+namespace
+{
+
+// Return true if the given element is still present in the given document.
+bool isInDocument(ConstElementPtr elem, ConstDocumentPtr doc)
+{
+    for (ConstElementPtr parent = elem->getParent(); parent; parent = parent->getParent())
+    {
+        if (parent->getChild(elem->getName()) != elem)
+        {
+            return false;
+        }
+        elem = parent;
+    }
+    return elem == doc;
+}
+
+// Remove the given element from a cache map entry.
+template <class T> void eraseCacheEntry(std::unordered_map<string, vector<shared_ptr<T>>>& map, const string& key, const Element* elem)
+{
+    auto it = map.find(key);
+    if (it != map.end())
+    {
+        vector<shared_ptr<T>>& vec = it->second;
+        vec.erase(std::remove_if(vec.begin(), vec.end(), [elem](const shared_ptr<T>& entry)
+        {
+            return entry.get() == elem;
+        }), vec.end());
+        if (vec.empty())
+        {
+            map.erase(it);
+        }
+    }
+}
+
+} // anonymous namespace
+
 //
 // Document cache
 //
@@ -30,7 +70,9 @@ class Document::Cache
 {
   public:
     Cache() :
-        _valid(false)
+        _valid(false),
+        _hitCount(0),
+        _rebuildCount(0)
     {
     }
     ~Cache() = default;
@@ -39,13 +81,48 @@ class Document::Cache
     {
         std::unique_lock<std::shared_mutex> lock(_mutex);
         _doc = document;
-        _valid = false;
+        invalidateLocked();
     }
 
     void invalidate()
     {
         std::unique_lock<std::shared_mutex> lock(_mutex);
-        _valid = false;
+        invalidateLocked();
+    }
+
+    // Record an element whose entries are to be added on the next lookup.
+    void addElement(ConstElementPtr elem)
+    {
+        std::unique_lock<std::shared_mutex> lock(_mutex);
+        if (_valid)
+        {
+            _pendingElements[elem.get()] = elem;
+        }
+    }
+
+    // Remove the entries for the given element and its descendants.
+    void removeElement(ConstElementPtr elem)
+    {
+        std::unique_lock<std::shared_mutex> lock(_mutex);
+        if (_valid)
+        {
+            for (ElementPtr descendant : elem->traverseTree())
+            {
+                removeEntries(descendant.get());
+            }
+        }
+    }
+
+    // Remove the entries for the given element, which are to be added again
+    // on the next lookup.
+    void updateElement(ConstElementPtr elem)
+    {
+        std::unique_lock<std::shared_mutex> lock(_mutex);
+        if (_valid)
+        {
+            removeEntries(elem.get());
+            _pendingElements[elem.get()] = elem;
+        }
     }
 
     vector<PortElementPtr> getMatchingPorts(const string& nodeName)
@@ -69,13 +146,38 @@ class Document::Cache
         return (it != _implementationMap.end()) ? it->second : vector<InterfaceElementPtr>();
     }
 
+    size_t getHitCount() const
+    {
+        return _hitCount;
+    }
+
+    size_t getRebuildCount() const
+    {
+        return _rebuildCount;
+    }
+
   private:
+    // Keys under which an element is stored in each map.
+    struct EntryKeys
+    {
+        string port;
+        string nodeDef;
+        string implementation;
+    };
+
+    void invalidateLocked()
+    {
+        _valid = false;
+        _pendingElements.clear();
+    }
+
     std::shared_lock<std::shared_mutex> refreshWithLock()
     {
         std::shared_lock<std::shared_mutex> lock(_mutex);
 
-        if (_valid)
+        if (_valid && _pendingElements.empty())
         {
+            _hitCount++;
             return lock;
         }
 
@@ -83,14 +185,22 @@ class Document::Cache
 
         {
             std::unique_lock<std::shared_mutex> writeLock(_mutex);
+            auto doc = _doc.lock();
             if (!_valid)
             {
-                auto doc = _doc.lock();
                 if (doc)
                 {
                     rebuild(doc);
                 }
             }
+            else
+            {
+                _hitCount++;
+                if (doc)
+                {
+                    update(doc);
+                }
+            }
         }
 
         lock.lock();
@@ -103,55 +213,356 @@ class Document::Cache
         _portElementMap.clear();
         _nodeDefMap.clear();
         _implementationMap.clear();
+        _entryKeys.clear();
+        _pendingElements.clear();
 
         // Traverse the document to build a new cache.
         for (ElementPtr elem : doc->traverseTree())
         {
-            const string& nodeName = elem->getAttribute(PortElement::NODE_NAME_ATTRIBUTE);
-            const string& nodeGraphName = elem->getAttribute(PortElement::NODE_GRAPH_ATTRIBUTE);
-            const string& nodeString = elem->getAttribute(NodeDef::NODE_ATTRIBUTE);
-            const string& nodeDefString = elem->getAttribute(InterfaceElement::NODE_DEF_ATTRIBUTE);
+            addEntries(elem);
+        }
 
-            const string& portKey = !nodeName.empty() ? nodeName : nodeGraphName;
-            if (!portKey.empty())
+        _valid = true;
+        _rebuildCount++;
+    }
+
+    // Add entries for pending elements that remain in the document.
+    void update(DocumentPtr doc)
+    {
+        for (const auto& pair : _pendingElements)
+        {
+            ConstElementPtr constElem = pair.second.lock();
+            if (constElem && isInDocument(constElem, doc))
             {
-                PortElementPtr portElem = elem->asA<PortElement>();
-                if (portElem)
-                {
-                    _portElementMap[portElem->getQualifiedName(portKey)].push_back(portElem);
-                }
+                ElementPtr elem = std::const_pointer_cast<Element>(constElem);
+                removeEntries(elem.get());
+                addEntries(elem);
+            }
+        }
+        _pendingElements.clear();
+    }
+
+    void addEntries(ElementPtr elem)
+    {
+        const string& nodeName = elem->getAttribute(PortElement::NODE_NAME_ATTRIBUTE);
+        const string& nodeGraphName = elem->getAttribute(PortElement::NODE_GRAPH_ATTRIBUTE);
+        const string& nodeString = elem->getAttribute(NodeDef::NODE_ATTRIBUTE);
+        const string& nodeDefString = elem->getAttribute(InterfaceElement::NODE_DEF_ATTRIBUTE);
+
+        EntryKeys keys;
+        const string& portKey = !nodeName.empty() ? nodeName : nodeGraphName;
+        if (!portKey.empty())
+        {
+            PortElementPtr portElem = elem->asA<PortElement>();
+            if (portElem)
+            {
+                keys.port = portElem->getQualifiedName(portKey);
+                _portElementMap[keys.port].push_back(portElem);
             }
-            if (!nodeString.empty())
+        }
+        if (!nodeString.empty())
+        {
+            NodeDefPtr nodeDef = elem->asA<NodeDef>();
+            if (nodeDef)
             {
-                NodeDefPtr nodeDef = elem->asA<NodeDef>();
-                if (nodeDef)
-                {
-                    _nodeDefMap[nodeDef->getQualifiedName(nodeString)].push_back(nodeDef);
-                }
+                keys.nodeDef = nodeDef->getQualifiedName(nodeString);
+                _nodeDefMap[keys.nodeDef].push_back(nodeDef);
             }
-            if (!nodeDefString.empty())
+        }
+        if (!nodeDefString.empty())
+        {
+            InterfaceElementPtr interface = elem->asA<InterfaceElement>();
+            if (interface)
             {
-                InterfaceElementPtr interface = elem->asA<InterfaceElement>();
-                if (interface)
+                if (interface->isA<Implementation>() || interface->isA<NodeGraph>())
                 {
-                    if (interface->isA<Implementation>() || interface->isA<NodeGraph>())
-                    {
-                        _implementationMap[interface->getQualifiedName(nodeDefString)].push_back(interface);
-                    }
+                    keys.implementation = interface->getQualifiedName(nodeDefString);
+                    _implementationMap[keys.implementation].push_back(interface);
                 }
             }
         }
 
-        _valid = true;
+        if (!keys.port.empty() || !keys.nodeDef.empty() || !keys.implementation.empty())
+        {
+            _entryKeys[elem.get()] = keys;
+        }
+    }
+
+    void removeEntries(const Element* elem)
+    {
+        auto it = _entryKeys.find(elem);
+        if (it == _entryKeys.end())
+        {
+            return;
+        }
+        const EntryKeys& keys = it->second;
+        if (!keys.port.empty())
+        {
+            eraseCacheEntry(_portElementMap, keys.port, elem);
+        }
+        if (!keys.nodeDef.empty())
+        {
+            eraseCacheEntry(_nodeDefMap, keys.nodeDef, elem);
+        }
+        if (!keys.implementation.empty())
+        {
+            eraseCacheEntry(_implementationMap, keys.implementation, elem);
+        }
+        _entryKeys.erase(it);
     }
 
   private:
     weak_ptr<Document> _doc;
     mutable std::shared_mutex _mutex;
     bool _valid;
+    std::atomic<size_t> _hitCount;
+    std::atomic<size_t> _rebuildCount;
     std::unordered_map<string, std::vector<PortElementPtr>> _portElementMap;
     std::unordered_map<string, std::vector<NodeDefPtr>> _nodeDefMap;
     std::unordered_map<string, std::vector<InterfaceElementPtr>> _implementationMap;
+    std::unordered_map<const Element*, EntryKeys> _entryKeys;
+    std::unordered_map<const Element*, weak_ptr<const Element>> _pendingElements;
+};
+
+//
+// Document validation state
+//
+
+class Document::ValidationState
+{
+  public:
+    ValidationState() :
+        _hasBaseline(false),
+        _fullValidation(false)
+    {
+    }
+    ~ValidationState() = default;
+
+    // Record a change to the given element, to be re-checked in the next
+    // incremental validation.
+    void markElement(ConstElementPtr elem)
+    {
+        if (!isTracking() || !elem)
+        {
+            return;
+        }
+        if (hasGlobalDependents(elem))
+        {
+            markAll();
+            return;
+        }
+        _dirtyElements[elem.get()] = elem;
+    }
+
+    // Record a change to the set of elements with the given element's name,
+    // whose connected ports are to be re-checked.
+    void markName(ConstElementPtr elem)
+    {
+        if (isTracking())
+        {
+            _changedNames.insert(elem->getQualifiedName(elem->getName()));
+        }
+    }
+
+    // Require a complete validation of the document.
+    void markAll()
+    {
+        if (isTracking())
+        {
+            _fullValidation = true;
+            _dirtyElements.clear();
+            _changedNames.clear();
+        }
+    }
+
+    bool validate(DocumentPtr doc, string* message)
+    {
+        if (!_hasBaseline || _fullValidation || doc->getDataLibrary() != _dataLibrary)
+        {
+            _failures.clear();
+            for (ElementPtr elem : doc->traverseTree())
+            {
+                validateElement(elem);
+            }
+        }
+        else
+        {
+            // Gather the changed elements and their dependents.
+            std::unordered_set<ConstElementPtr> elems = { doc };
+            std::unordered_set<ConstElementPtr> graphs;
+            StringSet names = _changedNames;
+            for (const auto& pair : _dirtyElements)
+            {
+                ConstElementPtr elem = pair.second.lock();
+                if (elem && isInDocument(elem, doc))
+                {
+                    addDependents(elem, elems, graphs, names);
+                }
+            }
+            for (ConstElementPtr graph : graphs)
+            {
+                for (ConstElementPtr child : graph->getChildren())
+                {
+                    if (child->isA<Output>() || child->isA<Backdrop>())
+                    {
+                        elems.insert(child);
+                    }
+                }
+            }
+            for (const string& name : names)
+            {
+                for (PortElementPtr port : doc->getMatchingPorts(name))
+                {
+                    elems.insert(port);
+                    elems.insert(port->getParent());
+                }
+            }
+
+            // Discard results for elements no longer in the document.
+            for (auto it = _failures.begin(); it != _failures.end();)
+            {
+                ConstElementPtr elem = it->second.first.lock();
+                it = (elem && isInDocument(elem, doc)) ? std::next(it) : _failures.erase(it);
+            }
+
+            for (ConstElementPtr elem : elems)
+            {
+                validateElement(elem);
+            }
+        }
+
+        _hasBaseline = true;
+        _fullValidation = false;
+        _dataLibrary = doc->getDataLibrary();
+        _dirtyElements.clear();
+        _changedNames.clear();
+
+        if (message)
+        {
+            vector<std::pair<string, const string*>> errors;
+            for (const auto& pair : _failures)
+            {
+                errors.emplace_back(pair.second.first.lock()->getNamePath(), &pair.second.second);
+            }
+            std::sort(errors.begin(), errors.end());
+            for (const auto& error : errors)
+            {
+                *message += *error.second;
+            }
+        }
+        return _failures.empty();
+    }
+
+  private:
+    // Changes are only tracked once a baseline validation has been made.
+    bool isTracking() const
+    {
+        return _hasBaseline && !_fullValidation;
+    }
+
+    void validateElement(ConstElementPtr elem)
+    {
+        string message;
+        if (elem->validateLocal(&message))
+        {
+            _failures.erase(elem.get());
+        }
+        else
+        {
+            _failures[elem.get()] = std::make_pair(weak_ptr<const Element>(elem), message);
+        }
+    }
+
+    // Return true if changes to the given element may affect the validity
+    // of arbitrary elements in the document.
+    static bool hasGlobalDependents(ConstElementPtr elem)
+    {
+        for (ConstElementPtr scope = elem; scope && !scope->isA<Document>(); scope = scope->getParent())
+        {
+            if (scope->isA<NodeDef>() || scope->isA<Implementation>() || scope->isA<TypeDef>() ||
+                scope->isA<UnitDef>() || scope->isA<UnitTypeDef>() || scope->isA<GeomPropDef>() ||
+                scope->isA<TargetDef>() || scope->isA<AttributeDef>() || scope->isA<Collection>() ||
+                scope->hasInheritString())
+            {
+                return true;
+            }
+            ConstNodeGraphPtr graph = scope->asA<NodeGraph>();
+            if (graph && graph->hasNodeDefString())
+            {
+                return true;
+            }
+            if (scope->isA<Output>() && scope->getParent() && scope->getParent()->isA<Document>())
+            {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    static void addDependents(ConstElementPtr elem,
+                              std::unordered_set<ConstElementPtr>& elems,
+                              std::unordered_set<ConstElementPtr>& graphs,
+                              StringSet& names)
+    {
+        // The element, its ancestors, and its children unless it is a graph,
+        // in which case only its outputs and backdrops are affected.
+        elems.insert(elem);
+        if (elem->isA<GraphElement>())
+        {
+            graphs.insert(elem);
+        }
+        else
+        {
+            for (ConstElementPtr child : elem->getChildren())
+            {
+                elems.insert(child);
+            }
+        }
+        if (elem->isA<Document>())
+        {
+            return;
+        }
+        for (ConstElementPtr parent = elem->getParent(); parent; parent = parent->getParent())
+        {
+            elems.insert(parent);
+        }
+
+        // Ports connected to the element or its parent.
+        names.insert(elem->getQualifiedName(elem->getName()));
+        ConstElementPtr parent = elem->getParent();
+        if (parent)
+        {
+            names.insert(parent->getQualifiedName(parent->getName()));
+        }
+
+        // Elements referencing the interface of a nodegraph.
+        if (parent && parent->isA<NodeGraph>() && (elem->isA<Input>() || elem->isA<Token>()))
+        {
+            for (ElementPtr descendant : parent->traverseTree())
+            {
+                elems.insert(descendant);
+            }
+        }
+
+        // Outputs and backdrops of the enclosing graph, whose upstream cycles
+        // and contained elements may be affected.
+        for (ConstElementPtr scope = parent; scope; scope = scope->getParent())
+        {
+            if (scope->isA<GraphElement>())
+            {
+                graphs.insert(scope);
+                break;
+            }
+        }
+    }
+
+  private:
+    bool _hasBaseline;
+    bool _fullValidation;
+    ConstDocumentPtr _dataLibrary;
+    std::unordered_map<const Element*, weak_ptr<const Element>> _dirtyElements;
+    StringSet _changedNames;
+    std::unordered_map<const Element*, std::pair<weak_ptr<const Element>, string>> _failures;
 };
 
 //
@@ -160,7 +571,8 @@ class Document::Cache
 
 Document::Document(ElementPtr parent, const string& name) :
     GraphElement(parent, CATEGORY, name),
-    _cache(std::make_unique<Cache>())
+    _cache(std::make_unique<Cache>()),
+    _validationState(std::make_unique<ValidationState>())
 {
 }
 
@@ -403,13 +815,18 @@ vector<InterfaceElementPtr> Document::getMatchingImplementations(const string& n
     return matchingImplementations;
 }
 
-bool Document::validate(string* message) const
+bool Document::validateLocal(string* message) const
 {
     bool res = true;
     std::pair<int, int> expectedVersion(MATERIALX_MAJOR_VERSION, MATERIALX_MINOR_VERSION);
     validateRequire(getVersionIntegers() >= expectedVersion, res, message, "Unsupported document version");
     validateRequire(getVersionIntegers() <= expectedVersion, res, message, "Future document version");
-    return GraphElement::validate(message) && res;
+    return GraphElement::validateLocal(message) && res;
+}
+
+bool Document::validateIncremental(string* message)
+{
+    return _validationState->validate(getDocument(), message);
 }
 
 void Document::invalidateCache()
@@ -417,6 +834,90 @@ void Document::invalidateCache()
     _cache->invalidate();
 }
 
+size_t Document::getCacheHitCount() const
+{
+    return _cache->getHitCount();
+}
+
+size_t Document::getCacheRebuildCount() const
+{
+    return _cache->getRebuildCount();
+}
+
+void Document::onAddElement(ConstElementPtr elem)
+{
+    _cache->addElement(elem);
+    _validationState->markElement(elem);
+    _validationState->markName(elem);
+}
+
+void Document::onRemoveElement(ConstElementPtr elem)
+{
+    _cache->removeElement(elem);
+    _validationState->markElement(elem);
+    _validationState->markElement(elem->getParent());
+    _validationState->markName(elem);
+
+    // Elements referencing a removed nodegraph interface are re-checked as well.
+    ConstElementPtr parent = elem->getParent();
+    if (parent && parent->isA<NodeGraph>() && (elem->isA<Input>() || elem->isA<Token>()))
+    {
+        for (ElementPtr descendant : parent->traverseTree())
+        {
+            _validationState->markElement(descendant);
+        }
+    }
+}
+
+void Document::onRenameElement(ConstElementPtr elem)
+{
+    // Cache entries are keyed by references to elements rather than by
+    // their own names, so they are unaffected by renaming.
+    _validationState->markElement(elem);
+    _validationState->markName(elem);
+}
+
+void Document::onSetAttribute(ConstElementPtr elem, const string& attrib)
+{
+    if (attrib == NAMESPACE_ATTRIBUTE)
+    {
+        _cache->invalidate();
+    }
+    else if (attrib == PortElement::NODE_NAME_ATTRIBUTE || attrib == PortElement::NODE_GRAPH_ATTRIBUTE ||
+             attrib == NodeDef::NODE_ATTRIBUTE || attrib == InterfaceElement::NODE_DEF_ATTRIBUTE)
+    {
+        _cache->updateElement(elem);
+    }
+    if (attrib == INHERIT_ATTRIBUTE || (attrib == NodeGraph::NODE_DEF_ATTRIBUTE && elem->isA<NodeGraph>()))
+    {
+        _validationState->markAll();
+    }
+    else
+    {
+        _validationState->markElement(elem);
+    }
+}
+
+void Document::onReplaceContent(ConstElementPtr elem)
+{
+    if (elem->isA<Document>())
+    {
+        _cache->invalidate();
+        _validationState->markAll();
+    }
+    else
+    {
+        // Existing descendants may be retained by the new content, so all
+        // are queued to be added again on the next lookup.
+        _cache->removeElement(elem);
+        for (ElementPtr descendant : elem->traverseTree())
+        {
+            _cache->addElement(descendant);
+        }
+        _validationState->markElement(elem);
+    }
+}
+
 //
 // Deprecated methods
 //
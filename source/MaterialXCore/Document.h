@@ -672,12 +672,24 @@ class MX_CORE_API Document : public GraphElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given document is consistent with the MaterialX
-    /// specification.
+    /// Validate that the given document, excluding its descendants, is
+    /// consistent with the MaterialX specification.  The complete document
+    /// is validated with Element::validate.
     /// @param message An optional output string, to which a description of
     ///    each error will be appended.
     /// @return True if the document passes all tests, false otherwise.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
+
+    /// Validate the document incrementally, re-checking only the elements
+    /// that have changed since the previous call, along with the elements
+    /// whose validity depends on them.  The first call validates the complete
+    /// document, and changes to definitions, inheritance or the data library
+    /// also trigger a complete validation.
+    /// @param message An optional output string, to which a description of
+    ///    each error in the document will be appended, in the same format as
+    ///    Document::validate, ordered by element name path.
+    /// @return True if the document passes all tests, false otherwise.
+    bool validateIncremental(string* message = nullptr);
 
     /// @}
     /// @name Utility
@@ -686,6 +698,13 @@ class MX_CORE_API Document : public GraphElement
     /// Invalidate cached data for optimized lookups within the given document.
     void invalidateCache();
 
+    /// Return the number of lookups served by the document cache without a
+    /// complete rebuild, including lookups that applied incremental updates.
+    size_t getCacheHitCount() const;
+
+    /// Return the number of complete rebuilds of the document cache.
+    size_t getCacheRebuildCount() const;
+
     /// @}
 
     //
@@ -700,12 +719,25 @@ class MX_CORE_API Document : public GraphElement
     static const string CMS_ATTRIBUTE;
     static const string CMS_CONFIG_ATTRIBUTE;
 
+  protected:
+    friend class Element;
+
+    // Notifications of changes to the elements of this document, used to
+    // maintain cached data.
+    void onAddElement(ConstElementPtr elem);
+    void onRemoveElement(ConstElementPtr elem);
+    void onRenameElement(ConstElementPtr elem);
+    void onSetAttribute(ConstElementPtr elem, const string& attrib);
+    void onReplaceContent(ConstElementPtr elem);
+
   private:
     class Cache;
+    class ValidationState;
 
   private:
     ConstDocumentPtr _dataLibrary;
     std::unique_ptr<Cache> _cache;
+    std::unique_ptr<ValidationState> _validationState;
 };
 
 /// Create a new Document.
@@ -89,7 +89,7 @@ void Element::setName(const string& name)
         throw Exception("Element name is not unique at the given scope: " + name);
     }
 
-    getDocument()->invalidateCache();
+    getDocument()->onRenameElement(getSelf());
 
     if (parent)
     {
@@ -135,7 +135,7 @@ ElementPtr Element::getDescendant(const string& namePath) const
 
 void Element::registerChildElement(ElementPtr child)
 {
-    getDocument()->invalidateCache();
+    getDocument()->onAddElement(child);
 
     _childMap[child->getName()] = child;
     _childOrder.push_back(child);
@@ -143,7 +143,7 @@ void Element::registerChildElement(ElementPtr child)
 
 void Element::unregisterChildElement(ElementPtr child)
 {
-    getDocument()->invalidateCache();
+    getDocument()->onRemoveElement(child);
 
     _childMap.erase(child->getName());
     _childOrder.erase(
@@ -192,7 +192,7 @@ void Element::removeChild(const string& name)
 
 void Element::setAttribute(const string& attrib, const string& value)
 {
-    getDocument()->invalidateCache();
+    getDocument()->onSetAttribute(getSelf(), attrib);
 
     if (!_attributeMap.count(attrib))
     {
@@ -206,7 +206,7 @@ void Element::removeAttribute(const string& attrib)
     StringMap::iterator it = _attributeMap.find(attrib);
     if (it != _attributeMap.end())
     {
-        getDocument()->invalidateCache();
+        getDocument()->onSetAttribute(getSelf(), attrib);
 
         _attributeMap.erase(it);
         _attributeOrder.erase(
@@ -524,7 +524,7 @@ InheritanceIterator Element::traverseInheritance() const
 
 void Element::copyContentFrom(const ConstElementPtr& source)
 {
-    getDocument()->invalidateCache();
+    getDocument()->onReplaceContent(getSelf());
 
     _sourceUri = source->_sourceUri;
     _attributeMap = source->_attributeMap;
@@ -549,7 +549,7 @@ void Element::copyContentFrom(const ConstElementPtr& source)
 
 void Element::clearContent()
 {
-    getDocument()->invalidateCache();
+    getDocument()->onReplaceContent(getSelf());
 
     _sourceUri.clear();
     _attributeMap.clear();
@@ -559,6 +559,16 @@ void Element::clearContent()
 }
 
 bool Element::validate(string* message) const
+{
+    bool res = validateLocal(message);
+    for (auto child : getChildren())
+    {
+        res = child->validate(message) && res;
+    }
+    return res;
+}
+
+bool Element::validateLocal(string* message) const
 {
     bool res = true;
     validateRequire(isValidName(getName()), res, message, "Invalid element name");
@@ -567,10 +577,6 @@ bool Element::validate(string* message) const
         bool validInherit = getInheritsFrom() && getInheritsFrom()->getCategory() == getCategory();
         validateRequire(validInherit, res, message, "Invalid element inheritance");
     }
-    for (auto child : getChildren())
-    {
-        res = child->validate(message) && res;
-    }
     validateRequire(!hasInheritanceCycle(), res, message, "Cycle in element inheritance chain");
     return res;
 }
@@ -782,7 +788,7 @@ bool ValueElement::isAttributeEquivalent(ConstElementPtr rhs, const string& attr
     return true;
 }
 
-bool ValueElement::validate(string* message) const
+bool ValueElement::validateLocal(string* message) const
 {
     bool res = true;
     if (hasType() && hasValueString())
@@ -844,7 +850,7 @@ bool ValueElement::validate(string* message) const
         }
         validateRequire(foundUnit, res, message, "Unit definition does not exist in document");
     }
-    return TypedElement::validate(message) && res;
+    return TypedElement::validateLocal(message) && res;
 }
 
 //
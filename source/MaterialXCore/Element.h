@@ -758,6 +758,12 @@ class MX_CORE_API Element : public std::enable_shared_from_this<Element>
     /// consistent with the MaterialX specification.
     virtual bool validate(string* message = nullptr) const;
 
+    /// Validate that the given element, excluding its descendants, is
+    /// consistent with the MaterialX specification.  Subclasses override
+    /// this method with the checks specific to their elements, and the
+    /// validate method applies it to each element of the tree.
+    virtual bool validateLocal(string* message = nullptr) const;
+
     /// @}
     /// @name Utility
     /// @{
@@ -1136,9 +1142,9 @@ class MX_CORE_API ValueElement : public TypedElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
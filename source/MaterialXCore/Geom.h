@@ -213,9 +213,9 @@ class MX_CORE_API GeomElement : public Element
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
@@ -552,9 +552,9 @@ class MX_CORE_API Collection : public Element
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
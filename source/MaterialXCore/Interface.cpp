@@ -145,7 +145,7 @@ OutputPtr PortElement::getConnectedOutput() const
     return result;
 }
 
-bool PortElement::validate(string* message) const
+bool PortElement::validateLocal(string* message) const
 {
     bool res = true;
 
@@ -204,7 +204,7 @@ bool PortElement::validate(string* message) const
             validateRequire(getType() == connectedNode->getType(), res, message, "Mismatched types in port connection");
         }
     }
-    return ValueElement::validate(message) && res;
+    return ValueElement::validateLocal(message) && res;
 }
 
 //
@@ -295,7 +295,7 @@ GeomPropDefPtr Input::getDefaultGeomProp() const
     return nullptr;
 }
 
-bool Input::validate(string* message) const
+bool Input::validateLocal(string* message) const
 {
     bool res = true;
     ConstElementPtr parent = getParent();
@@ -320,7 +320,7 @@ bool Input::validate(string* message) const
     {
         validateRequire(parent->asA<NodeGraph>()->getNodeDef() == nullptr, res, message, "Input element in a functional nodegraph has no effect");
     }
-    return PortElement::validate(message) && res;
+    return PortElement::validateLocal(message) && res;
 }
 
 //
@@ -350,11 +350,11 @@ bool Output::hasUpstreamCycle() const
     return false;
 }
 
-bool Output::validate(string* message) const
+bool Output::validateLocal(string* message) const
 {
     bool res = true;
     validateRequire(!hasUpstreamCycle(), res, message, "Cycle in upstream path");
-    return PortElement::validate(message) && res;
+    return PortElement::validateLocal(message) && res;
 }
 
 //
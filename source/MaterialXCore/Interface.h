@@ -153,9 +153,9 @@ class MX_CORE_API PortElement : public ValueElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
@@ -245,9 +245,9 @@ class MX_CORE_API Input : public PortElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
@@ -292,9 +292,9 @@ class MX_CORE_API Output : public PortElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
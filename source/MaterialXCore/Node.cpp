@@ -198,7 +198,7 @@ vector<PortElementPtr> Node::getDownstreamPorts() const
     return downstreamPorts;
 }
 
-bool Node::validate(string* message) const
+bool Node::validateLocal(string* message) const
 {
     bool res = true;
     validateRequire(!getCategory().empty(), res, message, "Node element is missing a category");
@@ -228,7 +228,7 @@ bool Node::validate(string* message) const
         validateRequire(!categoryDeclared, res, message, "Node interface doesn't support this output type");
     }
 
-    return InterfaceElement::validate(message) && res;
+    return InterfaceElement::validateLocal(message) && res;
 }
 
 //
@@ -781,7 +781,7 @@ vector<PortElementPtr> NodeGraph::getDownstreamPorts() const
     return downstreamPorts;
 }
 
-bool NodeGraph::validate(string* message) const
+bool NodeGraph::validateLocal(string* message) const
 {
     bool res = true;
 
@@ -802,7 +802,7 @@ bool NodeGraph::validate(string* message) const
         }
     }
 
-    return GraphElement::validate(message) && res;
+    return GraphElement::validateLocal(message) && res;
 }
 
 ConstInterfaceElementPtr NodeGraph::getDeclaration(const string&) const
@@ -858,7 +858,7 @@ vector<TypedElementPtr> Backdrop::getContainsElements() const
     return vec;
 }
 
-bool Backdrop::validate(string* message) const
+bool Backdrop::validateLocal(string* message) const
 {
     bool res = true;
     if (hasContainsString())
@@ -867,7 +867,7 @@ bool Backdrop::validate(string* message) const
         vector<TypedElementPtr> elemVec = getContainsElements();
         validateRequire(stringVec.size() == elemVec.size(), res, message, "Invalid element in contains string");
     }
-    return Element::validate(message) && res;
+    return Element::validateLocal(message) && res;
 }
 
 MATERIALX_NAMESPACE_END
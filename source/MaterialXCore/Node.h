@@ -168,9 +168,9 @@ class MX_CORE_API Node : public InterfaceElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
@@ -403,9 +403,9 @@ class MX_CORE_API NodeGraph : public GraphElement
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
@@ -503,9 +503,9 @@ class MX_CORE_API Backdrop : public Element
     /// @name Validation
     /// @{
 
-    /// Validate that the given element tree, including all descendants, is
+    /// Validate that the given element, excluding its descendants, is
     /// consistent with the MaterialX specification.
-    bool validate(string* message = nullptr) const override;
+    bool validateLocal(string* message = nullptr) const override;
 
     /// @}
 
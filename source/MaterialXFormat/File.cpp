@@ -13,6 +13,7 @@
     #define WIN32_LEAN_AND_MEAN
     #include <windows.h>
     #include <direct.h>
+    #include <sys/stat.h>
 #else
     #include <unistd.h>
     #include <sys/stat.h>
@@ -301,6 +302,36 @@ void FilePath::createDirectory(bool recursive) const
 #endif
 }
 
+size_t FilePath::getFileSize() const
+{
+#if defined(_WIN32)
+    struct _stat64 sb;
+    if (_stat64(asString().c_str(), &sb))
+        return 0;
+    return (size_t) sb.st_size;
+#else
+    struct stat sb;
+    if (stat(asString().c_str(), &sb))
+        return 0;
+    return (size_t) sb.st_size;
+#endif
+}
+
+int64_t FilePath::getModificationTime() const
+{
+#if defined(_WIN32)
+    struct _stat64 sb;
+    if (_stat64(asString().c_str(), &sb))
+        return 0;
+    return (int64_t) sb.st_mtime;
+#else
+    struct stat sb;
+    if (stat(asString().c_str(), &sb))
+        return 0;
+    return (int64_t) sb.st_mtime;
+#endif
+}
+
 bool FilePath::setCurrentPath()
 {
 #if defined(_WIN32)
@@ -198,6 +198,14 @@ class MX_FORMAT_API FilePath
     /// If recursive is true, any missing parent directories will be created as well.
     void createDirectory(bool recursive = false) const;
 
+    /// Return the size in bytes of the file at the given path,
+    /// or zero if the file does not exist.
+    size_t getFileSize() const;
+
+    /// Return the last modification time of the file at the given path,
+    /// in seconds since the epoch, or zero if the file does not exist.
+    int64_t getModificationTime() const;
+
     /// Set the current working directory of the file system.
     bool setCurrentPath();
 
@@ -5,9 +5,17 @@
 
 #include <MaterialXFormat/Util.h>
 
+#include <atomic>
+#include <cstdio>
+#include <cstring>
+#include <exception>
 #include <fstream>
 #include <iostream>
+#include <mutex>
+#include <random>
 #include <sstream>
+#include <system_error>
+#include <thread>
 
 #if defined(__APPLE__) && defined(BUILD_APPLE_FRAMEWORK)
     #include <dlfcn.h>
@@ -84,65 +92,662 @@ void loadLibrary(const FilePath& file, DocumentPtr doc, const FileSearchPath& se
     doc->importLibrary(libDoc);
 }
 
-StringSet loadLibraries(const FilePathVec& libraryFolders,
-                        const FileSearchPath& searchPath,
-                        DocumentPtr doc,
-                        const StringSet& excludeFiles,
-                        const XmlReadOptions* readOptions)
+FilePathVec getLibraryFiles(const FilePathVec& libraryFolders,
+                            const FileSearchPath& searchPath,
+                            const StringSet& excludeFiles)
 {
     // Append environment path to the specified search path.
     FileSearchPath librarySearchPath = searchPath;
     librarySearchPath.append(getEnvironmentPath());
 
-    StringSet loadedLibraries;
+    FilePathVec libraryPaths;
     if (libraryFolders.empty())
     {
         // No libraries specified so scan in all search paths
         for (const FilePath& libraryPath : librarySearchPath)
         {
-            for (const FilePath& path : libraryPath.getSubDirectories())
+            libraryPaths.push_back(libraryPath);
+        }
+    }
+    else
+    {
+        // Look for specific library folders in the search paths
+        for (const FilePath& libraryName : libraryFolders)
+        {
+            libraryPaths.push_back(librarySearchPath.find(libraryName));
+        }
+    }
+
+    FilePathVec libraryFiles;
+    StringSet foundFiles;
+    for (const FilePath& libraryPath : libraryPaths)
+    {
+        for (const FilePath& path : libraryPath.getSubDirectories())
+        {
+            for (const FilePath& filename : path.getFilesInDirectory(MTLX_EXTENSION))
             {
-                for (const FilePath& filename : path.getFilesInDirectory(MTLX_EXTENSION))
+                if (!excludeFiles.count(filename))
                 {
-                    if (!excludeFiles.count(filename))
+                    const FilePath& file = path / filename;
+                    if (foundFiles.count(file) == 0)
                     {
-                        const FilePath& file = path / filename;
-                        if (loadedLibraries.count(file) == 0)
-                        {
-                            loadLibrary(file, doc, searchPath, readOptions);
-                            loadedLibraries.insert(file.asString());
-                        }
+                        libraryFiles.push_back(file);
+                        foundFiles.insert(file.asString());
                     }
                 }
             }
         }
     }
-    else
+    return libraryFiles;
+}
+
+StringSet loadLibraries(const FilePathVec& libraryFolders,
+                        const FileSearchPath& searchPath,
+                        DocumentPtr doc,
+                        const StringSet& excludeFiles,
+                        const XmlReadOptions* readOptions)
+{
+    FilePathVec libraryFiles = getLibraryFiles(libraryFolders, searchPath, excludeFiles);
+
+    // Parse each library file into its own document, distributing files
+    // across worker threads.
+    vector<DocumentPtr> libDocs(libraryFiles.size());
+    vector<std::exception_ptr> errors(libraryFiles.size());
+    std::atomic<size_t> nextIndex(0);
+    auto parseLibraries = [&]()
     {
-        // Look for specific library folders in the search paths
-        for (const FilePath& libraryName : libraryFolders)
+        for (size_t i = nextIndex++; i < libraryFiles.size(); i = nextIndex++)
+        {
+            try
+            {
+                DocumentPtr libDoc = createDocument();
+                readFromXmlFile(libDoc, libraryFiles[i], searchPath, readOptions);
+                libDocs[i] = libDoc;
+            }
+            catch (...)
+            {
+                errors[i] = std::current_exception();
+            }
+        }
+    };
+    vector<std::thread> threads;
+#ifndef __EMSCRIPTEN__
+    size_t threadCount = std::min<size_t>(std::max(std::thread::hardware_concurrency(), 1u), libraryFiles.size());
+    for (size_t i = 1; i < threadCount; i++)
+    {
+        try
+        {
+            threads.emplace_back(parseLibraries);
+        }
+        catch (const std::system_error&)
+        {
+            break;
+        }
+    }
+#endif
+    parseLibraries();
+    for (std::thread& thread : threads)
+    {
+        thread.join();
+    }
+
+    // Import library documents in file order, so that the merged document
+    // is independent of the order in which files were parsed.
+    StringSet loadedLibraries;
+    for (size_t i = 0; i < libraryFiles.size(); i++)
+    {
+        if (errors[i])
+        {
+            std::rethrow_exception(errors[i]);
+        }
+        doc->importLibrary(libDocs[i]);
+        loadedLibraries.insert(libraryFiles[i].asString());
+    }
+    return loadedLibraries;
+}
+
+//
+// Library snapshots
+//
+
+namespace
+{
+
+const string SNAPSHOT_MAGIC = "MXLIBSNAP";
+const string ELEMENT_MAGIC = "MXELEM";
+const uint32_t SNAPSHOT_FORMAT_VERSION = 2;
+const uint32_t SNAPSHOT_NO_STRING = UINT32_MAX;
+
+// Writer for the binary element format used by library snapshots and
+// serialized elements, in which every string is stored once in a string
+// table and referenced by index.
+class SnapshotWriter
+{
+  public:
+    void writeUInt(uint64_t value)
+    {
+        _data.append(reinterpret_cast<const char*>(&value), sizeof(value));
+    }
+
+    void writeString(const string& str)
+    {
+        writeUInt(str.size());
+        _data.append(str);
+    }
+
+    void writeStringRef(const string& str)
+    {
+        auto it = _stringIndices.find(str);
+        if (it == _stringIndices.end())
+        {
+            it = _stringIndices.emplace(str, (uint32_t) _strings.size()).first;
+            _strings.push_back(&it->first);
+        }
+        writeUInt(it->second);
+    }
+
+    void writeElement(ConstElementPtr elem)
+    {
+        writeStringRef(elem->getCategory());
+        writeStringRef(elem->getName());
+        if (elem->hasSourceUri())
+        {
+            writeStringRef(elem->getSourceUri());
+        }
+        else
+        {
+            writeUInt(SNAPSHOT_NO_STRING);
+        }
+        const StringVec& attrNames = elem->getAttributeNames();
+        writeUInt(attrNames.size());
+        for (const string& attrName : attrNames)
+        {
+            writeStringRef(attrName);
+            writeStringRef(elem->getAttribute(attrName));
+        }
+        const vector<ElementPtr>& children = elem->getChildren();
+        writeUInt(children.size());
+        for (ElementPtr child : children)
+        {
+            writeElement(child);
+        }
+    }
+
+    // Return the complete snapshot, with the string table preceding the element data.
+    string getSnapshot(const string& header)
+    {
+        SnapshotWriter table;
+        table._data = header;
+        table.writeUInt(_strings.size());
+        for (const string* str : _strings)
+        {
+            table.writeString(*str);
+        }
+        return table._data + _data;
+    }
+
+    string _data;
+
+  private:
+    std::unordered_map<string, uint32_t> _stringIndices;
+    vector<const string*> _strings;
+};
+
+// Reader for the binary element format, throwing an exception on invalid data.
+class SnapshotReader
+{
+  public:
+    SnapshotReader(const string& data, size_t pos = 0) :
+        _data(data),
+        _pos(pos)
+    {
+    }
+
+    uint64_t readUInt()
+    {
+        uint64_t value = 0;
+        if (_pos + sizeof(value) > _data.size())
+        {
+            throw Exception("Truncated binary data");
+        }
+        std::memcpy(&value, _data.data() + _pos, sizeof(value));
+        _pos += sizeof(value);
+        return value;
+    }
+
+    string readString()
+    {
+        size_t size = (size_t) readUInt();
+        if (_pos + size > _data.size())
+        {
+            throw Exception("Truncated binary data");
+        }
+        string str = _data.substr(_pos, size);
+        _pos += size;
+        return str;
+    }
+
+    void readStringTable()
+    {
+        size_t count = (size_t) readUInt();
+        _strings.reserve(count);
+        for (size_t i = 0; i < count; i++)
+        {
+            _strings.push_back(readString());
+        }
+    }
+
+    const string& readStringRef()
+    {
+        uint64_t index = readUInt();
+        if (index >= _strings.size())
+        {
+            throw Exception("Invalid string reference in binary data");
+        }
+        return _strings[(size_t) index];
+    }
+
+    ElementPtr readElement(ElementPtr parent, bool skipExisting)
+    {
+        const string& category = readStringRef();
+        const string& name = readStringRef();
+
+        // Match the behavior of Document::importLibrary, which skips elements
+        // already present in the target document.
+        ElementPtr elem = (skipExisting && parent->getChild(name)) ? nullptr : parent->addChildOfCategory(category, name);
+        readContent(elem);
+        return elem;
+    }
+
+    // Read the source URI, attributes and children of an element, skipping
+    // them if no element is given.
+    void readContent(ElementPtr elem)
+    {
+        uint64_t sourceUriIndex = readUInt();
+        if (elem && sourceUriIndex != SNAPSHOT_NO_STRING)
+        {
+            if (sourceUriIndex >= _strings.size())
+            {
+                throw Exception("Invalid string reference in binary data");
+            }
+            elem->setSourceUri(_strings[(size_t) sourceUriIndex]);
+        }
+        size_t attrCount = (size_t) readUInt();
+        for (size_t i = 0; i < attrCount; i++)
+        {
+            const string& attrName = readStringRef();
+            const string& attrValue = readStringRef();
+            if (elem)
+            {
+                elem->setAttribute(attrName, attrValue);
+            }
+        }
+        size_t childCount = (size_t) readUInt();
+        for (size_t i = 0; i < childCount; i++)
+        {
+            if (elem)
+            {
+                readElement(elem, false);
+            }
+            else
+            {
+                skipElement();
+            }
+        }
+    }
+
+    void skipElement()
+    {
+        _pos += 3 * sizeof(uint64_t);
+        size_t attrCount = (size_t) readUInt();
+        _pos += 2 * attrCount * sizeof(uint64_t);
+        size_t childCount = (size_t) readUInt();
+        for (size_t i = 0; i < childCount; i++)
+        {
+            skipElement();
+        }
+    }
+
+  private:
+    const string& _data;
+    size_t _pos;
+    StringVec _strings;
+};
+
+string readBinaryFile(const FilePath& filePath)
+{
+    std::ifstream file(filePath.asString(), std::ios::in | std::ios::binary);
+    if (!file)
+    {
+        return EMPTY_STRING;
+    }
+    file.seekg(0, std::ios::end);
+    std::streamoff size = file.tellg();
+    if (size <= 0)
+    {
+        return EMPTY_STRING;
+    }
+    string data((size_t) size, '\0');
+    file.seekg(0, std::ios::beg);
+    file.read(&data[0], size);
+    return file ? data : EMPTY_STRING;
+}
+
+// Return a 64-bit FNV-1a hash of the contents of the given file.
+uint64_t getFileContentHash(const FilePath& filePath)
+{
+    uint64_t hash = 14695981039346656037ull;
+    for (char c : readBinaryFile(filePath))
+    {
+        hash ^= (unsigned char) c;
+        hash *= 1099511628211ull;
+    }
+    return hash;
+}
+
+// Write the path, size and content hash of the given file.
+void writeFileState(SnapshotWriter& writer, const FilePath& filePath)
+{
+    writer.writeString(filePath.asString());
+    writer.writeUInt(filePath.getFileSize());
+    writer.writeUInt(getFileContentHash(filePath));
+}
+
+// Read the state of a file written by writeFileState, returning true if
+// the file on disk still matches it.
+bool readFileState(SnapshotReader& reader)
+{
+    FilePath filePath = reader.readString();
+    uint64_t size = reader.readUInt();
+    uint64_t hash = reader.readUInt();
+    return filePath.getFileSize() == size && getFileContentHash(filePath) == hash;
+}
+
+// Return the header of a snapshot for the given library files, encoding
+// the format version, library version, and the state of each file.
+string getSnapshotHeader(const FilePathVec& libraryFiles)
+{
+    SnapshotWriter writer;
+    writer._data = SNAPSHOT_MAGIC;
+    writer.writeUInt(SNAPSHOT_FORMAT_VERSION);
+    writer.writeString(getVersionString());
+    writer.writeUInt(libraryFiles.size());
+    for (const FilePath& file : libraryFiles)
+    {
+        writeFileState(writer, file);
+    }
+    return writer._data;
+}
+
+// Load the given library files into a new document, recording the resolved
+// paths of all files read through XIncludes.
+DocumentPtr loadSnapshotLibraries(const FilePathVec& libraryFiles,
+                                  const FileSearchPath& searchPath,
+                                  const XmlReadOptions* readOptions,
+                                  StringSet& includeFiles)
+{
+    // Included documents are always read from their files rather than an
+    // XInclude cache, so that every included file is recorded.
+    XmlReadOptions snapshotReadOptions = readOptions ? *readOptions : XmlReadOptions();
+    snapshotReadOptions.xincludeCache = nullptr;
+    XmlReadFunction readXIncludeFunction = snapshotReadOptions.readXIncludeFunction;
+    if (readXIncludeFunction)
+    {
+        snapshotReadOptions.readXIncludeFunction = [readXIncludeFunction, &includeFiles](DocumentPtr doc, const FilePath& filename,
+                                                                                         const FileSearchPath& includeSearchPath,
+                                                                                         const XmlReadOptions* includeReadOptions)
+        {
+            FileSearchPath resolvePath = includeSearchPath;
+            resolvePath.append(getEnvironmentPath());
+            includeFiles.insert(resolvePath.find(filename).asString());
+            readXIncludeFunction(doc, filename, includeSearchPath, includeReadOptions);
+        };
+    }
+
+    DocumentPtr libraries = createDocument();
+    for (const FilePath& file : libraryFiles)
+    {
+        loadLibrary(file, libraries, searchPath, &snapshotReadOptions);
+    }
+    return libraries;
+}
+
+void writeSnapshot(ConstDocumentPtr libraries, const FilePathVec& libraryFiles, const StringSet& includeFiles, const FilePath& snapshotFile)
+{
+    SnapshotWriter writer;
+    const vector<ElementPtr>& children = libraries->getChildren();
+    writer.writeUInt(children.size());
+    for (ElementPtr child : children)
+    {
+        writer.writeElement(child);
+    }
+
+    // The state of included files follows the header, as they are only known
+    // once the libraries have been read.
+    SnapshotWriter header;
+    header._data = getSnapshotHeader(libraryFiles);
+    header.writeUInt(includeFiles.size());
+    for (const string& includeFile : includeFiles)
+    {
+        writeFileState(header, includeFile);
+    }
+    string snapshot = writer.getSnapshot(header._data);
+
+    // Write to a temporary file and move it into place, so that concurrent
+    // readers never observe a partially written snapshot.
+    FilePath tempFile = snapshotFile.asString() + "." + std::to_string(std::random_device()()) + ".tmp";
+    {
+        std::ofstream file(tempFile.asString(), std::ios::out | std::ios::binary);
+        if (!file)
+        {
+            throw ExceptionFileMissing("Unable to write library snapshot: " + snapshotFile.asString());
+        }
+        file.write(snapshot.data(), snapshot.size());
+    }
+    std::remove(snapshotFile.asString().c_str());
+    if (std::rename(tempFile.asString().c_str(), snapshotFile.asString().c_str()) != 0)
+    {
+        std::remove(tempFile.asString().c_str());
+    }
+}
+
+} // anonymous namespace
+
+void writeLibrariesSnapshot(const FilePathVec& libraryFolders,
+                            const FileSearchPath& searchPath,
+                            const FilePath& snapshotFile,
+                            const StringSet& excludeFiles,
+                            const XmlReadOptions* readOptions)
+{
+    FilePathVec libraryFiles = getLibraryFiles(libraryFolders, searchPath, excludeFiles);
+    StringSet includeFiles;
+    DocumentPtr libraries = loadSnapshotLibraries(libraryFiles, searchPath, readOptions, includeFiles);
+    writeSnapshot(libraries, libraryFiles, includeFiles, snapshotFile);
+}
+
+StringSet loadLibrariesSnapshot(const FilePathVec& libraryFolders,
+                                const FileSearchPath& searchPath,
+                                DocumentPtr doc,
+                                const FilePath& snapshotFile,
+                                const StringSet& excludeFiles,
+                                const XmlReadOptions* readOptions)
+{
+    FilePathVec libraryFiles = getLibraryFiles(libraryFolders, searchPath, excludeFiles);
+    StringSet loadedLibraries;
+    for (const FilePath& file : libraryFiles)
+    {
+        loadedLibraries.insert(file.asString());
+    }
+
+    // Reconstruct the libraries from the snapshot if it is up to date.
+    string header = getSnapshotHeader(libraryFiles);
+    string snapshot = readBinaryFile(snapshotFile);
+    if (snapshot.compare(0, header.size(), header) == 0)
+    {
+        DocumentPtr libraries = doc->getChildren().empty() ? doc : createDocument();
+        try
         {
-            FilePath libraryPath = librarySearchPath.find(libraryName);
-            for (const FilePath& path : libraryPath.getSubDirectories())
+            SnapshotReader reader(snapshot, header.size());
+            size_t includeCount = (size_t) reader.readUInt();
+            for (size_t i = 0; i < includeCount; i++)
             {
-                for (const FilePath& filename : path.getFilesInDirectory(MTLX_EXTENSION))
+                if (!readFileState(reader))
                 {
-                    if (!excludeFiles.count(filename))
-                    {
-                        const FilePath& file = path / filename;
-                        if (loadedLibraries.count(file) == 0)
-                        {
-                            loadLibrary(file, doc, searchPath, readOptions);
-                            loadedLibraries.insert(file.asString());
-                        }
-                    }
+                    throw Exception("Library snapshot is out of date");
                 }
             }
+            reader.readStringTable();
+            size_t childCount = (size_t) reader.readUInt();
+            for (size_t i = 0; i < childCount; i++)
+            {
+                reader.readElement(libraries, true);
+            }
+            if (libraries != doc)
+            {
+                doc->importLibrary(libraries);
+            }
+            return loadedLibraries;
         }
+        catch (Exception&)
+        {
+            // Fall back to loading from source files below.
+            if (libraries == doc)
+            {
+                ElementVec children = doc->getChildren();
+                for (ElementPtr child : children)
+                {
+                    doc->removeChild(child->getName());
+                }
+            }
+        }
+    }
+
+    // Load the libraries from their source files and refresh the snapshot.
+    StringSet includeFiles;
+    DocumentPtr libraries = loadSnapshotLibraries(libraryFiles, searchPath, readOptions, includeFiles);
+    try
+    {
+        writeSnapshot(libraries, libraryFiles, includeFiles, snapshotFile);
     }
+    catch (Exception&)
+    {
+        // A snapshot that cannot be written is not an error for loading.
+    }
+    doc->importLibrary(libraries);
     return loadedLibraries;
 }
 
+string writeToBinaryString(ConstElementPtr elem)
+{
+    SnapshotWriter header;
+    header._data = ELEMENT_MAGIC;
+    header.writeUInt(SNAPSHOT_FORMAT_VERSION);
+
+    SnapshotWriter writer;
+    writer.writeElement(elem);
+    return writer.getSnapshot(header._data);
+}
+
+ElementPtr readFromBinaryString(ElementPtr parent, const string& data)
+{
+    if (data.compare(0, ELEMENT_MAGIC.size(), ELEMENT_MAGIC) != 0)
+    {
+        throw Exception("Invalid binary element data");
+    }
+    SnapshotReader reader(data, ELEMENT_MAGIC.size());
+    if (reader.readUInt() != SNAPSHOT_FORMAT_VERSION)
+    {
+        throw Exception("Unsupported binary element format version");
+    }
+    reader.readStringTable();
+
+    const string& category = reader.readStringRef();
+    const string& name = reader.readStringRef();
+    if (category == Document::CATEGORY)
+    {
+        DocumentPtr doc = parent->asA<Document>();
+        if (!doc || !doc->getChildren().empty())
+        {
+            throw Exception("A serialized document can only be read into an empty document");
+        }
+        reader.readContent(doc);
+        return doc;
+    }
+
+    ElementPtr elem = parent->addChildOfCategory(category, name);
+    reader.readContent(elem);
+    return elem;
+}
+
+//
+// Shared data libraries
+//
+
+namespace
+{
+
+struct SharedDataLibrary
+{
+    string fingerprint;
+    ConstDocumentPtr doc;
+};
+
+std::mutex sharedDataLibraryMutex;
+std::unordered_map<string, SharedDataLibrary> sharedDataLibraries;
+
+} // anonymous namespace
+
+ConstDocumentPtr getSharedDataLibrary(const FilePathVec& libraryFolders,
+                                      const FileSearchPath& searchPath,
+                                      const StringSet& excludeFiles)
+{
+    string key;
+    for (const FilePath& folder : libraryFolders)
+    {
+        key += folder.asString() + PATH_LIST_SEPARATOR;
+    }
+    key += "|" + searchPath.asString() + "|";
+    for (const string& file : excludeFiles)
+    {
+        key += file + PATH_LIST_SEPARATOR;
+    }
+
+    // Fingerprint the current state of the library files.
+    FilePathVec libraryFiles = getLibraryFiles(libraryFolders, searchPath, excludeFiles);
+    string fingerprint;
+    for (const FilePath& file : libraryFiles)
+    {
+        fingerprint += file.asString() + ":" + std::to_string(file.getFileSize()) + ":" +
+                       std::to_string(file.getModificationTime()) + "\n";
+    }
+
+    std::lock_guard<std::mutex> lock(sharedDataLibraryMutex);
+    auto it = sharedDataLibraries.find(key);
+    if (it != sharedDataLibraries.end() && it->second.fingerprint == fingerprint)
+    {
+        return it->second.doc;
+    }
+
+    DocumentPtr doc = createDocument();
+    for (const FilePath& file : libraryFiles)
+    {
+        loadLibrary(file, doc, searchPath);
+    }
+
+    // Build the lookup cache of the document up front, so that concurrent
+    // readers share a single index.
+    doc->getMatchingNodeDefs(EMPTY_STRING);
+
+    sharedDataLibraries[key] = { fingerprint, doc };
+    return doc;
+}
+
+void clearSharedDataLibraries()
+{
+    std::lock_guard<std::mutex> lock(sharedDataLibraryMutex);
+    sharedDataLibraries.clear();
+}
+
 void flattenFilenames(DocumentPtr doc, const FileSearchPath& searchPath, StringResolverPtr customResolver)
 {
     for (ElementPtr elem : doc->traverseTree())
@@ -50,6 +50,62 @@ MX_FORMAT_API StringSet loadLibraries(const FilePathVec& libraryFolders,
                                       const StringSet& excludeFiles = StringSet(),
                                       const XmlReadOptions* readOptions = nullptr);
 
+/// Return the MaterialX files within the given library folders, in the order in
+/// which they would be loaded by loadLibraries.
+MX_FORMAT_API FilePathVec getLibraryFiles(const FilePathVec& libraryFolders,
+                                          const FileSearchPath& searchPath,
+                                          const StringSet& excludeFiles = StringSet());
+
+/// Write a binary snapshot of the data libraries within the given library folders
+/// to the given file.  The snapshot records the size and content hash of each
+/// library file and each file it includes, allowing loadLibrariesSnapshot to
+/// detect when it is out of date.
+MX_FORMAT_API void writeLibrariesSnapshot(const FilePathVec& libraryFolders,
+                                          const FileSearchPath& searchPath,
+                                          const FilePath& snapshotFile,
+                                          const StringSet& excludeFiles = StringSet(),
+                                          const XmlReadOptions* readOptions = nullptr);
+
+/// Load all MaterialX files within the given library folders into a document,
+/// reconstructing them from the given binary snapshot file when it is up to date
+/// with the library files on disk.  If the snapshot is missing or stale, then the
+/// libraries are loaded from their source files and the snapshot is rewritten.
+/// @return The set of library files loaded into the document.
+MX_FORMAT_API StringSet loadLibrariesSnapshot(const FilePathVec& libraryFolders,
+                                              const FileSearchPath& searchPath,
+                                              DocumentPtr doc,
+                                              const FilePath& snapshotFile,
+                                              const StringSet& excludeFiles = StringSet(),
+                                              const XmlReadOptions* readOptions = nullptr);
+
+/// Return a shared, read-only document containing the data libraries within the
+/// given library folders, loading them on first use.
+///
+/// Documents are held in a process-wide registry, keyed by the library folders,
+/// search path and excluded files, and are reloaded when the size or modification
+/// time of any library file changes.  Any number of documents may reference the
+/// returned libraries through Document::setDataLibrary without duplicating them.
+/// This function may be called concurrently from multiple threads.
+MX_FORMAT_API ConstDocumentPtr getSharedDataLibrary(const FilePathVec& libraryFolders,
+                                                    const FileSearchPath& searchPath,
+                                                    const StringSet& excludeFiles = StringSet());
+
+/// Release all data libraries held by the registry of getSharedDataLibrary.
+/// Documents that reference these libraries are unaffected.
+MX_FORMAT_API void clearSharedDataLibraries();
+
+/// Serialize the given element and its descendants to a compact binary string,
+/// suitable for transfer between processes.  If the element is a document, then
+/// the complete document is serialized.
+MX_FORMAT_API string writeToBinaryString(ConstElementPtr elem);
+
+/// Read an element serialized by writeToBinaryString.  A serialized document is
+/// read into the given parent, which must then be an empty document, while any
+/// other element is added as a new child of the given parent.
+/// @return The element that was read.
+/// @throws Exception if the data is invalid or the element cannot be added.
+MX_FORMAT_API ElementPtr readFromBinaryString(ElementPtr parent, const string& data);
+
 /// Flatten all filenames in the given document, applying string resolvers at the
 /// scope of each element and removing all fileprefix attributes.
 /// @param doc The document to modify.
@@ -9,10 +9,26 @@
 
 #include <MaterialXCore/Types.h>
 
+#include <cstdio>
 #include <cstring>
 #include <fstream>
 #include <sstream>
 
+#if defined(MATERIALX_BUILD_ZLIB)
+#include <zlib.h>
+#endif
+#if defined(MATERIALX_BUILD_ZSTD)
+#include <zstd.h>
+#endif
+
+#if !defined(_WIN32) && !defined(__EMSCRIPTEN__)
+#define MATERIALX_XML_MMAP
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
 using namespace pugi;
 
 MATERIALX_NAMESPACE_BEGIN
@@ -29,6 +45,11 @@ const string XINCLUDE_TAG = "xi:include";
 const string XINCLUDE_NAMESPACE = "xmlns:xi";
 const string XINCLUDE_URL = "http://www.w3.org/2001/XInclude";
 
+const string GZIP_EXTENSION = "gz";
+const string ZSTD_EXTENSION = "zst";
+
+const size_t COMPRESSION_CHUNK_SIZE = 1 << 16;
+
 using ElementStack = vector<std::pair<ElementPtr, xml_node>>;
 
 void documentToXml(DocumentPtr doc, xml_node& xmlRoot, const XmlWriteOptions* writeOptions)
@@ -112,12 +133,37 @@ void documentToXml(DocumentPtr doc, xml_node& xmlRoot, const XmlWriteOptions* wr
     }
 }
 
+// Return true if the given XML node passes the element filters of the given
+// read options at the given depth.
+bool passesReadFilters(const xml_node& xmlNode, const string& category, int depth, const XmlReadOptions& readOptions)
+{
+    if (readOptions.maxDepth > 0 && depth > readOptions.maxDepth)
+    {
+        return false;
+    }
+    if (readOptions.includeCategories.empty() && readOptions.excludeCategories.empty())
+    {
+        return true;
+    }
+
+    const string& filterCategory = (xmlNode.type() == node_comment) ? CommentElement::CATEGORY :
+                                   (xmlNode.type() == node_newline) ? NewlineElement::CATEGORY :
+                                   category;
+    if (depth == 1 && !readOptions.includeCategories.empty() && !readOptions.includeCategories.count(filterCategory))
+    {
+        return false;
+    }
+    return !readOptions.excludeCategories.count(filterCategory);
+}
+
 void elementFromXml(const xml_node& xmlNode, ElementPtr elem, const XmlReadOptions* readOptions, int depth = 1)
 {
     // Store attributes in element.
+    bool skipValues = readOptions && readOptions->skipValues;
     for (const xml_attribute& xmlAttr : xmlNode.attributes())
     {
-        if (xmlAttr.name() != Element::NAME_ATTRIBUTE)
+        if (xmlAttr.name() != Element::NAME_ATTRIBUTE &&
+            !(skipValues && xmlAttr.name() == ValueElement::VALUE_ATTRIBUTE))
         {
             elem->setAttribute(xmlAttr.name(), xmlAttr.value());
         }
@@ -133,6 +179,12 @@ void elementFromXml(const xml_node& xmlNode, ElementPtr elem, const XmlReadOptio
             continue;
         }
 
+        // Apply element filters.
+        if (readOptions && !passesReadFilters(xmlChild, category, depth, *readOptions))
+        {
+            continue;
+        }
+
         // Get child name and skip duplicates.
         string name = xmlChild.attribute(Element::NAME_ATTRIBUTE.c_str()).value();
         ConstElementPtr previous = elem->getChild(name);
@@ -196,10 +248,17 @@ void documentFromXml(DocumentPtr doc, const xml_document& xmlDoc, const FileSear
                     throw ExceptionParseError("Maximum XInclude depth exceeded.");
                 }
 
-                // Read the included file into a library document.
-                DocumentPtr library = createDocument();
                 XmlReadOptions xiReadOptions = readOptions ? *readOptions : XmlReadOptions();
                 xiReadOptions.parentXIncludes.push_back(filename);
+                if (xiReadOptions.xincludeCache)
+                {
+                    // Import a shared library document from the cache.
+                    doc->importLibrary(xiReadOptions.xincludeCache->getDocument(filename, searchPath, xiReadOptions));
+                    continue;
+                }
+
+                // Read the included file into a library document.
+                DocumentPtr library = createDocument();
                 readXIncludeFunction(library, filename, searchPath, &xiReadOptions);
 
                 // Import the library document.
@@ -261,6 +320,262 @@ unsigned int getParseOptions(const XmlReadOptions* readOptions)
     return parseOptions;
 }
 
+// Contents of an XML file, held for in-place parsing by pugixml.  Local files
+// are accessed through a private memory mapping where supported, avoiding a
+// copy of the file contents, while compressed files are decompressed into
+// memory.
+class XmlFileBuffer
+{
+  public:
+    XmlFileBuffer() :
+        _mapping(nullptr),
+        _mappingSize(0)
+    {
+    }
+    ~XmlFileBuffer()
+    {
+#if defined(MATERIALX_XML_MMAP)
+        if (_mapping)
+        {
+            munmap(_mapping, _mappingSize);
+        }
+#endif
+    }
+    XmlFileBuffer(const XmlFileBuffer&) = delete;
+    XmlFileBuffer& operator=(const XmlFileBuffer&) = delete;
+
+    // Parse the given file into the given XML document.  The buffer must
+    // outlive the document.
+    xml_parse_result load(xml_document& xmlDoc, const FilePath& filename, unsigned int parseOptions)
+    {
+        const string extension = filename.getExtension();
+        if (extension == GZIP_EXTENSION)
+        {
+            readGzip(filename);
+            return xmlDoc.load_buffer_inplace(&_storage[0], _storage.size(), parseOptions);
+        }
+        if (extension == ZSTD_EXTENSION)
+        {
+            readZstd(filename);
+            return xmlDoc.load_buffer_inplace(&_storage[0], _storage.size(), parseOptions);
+        }
+        if (map(filename))
+        {
+            return xmlDoc.load_buffer_inplace(_mapping, _mappingSize, parseOptions);
+        }
+        return xmlDoc.load_file(filename.asString().c_str(), parseOptions);
+    }
+
+  private:
+    bool map(const FilePath& filename)
+    {
+#if defined(MATERIALX_XML_MMAP)
+        int fd = open(filename.asString().c_str(), O_RDONLY);
+        if (fd < 0)
+        {
+            return false;
+        }
+        struct stat fileStat;
+        if (fstat(fd, &fileStat) != 0 || !S_ISREG(fileStat.st_mode) || fileStat.st_size <= 0)
+        {
+            close(fd);
+            return false;
+        }
+
+        // Pages are mapped copy-on-write, since pugixml modifies the buffer
+        // during in-place parsing.
+        size_t size = (size_t) fileStat.st_size;
+        void* mapping = mmap(nullptr, size, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, 0);
+        close(fd);
+        if (mapping == MAP_FAILED)
+        {
+            return false;
+        }
+        _mapping = mapping;
+        _mappingSize = size;
+        return true;
+#else
+        (void) filename;
+        return false;
+#endif
+    }
+
+    void readGzip(const FilePath& filename)
+    {
+#if defined(MATERIALX_BUILD_ZLIB)
+        gzFile file = gzopen(filename.asString().c_str(), "rb");
+        if (!file)
+        {
+            throw ExceptionFileMissing("Failed to open file for reading: " + filename.asString());
+        }
+        char chunk[COMPRESSION_CHUNK_SIZE];
+        int count;
+        while ((count = gzread(file, chunk, (unsigned int) COMPRESSION_CHUNK_SIZE)) > 0)
+        {
+            _storage.append(chunk, (size_t) count);
+        }
+        gzclose(file);
+        if (count < 0)
+        {
+            throw ExceptionParseError("Failed to decompress gzip file: " + filename.asString());
+        }
+#else
+        throw ExceptionParseError("Reading gzip-compressed documents requires MATERIALX_BUILD_ZLIB: " + filename.asString());
+#endif
+    }
+
+    void readZstd(const FilePath& filename)
+    {
+#if defined(MATERIALX_BUILD_ZSTD)
+        std::ifstream file(filename.asString(), std::ios::binary);
+        if (!file)
+        {
+            throw ExceptionFileMissing("Failed to open file for reading: " + filename.asString());
+        }
+        std::unique_ptr<ZSTD_DCtx, size_t (*)(ZSTD_DCtx*)> context(ZSTD_createDCtx(), ZSTD_freeDCtx);
+        vector<char> inChunk(ZSTD_DStreamInSize());
+        vector<char> outChunk(ZSTD_DStreamOutSize());
+        size_t result = 0;
+        while (file)
+        {
+            file.read(inChunk.data(), (std::streamsize) inChunk.size());
+            ZSTD_inBuffer input = { inChunk.data(), (size_t) file.gcount(), 0 };
+            while (input.pos < input.size)
+            {
+                ZSTD_outBuffer output = { outChunk.data(), outChunk.size(), 0 };
+                result = ZSTD_decompressStream(context.get(), &output, &input);
+                if (ZSTD_isError(result))
+                {
+                    throw ExceptionParseError("Failed to decompress Zstandard file: " + filename.asString());
+                }
+                _storage.append(outChunk.data(), output.pos);
+            }
+        }
+        if (result != 0)
+        {
+            throw ExceptionParseError("Truncated Zstandard file: " + filename.asString());
+        }
+#else
+        throw ExceptionParseError("Reading Zstandard-compressed documents requires MATERIALX_BUILD_ZSTD: " + filename.asString());
+#endif
+    }
+
+  private:
+    void* _mapping;
+    size_t _mappingSize;
+    string _storage;
+};
+
+#if defined(MATERIALX_BUILD_ZLIB)
+
+// XML writer streaming to a gzip-compressed file.
+class GzipXmlWriter : public xml_writer
+{
+  public:
+    explicit GzipXmlWriter(const FilePath& filename) :
+        _filename(filename),
+        _file(gzopen(filename.asString().c_str(), "wb"))
+    {
+        if (!_file)
+        {
+            throw Exception("Failed to open file for writing: " + filename.asString());
+        }
+    }
+    ~GzipXmlWriter()
+    {
+        if (_file)
+        {
+            gzclose(_file);
+        }
+    }
+
+    void write(const void* data, size_t size) override
+    {
+        if (size && gzwrite(_file, data, (unsigned int) size) == 0)
+        {
+            throw Exception("Failed to write gzip file: " + _filename.asString());
+        }
+    }
+
+    void finish()
+    {
+        int result = gzclose(_file);
+        _file = nullptr;
+        if (result != Z_OK)
+        {
+            throw Exception("Failed to write gzip file: " + _filename.asString());
+        }
+    }
+
+  private:
+    FilePath _filename;
+    gzFile _file;
+};
+
+#endif
+
+#if defined(MATERIALX_BUILD_ZSTD)
+
+// XML writer streaming to a Zstandard-compressed file.
+class ZstdXmlWriter : public xml_writer
+{
+  public:
+    explicit ZstdXmlWriter(const FilePath& filename) :
+        _filename(filename),
+        _file(filename.asString(), std::ios::binary),
+        _context(ZSTD_createCCtx(), ZSTD_freeCCtx),
+        _outChunk(ZSTD_CStreamOutSize())
+    {
+        if (!_file)
+        {
+            throw Exception("Failed to open file for writing: " + filename.asString());
+        }
+    }
+
+    void write(const void* data, size_t size) override
+    {
+        ZSTD_inBuffer input = { data, size, 0 };
+        while (input.pos < input.size)
+        {
+            compress(input, ZSTD_e_continue);
+        }
+    }
+
+    void finish()
+    {
+        ZSTD_inBuffer input = { nullptr, 0, 0 };
+        while (compress(input, ZSTD_e_end) != 0)
+        {
+        }
+        _file.close();
+        if (!_file)
+        {
+            throw Exception("Failed to write Zstandard file: " + _filename.asString());
+        }
+    }
+
+  private:
+    size_t compress(ZSTD_inBuffer& input, ZSTD_EndDirective mode)
+    {
+        ZSTD_outBuffer output = { _outChunk.data(), _outChunk.size(), 0 };
+        size_t remaining = ZSTD_compressStream2(_context.get(), &output, &input, mode);
+        if (ZSTD_isError(remaining))
+        {
+            throw Exception("Failed to compress Zstandard file: " + _filename.asString());
+        }
+        _file.write(_outChunk.data(), (std::streamsize) output.pos);
+        return remaining;
+    }
+
+  private:
+    FilePath _filename;
+    std::ofstream _file;
+    std::unique_ptr<ZSTD_CCtx, size_t (*)(ZSTD_CCtx*)> _context;
+    vector<char> _outChunk;
+};
+
+#endif
+
 } // anonymous namespace
 
 //
@@ -271,10 +586,198 @@ XmlReadOptions::XmlReadOptions() :
     readComments(false),
     readNewlines(false),
     upgradeVersion(true),
-    readXIncludeFunction(readFromXmlFile)
+    readXIncludeFunction(readFromXmlFile),
+    maxDepth(0),
+    skipValues(false)
 {
 }
 
+//
+// XIncludeCache methods
+//
+
+const size_t XIncludeCache::DEFAULT_MAX_SIZE = 64 * 1024 * 1024;
+
+ConstDocumentPtr XIncludeCache::getDocument(const FilePath& filename, const FileSearchPath& searchPath, const XmlReadOptions& readOptions)
+{
+    // The files read by the enclosing XInclude on this thread, if any.
+    static thread_local FileStateVec* dependencies = nullptr;
+
+    FileSearchPath resolvePath = searchPath;
+    resolvePath.append(getEnvironmentPath());
+    FilePath resolvedFilename = resolvePath.find(filename);
+    FileState fileState = { resolvedFilename.asString(), resolvedFilename.getModificationTime(), resolvedFilename.getFileSize() };
+
+    // Build a key from the resolved path and the options that affect the
+    // content of the included document.
+    string key = fileState.path;
+    for (const string& parent : readOptions.parentXIncludes)
+    {
+        key += "|" + parent;
+    }
+    key += "|" + std::to_string(readOptions.readComments) +
+           std::to_string(readOptions.readNewlines) +
+           std::to_string(readOptions.upgradeVersion) +
+           std::to_string(readOptions.skipValues) +
+           std::to_string(readOptions.maxDepth);
+    for (const string& category : readOptions.includeCategories)
+    {
+        key += "|+" + category;
+    }
+    for (const string& category : readOptions.excludeCategories)
+    {
+        key += "|-" + category;
+    }
+
+    // Return a cached document if its files are unchanged.
+    {
+        std::lock_guard<std::mutex> lock(_mutex);
+        auto it = _entryMap.find(key);
+        if (it != _entryMap.end())
+        {
+            const Entry& entry = *it->second;
+            bool current = true;
+            for (const FileState& file : entry.files)
+            {
+                FilePath path(file.path);
+                if (path.getModificationTime() != file.modificationTime || path.getFileSize() != file.size)
+                {
+                    current = false;
+                    break;
+                }
+            }
+            if (current)
+            {
+                _entries.splice(_entries.begin(), _entries, it->second);
+                _hitCount++;
+                if (dependencies)
+                {
+                    dependencies->insert(dependencies->end(), entry.files.begin(), entry.files.end());
+                }
+                return entry.document;
+            }
+            _size -= entry.size;
+            _entries.erase(it->second);
+            _entryMap.erase(it);
+        }
+        _missCount++;
+    }
+
+    // Read the included file, recording the files read by its own XIncludes.
+    FileStateVec files = { fileState };
+    DocumentPtr library = createDocument();
+    {
+        struct DependencyScope
+        {
+            DependencyScope(FileStateVec* files) :
+                previous(dependencies)
+            {
+                dependencies = files;
+            }
+            ~DependencyScope()
+            {
+                dependencies = previous;
+            }
+            FileStateVec* previous;
+        } scope(&files);
+        XmlReadFunction readFunction = readOptions.readXIncludeFunction ? readOptions.readXIncludeFunction : readFromXmlFile;
+        readFunction(library, filename, searchPath, &readOptions);
+    }
+    if (dependencies)
+    {
+        dependencies->insert(dependencies->end(), files.begin(), files.end());
+    }
+
+    // Store the document, unless it exceeds the maximum size of the cache.
+    size_t size = 0;
+    for (const FileState& file : files)
+    {
+        size += file.size;
+    }
+    std::lock_guard<std::mutex> lock(_mutex);
+    if (size <= _maxSize)
+    {
+        auto it = _entryMap.find(key);
+        if (it != _entryMap.end())
+        {
+            _size -= it->second->size;
+            _entries.erase(it->second);
+            _entryMap.erase(it);
+        }
+        _entries.push_front({ key, library, files, size });
+        _entryMap[key] = _entries.begin();
+        _size += size;
+        evictEntries();
+    }
+    return library;
+}
+
+void XIncludeCache::setMaxSize(size_t maxSize)
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    _maxSize = maxSize;
+    evictEntries();
+}
+
+size_t XIncludeCache::getMaxSize() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _maxSize;
+}
+
+size_t XIncludeCache::getSize() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _size;
+}
+
+size_t XIncludeCache::getEntryCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _entries.size();
+}
+
+size_t XIncludeCache::getHitCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _hitCount;
+}
+
+size_t XIncludeCache::getMissCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _missCount;
+}
+
+size_t XIncludeCache::getEvictionCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _evictionCount;
+}
+
+void XIncludeCache::clear()
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    _entries.clear();
+    _entryMap.clear();
+    _size = 0;
+    _hitCount = 0;
+    _missCount = 0;
+    _evictionCount = 0;
+}
+
+void XIncludeCache::evictEntries()
+{
+    while (_size > _maxSize && !_entries.empty())
+    {
+        const Entry& entry = _entries.back();
+        _size -= entry.size;
+        _entryMap.erase(entry.key);
+        _entries.pop_back();
+        _evictionCount++;
+    }
+}
+
 //
 // XmlWriteOptions methods
 //
@@ -315,8 +818,9 @@ void readFromXmlFile(DocumentPtr doc, FilePath filename, FileSearchPath searchPa
     searchPath.append(getEnvironmentPath());
     filename = searchPath.find(filename);
 
+    XmlFileBuffer buffer;
     xml_document xmlDoc;
-    xml_parse_result result = xmlDoc.load_file(filename.asString().c_str(), getParseOptions(readOptions));
+    xml_parse_result result = buffer.load(xmlDoc, filename, getParseOptions(readOptions));
     validateParseResult(result, filename);
 
     // Store the source URI of the document.
@@ -355,6 +859,38 @@ void writeToXmlStream(DocumentPtr doc, std::ostream& stream, const XmlWriteOptio
 
 void writeToXmlFile(DocumentPtr doc, const FilePath& filename, const XmlWriteOptions* writeOptions)
 {
+    const string extension = filename.getExtension();
+    if (extension == GZIP_EXTENSION || extension == ZSTD_EXTENSION)
+    {
+        if (!isXmlFileFormatSupported(filename))
+        {
+            throw Exception("Writing compressed documents requires " +
+                            string(extension == GZIP_EXTENSION ? "MATERIALX_BUILD_ZLIB" : "MATERIALX_BUILD_ZSTD") +
+                            ": " + filename.asString());
+        }
+
+        xml_document xmlDoc;
+        xml_node xmlRoot = xmlDoc.append_child("materialx");
+        documentToXml(doc, xmlRoot, writeOptions);
+#if defined(MATERIALX_BUILD_ZLIB)
+        if (extension == GZIP_EXTENSION)
+        {
+            GzipXmlWriter writer(filename);
+            xmlDoc.save(writer, "  ");
+            writer.finish();
+        }
+#endif
+#if defined(MATERIALX_BUILD_ZSTD)
+        if (extension == ZSTD_EXTENSION)
+        {
+            ZstdXmlWriter writer(filename);
+            xmlDoc.save(writer, "  ");
+            writer.finish();
+        }
+#endif
+        return;
+    }
+
     std::ofstream ofs(filename.asString());
     writeToXmlStream(doc, ofs, writeOptions);
 }
@@ -366,6 +902,28 @@ string writeToXmlString(DocumentPtr doc, const XmlWriteOptions* writeOptions)
     return stream.str();
 }
 
+bool isXmlFileFormatSupported(const FilePath& filename)
+{
+    const string extension = filename.getExtension();
+    if (extension == GZIP_EXTENSION)
+    {
+#if defined(MATERIALX_BUILD_ZLIB)
+        return true;
+#else
+        return false;
+#endif
+    }
+    if (extension == ZSTD_EXTENSION)
+    {
+#if defined(MATERIALX_BUILD_ZSTD)
+        return true;
+#else
+        return false;
+#endif
+    }
+    return true;
+}
+
 void prependXInclude(DocumentPtr doc, const FilePath& filename)
 {
     if (!filename.isEmpty())
@@ -16,9 +16,17 @@
 #include <MaterialXFormat/Export.h>
 #include <MaterialXFormat/File.h>
 
+#include <list>
+#include <mutex>
+#include <unordered_map>
+
 MATERIALX_NAMESPACE_BEGIN
 
 class XmlReadOptions;
+class XIncludeCache;
+
+/// A shared pointer to an XIncludeCache
+using XIncludeCachePtr = shared_ptr<XIncludeCache>;
 
 extern MX_FORMAT_API const string MTLX_EXTENSION;
 
@@ -56,6 +64,132 @@ class MX_FORMAT_API XmlReadOptions
     /// The vector of parent XIncludes at the scope of the current document.
     /// Defaults to an empty vector.
     StringVec parentXIncludes;
+
+    /// If non-empty, then only top-level elements with these categories, along
+    /// with their descendants, will be read into documents.  XML comments and
+    /// newlines are matched by the "comment" and "newline" categories.
+    /// Defaults to an empty set.
+    StringSet includeCategories;
+
+    /// Elements with these categories, along with their descendants, will be
+    /// skipped at any depth when reading documents.  Defaults to an empty set.
+    StringSet excludeCategories;
+
+    /// If greater than zero, then only elements up to this depth below the
+    /// document will be read, where top-level elements have a depth of one.
+    /// Defaults to zero.
+    int maxDepth;
+
+    /// If true, then value attributes will be skipped when reading documents,
+    /// leaving only the structure and connectivity of value elements.
+    /// Defaults to false.
+    bool skipValues;
+
+    /// If provided, then XIncludes will be read through this cache, allowing
+    /// documents that are included repeatedly within a process to be parsed
+    /// only once.  Defaults to a null pointer.
+    XIncludeCachePtr xincludeCache;
+};
+
+/// @class XIncludeCache
+/// A thread-safe cache of documents read through XInclude references.
+///
+/// Each included file is parsed into an immutable document, which is then
+/// imported into every document that includes it.  Entries are keyed by the
+/// resolved path of the included file and the read options in effect, and are
+/// reused only while the modification times and sizes of the file and its own
+/// includes are unchanged.  When the total size of cached entries, measured in
+/// bytes of source files, exceeds the maximum size of the cache, the least
+/// recently used entries are evicted.
+class MX_FORMAT_API XIncludeCache
+{
+  public:
+    /// The default maximum size of a cache in bytes.
+    static const size_t DEFAULT_MAX_SIZE;
+
+  public:
+    XIncludeCache(size_t maxSize = DEFAULT_MAX_SIZE) :
+        _maxSize(maxSize),
+        _size(0),
+        _hitCount(0),
+        _missCount(0),
+        _evictionCount(0)
+    {
+    }
+    ~XIncludeCache() = default;
+
+    /// Create a new XInclude cache with the given maximum size in bytes.
+    static XIncludeCachePtr create(size_t maxSize = DEFAULT_MAX_SIZE)
+    {
+        return std::make_shared<XIncludeCache>(maxSize);
+    }
+
+    /// Return the document for the given XInclude reference, reading it with
+    /// the XInclude read function of the given options if no valid entry
+    /// is present in the cache.
+    /// @param filename The filename of the XInclude reference.
+    /// @param searchPath The search path used to resolve the filename.
+    /// @param readOptions The read options for the included document, whose
+    ///    parent XIncludes end with the given filename.
+    ConstDocumentPtr getDocument(const FilePath& filename,
+                                 const FileSearchPath& searchPath,
+                                 const XmlReadOptions& readOptions);
+
+    /// Set the maximum size of the cache in bytes, evicting entries
+    /// as needed.
+    void setMaxSize(size_t maxSize);
+
+    /// Return the maximum size of the cache in bytes.
+    size_t getMaxSize() const;
+
+    /// Return the current size of the cache in bytes.
+    size_t getSize() const;
+
+    /// Return the number of documents held by the cache.
+    size_t getEntryCount() const;
+
+    /// Return the number of XIncludes that were served from the cache.
+    size_t getHitCount() const;
+
+    /// Return the number of XIncludes that were read from file.
+    size_t getMissCount() const;
+
+    /// Return the number of entries that were evicted from the cache
+    /// to remain within its maximum size.
+    size_t getEvictionCount() const;
+
+    /// Remove all entries from the cache and reset its statistics.
+    void clear();
+
+  protected:
+    struct FileState
+    {
+        string path;
+        int64_t modificationTime;
+        size_t size;
+    };
+    using FileStateVec = vector<FileState>;
+
+    struct Entry
+    {
+        string key;
+        ConstDocumentPtr document;
+        FileStateVec files;
+        size_t size;
+    };
+    using EntryList = std::list<Entry>;
+
+    void evictEntries();
+
+  protected:
+    mutable std::mutex _mutex;
+    EntryList _entries;
+    std::unordered_map<string, EntryList::iterator> _entryMap;
+    size_t _maxSize;
+    size_t _size;
+    size_t _hitCount;
+    size_t _missCount;
+    size_t _evictionCount;
 };
 
 /// @class XmlWriteOptions
@@ -123,7 +257,9 @@ MX_FORMAT_API void readFromXmlStream(DocumentPtr doc, std::istream& stream, File
 /// Read a Document as XML from the given filename.
 /// @param doc The Document into which data is read.
 /// @param filename The filename from which data is read.  This argument can
-///    be supplied either as a FilePath or a standard string.
+///    be supplied either as a FilePath or a standard string.  Filenames with
+///    a ".gz" or ".zst" extension are read as gzip or Zstandard-compressed
+///    documents, when supported by the build.
 /// @param searchPath An optional sequence of file paths that will be applied
 ///    in order when searching for the given file and its includes.  This
 ///    argument can be supplied either as a FileSearchPath, or as a standard
@@ -166,7 +302,9 @@ MX_FORMAT_API void writeToXmlStream(DocumentPtr doc, std::ostream& stream, const
 /// Write a Document as XML to the given filename.
 /// @param doc The Document to be written.
 /// @param filename The filename to which data is written.  This argument can
-///    be supplied either as a FilePath or a standard string.
+///    be supplied either as a FilePath or a standard string.  Filenames with
+///    a ".gz" or ".zst" extension are written as gzip or Zstandard-compressed
+///    documents, when supported by the build.
 /// @param writeOptions An optional pointer to an XmlWriteOptions object.
 ///    If provided, then the given options will affect the behavior of the
 ///    write function.  Defaults to a null pointer.
@@ -180,6 +318,11 @@ MX_FORMAT_API void writeToXmlFile(DocumentPtr doc, const FilePath& filename, con
 /// @return The output string, returned by value
 MX_FORMAT_API string writeToXmlString(DocumentPtr doc, const XmlWriteOptions* writeOptions = nullptr);
 
+/// Return true if documents with the given filename can be read and written
+/// by this build.  Compressed documents with a ".gz" or ".zst" extension
+/// require the MATERIALX_BUILD_ZLIB or MATERIALX_BUILD_ZSTD build options.
+MX_FORMAT_API bool isXmlFileFormatSupported(const FilePath& filename);
+
 /// @}
 /// @name Edit Functions
 /// @{
@@ -29,6 +29,18 @@ void GlslResourceBindingContext::initialize()
     _hwSamplerBindLocation = _hwInitSamplerBindLocation;
 }
 
+string GlslResourceBindingContext::getCacheKey() const
+{
+    return "glsl," + std::to_string(_hwInitUniformBindLocation) + "," +
+           std::to_string(_hwInitSamplerBindLocation) + "," +
+           std::to_string(_separateBindingLocation);
+}
+
+GenUserDataPtr GlslResourceBindingContext::clone() const
+{
+    return std::make_shared<GlslResourceBindingContext>(*this);
+}
+
 void GlslResourceBindingContext::emitDirectives(GenContext& context, ShaderStage& stage)
 {
     const ShaderGenerator& generator = context.getShaderGenerator();
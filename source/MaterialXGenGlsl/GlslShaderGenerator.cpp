@@ -461,11 +461,11 @@ void GlslShaderGenerator::emitPixelStage(const ShaderGraph& graph, GenContext& c
     // depending on the vertical flip flag.
     if (context.getOptions().fileTextureVerticalFlip)
     {
-        _tokenSubstitutions[ShaderGenerator::T_FILE_TRANSFORM_UV] = "mx_transform_uv_vflip.glsl";
+        setTokenSubstitution(ShaderGenerator::T_FILE_TRANSFORM_UV, "mx_transform_uv_vflip.glsl");
     }
     else
     {
-        _tokenSubstitutions[ShaderGenerator::T_FILE_TRANSFORM_UV] = "mx_transform_uv.glsl";
+        setTokenSubstitution(ShaderGenerator::T_FILE_TRANSFORM_UV, "mx_transform_uv.glsl");
     }
 
     emitLightFunctionDefinitions(graph, context, stage);
@@ -44,7 +44,7 @@ class MX_GENGLSL_API GlslShaderGenerator : public HwShaderGenerator
     const string& getTarget() const override { return TARGET; }
 
     /// Return the version string for the GLSL version this generator is for
-    virtual const string& getVersion() const { return VERSION; }
+    const string& getVersion() const override { return VERSION; }
 
     /// Emit a shader variable.
     void emitVariableDeclaration(const ShaderPort* variable, const string& qualifier, GenContext& context, ShaderStage& stage,
@@ -24,6 +24,16 @@ void VkResourceBindingContext::initialize()
     _hwUniformBindLocation = _hwInitUniformBindLocation;
 }
 
+string VkResourceBindingContext::getCacheKey() const
+{
+    return "vulkan," + std::to_string(_hwInitUniformBindLocation);
+}
+
+GenUserDataPtr VkResourceBindingContext::clone() const
+{
+    return std::make_shared<VkResourceBindingContext>(*this);
+}
+
 void VkResourceBindingContext::emitDirectives(GenContext& context, ShaderStage& stage)
 {
     const ShaderGenerator& generator = context.getShaderGenerator();
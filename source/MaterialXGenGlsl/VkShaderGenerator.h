@@ -42,6 +42,10 @@ class MX_GENGLSL_API VkShaderGenerator : public GlslShaderGenerator
 
     string getVertexDataPrefix(const VariableBlock& vertexData) const override;
 
+    /// Return false, since the resource binding context owned by this
+    /// generator is modified during generation.
+    bool supportsConcurrentGeneration() const override { return false; }
+
     /// Unique identifier for this generator target
     static const string TARGET;
     static const string VERSION;
@@ -19,6 +19,11 @@ WgslResourceBindingContext::WgslResourceBindingContext(size_t uniformBindingLoca
 {
 }
 
+GenUserDataPtr WgslResourceBindingContext::clone() const
+{
+    return std::make_shared<WgslResourceBindingContext>(*this);
+}
+
 // Copied from VkResourceBindingContext::emitResourceBindings().  
 // Modified the Type::FILENAME uniform codegen.
 void WgslResourceBindingContext::emitResourceBindings(GenContext& context, const VariableBlock& uniforms, ShaderStage& stage)
@@ -30,6 +30,9 @@ class MX_GENGLSL_API WgslResourceBindingContext : public VkResourceBindingContex
         return std::make_shared<WgslResourceBindingContext>(uniformBindingLocation);
     }
 
+    // Return a copy of this context, holding its own binding locations.
+    GenUserDataPtr clone() const override;
+
     // Emit uniforms with binding information
     void emitResourceBindings(GenContext& context, const VariableBlock& uniforms, ShaderStage& stage) override;
 };
@@ -14,6 +14,8 @@
 #include <MaterialXGenShader/GenUserData.h>
 #include <MaterialXGenShader/Shader.h>
 
+#include <map>
+
 MATERIALX_NAMESPACE_BEGIN
 
 class HwLightShaders;
@@ -63,6 +65,23 @@ class MX_GENHW_API HwLightShaders : public GenUserData
         return _shaders;
     }
 
+    /// Return the bound light types and the implementations of their
+    /// shaders, which affect generated code.
+    string getCacheKey() const override
+    {
+        std::map<unsigned int, string> bindings;
+        for (const auto& it : _shaders)
+        {
+            bindings[it.first] = it.second->getImplementation().getName();
+        }
+        string key;
+        for (const auto& it : bindings)
+        {
+            key += std::to_string(it.first) + ":" + it.second + ";";
+        }
+        return key;
+    }
+
   protected:
     std::unordered_map<unsigned int, ShaderNodePtr> _shaders;
 };
@@ -34,6 +34,12 @@ class MX_GENMDL_API GenMdlOptions : public GenUserData
     GenMdlOptions() :
         targetVersion(MdlVersion::MDL_LATEST) { }
 
+    /// Return the target version, which affects generated code.
+    string getCacheKey() const override
+    {
+        return std::to_string((int) targetVersion);
+    }
+
     /// Unique identifier for the MDL options on the GenContext object.
     static const string GEN_CONTEXT_USER_DATA_KEY;
 
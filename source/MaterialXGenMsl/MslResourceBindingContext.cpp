@@ -28,6 +28,18 @@ void MslResourceBindingContext::initialize()
     _hwSamplerBindLocation = _hwInitSamplerBindLocation;
 }
 
+string MslResourceBindingContext::getCacheKey() const
+{
+    return "msl," + std::to_string(_hwInitUniformBindLocation) + "," +
+           std::to_string(_hwInitSamplerBindLocation) + "," +
+           std::to_string(_separateBindingLocation);
+}
+
+GenUserDataPtr MslResourceBindingContext::clone() const
+{
+    return std::make_shared<MslResourceBindingContext>(*this);
+}
+
 void MslResourceBindingContext::emitDirectives(GenContext&, ShaderStage&)
 {
 }
@@ -35,6 +35,13 @@ class MX_GENMSL_API MslResourceBindingContext : public HwResourceBindingContext
     // Initialize the context before generation starts.
     void initialize() override;
 
+    // Return the type and initial binding locations of this context, which
+    // affect generated code.
+    string getCacheKey() const override;
+
+    // Return a copy of this context, holding its own binding locations.
+    GenUserDataPtr clone() const override;
+
     // Emit directives for stage
     void emitDirectives(GenContext& context, ShaderStage& stage) override;
 
@@ -54,11 +54,11 @@ ShaderPtr OslShaderGenerator::generate(const string& name, ElementPtr element, G
     // depending on the vertical flip flag.
     if (context.getOptions().fileTextureVerticalFlip)
     {
-        _tokenSubstitutions[ShaderGenerator::T_FILE_TRANSFORM_UV] = "mx_transform_uv_vflip.osl";
+        setTokenSubstitution(ShaderGenerator::T_FILE_TRANSFORM_UV, "mx_transform_uv_vflip.osl");
     }
     else
     {
-        _tokenSubstitutions[ShaderGenerator::T_FILE_TRANSFORM_UV] = "mx_transform_uv.osl";
+        setTokenSubstitution(ShaderGenerator::T_FILE_TRANSFORM_UV, "mx_transform_uv.osl");
     }
 
     // Emit function definitions for all nodes
@@ -6,6 +6,10 @@
 #include <MaterialXGenShader/Exception.h>
 #include <MaterialXGenShader/GenContext.h>
 
+#include <MaterialXFormat/Util.h>
+
+#include <algorithm>
+
 MATERIALX_NAMESPACE_BEGIN
 
 //
@@ -13,7 +17,8 @@ MATERIALX_NAMESPACE_BEGIN
 //
 
 GenContext::GenContext(ShaderGeneratorPtr sg) :
-    _sg(sg)
+    _sg(sg),
+    _sourceFileCache(SourceFileCache::getShared())
 {
     if (!_sg)
     {
@@ -43,6 +48,53 @@ GenContext::GenContext(ShaderGeneratorPtr sg) :
     _applicationVariableHandler = nullptr;
 }
 
+GenContextPtr GenContext::fork()
+{
+    // Move the implementations cached by this context into a new immutable
+    // snapshot, which is then shared with the fork.
+    if (!_nodeImpls.empty())
+    {
+        auto nodeImpls = _sharedNodeImpls ? std::make_shared<NodeImplMap>(*_sharedNodeImpls) : std::make_shared<NodeImplMap>();
+        for (const auto& it : _nodeImpls)
+        {
+            (*nodeImpls)[it.first] = it.second;
+        }
+        _sharedNodeImpls = nodeImpls;
+        _nodeImpls.clear();
+    }
+
+    GenContextPtr context = std::make_shared<GenContext>(*this);
+    context->_parentNodes.clear();
+    context->_inputSuffix.clear();
+    context->_outputSuffix.clear();
+    for (auto& it : context->_userData)
+    {
+        for (GenUserDataPtr& data : it.second)
+        {
+            GenUserDataPtr copy = data->clone();
+            if (copy)
+            {
+                data = copy;
+            }
+        }
+    }
+    return context;
+}
+
+ConstSourceFilePtr GenContext::getSourceFile(const FilePath& path) const
+{
+    if (_sourceFileCache)
+    {
+        return _sourceFileCache->getFile(path);
+    }
+    string content = readFile(path);
+    if (content.empty())
+    {
+        return nullptr;
+    }
+    return std::make_shared<SourceFile>(path, path.getModificationTime(), path.getFileSize(), content);
+}
+
 void GenContext::addNodeImplementation(const string& name, ShaderNodeImplPtr impl)
 {
     _nodeImpls[name] = impl;
@@ -51,7 +103,19 @@ void GenContext::addNodeImplementation(const string& name, ShaderNodeImplPtr imp
 ShaderNodeImplPtr GenContext::findNodeImplementation(const string& name) const
 {
     auto it = _nodeImpls.find(name);
-    return it != _nodeImpls.end() ? it->second : nullptr;
+    if (it != _nodeImpls.end())
+    {
+        return it->second;
+    }
+    if (_sharedNodeImpls)
+    {
+        auto sharedIt = _sharedNodeImpls->find(name);
+        if (sharedIt != _sharedNodeImpls->end())
+        {
+            return sharedIt->second;
+        }
+    }
+    return nullptr;
 }
 
 void GenContext::getNodeImplementationNames(StringSet& names)
@@ -60,11 +124,19 @@ void GenContext::getNodeImplementationNames(StringSet& names)
     {
         names.insert(it.first);
     }
+    if (_sharedNodeImpls)
+    {
+        for (const auto& it : *_sharedNodeImpls)
+        {
+            names.insert(it.first);
+        }
+    }
 }
 
 void GenContext::clearNodeImplementations()
 {
     _nodeImpls.clear();
+    _sharedNodeImpls.reset();
 }
 
 void GenContext::clearUserData()
@@ -72,6 +144,20 @@ void GenContext::clearUserData()
     _userData.clear();
 }
 
+StringVec GenContext::getUserDataNames() const
+{
+    StringVec names;
+    for (const auto& it : _userData)
+    {
+        if (!it.second.empty())
+        {
+            names.push_back(it.first);
+        }
+    }
+    std::sort(names.begin(), names.end());
+    return names;
+}
+
 void GenContext::addInputSuffix(const ShaderInput* input, const string& suffix)
 {
     _inputSuffix[input] = suffix;
@@ -15,6 +15,7 @@
 #include <MaterialXGenShader/GenUserData.h>
 #include <MaterialXGenShader/ShaderNode.h>
 #include <MaterialXGenShader/ShaderGenerator.h>
+#include <MaterialXGenShader/SourceFileCache.h>
 
 #include <MaterialXFormat/File.h>
 
@@ -32,6 +33,19 @@ class MX_GENSHADER_API GenContext
     /// Constructor.
     GenContext(ShaderGeneratorPtr sg);
 
+    /// Create a fork of this context, for shader generation on another thread.
+    ///
+    /// The fork shares the shader generator, options, source code search path,
+    /// source file cache, reserved words and application variable handler of
+    /// this context, along with an immutable snapshot of its cached node
+    /// implementations.  Parent nodes and input and output suffixes are owned
+    /// by each context, and implementations created after the fork are cached
+    /// only in the context that created them.
+    ///
+    /// User data is shared with the fork, except for data returning a copy
+    /// from GenUserData::clone, such as a resource binding context.
+    GenContextPtr fork();
+
     /// Return shader generatior.
     ShaderGenerator& getShaderGenerator()
     {
@@ -82,6 +96,25 @@ class MX_GENSHADER_API GenContext
         return searchPath.find(filename).getNormalized();
     }
 
+    /// Set the cache of source code files used by this context.  Defaults to
+    /// the process-wide cache returned by SourceFileCache::getShared.  If set
+    /// to nullptr, then source code files will be read on each request.
+    void setSourceFileCache(SourceFileCachePtr cache)
+    {
+        _sourceFileCache = cache;
+    }
+
+    /// Return the cache of source code files used by this context.
+    SourceFileCachePtr getSourceFileCache() const
+    {
+        return _sourceFileCache;
+    }
+
+    /// Return the source code file at the given resolved path, through the
+    /// source file cache of this context if one is set.
+    /// @return The source file, or nullptr if the file is missing or empty.
+    ConstSourceFilePtr getSourceFile(const FilePath& path) const;
+
     /// Add reserved words that should not be used as
     /// identifiers during code generation.
     void addReservedWords(const StringSet& names)
@@ -164,6 +197,9 @@ class MX_GENSHADER_API GenContext
         return it != _userData.end() && !it->second.empty() ? it->second.back()->asA<T>() : nullptr;
     }
 
+    /// Return the names of all user data in the context, in sorted order.
+    StringVec getUserDataNames() const;
+
     /// Add an input suffix to be used for the input in this context.
     /// @param input Node input
     /// @param suffix Suffix string
@@ -210,9 +246,13 @@ class MX_GENSHADER_API GenContext
     ShaderGeneratorPtr _sg;
     GenOptions _options;
     FileSearchPath _sourceCodeSearchPath;
+    SourceFileCachePtr _sourceFileCache;
     StringSet _reservedWords;
 
-    std::unordered_map<string, ShaderNodeImplPtr> _nodeImpls;
+    using NodeImplMap = std::unordered_map<string, ShaderNodeImplPtr>;
+
+    NodeImplMap _nodeImpls;
+    shared_ptr<const NodeImplMap> _sharedNodeImpls;
     std::unordered_map<string, vector<GenUserDataPtr>> _userData;
     std::unordered_map<const ShaderInput*, string> _inputSuffix;
     std::unordered_map<const ShaderOutput*, string> _outputSuffix;
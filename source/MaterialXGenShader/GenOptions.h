@@ -82,6 +82,7 @@ class MX_GENSHADER_API GenOptions
         libraryPrefix("libraries"),
         emitColorTransforms(true),
         elideConstantNodes(true),
+        foldConstantNodes(false),
         premultipliedBsdfAdd(false),
         distributeLayerOverBsdfMix(false),
         hwTransparency(false),
@@ -143,6 +144,13 @@ class MX_GENSHADER_API GenOptions
     /// Enable eliding constant nodes. Defaults to true.
     bool elideConstantNodes;
 
+    /// Enable folding of standard library math nodes whose inputs are all
+    /// constant, such as add, multiply, remap, clamp and mix, into a single
+    /// value.  When enabled, values assigned to the inputs of these nodes are
+    /// treated as final, and are no longer published as separate uniforms.
+    /// Defaults to false.
+    bool foldConstantNodes;
+
     /// Enable replacing BSDF mix nodes with premultiplied add nodes.
     /// This folds the mix weight into each BSDF's weight input, enabling
     /// hardware shading languages to skip BSDF evaluation via dynamic
@@ -52,6 +52,25 @@ class MX_GENSHADER_API GenUserData : public std::enable_shared_from_this<GenUser
         return std::dynamic_pointer_cast<const T>(getSelf());
     }
 
+    /// Return a string describing the state of this data that affects
+    /// generated code, which is included in the keys of cached shaders.
+    /// Data types that may be stored under the same name as other types
+    /// should include an identifier for their type in the string.
+    /// Defaults to an empty string.
+    virtual string getCacheKey() const
+    {
+        return string();
+    }
+
+    /// Return a copy of this data for use by a fork of a generation context,
+    /// or nullptr if this data may be shared between contexts.  Data holding
+    /// state that is modified during generation should return a copy.
+    /// Defaults to nullptr.
+    virtual GenUserDataPtr clone() const
+    {
+        return nullptr;
+    }
+
   protected:
     GenUserData() { }
 };
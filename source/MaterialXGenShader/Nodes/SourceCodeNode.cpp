@@ -33,12 +33,13 @@ void SourceCodeNode::resolveSourceCode(const InterfaceElement& element, GenConte
 
     FilePath localPath = FilePath(impl.getActiveSourceUri()).getParentPath();
     _sourceFilename = context.resolveSourceFile(impl.getAttribute("file"), localPath);
-    _functionSource = readFile(_sourceFilename);
-    if (_functionSource.empty())
+    ConstSourceFilePtr sourceFile = context.getSourceFile(_sourceFilename);
+    if (!sourceFile)
     {
         throw ExceptionShaderGenError("Failed to get source code from file '" + _sourceFilename.asString() +
                                       "' used by implementation '" + impl.getName() + "'");
     }
+    _functionSource = sourceFile->getContent();
 }
 
 void SourceCodeNode::initialize(const InterfaceElement& element, GenContext& context)
@@ -0,0 +1,161 @@
+//
+// Copyright Contributors to the MaterialX Project
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#include <MaterialXGenShader/ShaderBatch.h>
+
+#include <MaterialXGenShader/ShaderCache.h>
+#include <MaterialXGenShader/ShaderGenerator.h>
+
+#include <MaterialXCore/Util.h>
+
+MATERIALX_NAMESPACE_BEGIN
+
+const string TOPOLOGY_KEY_ATTRIBUTE = "topologykey";
+
+namespace
+{
+
+// Generate a shader, recording the given topology key as an attribute.
+ShaderPtr generateShader(const string& name, TypedElementPtr element, GenContext& context, const string& topologyKey)
+{
+    ShaderPtr shader = context.getShaderGenerator().generate(name, element, context);
+    if (shader)
+    {
+        shader->setAttribute(TOPOLOGY_KEY_ATTRIBUTE, Value::createValue(topologyKey));
+    }
+    return shader;
+}
+
+} // anonymous namespace
+
+//
+// ShaderBatch methods
+//
+
+ShaderPermutationPtr ShaderBatch::addElement(const string& name, TypedElementPtr element, GenContext& context)
+{
+    ShaderGraphPtr graph = ShaderGraph::create(nullptr, name, element, context);
+    const string key = ShaderCache::computeTopologyKey(*graph, context);
+
+    ShaderPermutationPtr permutation;
+    auto it = _permutationMap.find(key);
+    if (it != _permutationMap.end())
+    {
+        permutation = it->second;
+    }
+    else
+    {
+        ShaderPtr shader = generateShader(name, element, context, key);
+        if (!shader)
+        {
+            return nullptr;
+        }
+        permutation = std::make_shared<ShaderPermutation>(key, shader);
+        _permutations.push_back(permutation);
+        _permutationMap[key] = permutation;
+    }
+
+    // Since graphs of equal topology have matching input sockets, the uniforms
+    // of this element are mapped by position to the variables of the shared shader.
+    UniformValueMap uniformValues;
+    const vector<ShaderGraphInputSocket*>& sockets = graph->getInputSockets();
+    const vector<ShaderGraphInputSocket*>& sharedSockets = permutation->getShader()->getGraph().getInputSockets();
+    for (size_t i = 0; i < sockets.size() && i < sharedSockets.size(); i++)
+    {
+        if (!sharedSockets[i]->getConnections().empty() && sockets[i]->getValue())
+        {
+            uniformValues[sharedSockets[i]->getVariable()] = sockets[i]->getValue();
+        }
+    }
+    permutation->addElement(element, uniformValues);
+
+    return permutation;
+}
+
+size_t ShaderBatch::getElementCount() const
+{
+    size_t count = 0;
+    for (const ShaderPermutationPtr& permutation : _permutations)
+    {
+        count += permutation->getElementCount();
+    }
+    return count;
+}
+
+void ShaderBatch::clear()
+{
+    _permutations.clear();
+    _permutationMap.clear();
+}
+
+ShaderPermutationVec generateShaderPermutations(const vector<TypedElementPtr>& elements, GenContext& context)
+{
+    ShaderBatch batch;
+    for (TypedElementPtr element : elements)
+    {
+        batch.addElement(createValidName(element->getName()), element, context);
+    }
+    return batch.getPermutations();
+}
+
+ShaderPtr updateShader(ShaderPtr shader, const string& name, TypedElementPtr element, GenContext& context, UniformValueMap* uniformValues)
+{
+    ShaderGraphPtr graph = ShaderGraph::create(nullptr, name, element, context);
+    const string key = ShaderCache::computeTopologyKey(*graph, context);
+
+    // Regenerate the shader if its topology has changed.
+    ValuePtr previousKey = shader ? shader->getAttribute(TOPOLOGY_KEY_ATTRIBUTE) : nullptr;
+    if (!previousKey || previousKey->getValueString() != key)
+    {
+        if (uniformValues)
+        {
+            uniformValues->clear();
+        }
+        return generateShader(name, element, context, key);
+    }
+
+    // Otherwise copy the values of uniforms by position into the graph of the
+    // shader, and into the variable blocks of each stage.
+    const vector<ShaderGraphInputSocket*>& sockets = graph->getInputSockets();
+    const vector<ShaderGraphInputSocket*>& shaderSockets = shader->getGraph().getInputSockets();
+    UniformValueMap updatedValues;
+    for (size_t i = 0; i < sockets.size() && i < shaderSockets.size(); i++)
+    {
+        ValuePtr value = sockets[i]->getValue();
+        ValuePtr shaderValue = shaderSockets[i]->getValue();
+        if (shaderSockets[i]->getConnections().empty() || !value)
+        {
+            continue;
+        }
+        if (!shaderValue || shaderValue->getValueString() != value->getValueString())
+        {
+            shaderSockets[i]->setValue(value);
+            updatedValues[shaderSockets[i]->getVariable()] = value;
+        }
+    }
+    for (size_t i = 0; i < shader->numStages() && !updatedValues.empty(); i++)
+    {
+        for (const auto& it : shader->getStage(i).getUniformBlocks())
+        {
+            VariableBlock& block = *it.second;
+            for (size_t j = 0; j < block.size(); j++)
+            {
+                auto valueIt = updatedValues.find(block[j]->getVariable());
+                if (valueIt != updatedValues.end())
+                {
+                    block[j]->setValue(valueIt->second);
+                }
+            }
+        }
+    }
+
+    if (uniformValues)
+    {
+        *uniformValues = updatedValues;
+    }
+    return shader;
+}
+
+MATERIALX_NAMESPACE_END
@@ -0,0 +1,169 @@
+//
+// Copyright Contributors to the MaterialX Project
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#ifndef MATERIALX_SHADERBATCH_H
+#define MATERIALX_SHADERBATCH_H
+
+/// @file
+/// Batch generation of shaders shared between elements of equal topology
+
+#include <MaterialXGenShader/Export.h>
+
+#include <MaterialXGenShader/GenContext.h>
+#include <MaterialXGenShader/Shader.h>
+
+#include <map>
+
+MATERIALX_NAMESPACE_BEGIN
+
+/// A map from the variable names of uniforms to their values
+using UniformValueMap = std::map<string, ValuePtr>;
+
+/// A shared pointer to a ShaderPermutation
+using ShaderPermutationPtr = shared_ptr<class ShaderPermutation>;
+
+/// A vector of shader permutations
+using ShaderPermutationVec = vector<ShaderPermutationPtr>;
+
+/// A shared pointer to a ShaderBatch
+using ShaderBatchPtr = shared_ptr<class ShaderBatch>;
+
+/// The name of the shader attribute holding the topology key of shaders
+/// generated by a ShaderBatch or by updateShader.
+extern MX_GENSHADER_API const string TOPOLOGY_KEY_ATTRIBUTE;
+
+/// @class ShaderPermutation
+/// A shader generated once for a group of elements whose shader graphs share
+/// the same topology, along with the uniform values of each element.
+class MX_GENSHADER_API ShaderPermutation
+{
+  public:
+    ShaderPermutation(const string& topologyKey, ShaderPtr shader) :
+        _topologyKey(topologyKey),
+        _shader(shader)
+    {
+    }
+    ~ShaderPermutation() = default;
+
+    /// Return the topology key shared by the elements of this permutation.
+    const string& getTopologyKey() const
+    {
+        return _topologyKey;
+    }
+
+    /// Return the shader generated for this permutation.
+    ShaderPtr getShader() const
+    {
+        return _shader;
+    }
+
+    /// Return the number of elements sharing this permutation.
+    size_t getElementCount() const
+    {
+        return _elements.size();
+    }
+
+    /// Return the elements sharing this permutation, in the order in which
+    /// they were added.  The shader was generated from the first element.
+    const vector<TypedElementPtr>& getElements() const
+    {
+        return _elements;
+    }
+
+    /// Return the uniform values of the element at the given index, keyed by
+    /// the variable names of the corresponding uniforms in the shader.
+    const UniformValueMap& getUniformValues(size_t index) const
+    {
+        return _uniformValues.at(index);
+    }
+
+    /// Add an element with the given uniform values to this permutation.
+    void addElement(TypedElementPtr element, const UniformValueMap& uniformValues)
+    {
+        _elements.push_back(element);
+        _uniformValues.push_back(uniformValues);
+    }
+
+  protected:
+    string _topologyKey;
+    ShaderPtr _shader;
+    vector<TypedElementPtr> _elements;
+    vector<UniformValueMap> _uniformValues;
+};
+
+/// @class ShaderBatch
+/// A batch of shaders generated for a set of renderable elements.
+///
+/// As each element is added, its shader graph is created and its topology key
+/// is computed with ShaderCache::computeTopologyKey.  A shader is generated
+/// only for the first element of each topology, and later elements of the
+/// same topology share its shader, recording only their uniform values.
+class MX_GENSHADER_API ShaderBatch
+{
+  public:
+    ShaderBatch() = default;
+    ~ShaderBatch() = default;
+
+    /// Create a new shader batch.
+    static ShaderBatchPtr create()
+    {
+        return std::make_shared<ShaderBatch>();
+    }
+
+    /// Add the given element to the batch, generating a shader with the given
+    /// context if no existing permutation shares its topology.
+    /// @param name Name of the shader, used only if a new shader is generated.
+    /// @param element The element to add.
+    /// @param context The context for shader generation.
+    /// @return The permutation to which the element was added.
+    ShaderPermutationPtr addElement(const string& name, TypedElementPtr element, GenContext& context);
+
+    /// Return the permutations of the batch, in order of creation.
+    const ShaderPermutationVec& getPermutations() const
+    {
+        return _permutations;
+    }
+
+    /// Return the total number of elements added to the batch.
+    size_t getElementCount() const;
+
+    /// Remove all permutations from the batch.
+    void clear();
+
+  protected:
+    ShaderPermutationVec _permutations;
+    std::unordered_map<string, ShaderPermutationPtr> _permutationMap;
+};
+
+/// Generate shaders for the given renderable elements, generating a single
+/// shader for each group of elements whose shader graphs share a topology.
+/// @return The permutations generated, in order of first occurrence.
+MX_GENSHADER_API ShaderPermutationVec generateShaderPermutations(const vector<TypedElementPtr>& elements, GenContext& context);
+
+/// Update a previously generated shader for edits to the element from which it
+/// was generated.  If the topology of the element's shader graph is unchanged,
+/// then the values of the shader's uniforms are updated in place, without
+/// regenerating its source code.  Otherwise, a new shader is generated.
+///
+/// The shader graph of the element is created on each call, in order to
+/// compute its topology key, so an update in place saves the emission of
+/// source code and its compilation by the client, but not the construction
+/// of the graph.
+/// @param shader The shader to update.  Only shaders generated by a previous
+///    call to this function, or by a ShaderBatch, can be updated in place,
+///    and any other shader is regenerated.
+/// @param name Name of the shader, used only if a new shader is generated.
+/// @param element The edited element.
+/// @param context The context for shader generation.
+/// @param uniformValues If provided, this map is filled with the values of
+///    uniforms that were updated in place, keyed by their variable names,
+///    and is cleared if a new shader is generated.
+/// @return The given shader if it was updated in place, or a new shader.
+MX_GENSHADER_API ShaderPtr updateShader(ShaderPtr shader, const string& name, TypedElementPtr element,
+                                        GenContext& context, UniformValueMap* uniformValues = nullptr);
+
+MATERIALX_NAMESPACE_END
+
+#endif
@@ -0,0 +1,579 @@
+//
+// Copyright Contributors to the MaterialX Project
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#include <MaterialXGenShader/ShaderCache.h>
+
+#include <MaterialXGenShader/ShaderGenerator.h>
+#include <MaterialXGenShader/Syntax.h>
+#include <MaterialXGenShader/Util.h>
+
+#include <MaterialXFormat/Util.h>
+
+#include <MaterialXCore/Util.h>
+
+#include <algorithm>
+#include <charconv>
+#include <cstdio>
+#include <fstream>
+#include <iomanip>
+#include <random>
+#include <set>
+#include <unordered_map>
+
+MATERIALX_NAMESPACE_BEGIN
+
+const size_t ShaderCache::DEFAULT_MAX_SIZE = 1024 * 1024 * 1024;
+const string ShaderCache::ENTRY_EXTENSION = "mxsc";
+
+namespace
+{
+
+const string ENTRY_HEADER = "MXSC1";
+
+// A 128-bit FNV-1a hash, formed from two 64-bit hashes with distinct offsets,
+// used to produce stable keys across processes and platforms.
+class ContentHasher
+{
+  public:
+    void add(const string& str)
+    {
+        for (char c : str)
+        {
+            addByte((uint8_t) c);
+        }
+        addByte(0);
+    }
+
+    template <class T> void addValue(T value)
+    {
+        add(std::to_string(value));
+    }
+
+    string asString() const
+    {
+        std::ostringstream ss;
+        ss << std::hex << std::setfill('0') << std::setw(16) << _hash0 << std::setw(16) << _hash1;
+        return ss.str();
+    }
+
+  private:
+    void addByte(uint8_t byte)
+    {
+        _hash0 = (_hash0 ^ byte) * PRIME;
+        _hash1 = (_hash1 ^ byte) * PRIME;
+    }
+
+    static const uint64_t PRIME = 0x100000001b3ull;
+    uint64_t _hash0 = 0xcbf29ce484222325ull;
+    uint64_t _hash1 = 0x84222325cbf29ce4ull;
+};
+
+// Add an element and all of its descendants to the hash, at most once.
+void hashElementTree(ConstElementPtr elem, ContentHasher& hasher, std::set<ConstElementPtr>& visited)
+{
+    if (!elem || visited.count(elem))
+    {
+        return;
+    }
+    visited.insert(elem);
+    for (ElementPtr child : elem->traverseTree())
+    {
+        hasher.add(child->getNamePath());
+        hasher.add(child->asString());
+    }
+}
+
+// Add the content of a source code file and the files it includes to the
+// hash, at most once per file.
+void hashSourceFile(const FilePath& path, GenContext& context, ContentHasher& hasher, StringSet& visitedFiles)
+{
+    if (visitedFiles.count(path.asString()))
+    {
+        return;
+    }
+    visitedFiles.insert(path.asString());
+    hasher.add(path.asString(FilePath::FormatPosix));
+
+    ConstSourceFilePtr sourceFile = context.getSourceFile(path);
+    if (!sourceFile)
+    {
+        hasher.add(EMPTY_STRING);
+        return;
+    }
+    hasher.add(sourceFile->getContent());
+
+    const ShaderGenerator& generator = context.getShaderGenerator();
+    const Syntax& syntax = generator.getSyntax();
+    for (const SourceFile::Line& line : sourceFile->getLines(syntax.getIncludeStatement(), syntax.getStringQuote()))
+    {
+        if (line.isInclude && !line.includeFilename.empty())
+        {
+            string includeFilename = line.includeFilename;
+            tokenSubstitution(generator.getTokenSubstitutions(), includeFilename);
+            hashSourceFile(context.resolveSourceFile(includeFilename, path.getParentPath()), context, hasher, visitedFiles);
+        }
+    }
+}
+
+// Add a node, its enclosing graph, and the definition and implementation
+// it references to the hash.
+void hashNode(ConstNodePtr node, GenContext& context, ContentHasher& hasher, std::set<ConstElementPtr>& visited, StringSet& visitedFiles);
+
+// Add the upstream dependencies of an element to the hash.
+void hashUpstream(ConstElementPtr elem, GenContext& context, ContentHasher& hasher, std::set<ConstElementPtr>& visited, StringSet& visitedFiles)
+{
+    hashElementTree(elem, hasher, visited);
+    hasher.add(elem->getActiveColorSpace());
+    if (elem->getParent() && !elem->getParent()->isA<Document>())
+    {
+        hashElementTree(elem->getParent(), hasher, visited);
+    }
+    if (elem->isA<Node>())
+    {
+        hashNode(elem->asA<Node>(), context, hasher, visited, visitedFiles);
+    }
+    for (Edge edge : elem->traverseGraph())
+    {
+        for (ElementPtr edgeElem : { edge.getUpstreamElement(), edge.getConnectingElement() })
+        {
+            if (!edgeElem || visited.count(edgeElem))
+            {
+                continue;
+            }
+            hashElementTree(edgeElem, hasher, visited);
+            hasher.add(edgeElem->getActiveColorSpace());
+            if (edgeElem->getParent() && !edgeElem->getParent()->isA<Document>())
+            {
+                hashElementTree(edgeElem->getParent(), hasher, visited);
+            }
+            if (edgeElem->isA<Node>())
+            {
+                hashNode(edgeElem->asA<Node>(), context, hasher, visited, visitedFiles);
+            }
+        }
+    }
+}
+
+void hashNode(ConstNodePtr node, GenContext& context, ContentHasher& hasher, std::set<ConstElementPtr>& visited, StringSet& visitedFiles)
+{
+    const string& target = context.getShaderGenerator().getTarget();
+    NodeDefPtr nodeDef = node->getNodeDef(target);
+    if (!nodeDef || visited.count(nodeDef))
+    {
+        return;
+    }
+    hashElementTree(nodeDef, hasher, visited);
+
+    InterfaceElementPtr impl = nodeDef->getImplementation(target);
+    if (!impl || visited.count(impl))
+    {
+        return;
+    }
+    hashElementTree(impl, hasher, visited);
+    if (impl->isA<NodeGraph>())
+    {
+        for (NodePtr graphNode : impl->asA<NodeGraph>()->getNodes())
+        {
+            hashNode(graphNode, context, hasher, visited, visitedFiles);
+        }
+    }
+    else if (impl->isA<Implementation>() && impl->hasAttribute(Implementation::FILE_ATTRIBUTE))
+    {
+        // Source code is resolved as in SourceCodeNode::resolveSourceCode.
+        FilePath localPath = FilePath(impl->getActiveSourceUri()).getParentPath();
+        FilePath path = context.resolveSourceFile(impl->getAttribute(Implementation::FILE_ATTRIBUTE), localPath);
+        hashSourceFile(path, context, hasher, visitedFiles);
+    }
+}
+
+// Add the target and version of the shader generator of a context, and the
+// user data of the context, to the hash.
+void hashGeneratorState(GenContext& context, ContentHasher& hasher)
+{
+    const ShaderGenerator& generator = context.getShaderGenerator();
+    hasher.add(generator.getTarget());
+    hasher.add(generator.getVersion());
+    for (const string& name : context.getUserDataNames())
+    {
+        GenUserDataPtr data = context.getUserData<GenUserData>(name);
+        hasher.add(name);
+        hasher.add(data->getCacheKey());
+    }
+}
+
+// Add the generation options, color management system and unit system
+// of a context to the hash.
+void hashGenerator(GenContext& context, ContentHasher& hasher)
+{
+    const ShaderGenerator& generator = context.getShaderGenerator();
+    const GenOptions& options = context.getOptions();
+    hasher.addValue((int) options.shaderInterfaceType);
+    hasher.addValue(options.fileTextureVerticalFlip);
+    hasher.add(options.targetColorSpaceOverride);
+    hasher.add(options.targetDistanceUnit);
+    hasher.addValue(options.addUpstreamDependencies);
+    hasher.add(options.libraryPrefix.asString(FilePath::FormatPosix));
+    hasher.addValue(options.emitColorTransforms);
+    hasher.addValue(options.elideConstantNodes);
+    hasher.addValue(options.foldConstantNodes);
+    hasher.addValue(options.premultipliedBsdfAdd);
+    hasher.addValue(options.distributeLayerOverBsdfMix);
+    hasher.addValue(options.hwTransparency);
+    hasher.addValue((int) options.hwSpecularEnvironmentMethod);
+    hasher.addValue((int) options.hwDirectionalAlbedoMethod);
+    hasher.addValue((int) options.hwTransmissionRenderMethod);
+    hasher.addValue(options.hwAiryFresnelIterations);
+    hasher.addValue(options.hwSrgbEncodeOutput);
+    hasher.addValue(options.hwWriteDepthMoments);
+    hasher.addValue(options.hwShadowMap);
+    hasher.addValue(options.hwAmbientOcclusion);
+    hasher.addValue(options.hwMaxActiveLightSources);
+    hasher.addValue(options.hwNormalizeUdimTexCoords);
+    hasher.addValue(options.hwWriteAlbedoTable);
+    hasher.addValue(options.hwWriteEnvPrefilter);
+    hasher.addValue(options.hwImplicitBitangents);
+    hasher.addValue(options.oslImplicitSurfaceShaderConversion);
+    hasher.addValue(options.oslConnectCiWrapper);
+
+    // Color management and unit systems
+    ColorManagementSystemPtr cms = generator.getColorManagementSystem();
+    hasher.add(cms ? cms->getName() : EMPTY_STRING);
+    UnitSystemPtr unitSystem = generator.getUnitSystem();
+    hasher.add(unitSystem ? unitSystem->getName() : EMPTY_STRING);
+}
+
+// Add the structure of a shader graph to the hash, referring to nodes and
+// input sockets by index rather than by name.
+void hashGraphTopology(const ShaderGraph& graph, ContentHasher& hasher)
+{
+    std::unordered_map<const ShaderNode*, size_t> nodeIndices;
+    for (const ShaderNode* node : graph.getNodes())
+    {
+        nodeIndices.emplace(node, nodeIndices.size());
+    }
+    std::unordered_map<const ShaderOutput*, size_t> socketIndices;
+    for (const ShaderGraphInputSocket* socket : graph.getInputSockets())
+    {
+        socketIndices.emplace(socket, socketIndices.size());
+    }
+    auto hashConnection = [&](const ShaderOutput* upstream)
+    {
+        if (!upstream)
+        {
+            hasher.add(EMPTY_STRING);
+        }
+        else if (socketIndices.count(upstream))
+        {
+            hasher.add("socket");
+            hasher.addValue(socketIndices[upstream]);
+        }
+        else
+        {
+            auto it = nodeIndices.find(upstream->getNode());
+            hasher.add(it != nodeIndices.end() ? std::to_string(it->second) : upstream->getNode()->getName());
+            hasher.add(upstream->getName());
+        }
+    };
+
+    hasher.addValue(graph.getClassification());
+    for (const ShaderGraphInputSocket* socket : graph.getInputSockets())
+    {
+        hasher.add(socket->getType().getName());
+        hasher.addValue(socket->isUniform());
+        hasher.add(socket->getUnit());
+        hasher.add(socket->getColorSpace());
+        hasher.add(socket->getGeomProp());
+        hasher.addValue(socket->getConnections().empty());
+    }
+    for (const ShaderNode* node : graph.getNodes())
+    {
+        hasher.add(node->getImplementation().getName());
+        hasher.addValue(node->getClassification());
+        for (const ShaderInput* input : node->getInputs())
+        {
+            hasher.add(input->getName());
+            hasher.add(input->getType().getName());
+            hashConnection(input->getConnection());
+
+            // Values of unconnected inputs are emitted into the shader code.
+            if (!input->getConnection())
+            {
+                hasher.add(input->getValue() ? input->getValue()->getValueString() : EMPTY_STRING);
+            }
+        }
+        for (const ShaderOutput* output : node->getOutputs())
+        {
+            hasher.add(output->getName());
+            hasher.add(output->getType().getName());
+        }
+    }
+    for (const ShaderGraphOutputSocket* socket : graph.getOutputSockets())
+    {
+        hasher.add(socket->getName());
+        hasher.add(socket->getType().getName());
+        hashConnection(socket->getConnection());
+    }
+}
+
+} // anonymous namespace
+
+//
+// ShaderCache methods
+//
+
+ShaderCache::ShaderCache(const FilePath& directory, size_t maxSize) :
+    _directory(directory),
+    _maxSize(maxSize),
+    _totalSize(0),
+    _hitCount(0),
+    _missCount(0)
+{
+    _directory.createDirectory(true);
+    scanDirectory();
+    evictEntries();
+}
+
+void ShaderCache::setMaxSize(size_t maxSize)
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    _maxSize = maxSize;
+    evictEntries();
+}
+
+size_t ShaderCache::getTotalSize() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _totalSize;
+}
+
+size_t ShaderCache::getEntryCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _entries.size();
+}
+
+size_t ShaderCache::getHitCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _hitCount;
+}
+
+size_t ShaderCache::getMissCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _missCount;
+}
+
+string ShaderCache::computeKey(const string& name, ConstElementPtr element, GenContext& context)
+{
+    ContentHasher hasher;
+    hasher.add(getVersionString());
+    hasher.add(name);
+
+    hashGeneratorState(context, hasher);
+    hashGenerator(context, hasher);
+
+    // Upstream dependencies of the element, including the source code of
+    // their implementations
+    std::set<ConstElementPtr> visited;
+    StringSet visitedFiles;
+    hashUpstream(element, context, hasher, visited, visitedFiles);
+
+    return hasher.asString();
+}
+
+string ShaderCache::computeTopologyKey(const ShaderGraph& graph, GenContext& context)
+{
+    ContentHasher hasher;
+    hasher.add(getVersionString());
+    hashGeneratorState(context, hasher);
+    hashGenerator(context, hasher);
+    hashGraphTopology(graph, hasher);
+    return hasher.asString();
+}
+
+bool ShaderCache::getSourceCode(const string& key, StringMap& stageSourceCode)
+{
+    FilePath path = getEntryPath(key);
+    string content = readFile(path);
+
+    // Parse the stages of the entry, treating any malformed entry as a miss.
+    bool valid = content.compare(0, ENTRY_HEADER.size(), ENTRY_HEADER) == 0;
+    size_t pos = ENTRY_HEADER.size() + 1;
+    StringMap stages;
+    while (valid && pos < content.size())
+    {
+        size_t nameEnd = content.find('\n', pos);
+        size_t lengthEnd = nameEnd != string::npos ? content.find('\n', nameEnd + 1) : string::npos;
+        if (lengthEnd == string::npos)
+        {
+            valid = false;
+            break;
+        }
+        string stageName = content.substr(pos, nameEnd - pos);
+        const char* lengthBegin = content.data() + nameEnd + 1;
+        const char* lengthEndPtr = content.data() + lengthEnd;
+        size_t length = 0;
+        std::from_chars_result parsed = std::from_chars(lengthBegin, lengthEndPtr, length);
+        if (parsed.ec != std::errc() || parsed.ptr != lengthEndPtr || length > content.size() - lengthEnd - 1)
+        {
+            valid = false;
+            break;
+        }
+        stages[stageName] = content.substr(lengthEnd + 1, length);
+        pos = lengthEnd + 1 + length;
+    }
+
+    std::lock_guard<std::mutex> lock(_mutex);
+    if (!valid || stages.empty())
+    {
+        _missCount++;
+        if (_entryMap.count(key))
+        {
+            removeEntry(key);
+        }
+        return false;
+    }
+    _hitCount++;
+    touchEntry(key, content.size());
+    stageSourceCode = stages;
+    return true;
+}
+
+void ShaderCache::setSourceCode(const string& key, const Shader& shader)
+{
+    StringMap stageSourceCode;
+    for (size_t i = 0; i < shader.numStages(); i++)
+    {
+        const ShaderStage& stage = shader.getStage(i);
+        stageSourceCode[stage.getName()] = stage.getSourceCode();
+    }
+    setSourceCode(key, stageSourceCode);
+}
+
+void ShaderCache::setSourceCode(const string& key, const StringMap& stageSourceCode)
+{
+    string content = ENTRY_HEADER + "\n";
+    for (const auto& stage : stageSourceCode)
+    {
+        content += stage.first + "\n" + std::to_string(stage.second.size()) + "\n" + stage.second;
+    }
+
+    // Write to a temporary file, then move it into place, so that concurrent
+    // readers never observe a partially written entry.
+    FilePath path = getEntryPath(key);
+    FilePath tempPath = _directory / (key + "." + std::to_string(std::random_device()()) + ".tmp");
+    {
+        std::ofstream stream(tempPath.asString(), std::ios::binary);
+        if (!stream)
+        {
+            return;
+        }
+        stream.write(content.data(), content.size());
+    }
+    std::remove(path.asString().c_str());
+    if (std::rename(tempPath.asString().c_str(), path.asString().c_str()) != 0)
+    {
+        std::remove(tempPath.asString().c_str());
+        return;
+    }
+
+    std::lock_guard<std::mutex> lock(_mutex);
+    touchEntry(key, content.size());
+    evictEntries();
+}
+
+StringMap ShaderCache::generate(const string& name, ElementPtr element, GenContext& context)
+{
+    string key = computeKey(name, element, context);
+    StringMap stageSourceCode;
+    if (getSourceCode(key, stageSourceCode))
+    {
+        return stageSourceCode;
+    }
+
+    ShaderPtr shader = context.getShaderGenerator().generate(name, element, context);
+    if (!shader)
+    {
+        return StringMap();
+    }
+    setSourceCode(key, *shader);
+    for (size_t i = 0; i < shader->numStages(); i++)
+    {
+        const ShaderStage& stage = shader->getStage(i);
+        stageSourceCode[stage.getName()] = stage.getSourceCode();
+    }
+    return stageSourceCode;
+}
+
+void ShaderCache::clear()
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    while (!_entries.empty())
+    {
+        removeEntry(_entries.back().first);
+    }
+}
+
+void ShaderCache::scanDirectory()
+{
+    // Order existing entries by modification time, so that the most recently
+    // written entries are the last to be evicted.
+    vector<std::pair<int64_t, FilePath>> files;
+    for (const FilePath& filename : _directory.getFilesInDirectory(ENTRY_EXTENSION))
+    {
+        FilePath path = _directory / filename;
+        files.emplace_back(path.getModificationTime(), filename);
+    }
+    std::sort(files.begin(), files.end(), [](const std::pair<int64_t, FilePath>& a, const std::pair<int64_t, FilePath>& b)
+    {
+        return a.first < b.first;
+    });
+    for (const auto& file : files)
+    {
+        FilePath key = file.second;
+        key.removeExtension();
+        touchEntry(key.asString(), (_directory / file.second).getFileSize());
+    }
+}
+
+void ShaderCache::touchEntry(const string& key, size_t size)
+{
+    auto it = _entryMap.find(key);
+    if (it != _entryMap.end())
+    {
+        _totalSize -= it->second->second;
+        _entries.erase(it->second);
+    }
+    _entries.emplace_front(key, size);
+    _entryMap[key] = _entries.begin();
+    _totalSize += size;
+}
+
+void ShaderCache::removeEntry(const string& key)
+{
+    auto it = _entryMap.find(key);
+    if (it == _entryMap.end())
+    {
+        return;
+    }
+    // Resolve the path before erasing the entry, as the given key may refer
+    // to the entry itself.
+    const string path = getEntryPath(key).asString();
+    _totalSize -= it->second->second;
+    _entries.erase(it->second);
+    _entryMap.erase(it);
+    std::remove(path.c_str());
+}
+
+void ShaderCache::evictEntries()
+{
+    while (_totalSize > _maxSize && !_entries.empty())
+    {
+        removeEntry(_entries.back().first);
+    }
+}
+
+MATERIALX_NAMESPACE_END
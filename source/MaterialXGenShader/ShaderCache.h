@@ -0,0 +1,152 @@
+//
+// Copyright Contributors to the MaterialX Project
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#ifndef MATERIALX_SHADERCACHE_H
+#define MATERIALX_SHADERCACHE_H
+
+/// @file
+/// Persistent cache of generated shader source code
+
+#include <MaterialXGenShader/Export.h>
+
+#include <MaterialXGenShader/GenContext.h>
+#include <MaterialXGenShader/Shader.h>
+
+#include <list>
+#include <mutex>
+
+MATERIALX_NAMESPACE_BEGIN
+
+/// A shared pointer to a ShaderCache
+using ShaderCachePtr = shared_ptr<class ShaderCache>;
+
+/// @class ShaderCache
+/// A persistent, content-addressed cache of generated shader source code.
+///
+/// Entries are stored as individual files within a cache directory, keyed by
+/// a hash of the element's upstream dependencies, the node definitions and
+/// implementations they reference along with the content of implementation
+/// source files, the generation options and user data of the context, and the
+/// type, target and version of the shader generator. Since entries are written atomically, a single
+/// cache directory may be shared between processes.
+///
+/// When the total size of the cached entries exceeds the maximum size of the
+/// cache, the least recently used entries are evicted.
+class MX_GENSHADER_API ShaderCache
+{
+  public:
+    /// Default maximum size of a cache directory, in bytes.
+    static const size_t DEFAULT_MAX_SIZE;
+
+    /// File extension used for cache entries.
+    static const string ENTRY_EXTENSION;
+
+  public:
+    /// Create a shader cache backed by the given directory, which will be
+    /// created if it does not yet exist.
+    static ShaderCachePtr create(const FilePath& directory, size_t maxSize = DEFAULT_MAX_SIZE)
+    {
+        return ShaderCachePtr(new ShaderCache(directory, maxSize));
+    }
+
+    /// Return the directory backing this cache.
+    const FilePath& getDirectory() const
+    {
+        return _directory;
+    }
+
+    /// Set the maximum total size of the cache in bytes, evicting
+    /// least recently used entries as needed.
+    void setMaxSize(size_t maxSize);
+
+    /// Return the maximum total size of the cache in bytes.
+    size_t getMaxSize() const
+    {
+        return _maxSize;
+    }
+
+    /// Return the total size in bytes of the entries in the cache.
+    size_t getTotalSize() const;
+
+    /// Return the number of entries in the cache.
+    size_t getEntryCount() const;
+
+    /// Return the number of successful lookups made through this cache.
+    size_t getHitCount() const;
+
+    /// Return the number of failed lookups made through this cache.
+    size_t getMissCount() const;
+
+    /// Compute the cache key for generating a shader with the given name
+    /// from the given element and context.
+    static string computeKey(const string& name, ConstElementPtr element, GenContext& context);
+
+    /// Compute a structural key for the given shader graph, from its node
+    /// implementations and connections, the values of node inputs that are
+    /// not published as uniforms, the generation options and user data of the
+    /// context, and the target and version of the shader generator.  Nodes and
+    /// uniforms are referenced by position rather than name, so that graphs
+    /// with equal keys differ only in naming and in the values of their uniforms.
+    static string computeTopologyKey(const ShaderGraph& graph, GenContext& context);
+
+    /// Look up the stage source code stored under the given key.
+    /// @param key Key of the cache entry.
+    /// @param stageSourceCode Map from stage name to source code, filled on success.
+    /// @return True if an entry was found for the key.
+    bool getSourceCode(const string& key, StringMap& stageSourceCode);
+
+    /// Store the stage source code of the given shader under the given key.
+    void setSourceCode(const string& key, const Shader& shader);
+
+    /// Store the given stage source code under the given key.
+    void setSourceCode(const string& key, const StringMap& stageSourceCode);
+
+    /// Return the stage source code for a shader with the given name generated
+    /// from the given element, calling the shader generator of the context only
+    /// if no matching entry is found in the cache.
+    /// @return Map from stage name to source code, or an empty map if shader
+    ///    generation failed.
+    StringMap generate(const string& name, ElementPtr element, GenContext& context);
+
+    /// Remove all entries from the cache.
+    void clear();
+
+  protected:
+    ShaderCache(const FilePath& directory, size_t maxSize);
+
+    // Scan the cache directory for existing entries.
+    void scanDirectory();
+
+    // Record access to the given entry, adding it if needed.
+    void touchEntry(const string& key, size_t size);
+
+    // Remove the given entry from the index and the file system.
+    void removeEntry(const string& key);
+
+    // Evict least recently used entries until the cache fits its budget.
+    void evictEntries();
+
+    FilePath getEntryPath(const string& key) const
+    {
+        return _directory / (key + "." + ENTRY_EXTENSION);
+    }
+
+  protected:
+    FilePath _directory;
+    size_t _maxSize;
+    size_t _totalSize;
+    size_t _hitCount;
+    size_t _missCount;
+
+    // Entries ordered from most to least recently used.
+    std::list<std::pair<string, size_t>> _entries;
+    std::unordered_map<string, std::list<std::pair<string, size_t>>::iterator> _entryMap;
+
+    mutable std::mutex _mutex;
+};
+
+MATERIALX_NAMESPACE_END
+
+#endif
@@ -19,7 +19,11 @@
 
 #include <MaterialXTrace/Tracing.h>
 
+#include <atomic>
+#include <exception>
 #include <sstream>
+#include <system_error>
+#include <thread>
 
 MATERIALX_NAMESPACE_BEGIN
 
@@ -36,6 +40,7 @@ ShaderGenerator::ShaderGenerator(TypeSystemPtr typeSystem, SyntaxPtr syntax) :
 {
     // Register all graph refactoring passes.
     registerRefactor(std::make_shared<NodeElisionRefactor>());
+    registerRefactor(std::make_shared<ConstantFoldingRefactor>());
     registerRefactor(std::make_shared<PremultipliedBsdfAddRefactor>());
     registerRefactor(std::make_shared<DistributeLayerOverMixRefactor>());
 }
@@ -313,6 +318,78 @@ ShaderNodeImplPtr ShaderGenerator::createShaderNodeImplForImplementation(const I
     return SourceCodeNode::create();
 }
 
+vector<ShaderPtr> ShaderGenerator::generateMany(const vector<TypedElementPtr>& elements, GenContext& context, unsigned int threads) const
+{
+    vector<ShaderPtr> shaders(elements.size());
+    if (elements.empty())
+    {
+        return shaders;
+    }
+
+    // Generate the first shader with the given context, so that the
+    // implementations it creates are shared by all forks.
+    shaders[0] = generate(createValidName(elements[0]->getName()), elements[0], context);
+
+    // Generate the remaining shaders on the calling thread and on worker
+    // threads, each worker with its own fork of the context.
+    vector<std::exception_ptr> errors(elements.size());
+    std::atomic<size_t> nextIndex(1);
+    auto generateShaders = [&](GenContext& threadContext)
+    {
+        for (size_t i = nextIndex++; i < elements.size(); i = nextIndex++)
+        {
+            try
+            {
+                shaders[i] = generate(createValidName(elements[i]->getName()), elements[i], threadContext);
+            }
+            catch (...)
+            {
+                errors[i] = std::current_exception();
+            }
+        }
+    };
+    vector<std::thread> workers;
+#ifndef __EMSCRIPTEN__
+    size_t threadCount = threads ? threads : std::max(std::thread::hardware_concurrency(), 1u);
+    if (!supportsConcurrentGeneration())
+    {
+        threadCount = 1;
+    }
+    threadCount = std::min(threadCount, elements.size() - 1);
+    for (size_t i = 1; i < threadCount; i++)
+    {
+        try
+        {
+            GenContextPtr threadContext = context.fork();
+            workers.emplace_back([threadContext, &generateShaders]()
+            {
+                generateShaders(*threadContext);
+            });
+        }
+        catch (const std::system_error&)
+        {
+            break;
+        }
+    }
+#endif
+    generateShaders(context);
+    for (std::thread& worker : workers)
+    {
+        worker.join();
+    }
+
+    // Report the first error in element order.
+    for (const std::exception_ptr& error : errors)
+    {
+        if (error)
+        {
+            std::rethrow_exception(error);
+        }
+    }
+
+    return shaders;
+}
+
 ShaderNodeImplPtr ShaderGenerator::getImplementation(const NodeDef& nodedef, GenContext& context) const
 {
     MX_TRACE_FUNCTION(Tracing::Category::ShaderGen);
@@ -495,6 +572,15 @@ void ShaderGenerator::registerShaderMetadata(const DocumentPtr& doc, GenContext&
     }
 }
 
+void ShaderGenerator::setTokenSubstitution(const string& token, const string& substitution) const
+{
+    auto it = _tokenSubstitutions.find(token);
+    if (it == _tokenSubstitutions.end() || it->second != substitution)
+    {
+        _tokenSubstitutions[token] = substitution;
+    }
+}
+
 void ShaderGenerator::replaceTokens(const StringMap& substitutions, ShaderStage& stage) const
 {
     // Replace tokens in source code
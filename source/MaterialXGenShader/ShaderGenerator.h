@@ -40,6 +40,13 @@ class MX_GENSHADER_API ShaderGenerator
         return EMPTY_STRING;
     }
 
+    /// Return the version of the language targeted by this generator,
+    /// or an empty string if the target has no version.
+    virtual const string& getVersion() const
+    {
+        return EMPTY_STRING;
+    }
+
     /// Generate a shader starting from the given element, translating
     /// the element and all dependencies upstream into shader code.
     virtual ShaderPtr generate(const string&, ElementPtr, GenContext&) const
@@ -47,6 +54,29 @@ class MX_GENSHADER_API ShaderGenerator
         return nullptr;
     }
 
+    /// Return true if this generator supports concurrent generation with forks
+    /// of a context.  Generators holding state that is modified during
+    /// generation return false.  Defaults to true.
+    virtual bool supportsConcurrentGeneration() const
+    {
+        return true;
+    }
+
+    /// Generate shaders for the given elements, distributing them across
+    /// worker threads.  Each shader is named after its element.
+    ///
+    /// The first shader is generated with the given context, warming its cache
+    /// of node implementations, and the remaining shaders are generated with
+    /// forks of the context, one per thread.  If the generator does not support
+    /// concurrent generation, then all shaders are generated on the calling
+    /// thread.
+    /// @param elements The elements for which shaders are generated.
+    /// @param context The context for shader generation.
+    /// @param threads The maximum number of threads used for generation,
+    ///    where zero selects the number of hardware threads.
+    /// @return The generated shaders, in the order of the given elements.
+    vector<ShaderPtr> generateMany(const vector<TypedElementPtr>& elements, GenContext& context, unsigned int threads = 0) const;
+
     /// Start a new scope using the given bracket type.
     virtual void emitScopeBegin(ShaderStage& stage, Syntax::Punctuation punc = Syntax::CURLY_BRACKETS) const;
 
@@ -260,6 +290,11 @@ class MX_GENSHADER_API ShaderGenerator
         stage.setFunctionName(functionName);
     }
 
+    /// Set the substitution for a token during shader generation.  The map of
+    /// substitutions is only modified if the substitution has changed, so that
+    /// generation with shared options on multiple threads does not write to it.
+    void setTokenSubstitution(const string& token, const string& substitution) const;
+
     /// Replace tokens with identifiers according to the given substitutions map.
     void replaceTokens(const StringMap& substitutions, ShaderStage& stage) const;
 
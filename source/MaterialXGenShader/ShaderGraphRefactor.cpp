@@ -10,6 +10,8 @@
 
 #include <MaterialXCore/Document.h>
 
+#include <algorithm>
+
 MATERIALX_NAMESPACE_BEGIN
 
 namespace
@@ -97,6 +99,271 @@ ShaderOutput* foldWeightIntoBsdf(ShaderGraph& graph, GenContext& context,
     }
 }
 
+// Categories of standard library nodes evaluated by ConstantFoldingRefactor.
+const StringSet FOLDABLE_CATEGORIES = {
+    "add", "subtract", "multiply", "remap", "clamp", "mix", "convert",
+    "extract", "combine2", "combine3", "combine4", "separate2", "separate3", "separate4"
+};
+
+// Return the number of float components of the given type, or zero if the
+// type is not a float scalar, vector or color.
+size_t getComponentCount(TypeDesc type)
+{
+    if (type == Type::FLOAT)
+        return 1;
+    if (type == Type::VECTOR2)
+        return 2;
+    if (type == Type::VECTOR3 || type == Type::COLOR3)
+        return 3;
+    if (type == Type::VECTOR4 || type == Type::COLOR4)
+        return 4;
+    return 0;
+}
+
+template <class T> bool getVectorComponents(const Value& value, vector<float>& components)
+{
+    if (!value.isA<T>())
+    {
+        return false;
+    }
+    const T& vec = value.asA<T>();
+    components.assign(vec.data(), vec.data() + T::numElements());
+    return true;
+}
+
+// Return the float components of the given value.
+bool getComponents(ConstValuePtr value, vector<float>& components)
+{
+    if (!value)
+    {
+        return false;
+    }
+    if (value->isA<float>())
+    {
+        components.assign(1, value->asA<float>());
+        return true;
+    }
+    return getVectorComponents<Vector2>(*value, components) ||
+           getVectorComponents<Vector3>(*value, components) ||
+           getVectorComponents<Vector4>(*value, components) ||
+           getVectorComponents<Color3>(*value, components) ||
+           getVectorComponents<Color4>(*value, components);
+}
+
+template <class T> ValuePtr createVectorValue(const vector<float>& components)
+{
+    T vec;
+    std::copy(components.begin(), components.end(), vec.data());
+    return Value::createValue<T>(vec);
+}
+
+// Create a value of the given type from its float components.
+ValuePtr createComponentValue(TypeDesc type, const vector<float>& components)
+{
+    if (components.size() != getComponentCount(type))
+        return nullptr;
+    if (type == Type::FLOAT)
+        return Value::createValue<float>(components[0]);
+    if (type == Type::VECTOR2)
+        return createVectorValue<Vector2>(components);
+    if (type == Type::VECTOR3)
+        return createVectorValue<Vector3>(components);
+    if (type == Type::VECTOR4)
+        return createVectorValue<Vector4>(components);
+    if (type == Type::COLOR3)
+        return createVectorValue<Color3>(components);
+    if (type == Type::COLOR4)
+        return createVectorValue<Color4>(components);
+    return nullptr;
+}
+
+// Return the float components of the given node input, broadcasting scalar
+// values to the given number of components if it is non-zero.
+bool getInputComponents(ShaderNode* node, const string& name, vector<float>& components, size_t count = 0)
+{
+    ShaderInput* input = node->getInput(name);
+    if (!input || !getComponents(input->getValue(), components))
+    {
+        return false;
+    }
+    if (count && components.size() == 1)
+    {
+        components.assign(count, components[0]);
+    }
+    return !count || components.size() == count;
+}
+
+// Evaluate a node of the given category, whose inputs hold constant values,
+// returning a value for each of its outputs.
+bool evaluateNode(const string& category, ShaderNode* node, vector<ValuePtr>& outputValues)
+{
+    vector<vector<float>> results;
+    const size_t count = getComponentCount(node->getOutput()->getType());
+    if (category == "add" || category == "subtract" || category == "multiply")
+    {
+        vector<float> in1, in2;
+        if (!getInputComponents(node, "in1", in1, count) || !getInputComponents(node, "in2", in2, count))
+        {
+            return false;
+        }
+        for (size_t i = 0; i < count; i++)
+        {
+            in1[i] = (category == "add") ? in1[i] + in2[i] :
+                     (category == "subtract") ? in1[i] - in2[i] :
+                     in1[i] * in2[i];
+        }
+        results.push_back(in1);
+    }
+    else if (category == "remap")
+    {
+        vector<float> in, inLow, inHigh, outLow, outHigh;
+        if (!getInputComponents(node, "in", in, count) ||
+            !getInputComponents(node, "inlow", inLow, count) ||
+            !getInputComponents(node, "inhigh", inHigh, count) ||
+            !getInputComponents(node, "outlow", outLow, count) ||
+            !getInputComponents(node, "outhigh", outHigh, count))
+        {
+            return false;
+        }
+        for (size_t i = 0; i < count; i++)
+        {
+            if (inHigh[i] == inLow[i])
+            {
+                // Leave degenerate ranges to the shading language.
+                return false;
+            }
+            in[i] = outLow[i] + (in[i] - inLow[i]) * (outHigh[i] - outLow[i]) / (inHigh[i] - inLow[i]);
+        }
+        results.push_back(in);
+    }
+    else if (category == "clamp")
+    {
+        vector<float> in, low, high;
+        if (!getInputComponents(node, "in", in, count) ||
+            !getInputComponents(node, "low", low, count) ||
+            !getInputComponents(node, "high", high, count))
+        {
+            return false;
+        }
+        for (size_t i = 0; i < count; i++)
+        {
+            in[i] = std::min(std::max(in[i], low[i]), high[i]);
+        }
+        results.push_back(in);
+    }
+    else if (category == "mix")
+    {
+        vector<float> fg, bg, mix;
+        if (!getInputComponents(node, "fg", fg, count) ||
+            !getInputComponents(node, "bg", bg, count) ||
+            !getInputComponents(node, "mix", mix, count))
+        {
+            return false;
+        }
+        for (size_t i = 0; i < count; i++)
+        {
+            fg[i] = bg[i] * (1.0f - mix[i]) + fg[i] * mix[i];
+        }
+        results.push_back(fg);
+    }
+    else if (category == "convert")
+    {
+        // Scalars are broadcast, while vectors and colors are truncated or
+        // padded, with a fourth component padded to one.
+        vector<float> in;
+        if (!count || !getInputComponents(node, "in", in))
+        {
+            return false;
+        }
+        vector<float> out(count, in[0]);
+        if (in.size() > 1)
+        {
+            for (size_t i = 0; i < count; i++)
+            {
+                out[i] = (i < in.size()) ? in[i] : (i == 3) ? 1.0f : 0.0f;
+            }
+        }
+        results.push_back(out);
+    }
+    else if (category == "extract")
+    {
+        vector<float> in;
+        ShaderInput* index = node->getInput("index");
+        if (!getInputComponents(node, "in", in) || !index || !index->getValue() || !index->getValue()->isA<int>())
+        {
+            return false;
+        }
+        int i = index->getValue()->asA<int>();
+        if (i < 0 || (size_t) i >= in.size())
+        {
+            return false;
+        }
+        results.push_back({ in[i] });
+    }
+    else if (category.rfind("combine", 0) == 0)
+    {
+        vector<float> out;
+        for (ShaderInput* input : node->getInputs())
+        {
+            vector<float> in;
+            if (!getComponents(input->getValue(), in))
+            {
+                return false;
+            }
+            out.insert(out.end(), in.begin(), in.end());
+        }
+        results.push_back(out);
+    }
+    else if (category.rfind("separate", 0) == 0)
+    {
+        vector<float> in;
+        if (!getInputComponents(node, "in", in) || in.size() != node->numOutputs())
+        {
+            return false;
+        }
+        for (float component : in)
+        {
+            results.push_back({ component });
+        }
+    }
+    else
+    {
+        return false;
+    }
+
+    if (results.size() != node->numOutputs())
+    {
+        return false;
+    }
+    outputValues.clear();
+    for (size_t i = 0; i < results.size(); i++)
+    {
+        ValuePtr value = createComponentValue(node->getOutput(i)->getType(), results[i]);
+        if (!value)
+        {
+            return false;
+        }
+        outputValues.push_back(value);
+    }
+    return true;
+}
+
+// Return the category of the node definition implemented by the given node.
+string getNodeCategory(const ShaderNode* node, ConstDocumentPtr doc)
+{
+    const string& implName = node->getImplementation().getName();
+    NodeDefPtr nodeDef;
+    if (ImplementationPtr impl = doc->getImplementation(implName))
+    {
+        nodeDef = impl->getNodeDef();
+    }
+    else if (NodeGraphPtr nodeGraph = doc->getNodeGraph(implName))
+    {
+        nodeDef = nodeGraph->getNodeDef();
+    }
+    return nodeDef ? nodeDef->getNodeString() : EMPTY_STRING;
+}
+
 } // anonymous namespace
 
 //
@@ -400,4 +667,84 @@ size_t DistributeLayerOverMixRefactor::execute(ShaderGraph& graph, GenContext& c
     return numEdits;
 }
 
+//
+// ConstantFoldingRefactor
+//
+
+const string& ConstantFoldingRefactor::getName() const
+{
+    static const string name = "constantFolding";
+    return name;
+}
+
+size_t ConstantFoldingRefactor::execute(ShaderGraph& graph, GenContext& context)
+{
+    if (!context.getOptions().foldConstantNodes)
+    {
+        return 0;
+    }
+
+    // Find the nodes of foldable categories.
+    ConstDocumentPtr doc = graph.getDocument();
+    vector<std::pair<ShaderNode*, string>> candidates;
+    for (ShaderNode* node : graph.getNodes())
+    {
+        if (node->numOutputs() == 0 || !node->hasClassification(ShaderNode::Classification::TEXTURE))
+        {
+            continue;
+        }
+        string category = getNodeCategory(node, doc);
+        if (FOLDABLE_CATEGORIES.count(category))
+        {
+            candidates.emplace_back(node, category);
+        }
+    }
+
+    // Evaluate nodes whose inputs are all constant, moving their values
+    // downstream, until no further nodes can be folded.
+    size_t numEdits = 0;
+    vector<ValuePtr> outputValues;
+    for (bool folded = true; folded;)
+    {
+        folded = false;
+        for (auto& candidate : candidates)
+        {
+            ShaderNode* node = candidate.first;
+            if (!node)
+            {
+                continue;
+            }
+            bool isConstant = true;
+            for (ShaderInput* input : node->getInputs())
+            {
+                if (input->getConnection())
+                {
+                    isConstant = false;
+                    break;
+                }
+            }
+            if (!isConstant || !evaluateNode(candidate.second, node, outputValues))
+            {
+                continue;
+            }
+
+            for (size_t i = 0; i < node->numOutputs(); i++)
+            {
+                ShaderOutput* output = node->getOutput(i);
+                ShaderInputVec downstreamConnections = output->getConnections();
+                for (ShaderInput* downstream : downstreamConnections)
+                {
+                    output->breakConnection(downstream);
+                    downstream->setValue(outputValues[i]);
+                }
+            }
+            candidate.first = nullptr;
+            folded = true;
+            ++numEdits;
+        }
+    }
+
+    return numEdits;
+}
+
 MATERIALX_NAMESPACE_END
@@ -75,6 +75,20 @@ class MX_GENSHADER_API DistributeLayerOverMixRefactor : public ShaderGraphRefact
     size_t execute(ShaderGraph& graph, GenContext& context) override;
 };
 
+/// @class ConstantFoldingRefactor
+/// Evaluates chains of standard library math nodes on the CPU.
+/// Nodes whose inputs all hold constant values, such as add, multiply,
+/// remap, clamp, mix, convert, extract, combine and separate, are
+/// evaluated at generation time, and their values are moved downstream.
+/// Values assigned to node inputs are treated as final, while values
+/// supplied through graph interface inputs remain editable.
+class MX_GENSHADER_API ConstantFoldingRefactor : public ShaderGraphRefactor
+{
+  public:
+    const string& getName() const override;
+    size_t execute(ShaderGraph& graph, GenContext& context) override;
+};
+
 MATERIALX_NAMESPACE_END
 
 #endif
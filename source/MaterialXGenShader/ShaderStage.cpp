@@ -313,33 +313,7 @@ void ShaderStage::addComment(const string& str)
 
 void ShaderStage::addBlock(const string& str, const FilePath& sourceFilename, GenContext& context)
 {
-    const string& INCLUDE = _syntax->getIncludeStatement();
-    const string& QUOTE   = _syntax->getStringQuote();
-
-    // Add each line in the block separately to get correct indentation.
-    StringStream stream(str);
-    for (string line; std::getline(stream, line);)
-    {
-        size_t pos = line.find(INCLUDE);
-        if (pos != string::npos)
-        {
-            size_t startQuote = line.find_first_of(QUOTE);
-            size_t endQuote = line.find_last_of(QUOTE);
-            if (startQuote != string::npos && endQuote != string::npos && endQuote > startQuote)
-            {
-                size_t length = (endQuote - startQuote) - 1;
-                if (length)
-                {
-                    const string filename = line.substr(startQuote + 1, length);
-                    addInclude(filename, sourceFilename, context);
-                }
-            }
-        }
-        else
-        {
-            addLine(line, false);
-        }
-    }
+    addLines(SourceFile::splitLines(str, _syntax->getIncludeStatement(), _syntax->getStringQuote()), sourceFilename, context);
 }
 
 void ShaderStage::addInclude(const FilePath& includeFilename, const FilePath& sourceFilename, GenContext& context)
@@ -350,13 +324,32 @@ void ShaderStage::addInclude(const FilePath& includeFilename, const FilePath& so
 
     if (!_includes.count(resolvedFile))
     {
-        string content = readFile(resolvedFile);
-        if (content.empty())
+        ConstSourceFilePtr sourceFile = context.getSourceFile(resolvedFile);
+        if (!sourceFile)
         {
             throw ExceptionShaderGenError("Could not find include file: '" + includeFilename.asString() + "'");
         }
         _includes.insert(resolvedFile);
-        addBlock(content, resolvedFile, context);
+        addLines(sourceFile->getLines(_syntax->getIncludeStatement(), _syntax->getStringQuote()), resolvedFile, context);
+    }
+}
+
+void ShaderStage::addLines(const SourceFile::LineVec& lines, const FilePath& sourceFilename, GenContext& context)
+{
+    // Add each line in the block separately to get correct indentation.
+    for (const SourceFile::Line& line : lines)
+    {
+        if (line.isInclude)
+        {
+            if (!line.includeFilename.empty())
+            {
+                addInclude(line.includeFilename, sourceFilename, context);
+            }
+        }
+        else
+        {
+            addLine(line.text, false);
+        }
     }
 }
 
@@ -13,6 +13,7 @@
 
 #include <MaterialXGenShader/GenOptions.h>
 #include <MaterialXGenShader/ShaderGraph.h>
+#include <MaterialXGenShader/SourceFileCache.h>
 #include <MaterialXGenShader/Syntax.h>
 
 #include <MaterialXFormat/File.h>
@@ -262,6 +263,10 @@ class MX_GENSHADER_API ShaderStage
     /// Add the contents of an include file if not already present.
     void addInclude(const FilePath& includeFilename, const FilePath& sourceFilename, GenContext& context);
 
+    /// Add the given lines of code, adding the contents of include files
+    /// for any include directives.
+    void addLines(const SourceFile::LineVec& lines, const FilePath& sourceFilename, GenContext& context);
+
     /// Return true if this stage depends on the given source file.
     bool hasSourceDependency(const FilePath& file);
 
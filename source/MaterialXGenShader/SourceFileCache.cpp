@@ -0,0 +1,150 @@
+//
+// Copyright Contributors to the MaterialX Project
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#include <MaterialXGenShader/SourceFileCache.h>
+
+#include <MaterialXFormat/Util.h>
+
+#include <ctime>
+#include <sstream>
+
+MATERIALX_NAMESPACE_BEGIN
+
+//
+// SourceFile methods
+//
+
+const SourceFile::LineVec& SourceFile::getLines(const string& includeStatement, const string& quote) const
+{
+    const string key = includeStatement + '\n' + quote;
+    std::lock_guard<std::mutex> lock(_mutex);
+    auto it = _lines.find(key);
+    if (it == _lines.end())
+    {
+        it = _lines.emplace(key, splitLines(_content, includeStatement, quote)).first;
+    }
+    return it->second;
+}
+
+SourceFile::LineVec SourceFile::splitLines(const string& content, const string& includeStatement, const string& quote)
+{
+    LineVec lines;
+    std::istringstream stream(content);
+    for (string text; std::getline(stream, text);)
+    {
+        Line line;
+        if (text.find(includeStatement) != string::npos)
+        {
+            line.isInclude = true;
+            size_t startQuote = text.find_first_of(quote);
+            size_t endQuote = text.find_last_of(quote);
+            if (startQuote != string::npos && endQuote != string::npos && endQuote > startQuote)
+            {
+                line.includeFilename = text.substr(startQuote + 1, (endQuote - startQuote) - 1);
+            }
+        }
+        line.text = std::move(text);
+        lines.push_back(std::move(line));
+    }
+    return lines;
+}
+
+//
+// SourceFileCache methods
+//
+
+SourceFileCachePtr SourceFileCache::getShared()
+{
+    static SourceFileCachePtr sharedCache = create();
+    return sharedCache;
+}
+
+ConstSourceFilePtr SourceFileCache::getFile(const FilePath& path)
+{
+    int64_t modificationTime = path.getModificationTime();
+    size_t size = path.getFileSize();
+    ConstSourceFilePtr cachedFile;
+    {
+        std::lock_guard<std::mutex> lock(_mutex);
+        auto it = _files.find(path.asString());
+        if (it != _files.end() &&
+            it->second.file->getModificationTime() == modificationTime &&
+            it->second.file->getSize() == size)
+        {
+            // A file modified no earlier than the second in which it was read
+            // may have changed since, so its content is compared below.
+            if (modificationTime < it->second.readTime)
+            {
+                _hitCount++;
+                return it->second.file;
+            }
+            cachedFile = it->second.file;
+        }
+    }
+
+    // Read the file outside of the lock, so that distinct files may be read
+    // concurrently.
+    int64_t readTime = (int64_t) std::time(nullptr);
+    string content = readFile(path);
+    ConstSourceFilePtr file = cachedFile;
+    if (!cachedFile || content != cachedFile->getContent())
+    {
+        file = !content.empty() ? std::make_shared<SourceFile>(path, modificationTime, size, content) : nullptr;
+    }
+
+    std::lock_guard<std::mutex> lock(_mutex);
+    if (cachedFile && file == cachedFile)
+    {
+        _hitCount++;
+    }
+    else
+    {
+        _missCount++;
+    }
+    if (file)
+    {
+        _files[path.asString()] = { file, readTime };
+    }
+    return file;
+}
+
+size_t SourceFileCache::getEntryCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _files.size();
+}
+
+size_t SourceFileCache::getTotalSize() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    size_t totalSize = 0;
+    for (const auto& it : _files)
+    {
+        totalSize += it.second.file->getContent().size();
+    }
+    return totalSize;
+}
+
+size_t SourceFileCache::getHitCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _hitCount;
+}
+
+size_t SourceFileCache::getMissCount() const
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    return _missCount;
+}
+
+void SourceFileCache::clear()
+{
+    std::lock_guard<std::mutex> lock(_mutex);
+    _files.clear();
+    _hitCount = 0;
+    _missCount = 0;
+}
+
+MATERIALX_NAMESPACE_END
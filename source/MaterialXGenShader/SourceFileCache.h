@@ -0,0 +1,162 @@
+//
+// Copyright Contributors to the MaterialX Project
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#ifndef MATERIALX_SOURCEFILECACHE_H
+#define MATERIALX_SOURCEFILECACHE_H
+
+/// @file
+/// Process-wide cache of shader source code files
+
+#include <MaterialXGenShader/Export.h>
+
+#include <MaterialXFormat/File.h>
+
+#include <mutex>
+#include <unordered_map>
+
+MATERIALX_NAMESPACE_BEGIN
+
+/// A shared pointer to a const SourceFile
+using ConstSourceFilePtr = shared_ptr<const class SourceFile>;
+
+/// A shared pointer to a SourceFileCache
+using SourceFileCachePtr = shared_ptr<class SourceFileCache>;
+
+/// @class SourceFile
+/// The immutable content of a shader source code file, along with its lines
+/// and the include directives they contain.
+class MX_GENSHADER_API SourceFile
+{
+  public:
+    /// A line of source code.  For a line containing an include directive,
+    /// the include filename is stored, and is empty if the directive could
+    /// not be parsed.
+    struct Line
+    {
+        string text;
+        bool isInclude = false;
+        string includeFilename;
+    };
+    using LineVec = vector<Line>;
+
+  public:
+    SourceFile(const FilePath& path, int64_t modificationTime, size_t size, const string& content) :
+        _path(path),
+        _modificationTime(modificationTime),
+        _size(size),
+        _content(content)
+    {
+    }
+    ~SourceFile() = default;
+
+    /// Return the resolved path of the file.
+    const FilePath& getPath() const
+    {
+        return _path;
+    }
+
+    /// Return the modification time of the file when it was read.
+    int64_t getModificationTime() const
+    {
+        return _modificationTime;
+    }
+
+    /// Return the size of the file in bytes when it was read.
+    size_t getSize() const
+    {
+        return _size;
+    }
+
+    /// Return the content of the file.
+    const string& getContent() const
+    {
+        return _content;
+    }
+
+    /// Return the lines of the file, with include directives parsed for the
+    /// given include statement and string quote.  The lines are computed on
+    /// first request for each syntax, and shared by later requests.
+    const LineVec& getLines(const string& includeStatement, const string& quote) const;
+
+    /// Split the given source code into lines, parsing include directives
+    /// for the given include statement and string quote.
+    static LineVec splitLines(const string& content, const string& includeStatement, const string& quote);
+
+  protected:
+    FilePath _path;
+    int64_t _modificationTime;
+    size_t _size;
+    string _content;
+
+    mutable std::unordered_map<string, LineVec> _lines;
+    mutable std::mutex _mutex;
+};
+
+/// @class SourceFileCache
+/// A thread-safe cache of shader source code files.
+///
+/// Files are keyed by their resolved path, and are read again only when their
+/// modification time or size changes, allowing the library sources included
+/// by many shaders to be read and split into lines once per process.  Since
+/// modification times have a resolution of one second, a file modified within
+/// the second in which it was read has its content compared on each request,
+/// until a request is made in a later second.
+class MX_GENSHADER_API SourceFileCache
+{
+  public:
+    SourceFileCache() :
+        _hitCount(0),
+        _missCount(0)
+    {
+    }
+    ~SourceFileCache() = default;
+
+    /// Create a new source file cache.
+    static SourceFileCachePtr create()
+    {
+        return std::make_shared<SourceFileCache>();
+    }
+
+    /// Return the process-wide source file cache, which is used by default
+    /// for all shader generation contexts.
+    static SourceFileCachePtr getShared();
+
+    /// Return the source file at the given resolved path, reading it if it is
+    /// not yet cached or has been modified since it was cached.
+    /// @return The source file, or nullptr if the file is missing or empty.
+    ConstSourceFilePtr getFile(const FilePath& path);
+
+    /// Return the number of source files held by the cache.
+    size_t getEntryCount() const;
+
+    /// Return the total size in bytes of the source files held by the cache.
+    size_t getTotalSize() const;
+
+    /// Return the number of requests served from the cache.
+    size_t getHitCount() const;
+
+    /// Return the number of requests for which a file was read.
+    size_t getMissCount() const;
+
+    /// Remove all files from the cache and reset its statistics.
+    void clear();
+
+  protected:
+    struct Entry
+    {
+        ConstSourceFilePtr file;
+        int64_t readTime;
+    };
+
+  protected:
+    std::unordered_map<string, Entry> _files;
+    size_t _hitCount;
+    size_t _missCount;
+    mutable std::mutex _mutex;
+};
+
+MATERIALX_NAMESPACE_END
+
+#endif
@@ -8,7 +8,12 @@
 #include <MaterialXGenShader/Shader.h>
 #include <MaterialXGenShader/Util.h>
 
+#include <algorithm>
+#include <condition_variable>
+#include <deque>
+#include <functional>
 #include <iostream>
+#include <thread>
 
 MATERIALX_NAMESPACE_BEGIN
 
@@ -34,6 +39,116 @@ const string ImageLoader::TX_EXTENSION = "tx";
 const string ImageLoader::TXT_EXTENSION = "txt";
 const string ImageLoader::TXR_EXTENSION = "txr";
 
+namespace
+{
+
+const vector<ImageLoaderPtr> EMPTY_LOADERS;
+
+size_t getImageSize(ConstImagePtr image)
+{
+    return (size_t) image->getRowStride() * image->getHeight();
+}
+
+ImageInfo getImageInfo(ConstImagePtr image)
+{
+    ImageInfo info;
+    info.width = image->getWidth();
+    info.height = image->getHeight();
+    info.channelCount = image->getChannelCount();
+    info.baseType = image->getBaseType();
+    return info;
+}
+
+} // anonymous namespace
+
+//
+// ImageLoadPool methods
+//
+
+// A bounded pool of worker threads for asynchronous image loading.  Threads
+// are started on demand, and queued tasks that have not yet started when the
+// pool is destroyed are discarded.
+class ImageLoadPool
+{
+  public:
+    ImageLoadPool() :
+        _maxThreads(std::max(std::thread::hardware_concurrency(), 1u)),
+        _idleThreads(0),
+        _stopping(false)
+    {
+    }
+
+    ~ImageLoadPool()
+    {
+        {
+            std::lock_guard<std::mutex> lock(_mutex);
+            _stopping = true;
+            _tasks.clear();
+        }
+        _condition.notify_all();
+        for (std::thread& thread : _threads)
+        {
+            thread.join();
+        }
+    }
+
+    void setMaxThreads(unsigned int threadCount)
+    {
+        std::lock_guard<std::mutex> lock(_mutex);
+        _maxThreads = std::max(threadCount, 1u);
+    }
+
+    unsigned int getMaxThreads() const
+    {
+        std::lock_guard<std::mutex> lock(_mutex);
+        return _maxThreads;
+    }
+
+    void enqueue(std::function<void()> task)
+    {
+        {
+            std::lock_guard<std::mutex> lock(_mutex);
+            _tasks.push_back(std::move(task));
+            if (_tasks.size() > _idleThreads && _threads.size() < _maxThreads)
+            {
+                _threads.emplace_back([this]() { run(); });
+            }
+        }
+        _condition.notify_one();
+    }
+
+  private:
+    void run()
+    {
+        while (true)
+        {
+            std::function<void()> task;
+            {
+                std::unique_lock<std::mutex> lock(_mutex);
+                _idleThreads++;
+                _condition.wait(lock, [this]() { return _stopping || !_tasks.empty(); });
+                _idleThreads--;
+                if (_stopping)
+                {
+                    return;
+                }
+                task = std::move(_tasks.front());
+                _tasks.pop_front();
+            }
+            task();
+        }
+    }
+
+  private:
+    unsigned int _maxThreads;
+    size_t _idleThreads;
+    bool _stopping;
+    std::deque<std::function<void()>> _tasks;
+    std::vector<std::thread> _threads;
+    std::condition_variable _condition;
+    mutable std::mutex _mutex;
+};
+
 //
 // ImageLoader methods
 //
@@ -48,14 +163,47 @@ ImagePtr ImageLoader::loadImage(const FilePath&)
     return nullptr;
 }
 
+ImageInfo ImageLoader::probeImage(const FilePath&)
+{
+    return ImageInfo();
+}
+
+//
+// Global functions
+//
+
+UnsignedIntPair getMaxDimensions(const ImageInfoVec& infoVec)
+{
+    UnsignedIntPair maxSize(0, 0);
+    for (const ImageInfo& info : infoVec)
+    {
+        maxSize.first = std::max(maxSize.first, info.width);
+        maxSize.second = std::max(maxSize.second, info.height);
+    }
+    return maxSize;
+}
+
 //
 // ImageHandler methods
 //
 
-ImageHandler::ImageHandler(ImageLoaderPtr imageLoader)
+ImageHandler::ImageHandler(ImageLoaderPtr imageLoader) :
+    _imageCacheBudget(0),
+    _imageCacheSize(0),
+    _imageCacheHits(0),
+    _imageCacheMisses(0),
+    _imageCacheEvictions(0),
+    _imageAccessCounter(0)
 {
     addLoader(imageLoader);
     _zeroImage = createUniformImage(2, 2, 4, Image::BaseType::UINT8, Color4(0.0f));
+    _loadPool = std::make_unique<ImageLoadPool>();
+}
+
+ImageHandler::~ImageHandler()
+{
+    // Join worker threads before the state they reference is destroyed.
+    _loadPool.reset();
 }
 
 void ImageHandler::addLoader(ImageLoaderPtr loader)
@@ -96,7 +244,7 @@ bool ImageHandler::saveImage(const FilePath& filePath,
     }
 
     string extension = foundFilePath.getExtension();
-    for (ImageLoaderPtr loader : _imageLoaders[extension])
+    for (ImageLoaderPtr loader : getLoaders(extension))
     {
         bool saved = false;
         try
@@ -118,18 +266,27 @@ bool ImageHandler::saveImage(const FilePath& filePath,
 ImagePtr ImageHandler::acquireImage(const FilePath& filePath, const Color4& defaultColor)
 {
     // Resolve the input filepath.
-    FilePath resolvedFilePath = filePath;
-    if (_resolver)
-    {
-        resolvedFilePath = _resolver->resolve(resolvedFilePath, FILENAME_TYPE_STRING);
-    }
+    FilePath resolvedFilePath = resolveFilePath(filePath);
 
     // Return a cached image if available.
+    cacheCompletedImages();
     ImagePtr cachedImage = getCachedImage(resolvedFilePath);
     if (cachedImage)
     {
+        _imageCacheHits++;
         return cachedImage;
     }
+    _imageCacheMisses++;
+
+    // Wait for an asynchronous load of the requested image if one is in flight.
+    auto pending = _pendingImages.find(resolvedFilePath);
+    if (pending != _pendingImages.end())
+    {
+        ImagePtr image = pending->second.get();
+        _pendingImages.erase(pending);
+        cacheImage(resolvedFilePath, image);
+        return image;
+    }
 
     // Load and cache the requested image.
     ImagePtr image = loadImage(_searchPath.find(resolvedFilePath));
@@ -147,6 +304,73 @@ ImagePtr ImageHandler::acquireImage(const FilePath& filePath, const Color4& defa
     return defaultImage;
 }
 
+ImageFuture ImageHandler::getPendingImage(const FilePath& filePath) const
+{
+    auto pending = _pendingImages.find(resolveFilePath(filePath));
+    return pending != _pendingImages.end() ? pending->second : ImageFuture();
+}
+
+ImageFutureVec ImageHandler::acquireImagesAsync(const FilePathVec& filePaths, const Color4& defaultColor)
+{
+    cacheCompletedImages();
+
+    ImageFutureVec futures;
+    futures.reserve(filePaths.size());
+    for (const FilePath& filePath : filePaths)
+    {
+        FilePath resolvedFilePath = resolveFilePath(filePath);
+
+        // Return cached images and in-flight loads directly.
+        ImagePtr cachedImage = getCachedImage(resolvedFilePath);
+        if (cachedImage)
+        {
+            _imageCacheHits++;
+            std::promise<ImagePtr> promise;
+            promise.set_value(cachedImage);
+            futures.push_back(promise.get_future().share());
+            continue;
+        }
+        _imageCacheMisses++;
+        auto pending = _pendingImages.find(resolvedFilePath);
+        if (pending != _pendingImages.end())
+        {
+            futures.push_back(pending->second);
+            continue;
+        }
+
+        // Queue the image for loading on a worker thread.
+        auto promise = std::make_shared<std::promise<ImagePtr>>();
+        ImageFuture future = promise->get_future().share();
+        _pendingImages[resolvedFilePath] = future;
+        futures.push_back(future);
+        _loadPool->enqueue([this, promise, resolvedFilePath, defaultColor]()
+        {
+            ImagePtr image = loadImage(_searchPath.find(resolvedFilePath));
+            if (!image)
+            {
+                image = createUniformImage(1, 1, 4, Image::BaseType::UINT8, defaultColor);
+            }
+            promise->set_value(image);
+        });
+    }
+    return futures;
+}
+
+void ImageHandler::prefetchReferencedImages(ConstDocumentPtr doc)
+{
+    acquireImagesAsync(getReferencedFilePaths(doc));
+}
+
+void ImageHandler::setMaxLoadThreads(unsigned int threadCount)
+{
+    _loadPool->setMaxThreads(threadCount);
+}
+
+unsigned int ImageHandler::getMaxLoadThreads() const
+{
+    return _loadPool->getMaxThreads();
+}
+
 bool ImageHandler::bindImage(ImagePtr, const ImageSamplingProperties&)
 {
     return false;
@@ -165,6 +389,11 @@ void ImageHandler::unbindImages()
     }
 }
 
+bool ImageHandler::isImageBound(ConstImagePtr) const
+{
+    return false;
+}
+
 bool ImageHandler::createRenderResources(ImagePtr, bool, bool)
 {
     return false;
@@ -174,9 +403,111 @@ void ImageHandler::releaseRenderResources(ImagePtr)
 {
 }
 
+void ImageHandler::clearImageCache()
+{
+    // Discard the results of in-flight loads.
+    _pendingImages.clear();
+
+    releaseRenderResources();
+    _imageCache.clear();
+    _imageAccessTimes.clear();
+    _imageCacheSize = 0;
+}
+
+void ImageHandler::setImageCacheBudget(size_t budget)
+{
+    _imageCacheBudget = budget;
+    evictImages();
+}
+
+void ImageHandler::pinImage(const FilePath& filePath)
+{
+    _pinnedImages.insert(resolveFilePath(filePath));
+}
+
+void ImageHandler::unpinImage(const FilePath& filePath)
+{
+    _pinnedImages.erase(resolveFilePath(filePath));
+    evictImages();
+}
+
+bool ImageHandler::isImagePinned(const FilePath& filePath) const
+{
+    return _pinnedImages.count(resolveFilePath(filePath)) > 0;
+}
+
 ImageVec ImageHandler::getReferencedImages(ConstDocumentPtr doc)
 {
+    FilePathVec filePaths = getReferencedFilePaths(doc);
+    ImageFutureVec futures = acquireImagesAsync(filePaths);
+
     ImageVec imageVec;
+    for (const ImageFuture& future : futures)
+    {
+        ImagePtr image = future.get();
+        if (image)
+        {
+            imageVec.push_back(image);
+        }
+    }
+    cacheCompletedImages();
+    return imageVec;
+}
+
+ImageInfo ImageHandler::probeImage(const FilePath& filePath)
+{
+    FilePath resolvedFilePath = resolveFilePath(filePath);
+
+    // Describe a cached image if available.
+    cacheCompletedImages();
+    ImagePtr cachedImage = getCachedImage(resolvedFilePath);
+    if (cachedImage)
+    {
+        return getImageInfo(cachedImage);
+    }
+
+    // Ask each loader in turn to read the image header.
+    FilePath foundFilePath = _searchPath.find(resolvedFilePath);
+    string extension = stringToLower(foundFilePath.getExtension());
+    for (ImageLoaderPtr loader : getLoaders(extension))
+    {
+        ImageInfo info;
+        try
+        {
+            info = loader->probeImage(foundFilePath);
+        }
+        catch (std::exception& e)
+        {
+            std::cerr << "Exception in image I/O library: " << e.what() << std::endl;
+        }
+        if (info.isValid())
+        {
+            return info;
+        }
+    }
+
+    // Fall back to loading the image in full.
+    ImagePtr image = loadImage(foundFilePath);
+    return image ? getImageInfo(image) : ImageInfo();
+}
+
+ImageInfoVec ImageHandler::getReferencedImageInfo(ConstDocumentPtr doc)
+{
+    ImageInfoVec infoVec;
+    for (const FilePath& filePath : getReferencedFilePaths(doc))
+    {
+        ImageInfo info = probeImage(filePath);
+        if (info.isValid())
+        {
+            infoVec.push_back(info);
+        }
+    }
+    return infoVec;
+}
+
+FilePathVec ImageHandler::getReferencedFilePaths(ConstDocumentPtr doc) const
+{
+    FilePathVec filePaths;
     for (ElementPtr elem : doc->traverseTree())
     {
         if (elem->getActiveSourceUri() != doc->getSourceUri())
@@ -187,20 +518,45 @@ ImageVec ImageHandler::getReferencedImages(ConstDocumentPtr doc)
         InputPtr input = elem->asA<Input>();
         if (input && input->getType() == FILENAME_TYPE_STRING)
         {
-            ImagePtr image = acquireImage(input->getResolvedValueString());
-            if (image)
-            {
-                imageVec.push_back(image);
-            }
+            filePaths.push_back(input->getResolvedValueString());
+        }
+    }
+    return filePaths;
+}
+
+FilePath ImageHandler::resolveFilePath(const FilePath& filePath) const
+{
+    return _resolver ? FilePath(_resolver->resolve(filePath, FILENAME_TYPE_STRING)) : filePath;
+}
+
+const vector<ImageLoaderPtr>& ImageHandler::getLoaders(const string& extension) const
+{
+    // Loaders are looked up without modifying the map, which may be read
+    // concurrently by worker threads.
+    auto it = _imageLoaders.find(extension);
+    return it != _imageLoaders.end() ? it->second : EMPTY_LOADERS;
+}
+
+void ImageHandler::cacheCompletedImages()
+{
+    for (auto it = _pendingImages.begin(); it != _pendingImages.end();)
+    {
+        if (it->second.wait_for(std::chrono::seconds(0)) == std::future_status::ready)
+        {
+            cacheImage(it->first, it->second.get());
+            it = _pendingImages.erase(it);
+        }
+        else
+        {
+            ++it;
         }
     }
-    return imageVec;
 }
 
 ImagePtr ImageHandler::loadImage(const FilePath& filePath)
 {
     string extension = stringToLower(filePath.getExtension());
-    for (ImageLoaderPtr loader : _imageLoaders[extension])
+    for (ImageLoaderPtr loader : getLoaders(extension))
     {
         ImagePtr image;
         try
@@ -238,27 +594,74 @@ ImagePtr ImageHandler::loadImage(const FilePath& filePath)
 
 void ImageHandler::cacheImage(const string& filePath, ImagePtr image)
 {
-    _imageCache[filePath] = image;
+    ImagePtr& cachedImage = _imageCache[filePath];
+    if (cachedImage)
+    {
+        _imageCacheSize -= getImageSize(cachedImage);
+    }
+    cachedImage = image;
+    _imageCacheSize += getImageSize(image);
+    _imageAccessTimes[filePath] = ++_imageAccessCounter;
+    evictImages();
 }
 
 ImagePtr ImageHandler::getCachedImage(const FilePath& filePath)
 {
-    if (_imageCache.count(filePath))
-    {
-        return _imageCache[filePath];
-    }
-    if (!filePath.isAbsolute())
+    auto it = _imageCache.find(filePath);
+    if (it == _imageCache.end() && !filePath.isAbsolute())
     {
         for (const FilePath& path : _searchPath)
         {
-            FilePath combined = path / filePath;
-            if (_imageCache.count(combined))
+            it = _imageCache.find(path / filePath);
+            if (it != _imageCache.end())
             {
-                return _imageCache[combined];
+                break;
             }
         }
     }
-    return nullptr;
+    if (it == _imageCache.end())
+    {
+        return nullptr;
+    }
+    _imageAccessTimes[it->first] = ++_imageAccessCounter;
+    return it->second;
+}
+
+void ImageHandler::evictImages()
+{
+    if (!_imageCacheBudget || _imageCacheSize <= _imageCacheBudget)
+    {
+        return;
+    }
+
+    // Gather evictable images into a heap ordered from least to most
+    // recently used, always retaining the most recently used image.  Only
+    // as many images as are evicted are taken from the heap.
+    using Candidate = std::pair<size_t, string>;
+    std::vector<Candidate> candidates;
+    for (const auto& pair : _imageCache)
+    {
+        size_t accessTime = _imageAccessTimes[pair.first];
+        if (accessTime != _imageAccessCounter && !_pinnedImages.count(pair.first) && !isImageBound(pair.second))
+        {
+            candidates.emplace_back(accessTime, pair.first);
+        }
+    }
+    std::make_heap(candidates.begin(), candidates.end(), std::greater<Candidate>());
+
+    while (!candidates.empty() && _imageCacheSize > _imageCacheBudget)
+    {
+        std::pop_heap(candidates.begin(), candidates.end(), std::greater<Candidate>());
+        Candidate candidate = std::move(candidates.back());
+        candidates.pop_back();
+        auto it = _imageCache.find(candidate.second);
+        ImagePtr image = it->second;
+        _imageCache.erase(it);
+        _imageAccessTimes.erase(candidate.second);
+        _imageCacheSize -= getImageSize(image);
+        _imageCacheEvictions++;
+        releaseRenderResources(image);
+    }
 }
 
 //
@@ -16,6 +16,8 @@
 
 #include <MaterialXCore/Document.h>
 
+#include <future>
+
 MATERIALX_NAMESPACE_BEGIN
 
 extern MX_RENDER_API const string IMAGE_PROPERTY_SEPARATOR;
@@ -26,6 +28,7 @@ extern MX_RENDER_API const string DEFAULT_COLOR_SUFFIX;
 
 class ImageHandler;
 class ImageLoader;
+class ImageLoadPool;
 class VariableBlock;
 
 /// Shared pointer to an ImageHandler
@@ -37,6 +40,12 @@ using ImageLoaderPtr = std::shared_ptr<ImageLoader>;
 /// Map from strings to vectors of image loaders
 using ImageLoaderMap = std::unordered_map<string, std::vector<ImageLoaderPtr>>;
 
+/// A shared future for an image that is being acquired asynchronously
+using ImageFuture = std::shared_future<ImagePtr>;
+
+/// A vector of image futures
+using ImageFutureVec = vector<ImageFuture>;
+
 /// @class ImageSamplingProperties
 /// Interface to describe sampling properties for images.
 class MX_RENDER_API ImageSamplingProperties
@@ -102,6 +111,36 @@ struct MX_RENDER_API ImageSamplingKeyHasher
     }
 };
 
+/// @class ImageInfo
+/// Properties of an image file that can be read from its header, without
+/// decoding its pixels.
+class MX_RENDER_API ImageInfo
+{
+  public:
+    /// Return true if the properties describe a valid image.
+    bool isValid() const
+    {
+        return width > 0 && height > 0;
+    }
+
+    /// Image width in pixels
+    unsigned int width = 0;
+    /// Image height in pixels
+    unsigned int height = 0;
+    /// Number of channels per pixel
+    unsigned int channelCount = 0;
+    /// Base type of each channel
+    Image::BaseType baseType = Image::BaseType::UINT8;
+    /// Color space recorded in the file, if any
+    string colorSpace;
+};
+
+/// A vector of image properties
+using ImageInfoVec = vector<ImageInfo>;
+
+/// Compute the maximum width and height of the given image properties.
+MX_RENDER_API UnsignedIntPair getMaxDimensions(const ImageInfoVec& infoVec);
+
 /// @class ImageLoader
 /// Abstract base class for file-system image loaders
 class MX_RENDER_API ImageLoader
@@ -150,6 +189,13 @@ class MX_RENDER_API ImageLoader
     /// @return On success, a shared pointer to the loaded image; otherwise an empty shared pointer.
     virtual ImagePtr loadImage(const FilePath& filePath);
 
+    /// Read the properties of an image from the file system without decoding
+    /// its pixels.  The default implementation returns invalid properties,
+    /// indicating that probing is not supported by this loader.
+    /// @param filePath The requested image file path.
+    /// @return The properties of the image, which are invalid on failure.
+    virtual ImageInfo probeImage(const FilePath& filePath);
+
   protected:
     // List of supported string extensions
     StringSet _extensions;
@@ -167,7 +213,7 @@ class MX_RENDER_API ImageHandler
     {
         return ImageHandlerPtr(new ImageHandler(imageLoader));
     }
-    virtual ~ImageHandler() { }
+    virtual ~ImageHandler();
 
     /// Add another image loader to the handler, which will be invoked if
     /// existing loaders cannot load a given image.
@@ -193,6 +239,39 @@ class MX_RENDER_API ImageHandler
     /// @return On success, a shared pointer to the acquired image.
     ImagePtr acquireImage(const FilePath& filePath, const Color4& defaultColor = Color4(0.0f));
 
+    /// Acquire a set of images asynchronously, loading images that are not
+    /// yet cached on a pool of worker threads.  Images that cannot be found by
+    /// any loader resolve to a uniform image of the given default color.
+    ///
+    /// Loaded images are added to the image cache on the next call to
+    /// acquireImage or acquireImagesAsync from the thread that owns this
+    /// handler.  Image loaders, search paths and resolvers should not be
+    /// modified while asynchronous loads are in flight.
+    /// @param filePaths File paths of the images.
+    /// @param defaultColor Default color to use as a fallback for missing images.
+    /// @return A vector of futures, one for each given file path.
+    ImageFutureVec acquireImagesAsync(const FilePathVec& filePaths, const Color4& defaultColor = Color4(0.0f));
+
+    /// Return the future of an asynchronous load of the given image that has
+    /// not yet been moved into the image cache, or an invalid future if no
+    /// such load is in flight.
+    ImageFuture getPendingImage(const FilePath& filePath) const;
+
+    /// Return the resolved file paths of all images referenced by the given document.
+    FilePathVec getReferencedFilePaths(ConstDocumentPtr doc) const;
+
+    /// Start loading all images referenced by the given document in the
+    /// background, so that they are ready by the time they are acquired.
+    void prefetchReferencedImages(ConstDocumentPtr doc);
+
+    /// Set the maximum number of worker threads used for asynchronous image
+    /// loading.  Defaults to the number of hardware threads.
+    void setMaxLoadThreads(unsigned int threadCount);
+
+    /// Return the maximum number of worker threads used for asynchronous
+    /// image loading.
+    unsigned int getMaxLoadThreads() const;
+
     /// Bind an image for rendering.
     /// @param image The image to bind.
     /// @param samplingProperties Sampling properties for the image.
@@ -205,6 +284,10 @@ class MX_RENDER_API ImageHandler
     /// Unbind all images that are currently stored in the cache.
     void unbindImages();
 
+    /// Return true if the given image is currently bound for rendering.
+    /// Bound images are never evicted from the image cache.
+    virtual bool isImageBound(ConstImagePtr image) const;
+
     /// Set the search path to be used for finding images on the file system.
     void setSearchPath(const FileSearchPath& path)
     {
@@ -238,10 +321,52 @@ class MX_RENDER_API ImageHandler
 
     /// Clear the contents of the image cache, first releasing any render
     /// resources associated with cached images.
-    void clearImageCache()
+    void clearImageCache();
+
+    /// Set the memory budget of the image cache in bytes, evicting least
+    /// recently used images as needed.  Images that are pinned or currently
+    /// bound are never evicted.  A budget of zero, the default, disables
+    /// eviction.
+    void setImageCacheBudget(size_t budget);
+
+    /// Return the memory budget of the image cache in bytes.
+    size_t getImageCacheBudget() const
     {
-        releaseRenderResources();
-        _imageCache.clear();
+        return _imageCacheBudget;
+    }
+
+    /// Return the total size in bytes of the images in the cache.
+    size_t getImageCacheSize() const
+    {
+        return _imageCacheSize;
+    }
+
+    /// Pin the image with the given file path, so that it remains in the
+    /// image cache regardless of its memory budget.
+    void pinImage(const FilePath& filePath);
+
+    /// Unpin the image with the given file path, allowing it to be evicted.
+    void unpinImage(const FilePath& filePath);
+
+    /// Return true if the image with the given file path is pinned.
+    bool isImagePinned(const FilePath& filePath) const;
+
+    /// Return the number of image acquisitions served from the cache.
+    size_t getImageCacheHitCount() const
+    {
+        return _imageCacheHits;
+    }
+
+    /// Return the number of image acquisitions that required a load.
+    size_t getImageCacheMissCount() const
+    {
+        return _imageCacheMisses;
+    }
+
+    /// Return the number of images evicted from the cache.
+    size_t getImageCacheEvictionCount() const
+    {
+        return _imageCacheEvictions;
     }
 
     /// Return a fallback image with zeroes in all channels.
@@ -251,13 +376,37 @@ class MX_RENDER_API ImageHandler
     }
 
     /// Acquire all images referenced by the given document, and return the
-    /// images in a vector.
+    /// images in a vector.  Images that are not yet cached are loaded in
+    /// parallel.
     ImageVec getReferencedImages(ConstDocumentPtr doc);
 
+    /// Read the properties of an image without decoding its pixels.  Cached
+    /// images are described directly, and otherwise each image loader is
+    /// asked in turn to read the image header.  Loaders that do not support
+    /// probing fall back to a full load, whose result is not cached.
+    /// @param filePath File path of the image.
+    /// @return The properties of the image, which are invalid if the image
+    ///    could not be read.
+    ImageInfo probeImage(const FilePath& filePath);
+
+    /// Read the properties of all images referenced by the given document,
+    /// without decoding their pixels, and return them in a vector.  Images
+    /// that cannot be read are omitted.
+    ImageInfoVec getReferencedImageInfo(ConstDocumentPtr doc);
+
   protected:
     // Protected constructor.
     ImageHandler(ImageLoaderPtr imageLoader);
 
+    // Resolve the given file path with the current filename resolver.
+    FilePath resolveFilePath(const FilePath& filePath) const;
+
+    // Return the loaders registered for the given file extension.
+    const std::vector<ImageLoaderPtr>& getLoaders(const string& extension) const;
+
+    // Move completed asynchronous loads into the image cache.
+    void cacheCompletedImages();
+
     // Load an image from the file system.
     ImagePtr loadImage(const FilePath& filePath);
 
@@ -268,12 +417,31 @@ class MX_RENDER_API ImageHandler
     // shared pointer.
     ImagePtr getCachedImage(const FilePath& filePath);
 
+    // Evict least recently used images until the cache fits its budget.
+    void evictImages();
+
   protected:
     ImageLoaderMap _imageLoaders;
     ImageMap _imageCache;
     FileSearchPath _searchPath;
     StringResolverPtr _resolver;
     ImagePtr _zeroImage;
+
+    // Memory budget and usage of the image cache.
+    size_t _imageCacheBudget;
+    size_t _imageCacheSize;
+    size_t _imageCacheHits;
+    size_t _imageCacheMisses;
+    size_t _imageCacheEvictions;
+
+    // Last access time of each cached image, and the set of pinned images.
+    std::unordered_map<string, size_t> _imageAccessTimes;
+    size_t _imageAccessCounter;
+    StringSet _pinnedImages;
+
+    // Asynchronous loads that have not yet been moved into the image cache.
+    std::unordered_map<string, ImageFuture> _pendingImages;
+    std::unique_ptr<ImageLoadPool> _loadPool;
 };
 
 MATERIALX_NAMESPACE_END
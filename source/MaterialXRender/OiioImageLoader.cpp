@@ -71,40 +71,54 @@ bool OiioImageLoader::saveImage(const FilePath& filePath,
     return written;
 }
 
-ImagePtr OiioImageLoader::loadImage(const FilePath& filePath)
+namespace
 {
-    auto imageInput = OIIO::ImageInput::open(filePath);
-    if (!imageInput)
-    {
-        return nullptr;
-    }
 
-    OIIO::ImageSpec imageSpec = imageInput->spec();
-    Image::BaseType baseType;
-    switch (imageSpec.format.basetype)
+// Return the base type corresponding to the given OpenImageIO type, if any.
+bool getBaseType(const OIIO::TypeDesc& format, Image::BaseType& baseType)
+{
+    switch (format.basetype)
     {
         case OIIO::TypeDesc::UINT8:
             baseType = Image::BaseType::UINT8;
-            break;
+            return true;
         case OIIO::TypeDesc::INT8:
             baseType = Image::BaseType::INT8;
-            break;
+            return true;
         case OIIO::TypeDesc::UINT16:
             baseType = Image::BaseType::UINT16;
-            break;
+            return true;
         case OIIO::TypeDesc::INT16:
             baseType = Image::BaseType::INT16;
-            break;
+            return true;
         case OIIO::TypeDesc::HALF:
             baseType = Image::BaseType::HALF;
-            break;
+            return true;
         case OIIO::TypeDesc::FLOAT:
             baseType = Image::BaseType::FLOAT;
-            break;
+            return true;
         default:
-            imageInput->close();
-            return nullptr;
+            return false;
     };
+}
+
+} // anonymous namespace
+
+ImagePtr OiioImageLoader::loadImage(const FilePath& filePath)
+{
+    auto imageInput = OIIO::ImageInput::open(filePath);
+    if (!imageInput)
+    {
+        return nullptr;
+    }
+
+    OIIO::ImageSpec imageSpec = imageInput->spec();
+    Image::BaseType baseType;
+    if (!getBaseType(imageSpec.format, baseType))
+    {
+        imageInput->close();
+        return nullptr;
+    }
 
     ImagePtr image = Image::create(imageSpec.width, imageSpec.height, imageSpec.nchannels, baseType);
     image->createResourceBuffer();
@@ -117,6 +131,28 @@ ImagePtr OiioImageLoader::loadImage(const FilePath& filePath)
     return image;
 }
 
+ImageInfo OiioImageLoader::probeImage(const FilePath& filePath)
+{
+    ImageInfo info;
+    auto imageInput = OIIO::ImageInput::open(filePath);
+    if (!imageInput)
+    {
+        return info;
+    }
+
+    const OIIO::ImageSpec& imageSpec = imageInput->spec();
+    if (getBaseType(imageSpec.format, info.baseType))
+    {
+        info.width = (unsigned int) imageSpec.width;
+        info.height = (unsigned int) imageSpec.height;
+        info.channelCount = (unsigned int) imageSpec.nchannels;
+        info.colorSpace = imageSpec.get_string_attribute("oiio:ColorSpace");
+    }
+    imageInput->close();
+
+    return info;
+}
+
 MATERIALX_NAMESPACE_END
 
 #endif
\ No newline at end of file
@@ -54,6 +54,9 @@ class MX_RENDER_API OiioImageLoader : public ImageLoader
 
     /// Load an image from the file system.
     ImagePtr loadImage(const FilePath& filePath) override;
+
+    /// Read the properties of an image from the file system without decoding its pixels.
+    ImageInfo probeImage(const FilePath& filePath) override;
 };
 
 MATERIALX_NAMESPACE_END
@@ -55,7 +55,7 @@ bool StbImageLoader::saveImage(const FilePath& filePath,
 
     const string filePathName = filePath.asString();
 
-    string extension = filePath.getExtension();
+    string extension = stringToLower(filePath.getExtension());
     if (!isFloat)
     {
         if (extension == PNG_EXTENSION)
@@ -99,7 +99,7 @@ ImagePtr StbImageLoader::loadImage(const FilePath& filePath)
     void* buffer = nullptr;
 
     // Select standard or float reader based on file extension.
-    string extension = filePath.getExtension();
+    string extension = stringToLower(filePath.getExtension());
     if (extension == HDR_EXTENSION)
     {
         buffer = stbi_loadf(filePath.asString().c_str(), &width, &height, &channelCount, 0);
@@ -122,6 +122,22 @@ ImagePtr StbImageLoader::loadImage(const FilePath& filePath)
     return image;
 }
 
+ImageInfo StbImageLoader::probeImage(const FilePath& filePath)
+{
+    int width = 0;
+    int height = 0;
+    int channelCount = 0;
+    ImageInfo info;
+    if (stbi_info(filePath.asString().c_str(), &width, &height, &channelCount))
+    {
+        info.width = (unsigned int) width;
+        info.height = (unsigned int) height;
+        info.channelCount = (unsigned int) channelCount;
+        info.baseType = (stringToLower(filePath.getExtension()) == HDR_EXTENSION) ? Image::BaseType::FLOAT : Image::BaseType::UINT8;
+    }
+    return info;
+}
+
 #if defined(__APPLE__)
     #pragma clang diagnostic pop
 #endif
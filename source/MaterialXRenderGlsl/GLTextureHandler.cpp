@@ -10,6 +10,7 @@
 
 #include <MaterialXRender/ShaderRenderer.h>
 
+#include <algorithm>
 #include <iostream>
 
 MATERIALX_NAMESPACE_BEGIN
@@ -159,6 +160,13 @@ void GLTextureHandler::releaseRenderResources(ImagePtr image)
     image->setResourceId(GlslProgram::UNDEFINED_OPENGL_RESOURCE_ID);
 }
 
+bool GLTextureHandler::isImageBound(ConstImagePtr image) const
+{
+    unsigned int resourceId = image->getResourceId();
+    return resourceId != GlslProgram::UNDEFINED_OPENGL_RESOURCE_ID &&
+           std::find(_boundTextureLocations.begin(), _boundTextureLocations.end(), resourceId) != _boundTextureLocations.end();
+}
+
 int GLTextureHandler::getBoundTextureLocation(unsigned int resourceId)
 {
     for (size_t i = 0; i < _boundTextureLocations.size(); i++)
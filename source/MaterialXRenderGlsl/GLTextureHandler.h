@@ -36,6 +36,9 @@ class MX_RENDERGLSL_API GLTextureHandler : public ImageHandler
     /// Unbind an image.
     bool unbindImage(ImagePtr image) override;
 
+    /// Return true if the given image is currently bound to a texture unit.
+    bool isImageBound(ConstImagePtr image) const override;
+
     /// Create rendering resources for the given image.
     bool createRenderResources(ImagePtr image, bool generateMipMaps, bool useAsRenderTarget = false) override;
 
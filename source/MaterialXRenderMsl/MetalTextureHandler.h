@@ -54,6 +54,9 @@ class MX_RENDERMSL_API MetalTextureHandler : public ImageHandler
     /// Unbind an image.
     bool unbindImage(ImagePtr image) override;
 
+    /// Return true if the given image is currently bound to a texture unit.
+    bool isImageBound(ConstImagePtr image) const override;
+
     id<MTLTexture> getMTLTextureForImage(unsigned int index) const;
     id<MTLSamplerState> getMTLSamplerStateForImage(unsigned int index);
 
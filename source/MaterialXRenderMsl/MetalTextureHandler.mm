@@ -7,6 +7,7 @@
 #include <MaterialXRenderMsl/MslPipelineStateObject.h>
 #include <MaterialXRender/ShaderRenderer.h>
 
+#include <algorithm>
 #include <iostream>
 
 MATERIALX_NAMESPACE_BEGIN
@@ -302,6 +303,13 @@ void MetalTextureHandler::releaseRenderResources(ImagePtr image)
     image->setResourceId(MslProgram::UNDEFINED_METAL_RESOURCE_ID);
 }
 
+bool MetalTextureHandler::isImageBound(ConstImagePtr image) const
+{
+    unsigned int resourceId = image->getResourceId();
+    return resourceId != MslProgram::UNDEFINED_METAL_RESOURCE_ID &&
+           std::find(_boundTextureLocations.begin(), _boundTextureLocations.end(), resourceId) != _boundTextureLocations.end();
+}
+
 int MetalTextureHandler::getBoundTextureLocation(unsigned int resourceId)
 {
     for (size_t i = 0; i < _boundTextureLocations.size(); i++)
@@ -80,6 +80,12 @@ bool SlangTextureHandler::bindImage(ImagePtr image, const ImageSamplingPropertie
     return true;
 }
 
+bool SlangTextureHandler::isImageBound(ConstImagePtr image) const
+{
+    unsigned int resourceId = image->getResourceId();
+    return resourceId != SlangProgram::UNDEFINED_SLANG_RESOURCE_ID && _imageBindingInfo.count(resourceId);
+}
+
 rhi::ComPtr<rhi::ISampler> SlangTextureHandler::getSamplerState(const ImageSamplingProperties& samplingProperties)
 {
     auto samplerIt = _imageSamplerStateMap.find(samplingProperties);
@@ -53,6 +53,10 @@ class MX_RENDERSLANG_API SlangTextureHandler : public ImageHandler
     /// to the same cursor.
     bool unbindImage(ImagePtr image) override { return true; }
 
+    /// Return true if the given image has been bound and its rendering
+    /// resources have not been released.
+    bool isImageBound(ConstImagePtr image) const override;
+
     /// Create rendering resources for the given image.
     bool createRenderResources(ImagePtr image, bool generateMipMaps, bool useAsRenderTarget = false) override;
 
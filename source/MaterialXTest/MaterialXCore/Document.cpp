@@ -271,3 +271,173 @@ TEST_CASE("Document equivalence", "[document]")
     equivalent = doc->isEquivalent(doc2, options, &message);
     REQUIRE(!equivalent);
 }
+
+TEST_CASE("Incremental validation", "[document]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::DocumentPtr stdlib = mx::createDocument();
+    mx::loadLibraries({ "libraries" }, searchPath, stdlib);
+
+    // Compare incremental and complete validation, including the set of
+    // reported errors.
+    auto checkValidation = [](mx::DocumentPtr doc)
+    {
+        std::string message, incrementalMessage;
+        bool valid = doc->validate(&message);
+        bool incrementalValid = doc->validateIncremental(&incrementalMessage);
+        REQUIRE(incrementalValid == valid);
+        mx::StringVec lines = mx::splitString(message, "\n");
+        mx::StringVec incrementalLines = mx::splitString(incrementalMessage, "\n");
+        std::sort(lines.begin(), lines.end());
+        std::sort(incrementalLines.begin(), incrementalLines.end());
+        REQUIRE(incrementalLines == lines);
+        return valid;
+    };
+
+    // Build a node graph with a chain of connected nodes.
+    mx::DocumentPtr doc = mx::createDocument();
+    doc->setDataLibrary(stdlib);
+    mx::NodeGraphPtr nodeGraph = doc->addNodeGraph("graph");
+    mx::NodePtr constant = nodeGraph->addNode("constant", "constant1", "color3");
+    constant->setInputValue("value", mx::Color3(0.5f));
+    mx::NodePtr multiply = nodeGraph->addNode("multiply", "multiply1", "color3");
+    multiply->setConnectedNode("in1", constant);
+    multiply->setInputValue("in2", mx::Color3(2.0f));
+    mx::OutputPtr output = nodeGraph->addOutput("out", "color3");
+    output->setConnectedNode(multiply);
+    REQUIRE(checkValidation(doc));
+
+    // Create and fix a type mismatch in a connection.
+    constant->setType("float");
+    REQUIRE(!checkValidation(doc));
+    constant->setType("color3");
+    REQUIRE(checkValidation(doc));
+
+    // Create and fix a connection to a missing node.
+    constant->setName("constant2");
+    REQUIRE(!checkValidation(doc));
+    constant->setName("constant1");
+    REQUIRE(checkValidation(doc));
+    nodeGraph->removeNode("constant1");
+    REQUIRE(!checkValidation(doc));
+    constant = nodeGraph->addNode("constant", "constant1", "color3");
+    REQUIRE(checkValidation(doc));
+
+    // Create and fix a cycle in the graph.
+    constant->setConnectedNode("value", multiply);
+    REQUIRE(!checkValidation(doc));
+    constant->removeInput("value");
+    REQUIRE(checkValidation(doc));
+
+    // Create and fix an input with conflicting bindings.
+    mx::InputPtr in2 = multiply->getInput("in2");
+    in2->setNodeName("constant1");
+    REQUIRE(!checkValidation(doc));
+    in2->removeAttribute(mx::PortElement::NODE_NAME_ATTRIBUTE);
+    REQUIRE(checkValidation(doc));
+
+    // Create and fix an invalid interface name.
+    in2->removeAttribute(mx::ValueElement::VALUE_ATTRIBUTE);
+    in2->setInterfaceName("scale");
+    REQUIRE(!checkValidation(doc));
+    nodeGraph->addInput("scale", "color3");
+    REQUIRE(checkValidation(doc));
+    nodeGraph->removeInput("scale");
+    REQUIRE(!checkValidation(doc));
+    nodeGraph->addInput("scale", "color3");
+    REQUIRE(checkValidation(doc));
+
+    // Changes to definitions trigger a complete validation.
+    mx::NodeDefPtr nodeDef = doc->addNodeDef("ND_custom", "color3", "custom");
+    mx::NodePtr custom = nodeGraph->addNode("custom", "custom1", "color3");
+    REQUIRE(checkValidation(doc));
+    nodeDef->getOutputs()[0]->setType("float");
+    REQUIRE(!checkValidation(doc));
+    doc->removeNodeDef("ND_custom");
+    REQUIRE(checkValidation(doc));
+
+    // Changes to the data library trigger a complete validation.
+    doc->setDataLibrary(nullptr);
+    REQUIRE(checkValidation(doc) == doc->validate());
+
+    // Edit the types of inputs in documents read from file.
+    mx::FilePath adjustmentPath = searchPath.find("resources/Materials/TestSuite/stdlib/adjustment");
+    for (const mx::FilePath& filename : adjustmentPath.getFilesInDirectory(mx::MTLX_EXTENSION))
+    {
+        mx::DocumentPtr fileDoc = mx::createDocument();
+        mx::readFromXmlFile(fileDoc, adjustmentPath / filename);
+        fileDoc->setDataLibrary(stdlib);
+        checkValidation(fileDoc);
+        size_t index = 0;
+        for (mx::ElementPtr elem : fileDoc->traverseTree())
+        {
+            mx::InputPtr input = elem->asA<mx::Input>();
+            if (input && input->getParent()->isA<mx::Node>() && index++ % 3 == 0)
+            {
+                input->setType("float");
+                checkValidation(fileDoc);
+            }
+        }
+    }
+}
+
+TEST_CASE("Document cache", "[document]")
+{
+    mx::DocumentPtr doc = mx::createDocument();
+    mx::NodeDefPtr nodeDef = doc->addNodeDef("ND_custom", "color3", "custom");
+    nodeDef->addInput("in", "color3");
+    mx::NodeGraphPtr graph = doc->addNodeGraph("graph");
+    mx::NodePtr constant = graph->addNode("constant", "constant1", "color3");
+    REQUIRE(doc->getMatchingNodeDefs("custom").size() == 1);
+    size_t rebuildCount = doc->getCacheRebuildCount();
+
+    // Interleave edits with lookups, which are served without rebuilding
+    // the cache.
+    mx::NodePtr previous = constant;
+    for (int i = 0; i < 100; i++)
+    {
+        mx::NodePtr node = graph->addNode("custom", "node" + std::to_string(i), "color3");
+        node->setConnectedNode("in", previous);
+        REQUIRE(node->getNodeDef() == nodeDef);
+        REQUIRE(doc->getMatchingPorts(previous->getName()).size() == 1);
+        previous = node;
+    }
+    REQUIRE(doc->getCacheRebuildCount() == rebuildCount);
+
+    // Connections, definitions and implementations are tracked across
+    // attribute changes, renames and removals.
+    mx::InputPtr input = graph->getNode("node1")->getInput("in");
+    input->setNodeName("constant1");
+    REQUIRE(doc->getMatchingPorts("node0").empty());
+    REQUIRE(doc->getMatchingPorts("constant1").size() == 2);
+    graph->getNode("node1")->setName("renamed");
+    REQUIRE(doc->getMatchingPorts("constant1").size() == 2);
+    graph->removeNode("renamed");
+    REQUIRE(doc->getMatchingPorts("constant1").size() == 1);
+    nodeDef->setNodeString("custom2");
+    REQUIRE(doc->getMatchingNodeDefs("custom").empty());
+    REQUIRE(doc->getMatchingNodeDefs("custom2").size() == 1);
+    mx::ImplementationPtr impl = doc->addImplementation("IM_custom");
+    impl->setNodeDef(nodeDef);
+    REQUIRE(doc->getMatchingImplementations("ND_custom").size() == 1);
+    doc->removeImplementation("IM_custom");
+    REQUIRE(doc->getMatchingImplementations("ND_custom").empty());
+    REQUIRE(doc->getCacheRebuildCount() == rebuildCount);
+
+    // Copied content matches a complete rebuild.
+    mx::NodeGraphPtr graphCopy = doc->addNodeGraph("graphCopy");
+    graphCopy->copyContentFrom(graph);
+    size_t portCount = doc->getMatchingPorts("node50").size();
+    REQUIRE(portCount == 2);
+
+    // Children retained when copying content into a graph remain tracked.
+    mx::NodeGraphPtr source = doc->addNodeGraph("source");
+    source->addNode("constant", "constant2", "color3");
+    graph->copyContentFrom(source);
+    REQUIRE(graph->getNode("constant2"));
+    REQUIRE(doc->getMatchingPorts("node50").size() == portCount);
+    doc->invalidateCache();
+    REQUIRE(doc->getMatchingPorts("node50").size() == portCount);
+    REQUIRE(doc->getCacheRebuildCount() == rebuildCount + 1);
+    REQUIRE(doc->getCacheHitCount() > 0);
+}
@@ -9,6 +9,10 @@
 #include <MaterialXFormat/Util.h>
 #include <MaterialXFormat/XmlIo.h>
 
+#include <cstdio>
+#include <filesystem>
+#include <fstream>
+
 namespace mx = MaterialX;
 
 TEST_CASE("Load content", "[xmlio]")
@@ -239,6 +243,338 @@ TEST_CASE("Load content", "[xmlio]")
     REQUIRE_THROWS_AS(mx::readFromXmlFile(nonExistentDoc, "NonExistent.mtlx", mx::FileSearchPath(), &readOptions), mx::ExceptionFileMissing);
 }
 
+TEST_CASE("Library snapshots", "[xmlio]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::FilePathVec libraryFolders = { "libraries" };
+    mx::FilePath snapshotFile = mx::FilePath::getCurrentPath() / "libraries_snapshot_test.mxsnap";
+
+    // Load libraries from source files as a reference.
+    mx::DocumentPtr reference = mx::createDocument();
+    mx::StringSet referenceFiles = mx::loadLibraries(libraryFolders, searchPath, reference);
+    REQUIRE(!referenceFiles.empty());
+
+    // Write a snapshot and reconstruct the libraries from it.
+    mx::writeLibrariesSnapshot(libraryFolders, searchPath, snapshotFile);
+    REQUIRE(snapshotFile.exists());
+    mx::DocumentPtr libraries = mx::createDocument();
+    mx::StringSet snapshotFiles = mx::loadLibrariesSnapshot(libraryFolders, searchPath, libraries, snapshotFile);
+    REQUIRE(snapshotFiles == referenceFiles);
+    REQUIRE(*libraries == *reference);
+    for (mx::ElementPtr child : reference->getChildren())
+    {
+        REQUIRE(libraries->getChild(child->getName())->getSourceUri() == child->getSourceUri());
+    }
+
+    // Reconstruct the libraries into a document with existing content.
+    mx::DocumentPtr doc = mx::createDocument();
+    doc->addNodeGraph("custom_graph");
+    mx::loadLibrariesSnapshot(libraryFolders, searchPath, doc, snapshotFile);
+    REQUIRE(doc->getNodeGraph("custom_graph"));
+    REQUIRE(doc->getNodeDefs().size() == reference->getNodeDefs().size());
+
+    // A corrupt snapshot falls back to the source files and is rewritten.
+    {
+        std::ofstream file(snapshotFile.asString(), std::ios::trunc);
+        file << "invalid";
+    }
+    libraries = mx::createDocument();
+    mx::loadLibrariesSnapshot(libraryFolders, searchPath, libraries, snapshotFile);
+    REQUIRE(*libraries == *reference);
+    REQUIRE(snapshotFile.getFileSize() > std::string("invalid").size());
+
+    std::remove(snapshotFile.asString().c_str());
+
+    // Edits to included files are detected, even when the size and modification
+    // time of the file are unchanged.
+    std::filesystem::path rootPath = std::filesystem::temp_directory_path() / "materialx_snapshot_test";
+    std::filesystem::remove_all(rootPath);
+    std::filesystem::create_directories(rootPath / "libraries" / "custom");
+    std::filesystem::create_directories(rootPath / "includes");
+    std::filesystem::path includePath = rootPath / "includes" / "custom_defs.mtlx";
+    auto writeInclude = [&includePath](const std::string& nodeDefName)
+    {
+        std::ofstream file(includePath, std::ios::trunc);
+        file << "<?xml version=\"1.0\"?>\n<materialx version=\"1.39\">\n"
+             << "  <nodedef name=\"" << nodeDefName << "\" node=\"custom\">\n"
+             << "    <output name=\"out\" type=\"float\" />\n"
+             << "  </nodedef>\n</materialx>\n";
+    };
+    writeInclude("ND_custom_a");
+    {
+        std::ofstream file(rootPath / "libraries" / "custom" / "custom.mtlx");
+        file << "<?xml version=\"1.0\"?>\n<materialx version=\"1.39\" xmlns:xi=\"http://www.w3.org/2001/XInclude\">\n"
+             << "  <xi:include href=\"../../includes/custom_defs.mtlx\" />\n</materialx>\n";
+    }
+    mx::FileSearchPath customSearchPath(rootPath.string());
+    mx::FilePath customSnapshotFile = (rootPath / "custom.mxsnap").string();
+    mx::writeLibrariesSnapshot(libraryFolders, customSearchPath, customSnapshotFile);
+    libraries = mx::createDocument();
+    mx::loadLibrariesSnapshot(libraryFolders, customSearchPath, libraries, customSnapshotFile);
+    REQUIRE(libraries->getNodeDef("ND_custom_a"));
+
+    std::filesystem::file_time_type includeTime = std::filesystem::last_write_time(includePath);
+    writeInclude("ND_custom_b");
+    std::filesystem::last_write_time(includePath, includeTime);
+    libraries = mx::createDocument();
+    mx::loadLibrariesSnapshot(libraryFolders, customSearchPath, libraries, customSnapshotFile);
+    REQUIRE(!libraries->getNodeDef("ND_custom_a"));
+    REQUIRE(libraries->getNodeDef("ND_custom_b"));
+
+    std::filesystem::remove_all(rootPath);
+}
+
+TEST_CASE("Filtered reading", "[xmlio]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::FilePath filename = searchPath.find("libraries/stdlib/stdlib_defs.mtlx");
+    mx::DocumentPtr reference = mx::createDocument();
+    mx::readFromXmlFile(reference, filename);
+
+    // Read only node definitions.
+    mx::XmlReadOptions readOptions;
+    readOptions.includeCategories = { mx::NodeDef::CATEGORY };
+    mx::DocumentPtr doc = mx::createDocument();
+    mx::readFromXmlFile(doc, filename, mx::FileSearchPath(), &readOptions);
+    REQUIRE(!doc->getNodeDefs().empty());
+    REQUIRE(doc->getChildren().size() == reference->getNodeDefs().size());
+    for (mx::NodeDefPtr nodeDef : doc->getNodeDefs())
+    {
+        REQUIRE(*nodeDef == *reference->getNodeDef(nodeDef->getName()));
+    }
+
+    // Exclude inputs at any depth.
+    readOptions = mx::XmlReadOptions();
+    readOptions.excludeCategories = { mx::Input::CATEGORY };
+    doc = mx::createDocument();
+    mx::readFromXmlFile(doc, filename, mx::FileSearchPath(), &readOptions);
+    REQUIRE(doc->getNodeDefs().size() == reference->getNodeDefs().size());
+    for (mx::ElementPtr elem : doc->traverseTree())
+    {
+        REQUIRE(!elem->isA<mx::Input>());
+    }
+
+    // Limit the depth of the element tree.
+    readOptions = mx::XmlReadOptions();
+    readOptions.maxDepth = 1;
+    doc = mx::createDocument();
+    mx::readFromXmlFile(doc, filename, mx::FileSearchPath(), &readOptions);
+    REQUIRE(doc->getChildren().size() == reference->getChildren().size());
+    for (mx::ElementPtr child : doc->getChildren())
+    {
+        REQUIRE(child->getChildren().empty());
+    }
+
+    // Skip values.
+    readOptions = mx::XmlReadOptions();
+    readOptions.skipValues = true;
+    doc = mx::createDocument();
+    mx::readFromXmlFile(doc, filename, mx::FileSearchPath(), &readOptions);
+    REQUIRE(doc->getNodeDefs().size() == reference->getNodeDefs().size());
+    for (mx::ElementPtr elem : doc->traverseTree())
+    {
+        REQUIRE(!elem->hasAttribute(mx::ValueElement::VALUE_ATTRIBUTE));
+    }
+}
+
+TEST_CASE("Compressed documents", "[xmlio]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::FilePath filename = searchPath.find("resources/Materials/Examples/StandardSurface/standard_surface_carpaint.mtlx");
+    mx::DocumentPtr doc = mx::createDocument();
+    mx::readFromXmlFile(doc, filename);
+
+    REQUIRE(mx::isXmlFileFormatSupported("document.mtlx"));
+    for (const std::string& extension : mx::StringVec{ "gz", "zst" })
+    {
+        mx::FilePath compressedFile = mx::FilePath::getCurrentPath() / ("compressed_test.mtlx." + extension);
+        if (!mx::isXmlFileFormatSupported(compressedFile))
+        {
+            REQUIRE_THROWS_AS(mx::writeToXmlFile(doc, compressedFile), mx::Exception);
+            continue;
+        }
+
+        // Write and read back a compressed document.
+        mx::writeToXmlFile(doc, compressedFile);
+        REQUIRE(compressedFile.exists());
+        mx::DocumentPtr compressedDoc = mx::createDocument();
+        mx::readFromXmlFile(compressedDoc, compressedFile);
+        REQUIRE(*compressedDoc == *doc);
+
+        // Compressed files are smaller than their uncompressed content.
+        REQUIRE(compressedFile.getFileSize() < mx::writeToXmlString(doc).size());
+
+        // Corrupt files are rejected.
+        {
+            std::ofstream file(compressedFile.asString(), std::ios::trunc);
+            file << "invalid";
+        }
+        REQUIRE_THROWS(mx::readFromXmlFile(mx::createDocument(), compressedFile));
+
+        std::remove(compressedFile.asString().c_str());
+    }
+}
+
+TEST_CASE("XInclude cache", "[xmlio]")
+{
+    mx::FilePath testPath = mx::FilePath::getCurrentPath();
+    mx::FilePath docFile = testPath / "xinclude_cache_doc.mtlx";
+    mx::FilePath libFile = testPath / "xinclude_cache_lib.mtlx";
+    mx::FilePath nestedFile = testPath / "xinclude_cache_nested.mtlx";
+    auto writeFile = [](const mx::FilePath& filename, const std::string& content)
+    {
+        std::ofstream file(filename.asString(), std::ios::trunc);
+        file << "<?xml version=\"1.0\"?>\n<materialx version=\"1.39\" xmlns:xi=\"http://www.w3.org/2001/XInclude\">\n" << content << "</materialx>\n";
+    };
+    writeFile(nestedFile, "  <typedef name=\"customtype\" />\n");
+    writeFile(libFile, "  <xi:include href=\"xinclude_cache_nested.mtlx\" />\n"
+                       "  <nodedef name=\"ND_custom\" node=\"custom\">\n"
+                       "    <output name=\"out\" type=\"float\" />\n"
+                       "  </nodedef>\n");
+    writeFile(docFile, "  <xi:include href=\"xinclude_cache_lib.mtlx\" />\n"
+                       "  <custom name=\"custom1\" type=\"float\" />\n");
+
+    mx::XmlReadOptions readOptions;
+    readOptions.xincludeCache = mx::XIncludeCache::create();
+    mx::XIncludeCachePtr cache = readOptions.xincludeCache;
+
+    // Read the same document repeatedly, parsing its includes only once.
+    mx::DocumentPtr uncachedDoc = mx::createDocument();
+    mx::readFromXmlFile(uncachedDoc, docFile);
+    for (int i = 0; i < 3; i++)
+    {
+        mx::DocumentPtr doc = mx::createDocument();
+        mx::readFromXmlFile(doc, docFile, mx::FileSearchPath(), &readOptions);
+        REQUIRE(*doc == *uncachedDoc);
+        REQUIRE(doc->getNodeDef("ND_custom"));
+        REQUIRE(doc->getTypeDef("customtype"));
+    }
+    REQUIRE(cache->getMissCount() == 2);
+    REQUIRE(cache->getHitCount() == 2);
+    REQUIRE(cache->getEntryCount() == 2);
+    REQUIRE(cache->getSize() > 0);
+
+    // Modifying a nested include invalidates the entries that depend on it.
+    writeFile(nestedFile, "  <typedef name=\"customtype\" />\n  <typedef name=\"customtype2\" />\n");
+    mx::DocumentPtr doc = mx::createDocument();
+    mx::readFromXmlFile(doc, docFile, mx::FileSearchPath(), &readOptions);
+    REQUIRE(doc->getTypeDef("customtype2"));
+    REQUIRE(cache->getMissCount() == 4);
+
+    // Entries are keyed by the read options in effect.
+    mx::XmlReadOptions commentOptions = readOptions;
+    commentOptions.readComments = true;
+    mx::readFromXmlFile(mx::createDocument(), docFile, mx::FileSearchPath(), &commentOptions);
+    REQUIRE(cache->getMissCount() == 6);
+    REQUIRE(cache->getEntryCount() == 4);
+
+    // Entries are evicted to remain within the maximum size.
+    cache->setMaxSize(libFile.getFileSize() + nestedFile.getFileSize());
+    REQUIRE(cache->getEntryCount() == 1);
+    REQUIRE(cache->getEvictionCount() == 3);
+    REQUIRE(cache->getSize() <= cache->getMaxSize());
+    cache->clear();
+    REQUIRE(cache->getEntryCount() == 0);
+    REQUIRE(cache->getHitCount() == 0);
+
+    std::remove(docFile.asString().c_str());
+    std::remove(libFile.asString().c_str());
+    std::remove(nestedFile.asString().c_str());
+}
+
+TEST_CASE("Binary serialization", "[xmlio]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::FilePath examplesPath = searchPath.find("resources/Materials/Examples/StandardSurface");
+    searchPath.append(examplesPath);
+
+    for (const mx::FilePath& filename : examplesPath.getFilesInDirectory(mx::MTLX_EXTENSION))
+    {
+        mx::DocumentPtr doc = mx::createDocument();
+        mx::readFromXmlFile(doc, filename, searchPath);
+
+        // Round-trip the complete document.
+        std::string data = mx::writeToBinaryString(doc);
+        mx::DocumentPtr doc2 = mx::createDocument();
+        REQUIRE(mx::readFromBinaryString(doc2, data) == doc2);
+        REQUIRE(*doc2 == *doc);
+
+        // Round-trip each top-level element into a new document.
+        for (mx::ElementPtr child : doc->getChildren())
+        {
+            mx::DocumentPtr doc3 = mx::createDocument();
+            mx::ElementPtr child3 = mx::readFromBinaryString(doc3, mx::writeToBinaryString(child));
+            REQUIRE(child3->getParent() == doc3);
+            REQUIRE(*child3 == *child);
+        }
+
+        // A document can only be read into an empty document.
+        REQUIRE_THROWS_AS(mx::readFromBinaryString(doc2, data), mx::Exception);
+    }
+
+    // Invalid and truncated data is rejected.
+    mx::DocumentPtr doc = mx::createDocument();
+    doc->addNodeGraph("graph")->addNode("constant", "node1", "color3");
+    std::string data = mx::writeToBinaryString(doc->getNodeGraph("graph"));
+    REQUIRE_THROWS_AS(mx::readFromBinaryString(mx::createDocument(), "invalid"), mx::Exception);
+    REQUIRE_THROWS_AS(mx::readFromBinaryString(mx::createDocument(), data.substr(0, data.size() / 2)), mx::Exception);
+}
+
+TEST_CASE("Parallel library loading", "[xmlio]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+
+    // Load the data libraries one file at a time.
+    mx::DocumentPtr sequentialDoc = mx::createDocument();
+    mx::FilePathVec libraryFiles = mx::getLibraryFiles({ "libraries" }, searchPath);
+    REQUIRE(libraryFiles.size() > 1);
+    for (const mx::FilePath& file : libraryFiles)
+    {
+        mx::loadLibrary(file, sequentialDoc, searchPath);
+    }
+
+    // Libraries parsed in parallel are merged in the same order.
+    for (int i = 0; i < 2; i++)
+    {
+        mx::DocumentPtr doc = mx::createDocument();
+        mx::StringSet loadedLibraries = mx::loadLibraries({ "libraries" }, searchPath, doc);
+        REQUIRE(loadedLibraries.size() == libraryFiles.size());
+        REQUIRE(*doc == *sequentialDoc);
+    }
+}
+
+TEST_CASE("Shared data libraries", "[xmlio]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::clearSharedDataLibraries();
+
+    // Repeated requests share a single library document.
+    mx::ConstDocumentPtr libraries = mx::getSharedDataLibrary({ "libraries" }, searchPath);
+    REQUIRE(libraries);
+    REQUIRE(!libraries->getNodeDefs().empty());
+    REQUIRE(mx::getSharedDataLibrary({ "libraries" }, searchPath) == libraries);
+
+    // Distinct library folders map to distinct documents.
+    mx::ConstDocumentPtr stdlib = mx::getSharedDataLibrary({ "libraries/stdlib" }, searchPath);
+    REQUIRE(stdlib != libraries);
+    REQUIRE(stdlib->getNodeDefs().size() < libraries->getNodeDefs().size());
+
+    // User documents reference the shared libraries without copying them.
+    mx::DocumentPtr doc1 = mx::createDocument();
+    mx::DocumentPtr doc2 = mx::createDocument();
+    doc1->setDataLibrary(libraries);
+    doc2->setDataLibrary(libraries);
+    REQUIRE(doc1->getNodeDef("ND_image_color3"));
+    REQUIRE(doc2->getNodeDef("ND_image_color3"));
+    REQUIRE(doc1->getChildren().empty());
+
+    // Clearing the registry leaves referencing documents intact.
+    mx::clearSharedDataLibraries();
+    REQUIRE(doc1->getNodeDef("ND_image_color3"));
+    REQUIRE(mx::getSharedDataLibrary({ "libraries" }, searchPath) != libraries);
+    mx::clearSharedDataLibraries();
+}
+
 TEST_CASE("Comments and newlines", "[xmlio]")
 {
     mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
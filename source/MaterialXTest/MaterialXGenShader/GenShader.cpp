@@ -14,11 +14,17 @@
 #include <MaterialXGenHw/HwConstants.h>
 
 #include <MaterialXGenShader/GenContext.h>
+#include <MaterialXGenShader/ShaderBatch.h>
+#include <MaterialXGenShader/ShaderCache.h>
 #include <MaterialXGenShader/ShaderTranslator.h>
+#include <MaterialXGenShader/SourceFileCache.h>
 #include <MaterialXGenShader/Util.h>
 
 #ifdef MATERIALX_BUILD_GEN_GLSL
+#include <MaterialXGenGlsl/GlslResourceBindingContext.h>
 #include <MaterialXGenGlsl/GlslShaderGenerator.h>
+#include <MaterialXGenGlsl/VkResourceBindingContext.h>
+#include <MaterialXGenGlsl/VkShaderGenerator.h>
 #endif
 #ifdef MATERIALX_BUILD_GEN_OSL
 #include <MaterialXGenOsl/OslShaderGenerator.h>
@@ -34,6 +40,9 @@
 #endif
 
 #include <cstdlib>
+#include <filesystem>
+#include <fstream>
+#include <functional>
 #include <iostream>
 #include <vector>
 #include <set>
@@ -286,6 +295,514 @@ TEST_CASE("GenShader: Deterministic Generation", "[genshader]")
 #endif
 }
 
+TEST_CASE("GenShader: Shader Cache", "[genshader]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::DocumentPtr libraries = mx::createDocument();
+    mx::loadLibraries({ "libraries" }, searchPath, libraries);
+
+    mx::DocumentPtr doc = mx::createDocument();
+    doc->setDataLibrary(libraries);
+    mx::NodePtr constant = doc->addNode("constant", "constant1", "color3");
+    mx::InputPtr value = constant->setInputValue("value", mx::Color3(0.5f));
+    mx::NodePtr multiply = doc->addNode("multiply", "multiply1", "color3");
+    multiply->setConnectedNode("in1", constant);
+    mx::OutputPtr output = doc->addOutput("out", "color3");
+    output->setConnectedNode(multiply);
+
+    const std::filesystem::path tempDirectory = std::filesystem::temp_directory_path() / "materialx_shadercache_test";
+    std::filesystem::remove_all(tempDirectory);
+    mx::FilePath cacheDirectory = tempDirectory.string();
+    mx::ShaderCachePtr cache = mx::ShaderCache::create(cacheDirectory);
+
+#ifdef MATERIALX_BUILD_GEN_GLSL
+    mx::GenContext context(mx::GlslShaderGenerator::create());
+    context.registerSourceCodeSearchPath(searchPath);
+
+    // Keys are stable for unchanged content, and sensitive to edits.
+    const std::string key = mx::ShaderCache::computeKey("test", output, context);
+    REQUIRE(key == mx::ShaderCache::computeKey("test", output, context));
+    REQUIRE(key != mx::ShaderCache::computeKey("test2", output, context));
+    value->setValue(mx::Color3(0.25f));
+    REQUIRE(key != mx::ShaderCache::computeKey("test", output, context));
+    context.getOptions().hwTransparency = true;
+    REQUIRE(key != mx::ShaderCache::computeKey("test", output, context));
+    context.getOptions().hwTransparency = false;
+    value->setValue(mx::Color3(0.5f));
+    REQUIRE(key == mx::ShaderCache::computeKey("test", output, context));
+
+    // Keys are sensitive to the target and version of the generator and to
+    // the type and state of context user data.
+    mx::GenContext vkContext(mx::VkShaderGenerator::create());
+    vkContext.registerSourceCodeSearchPath(searchPath);
+    REQUIRE(key != mx::ShaderCache::computeKey("test", output, vkContext));
+    context.pushUserData(mx::HW::USER_DATA_BINDING_CONTEXT, mx::GlslResourceBindingContext::create(0, 0));
+    const std::string bindingKey = mx::ShaderCache::computeKey("test", output, context);
+    REQUIRE(key != bindingKey);
+    context.pushUserData(mx::HW::USER_DATA_BINDING_CONTEXT, mx::GlslResourceBindingContext::create(1, 0));
+    REQUIRE(bindingKey != mx::ShaderCache::computeKey("test", output, context));
+    context.pushUserData(mx::HW::USER_DATA_BINDING_CONTEXT, mx::VkResourceBindingContext::create(0));
+    REQUIRE(bindingKey != mx::ShaderCache::computeKey("test", output, context));
+    context.clearUserData();
+    REQUIRE(key == mx::ShaderCache::computeKey("test", output, context));
+
+    // Keys are sensitive to the content of implementation source files.
+    {
+        mx::DocumentPtr sourceDoc = mx::createDocument();
+        sourceDoc->setDataLibrary(libraries);
+        mx::NodeDefPtr nodeDef = sourceDoc->addNodeDef("ND_cachetest_color3", "color3", "cachetest");
+        nodeDef->setInputValue("in", mx::Color3(0.0f));
+        mx::ImplementationPtr impl = sourceDoc->addImplementation("IM_cachetest_color3_genglsl");
+        impl->setNodeDef(nodeDef);
+        impl->setTarget("genglsl");
+        impl->setFunction("mx_cachetest");
+        const mx::FilePath sourceFile = cacheDirectory / "mx_cachetest.glsl";
+        impl->setFile(sourceFile.asString());
+        mx::NodePtr node = sourceDoc->addNode("cachetest", "cachetest1", "color3");
+        mx::OutputPtr sourceOutput = sourceDoc->addOutput("out", "color3");
+        sourceOutput->setConnectedNode(node);
+
+        std::ofstream(sourceFile.asString()) << "void mx_cachetest(vec3 in, out vec3 result) { result = in; }\n";
+        const std::string sourceKey = mx::ShaderCache::computeKey("test", sourceOutput, context);
+        REQUIRE(sourceKey == mx::ShaderCache::computeKey("test", sourceOutput, context));
+        std::ofstream(sourceFile.asString()) << "void mx_cachetest(vec3 in, out vec3 result) { result = in * 2.0; }\n";
+        REQUIRE(sourceKey != mx::ShaderCache::computeKey("test", sourceOutput, context));
+    }
+
+    // The first request generates, while the second is served from the cache.
+    mx::StringMap generated = cache->generate("test", output, context);
+    REQUIRE(generated.count(mx::Stage::PIXEL));
+    REQUIRE(cache->getMissCount() == 1);
+    mx::StringMap cached = cache->generate("test", output, context);
+    REQUIRE(cache->getHitCount() == 1);
+    REQUIRE(cached == generated);
+
+    // Entries persist across cache instances sharing a directory.
+    mx::ShaderCachePtr sharedCache = mx::ShaderCache::create(cacheDirectory);
+    REQUIRE(sharedCache->getEntryCount() == 1);
+    mx::StringMap shared;
+    REQUIRE(sharedCache->getSourceCode(key, shared));
+    REQUIRE(shared == generated);
+
+    // Entries are evicted once the cache exceeds its maximum size.
+    sharedCache->setMaxSize(0);
+    REQUIRE(sharedCache->getEntryCount() == 0);
+    REQUIRE(!sharedCache->getSourceCode(key, shared));
+
+    // Malformed entries are treated as misses.
+    cache->setSourceCode(key, generated);
+    std::ofstream((cache->getDirectory() / (key + "." + mx::ShaderCache::ENTRY_EXTENSION)).asString(), std::ios::binary) << "MXSC1\npixel\nbad\ncode";
+    REQUIRE(!cache->getSourceCode(key, shared));
+#endif
+
+    cache->clear();
+    cache = nullptr;
+    std::filesystem::remove_all(tempDirectory);
+}
+
+TEST_CASE("GenShader: Source File Cache", "[genshader]")
+{
+    // Include directives are parsed for the given syntax.
+    mx::SourceFile::LineVec lines = mx::SourceFile::splitLines("#include \"lib/a.glsl\"\nfloat x;\n#include \"\"\n", "#include", "\"");
+    REQUIRE(lines.size() == 3);
+    REQUIRE(lines[0].isInclude);
+    REQUIRE(lines[0].includeFilename == "lib/a.glsl");
+    REQUIRE(!lines[1].isInclude);
+    REQUIRE(lines[1].text == "float x;");
+    REQUIRE(lines[2].isInclude);
+    REQUIRE(lines[2].includeFilename.empty());
+
+    // Edits that preserve the size of a file within the second in which it
+    // was read are detected.
+    mx::FilePath tempFile = (std::filesystem::temp_directory_path() / "materialx_sourcefilecache_test.glsl").string();
+    mx::SourceFileCachePtr fileCache = mx::SourceFileCache::create();
+    std::ofstream(tempFile.asString(), std::ios::binary) << "float a;";
+    mx::ConstSourceFilePtr sourceFile = fileCache->getFile(tempFile);
+    REQUIRE((sourceFile && sourceFile->getContent() == "float a;"));
+    std::ofstream(tempFile.asString(), std::ios::binary) << "float b;";
+    sourceFile = fileCache->getFile(tempFile);
+    REQUIRE((sourceFile && sourceFile->getContent() == "float b;"));
+    REQUIRE(fileCache->getFile(tempFile) == sourceFile);
+    REQUIRE(fileCache->getMissCount() == 2);
+    REQUIRE(fileCache->getHitCount() == 1);
+    std::filesystem::remove(tempFile.asString());
+
+#ifdef MATERIALX_BUILD_GEN_GLSL
+    // Contexts use the process-wide cache by default.
+    mx::GenContext defaultContext(mx::GlslShaderGenerator::create());
+    REQUIRE(defaultContext.getSourceFileCache() == mx::SourceFileCache::getShared());
+
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::DocumentPtr libraries = mx::createDocument();
+    mx::loadLibraries({ "libraries" }, searchPath, libraries);
+
+    mx::DocumentPtr doc = mx::createDocument();
+    mx::readFromXmlFile(doc, searchPath.find("resources/Materials/Examples/StandardSurface/standard_surface_brass_tiled.mtlx"));
+    doc->setDataLibrary(libraries);
+    mx::ElementPtr element = doc->getChild("Tiled_Brass");
+    REQUIRE(element);
+
+    // Generate without a cache, then with a private cache shared by two contexts.
+    mx::GenContext uncachedContext(mx::GlslShaderGenerator::create());
+    uncachedContext.registerSourceCodeSearchPath(searchPath);
+    uncachedContext.setSourceFileCache(nullptr);
+    mx::ShaderPtr uncachedShader = uncachedContext.getShaderGenerator().generate("test", element, uncachedContext);
+    REQUIRE(uncachedShader);
+
+    mx::SourceFileCachePtr cache = mx::SourceFileCache::create();
+    size_t missCount = 0;
+    for (int i = 0; i < 2; i++)
+    {
+        mx::GenContext context(mx::GlslShaderGenerator::create());
+        context.registerSourceCodeSearchPath(searchPath);
+        context.setSourceFileCache(cache);
+        mx::ShaderPtr shader = context.getShaderGenerator().generate("test", element, context);
+        REQUIRE(shader);
+        REQUIRE(shader->getSourceCode(mx::Stage::PIXEL) == uncachedShader->getSourceCode(mx::Stage::PIXEL));
+        REQUIRE(shader->getSourceCode(mx::Stage::VERTEX) == uncachedShader->getSourceCode(mx::Stage::VERTEX));
+        if (i == 0)
+        {
+            missCount = cache->getMissCount();
+            REQUIRE(missCount > 0);
+            REQUIRE(cache->getEntryCount() > 0);
+        }
+    }
+
+    // The second context reads no files.
+    REQUIRE(cache->getMissCount() == missCount);
+    REQUIRE(cache->getHitCount() > 0);
+    REQUIRE(cache->getTotalSize() > 0);
+    cache->clear();
+    REQUIRE(cache->getEntryCount() == 0);
+#endif
+}
+
+TEST_CASE("GenShader: Shader Permutations", "[genshader]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::DocumentPtr libraries = mx::createDocument();
+    mx::loadLibraries({ "libraries" }, searchPath, libraries);
+
+    // Create materials of two distinct topologies, differing in names and
+    // uniform values within each topology.
+    mx::DocumentPtr doc = mx::createDocument();
+    doc->setDataLibrary(libraries);
+    std::vector<mx::Color3> colors = { mx::Color3(0.8f, 0.1f, 0.1f), mx::Color3(0.1f, 0.8f, 0.1f), mx::Color3(0.1f, 0.1f, 0.8f) };
+    for (size_t i = 0; i < colors.size(); i++)
+    {
+        mx::NodePtr shaderNode = doc->addNode("standard_surface", "surface" + std::to_string(i), mx::SURFACE_SHADER_TYPE_STRING);
+        shaderNode->setInputValue("base_color", colors[i]);
+        shaderNode->setInputValue("specular_roughness", 0.1f * (float) (i + 1));
+        if (i == 2)
+        {
+            mx::NodePtr multiply = doc->addNode("multiply", "multiply" + std::to_string(i), "color3");
+            multiply->setInputValue("in1", colors[i]);
+            multiply->setInputValue("in2", mx::Color3(0.5f));
+            shaderNode->setConnectedNode("base_color", multiply);
+        }
+        mx::NodePtr material = doc->addNode("surfacematerial", "material" + std::to_string(i), mx::MATERIAL_TYPE_STRING);
+        material->setConnectedNode("surfaceshader", shaderNode);
+    }
+    std::vector<mx::TypedElementPtr> elements = mx::findRenderableElements(doc);
+    REQUIRE(elements.size() == 3);
+
+#ifdef MATERIALX_BUILD_GEN_GLSL
+    mx::GenContext context(mx::GlslShaderGenerator::create());
+    context.registerSourceCodeSearchPath(searchPath);
+
+    // Elements of equal topology share a single shader.
+    mx::ShaderPermutationVec permutations = mx::generateShaderPermutations(elements, context);
+    REQUIRE(permutations.size() == 2);
+    REQUIRE(permutations[0]->getElementCount() == 2);
+    REQUIRE(permutations[1]->getElementCount() == 1);
+    REQUIRE(permutations[0]->getTopologyKey() != permutations[1]->getTopologyKey());
+
+    // Uniform values of each element are keyed by the uniforms of the shared shader.
+    mx::ShaderPtr shader = permutations[0]->getShader();
+    mx::VariableBlock& uniforms = shader->getStage(mx::Stage::PIXEL).getUniformBlock(mx::HW::PUBLIC_UNIFORMS);
+    for (size_t i = 0; i < 2; i++)
+    {
+        const mx::UniformValueMap& uniformValues = permutations[0]->getUniformValues(i);
+        REQUIRE(!uniformValues.empty());
+        bool foundColor = false;
+        for (const auto& it : uniformValues)
+        {
+            REQUIRE(uniforms.find([&it](mx::ShaderPort* port) { return port->getVariable() == it.first; }));
+            if (it.second->isA<mx::Color3>() && it.second->asA<mx::Color3>() == colors[i])
+            {
+                foundColor = true;
+            }
+        }
+        REQUIRE(foundColor);
+    }
+
+    // Shared shaders match shaders generated for each element.
+    mx::ShaderPtr directShader = context.getShaderGenerator().generate(shader->getName(), elements[0], context);
+    REQUIRE(directShader->getSourceCode(mx::Stage::PIXEL) == shader->getSourceCode(mx::Stage::PIXEL));
+
+    // Generators of the same target but a different version have distinct keys.
+    mx::GenContext vkContext(mx::VkShaderGenerator::create());
+    vkContext.registerSourceCodeSearchPath(searchPath);
+    mx::ShaderPermutationVec vkPermutations = mx::generateShaderPermutations(elements, vkContext);
+    REQUIRE(vkPermutations.size() == 2);
+    REQUIRE(vkPermutations[0]->getTopologyKey() != permutations[0]->getTopologyKey());
+#endif
+}
+
+TEST_CASE("GenShader: Uniform Updates", "[genshader]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::DocumentPtr libraries = mx::createDocument();
+    mx::loadLibraries({ "libraries" }, searchPath, libraries);
+
+    mx::DocumentPtr doc = mx::createDocument();
+    doc->setDataLibrary(libraries);
+    mx::NodePtr shaderNode = doc->addNode("standard_surface", "surface1", mx::SURFACE_SHADER_TYPE_STRING);
+    mx::InputPtr baseColor = shaderNode->setInputValue("base_color", mx::Color3(0.8f, 0.1f, 0.1f));
+    mx::NodePtr material = doc->addNode("surfacematerial", "material1", mx::MATERIAL_TYPE_STRING);
+    material->setConnectedNode("surfaceshader", shaderNode);
+
+#ifdef MATERIALX_BUILD_GEN_GLSL
+    mx::GenContext context(mx::GlslShaderGenerator::create());
+    context.registerSourceCodeSearchPath(searchPath);
+
+    // The first update generates a new shader.
+    mx::ShaderPtr shader = mx::updateShader(nullptr, "test", material, context);
+    REQUIRE(shader);
+    REQUIRE(shader->hasAttribute(mx::TOPOLOGY_KEY_ATTRIBUTE));
+    const std::string sourceCode = shader->getSourceCode(mx::Stage::PIXEL);
+
+    // Uniform edits are applied in place.
+    baseColor->setValue(mx::Color3(0.1f, 0.8f, 0.1f));
+    mx::UniformValueMap uniformValues;
+    REQUIRE(mx::updateShader(shader, "test", material, context, &uniformValues) == shader);
+    REQUIRE(uniformValues.size() == 1);
+    const std::string variable = uniformValues.begin()->first;
+    REQUIRE(uniformValues.begin()->second->asA<mx::Color3>() == mx::Color3(0.1f, 0.8f, 0.1f));
+    REQUIRE(shader->getSourceCode(mx::Stage::PIXEL) == sourceCode);
+    mx::VariableBlock& uniforms = shader->getStage(mx::Stage::PIXEL).getUniformBlock(mx::HW::PUBLIC_UNIFORMS);
+    mx::ShaderPort* port = uniforms.find([&variable](mx::ShaderPort* p) { return p->getVariable() == variable; });
+    REQUIRE(port);
+    REQUIRE(port->getValue()->asA<mx::Color3>() == mx::Color3(0.1f, 0.8f, 0.1f));
+
+    // Unchanged values report no updates.
+    REQUIRE(mx::updateShader(shader, "test", material, context, &uniformValues) == shader);
+    REQUIRE(uniformValues.empty());
+
+    // Topology edits generate a new shader, and report no updated values.
+    mx::NodePtr multiply = doc->addNode("multiply", "multiply1", "color3");
+    shaderNode->setConnectedNode("base_color", multiply);
+    uniformValues[variable] = mx::Value::createValue(mx::Color3(0.0f));
+    mx::ShaderPtr newShader = mx::updateShader(shader, "test", material, context, &uniformValues);
+    REQUIRE(newShader);
+    REQUIRE(newShader != shader);
+    REQUIRE(newShader->getSourceCode(mx::Stage::PIXEL) != sourceCode);
+    REQUIRE(uniformValues.empty());
+#endif
+}
+
+TEST_CASE("GenShader: Parallel Generation", "[genshader]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::DocumentPtr libraries = mx::createDocument();
+    mx::loadLibraries({ "libraries" }, searchPath, libraries);
+
+    mx::DocumentPtr doc = mx::createDocument();
+    doc->setDataLibrary(libraries);
+    for (size_t i = 0; i < 6; i++)
+    {
+        mx::NodePtr shaderNode = doc->addNode("standard_surface", "surface" + std::to_string(i), mx::SURFACE_SHADER_TYPE_STRING);
+        shaderNode->setInputValue("specular_roughness", 0.1f * (float) (i + 1));
+        if (i % 2)
+        {
+            mx::NodePtr image = doc->addNode("image", "image" + std::to_string(i), "color3");
+            shaderNode->setConnectedNode("base_color", image);
+        }
+        mx::NodePtr material = doc->addNode("surfacematerial", "material" + std::to_string(i), mx::MATERIAL_TYPE_STRING);
+        material->setConnectedNode("surfaceshader", shaderNode);
+    }
+    std::vector<mx::TypedElementPtr> elements = mx::findRenderableElements(doc);
+    REQUIRE(elements.size() == 6);
+
+#ifdef MATERIALX_BUILD_GEN_GLSL
+    mx::GenContext context(mx::GlslShaderGenerator::create());
+    context.registerSourceCodeSearchPath(searchPath);
+
+    // Forks share the implementations cached by their parent, while
+    // implementations cached by a fork remain local to it.
+    context.getShaderGenerator().generate("warmup", elements[0], context);
+    mx::StringSet implNames;
+    context.getNodeImplementationNames(implNames);
+    REQUIRE(!implNames.empty());
+    mx::GenContextPtr fork = context.fork();
+    mx::StringSet forkImplNames;
+    fork->getNodeImplementationNames(forkImplNames);
+    REQUIRE(forkImplNames == implNames);
+    const std::string& implName = *implNames.begin();
+    REQUIRE(fork->findNodeImplementation(implName) == context.findNodeImplementation(implName));
+    fork->getShaderGenerator().generate("fork", elements[1], *fork);
+    forkImplNames.clear();
+    fork->getNodeImplementationNames(forkImplNames);
+    REQUIRE(forkImplNames.size() > implNames.size());
+    mx::StringSet parentImplNames;
+    context.getNodeImplementationNames(parentImplNames);
+    REQUIRE(parentImplNames == implNames);
+
+    // Forks hold their own copy of a resource binding context.
+    mx::HwResourceBindingContextPtr bindingCtx = mx::GlslResourceBindingContext::create();
+    context.pushUserData(mx::HW::USER_DATA_BINDING_CONTEXT, bindingCtx);
+    mx::GenContextPtr bindingFork = context.fork();
+    mx::HwResourceBindingContextPtr forkBindingCtx = bindingFork->getUserData<mx::HwResourceBindingContext>(mx::HW::USER_DATA_BINDING_CONTEXT);
+    REQUIRE(forkBindingCtx);
+    REQUIRE(forkBindingCtx != bindingCtx);
+    REQUIRE(forkBindingCtx->getCacheKey() == bindingCtx->getCacheKey());
+    context.popUserData(mx::HW::USER_DATA_BINDING_CONTEXT);
+
+    // Shaders generated in parallel match shaders generated sequentially,
+    // including shaders with resource bindings held by the context or by
+    // the generator.
+    auto createContext = [&searchPath](mx::ShaderGeneratorPtr generator, bool bindings)
+    {
+        mx::GenContextPtr genContext = std::make_shared<mx::GenContext>(generator);
+        genContext->registerSourceCodeSearchPath(searchPath);
+        if (bindings)
+        {
+            genContext->pushUserData(mx::HW::USER_DATA_BINDING_CONTEXT, mx::GlslResourceBindingContext::create());
+        }
+        return genContext;
+    };
+    std::vector<std::pair<std::function<mx::ShaderGeneratorPtr()>, bool>> configurations =
+    {
+        { []() { return mx::GlslShaderGenerator::create(); }, false },
+        { []() { return mx::GlslShaderGenerator::create(); }, true },
+        { []() { return mx::VkShaderGenerator::create(); }, false }
+    };
+    for (const auto& configuration : configurations)
+    {
+        mx::GenContextPtr parallelContext = createContext(configuration.first(), configuration.second);
+        std::vector<mx::ShaderPtr> shaders = parallelContext->getShaderGenerator().generateMany(elements, *parallelContext, 4);
+        REQUIRE(shaders.size() == elements.size());
+        mx::GenContextPtr sequentialContext = createContext(configuration.first(), configuration.second);
+        for (size_t i = 0; i < elements.size(); i++)
+        {
+            REQUIRE(shaders[i]);
+            REQUIRE(shaders[i]->getName() == elements[i]->getName());
+            mx::ShaderPtr shader = sequentialContext->getShaderGenerator().generate(elements[i]->getName(), elements[i], *sequentialContext);
+            REQUIRE(shaders[i]->getSourceCode(mx::Stage::VERTEX) == shader->getSourceCode(mx::Stage::VERTEX));
+            REQUIRE(shaders[i]->getSourceCode(mx::Stage::PIXEL) == shader->getSourceCode(mx::Stage::PIXEL));
+        }
+    }
+#endif
+}
+
+TEST_CASE("GenShader: Constant Folding", "[genshader]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::DocumentPtr libraries = mx::createDocument();
+    mx::loadLibraries({ "libraries" }, searchPath, libraries);
+
+    // Create a chain of math nodes with constant inputs, and a second chain
+    // fed by a geometric node.
+    mx::DocumentPtr doc = mx::createDocument();
+    doc->setDataLibrary(libraries);
+    mx::NodePtr multiply = doc->addNode("multiply", "multiply1", "color3");
+    multiply->setInputValue("in1", mx::Color3(0.2f, 0.4f, 0.6f));
+    multiply->setInputValue("in2", 0.5f);
+    mx::NodePtr add = doc->addNode("add", "add1", "color3");
+    add->setConnectedNode("in1", multiply);
+    add->setInputValue("in2", mx::Color3(0.7f));
+    mx::NodePtr clamp = doc->addNode("clamp", "clamp1", "color3");
+    clamp->setConnectedNode("in", add);
+    mx::NodePtr remap = doc->addNode("remap", "remap1", "color3");
+    remap->setConnectedNode("in", clamp);
+    remap->setInputValue("outlow", 0.5f);
+    mx::NodePtr separate = doc->addNode("separate3", "separate1", "multioutput");
+    separate->setConnectedNode("in", remap);
+    mx::NodePtr texcoord = doc->addNode("texcoord", "texcoord1", "vector2");
+    mx::NodePtr extract = doc->addNode("extract", "extract1", "float");
+    extract->setConnectedNode("in", texcoord);
+    mx::NodePtr mix = doc->addNode("mix", "mix1", "float");
+    mix->setInputValue("fg", 1.0f);
+    mix->setInputValue("bg", 0.0f);
+    mix->setConnectedNode("mix", extract);
+
+    mx::NodePtr shaderNode = doc->addNode("standard_surface", "surface1", mx::SURFACE_SHADER_TYPE_STRING);
+    shaderNode->setConnectedNode("base_color", remap);
+    mx::InputPtr roughness = shaderNode->addInput("specular_roughness", "float");
+    roughness->setConnectedNode(separate);
+    roughness->setOutputString("outg");
+    shaderNode->setConnectedNode("metalness", mix);
+    mx::NodePtr material = doc->addNode("surfacematerial", "material1", mx::MATERIAL_TYPE_STRING);
+    material->setConnectedNode("surfaceshader", shaderNode);
+
+    auto hasNode = [](const mx::ShaderGraph& graph, const std::string& name)
+    {
+        for (const mx::ShaderNode* node : graph.getNodes())
+        {
+            if (node->getName() == name)
+            {
+                return true;
+            }
+        }
+        return false;
+    };
+
+#ifdef MATERIALX_BUILD_GEN_GLSL
+    mx::GenContext context(mx::GlslShaderGenerator::create());
+    context.registerSourceCodeSearchPath(searchPath);
+
+    // Math nodes are preserved by default.
+    mx::ShaderGraphPtr graph = mx::ShaderGraph::create(nullptr, "test", material, context);
+    REQUIRE(hasNode(*graph, "multiply1"));
+    REQUIRE(hasNode(*graph, "remap1"));
+
+    // Chains of constant math nodes are folded into the inputs they feed.
+    context.getOptions().foldConstantNodes = true;
+    graph = mx::ShaderGraph::create(nullptr, "test", material, context);
+    for (const std::string& name : mx::StringVec{ "multiply1", "add1", "clamp1", "remap1", "separate1" })
+    {
+        REQUIRE(!hasNode(*graph, name));
+    }
+    mx::ShaderNode* surface = graph->getNode("surface1");
+    REQUIRE(surface);
+    mx::ShaderInput* baseColor = surface->getInput("base_color");
+    REQUIRE(baseColor->getConnection()->getNode() == graph.get());
+    mx::Color3 expected(0.9f, 0.95f, 1.0f);
+    mx::Color3 folded = baseColor->getValue()->asA<mx::Color3>();
+    for (size_t i = 0; i < 3; i++)
+    {
+        REQUIRE(std::abs(folded[i] - expected[i]) < 1e-5f);
+    }
+    mx::ShaderInput* specularRoughness = surface->getInput("specular_roughness");
+    REQUIRE(std::abs(specularRoughness->getValue()->asA<float>() - expected[1]) < 1e-5f);
+
+    // Nodes with varying inputs are preserved.
+    REQUIRE(hasNode(*graph, "extract1"));
+    REQUIRE(hasNode(*graph, "mix1"));
+
+    // Nodes fed by graph interface inputs are preserved.
+    mx::NodeGraphPtr nodeGraph = doc->addNodeGraph("graph1");
+    mx::InputPtr graphInput = nodeGraph->addInput("scale", "float");
+    graphInput->setValue(2.0f);
+    mx::NodePtr graphMultiply = nodeGraph->addNode("multiply", "multiply2", "float");
+    graphMultiply->setInputValue("in1", 0.25f);
+    graphMultiply->addInput("in2", "float")->setConnectedInterfaceName("scale");
+    mx::NodePtr graphAdd = nodeGraph->addNode("add", "add2", "float");
+    graphAdd->setInputValue("in1", 0.25f);
+    graphAdd->setInputValue("in2", 0.5f);
+    mx::OutputPtr graphOutput = nodeGraph->addOutput("out", "float");
+    graphOutput->setConnectedNode(graphMultiply);
+    mx::OutputPtr foldedOutput = nodeGraph->addOutput("out2", "float");
+    foldedOutput->setConnectedNode(graphAdd);
+    graph = mx::ShaderGraph::create(nullptr, "test", graphOutput, context);
+    REQUIRE(hasNode(*graph, "multiply2"));
+
+    // Folded shaders generate successfully.
+    REQUIRE(context.getShaderGenerator().generate("test", material, context));
+    REQUIRE(context.getShaderGenerator().generate("test", foldedOutput, context));
+#endif
+}
+
 void checkPixelDependencies(mx::DocumentPtr libraries, mx::GenContext& context)
 {
     mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
@@ -17,6 +17,7 @@
 #include <MaterialXRender/OiioImageLoader.h>
 #endif
 
+#include <filesystem>
 #include <fstream>
 #include <iostream>
 #include <limits>
@@ -243,3 +244,131 @@ TEST_CASE("Render: Image Handler Load", "[rendercore]")
     CHECK(imagesLoaded);
     imageHandlerLog.close();
 }
+
+TEST_CASE("Render: Image Handler Async Load", "[rendercore]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::FilePath imagePath = searchPath.find("resources/Images/");
+
+    mx::ImageHandlerPtr imageHandler = mx::ImageHandler::create(mx::StbImageLoader::create());
+    imageHandler->setSearchPath(mx::FileSearchPath(imagePath));
+    imageHandler->setMaxLoadThreads(2);
+    REQUIRE(imageHandler->getMaxLoadThreads() == 2);
+
+    // Acquire a set of images, including a duplicate and a missing file.
+    mx::FilePathVec filePaths = { "cloth.png", "grid.png", "wood_color.jpg", "cloth.png", "missing.png" };
+    mx::Color4 defaultColor(1.0f, 0.0f, 0.0f, 1.0f);
+    mx::ImageFutureVec futures = imageHandler->acquireImagesAsync(filePaths, defaultColor);
+    REQUIRE(futures.size() == filePaths.size());
+    mx::ImageVec images;
+    for (const mx::ImageFuture& future : futures)
+    {
+        images.push_back(future.get());
+        REQUIRE(images.back());
+    }
+    CHECK(images[0] == images[3]);
+    CHECK(images[1]->getWidth() > 1);
+    CHECK(images[4]->getWidth() == 1);
+    CHECK(images[4]->getTexelColor(0, 0) == defaultColor);
+
+    // Completed loads are shared with synchronous acquisition.
+    for (size_t i = 0; i < filePaths.size(); i++)
+    {
+        CHECK(imageHandler->acquireImage(filePaths[i]) == images[i]);
+    }
+
+    // Cached images are returned as completed futures.
+    futures = imageHandler->acquireImagesAsync({ "grid.png" });
+    CHECK(futures[0].wait_for(std::chrono::seconds(0)) == std::future_status::ready);
+    CHECK(futures[0].get() == images[1]);
+}
+
+TEST_CASE("Render: Image Probe", "[rendercore]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::FilePath imagePath = searchPath.find("resources/Images/");
+
+    mx::ImageHandlerPtr imageHandler = mx::ImageHandler::create(mx::StbImageLoader::create());
+    imageHandler->setSearchPath(mx::FileSearchPath(imagePath));
+
+    // Probed properties match those of the decoded images.
+    for (const std::string& filename : mx::StringVec{ "cloth.png", "wood_color.jpg", "cloth.tga" })
+    {
+        mx::ImageInfo info = imageHandler->probeImage(filename);
+        REQUIRE(info.isValid());
+        mx::ImagePtr image = mx::StbImageLoader::create()->loadImage(imagePath / filename);
+        REQUIRE(image);
+        CHECK(info.width == image->getWidth());
+        CHECK(info.height == image->getHeight());
+        CHECK(info.channelCount == image->getChannelCount());
+        CHECK(info.baseType == image->getBaseType());
+    }
+    CHECK(!imageHandler->probeImage("missing.png").isValid());
+
+    // HDR images are saved, probed, and loaded regardless of the case of their extension.
+    mx::ImagePtr hdrImage = mx::createUniformImage(2, 2, 3, mx::Image::BaseType::FLOAT, mx::Color4(1.0f));
+    const std::filesystem::path upperHdrPath = std::filesystem::temp_directory_path() / "materialx_probe_test.HDR";
+    REQUIRE(mx::StbImageLoader::create()->saveImage(upperHdrPath.string(), hdrImage));
+    CHECK(mx::StbImageLoader::create()->probeImage(upperHdrPath.string()).baseType == mx::Image::BaseType::FLOAT);
+    mx::ImagePtr loadedHdrImage = mx::StbImageLoader::create()->loadImage(upperHdrPath.string());
+    REQUIRE(loadedHdrImage);
+    CHECK(loadedHdrImage->getBaseType() == mx::Image::BaseType::FLOAT);
+    CHECK(loadedHdrImage->getTexelColor(0, 0) == mx::Color4(1.0f));
+    std::filesystem::remove(upperHdrPath);
+
+    // Probe the images referenced by a document.
+    mx::DocumentPtr doc = mx::createDocument();
+    mx::NodePtr image1 = doc->addNode("image", "image1", "color3");
+    image1->setInputValue("file", std::string("cloth.png"), mx::FILENAME_TYPE_STRING);
+    mx::NodePtr image2 = doc->addNode("image", "image2", "color3");
+    image2->setInputValue("file", std::string("wood_color.jpg"), mx::FILENAME_TYPE_STRING);
+    mx::ImageInfoVec infoVec = imageHandler->getReferencedImageInfo(doc);
+    REQUIRE(infoVec.size() == 2);
+    mx::UnsignedIntPair maxSize = mx::getMaxDimensions(infoVec);
+    CHECK(maxSize.first == std::max(infoVec[0].width, infoVec[1].width));
+    CHECK(maxSize.second == std::max(infoVec[0].height, infoVec[1].height));
+}
+
+TEST_CASE("Render: Image Cache Budget", "[rendercore]")
+{
+    mx::FileSearchPath searchPath = mx::getDefaultDataSearchPath();
+    mx::FilePath imagePath = searchPath.find("resources/Images/");
+
+    mx::ImageHandlerPtr imageHandler = mx::ImageHandler::create(mx::StbImageLoader::create());
+    imageHandler->setSearchPath(mx::FileSearchPath(imagePath));
+    auto imageSize = [](mx::ImagePtr image)
+    {
+        return (size_t) image->getRowStride() * image->getHeight();
+    };
+
+    // Without a budget, all acquired images remain resident.
+    mx::ImagePtr imageA = imageHandler->acquireImage("cloth.png");
+    mx::ImagePtr imageB = imageHandler->acquireImage("grid.png");
+    mx::ImagePtr imageC = imageHandler->acquireImage("wood_color.jpg");
+    CHECK(imageHandler->getImageCacheSize() == imageSize(imageA) + imageSize(imageB) + imageSize(imageC));
+    CHECK(imageHandler->acquireImage("cloth.png") == imageA);
+    CHECK(imageHandler->getImageCacheHitCount() == 1);
+    CHECK(imageHandler->getImageCacheMissCount() == 3);
+
+    // Least recently used images are evicted, while pinned images and the
+    // most recently used image are retained.
+    imageHandler->pinImage("grid.png");
+    CHECK(imageHandler->isImagePinned("grid.png"));
+    imageHandler->setImageCacheBudget(1);
+    CHECK(imageHandler->getImageCacheEvictionCount() == 1);
+    CHECK(imageHandler->getImageCacheSize() == imageSize(imageA) + imageSize(imageB));
+    CHECK(imageHandler->acquireImage("grid.png") == imageB);
+
+    // Reacquiring an evicted image reloads it.
+    mx::ImagePtr reloadedC = imageHandler->acquireImage("wood_color.jpg");
+    CHECK(reloadedC != imageC);
+    CHECK(imageHandler->getImageCacheMissCount() == 4);
+    CHECK(imageHandler->getImageCacheEvictionCount() == 2);
+    CHECK(imageHandler->getImageCacheSize() == imageSize(imageB) + imageSize(reloadedC));
+
+    // Unpinning allows an image to be evicted.
+    imageHandler->unpinImage("grid.png");
+    CHECK(!imageHandler->isImagePinned("grid.png"));
+    CHECK(imageHandler->getImageCacheEvictionCount() == 3);
+    CHECK(imageHandler->getImageCacheSize() == imageSize(reloadedC));
+}
@@ -854,6 +854,14 @@ void Viewer::createAdvancedSettings(ng::ref<Widget> parent)
         reloadShaders();
     });
 
+    ng::ref<ng::CheckBox> constantFoldingBox = new ng::CheckBox(settingsGroup, "Constant Folding");
+    constantFoldingBox->set_checked(_genContext.getOptions().foldConstantNodes);
+    constantFoldingBox->set_callback([this](bool enable)
+    {
+        _genContext.getOptions().foldConstantNodes = enable;
+        reloadShaders();
+    });
+
     ng::ref<ng::CheckBox> premultipliedBsdfAddBox = new ng::CheckBox(settingsGroup, "Premultiplied BSDF Add");
     premultipliedBsdfAddBox->set_checked(_genContext.getOptions().premultipliedBsdfAdd);
     premultipliedBsdfAddBox->set_callback([this](bool enable)
@@ -1773,8 +1781,8 @@ void Viewer::saveDotFiles()
 
 mx::UnsignedIntPair Viewer::computeBakingResolution(mx::ConstDocumentPtr doc)
 {
-    mx::ImageVec imageVec = _imageHandler->getReferencedImages(doc);
-    mx::UnsignedIntPair bakingRes = mx::getMaxDimensions(imageVec);
+    mx::ImageInfoVec imageInfoVec = _imageHandler->getReferencedImageInfo(doc);
+    mx::UnsignedIntPair bakingRes = mx::getMaxDimensions(imageInfoVec);
     bakingRes.first = std::max(bakingRes.first, (unsigned int) 4);
     bakingRes.second = std::max(bakingRes.second, (unsigned int) 4);
     if (_bakeWidth)
@@ -16,6 +16,12 @@
 #include <pybind11/operators.h>
 #include <pybind11/stl.h>
 
+#include <cmath>
+#include <cstdint>
+#include <cstring>
+#include <string>
+#include <vector>
+
 // Define a macro to import a PyMaterialX module, e.g. `PyMaterialXCore`,
 // either within the `MaterialX` Python package, e.g. in `installed/python/`,
 // or as a standalone module, e.g. in `lib/`
@@ -28,4 +34,114 @@
     {                                                                        \
         pybind11::module::import(#MODULE_NAME);                              \
     }
+
+// Convert the bits of an IEEE 754 half-precision value to single precision.
+inline float halfBitsToFloat(uint16_t bits)
+{
+    const float sign = (bits & 0x8000) ? -1.0f : 1.0f;
+    const int exponent = (bits >> 10) & 0x1f;
+    const int mantissa = bits & 0x3ff;
+    if (exponent == 0x1f)
+    {
+        return mantissa ? std::nanf("") : sign * INFINITY;
+    }
+    if (exponent == 0)
+    {
+        return sign * std::ldexp((float) mantissa, -24);
+    }
+    return sign * std::ldexp((float) (mantissa | 0x400), exponent - 25);
+}
+
+// Copy the elements of a buffer with elements of type S into the given
+// destination in row-major order, converting each element with the given
+// function.
+template <class S, class T, class F> void copyBufferElements(const pybind11::buffer_info& info, T* dest, F convert)
+{
+    const char* ptr = static_cast<const char*>(info.ptr);
+    const pybind11::ssize_t ndim = info.ndim;
+    std::vector<pybind11::ssize_t> index((size_t) ndim, 0);
+    pybind11::ssize_t offset = 0;
+    for (pybind11::ssize_t i = 0; i < info.size; i++)
+    {
+        S value;
+        std::memcpy(&value, ptr + offset, sizeof(value));
+        dest[i] = convert(value);
+
+        // Advance to the next element, carrying into outer dimensions.
+        for (pybind11::ssize_t d = ndim - 1; d >= 0; d--)
+        {
+            offset += info.strides[d];
+            if (++index[d] < info.shape[d])
+            {
+                break;
+            }
+            offset -= info.strides[d] * info.shape[d];
+            index[d] = 0;
+        }
+    }
+}
+
+// Return the elements of a buffer in row-major order as values of type T,
+// converting from the numeric struct format of the buffer.
+template <class T> std::vector<T> readBufferElements(const pybind11::buffer_info& info)
+{
+    std::string format = info.format;
+    if (!format.empty() && (format[0] == '@' || format[0] == '=' || format[0] == '<'))
+    {
+        format = format.substr(1);
+    }
+    std::vector<T> values((size_t) info.size);
+    T* dest = values.data();
+    auto cast = [](auto value)
+    {
+        return static_cast<T>(value);
+    };
+    switch (format.size() == 1 ? format[0] : 0)
+    {
+        case 'e':
+            copyBufferElements<uint16_t>(info, dest, [](uint16_t bits)
+            {
+                return static_cast<T>(halfBitsToFloat(bits));
+            });
+            break;
+        case 'f': copyBufferElements<float>(info, dest, cast); break;
+        case 'd': copyBufferElements<double>(info, dest, cast); break;
+        case 'b': copyBufferElements<signed char>(info, dest, cast); break;
+        case 'B': copyBufferElements<unsigned char>(info, dest, cast); break;
+        case '?': copyBufferElements<bool>(info, dest, cast); break;
+        case 'h': copyBufferElements<short>(info, dest, cast); break;
+        case 'H': copyBufferElements<unsigned short>(info, dest, cast); break;
+        case 'i': copyBufferElements<int>(info, dest, cast); break;
+        case 'I': copyBufferElements<unsigned>(info, dest, cast); break;
+        case 'l': copyBufferElements<long>(info, dest, cast); break;
+        case 'L': copyBufferElements<unsigned long>(info, dest, cast); break;
+        case 'q': copyBufferElements<long long>(info, dest, cast); break;
+        case 'Q': copyBufferElements<unsigned long long>(info, dest, cast); break;
+        default: throw pybind11::value_error("Unsupported array format: " + info.format);
+    }
+    return values;
+}
+
+// Return a writable memoryview of the given shape holding a copy of the given data.
+template <class T> pybind11::object createMemoryView(const T* data, const std::vector<pybind11::ssize_t>& shape)
+{
+    size_t count = 1;
+    for (pybind11::ssize_t dim : shape)
+    {
+        count *= (size_t) dim;
+    }
+    const std::string format = pybind11::format_descriptor<T>::format();
+    pybind11::bytearray bytes(reinterpret_cast<const char*>(data), count * sizeof(T));
+    if (!count)
+    {
+        return pybind11::memoryview(bytes).attr("cast")(format);
+    }
+    pybind11::tuple shapeTuple(shape.size());
+    for (size_t i = 0; i < shape.size(); i++)
+    {
+        shapeTuple[i] = shape[i];
+    }
+    return pybind11::memoryview(bytes).attr("cast")(format, shapeTuple);
+}
+
 #endif
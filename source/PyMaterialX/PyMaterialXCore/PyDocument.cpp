@@ -119,5 +119,14 @@ void bindPyDocument(py::module& mod)
         .def("getColorManagementSystem", &mx::Document::getColorManagementSystem)
         .def("setColorManagementConfig", &mx::Document::setColorManagementConfig)
         .def("hasColorManagementConfig", &mx::Document::hasColorManagementConfig)
-        .def("getColorManagementConfig", &mx::Document::getColorManagementConfig);
+        .def("getColorManagementConfig", &mx::Document::getColorManagementConfig)
+        .def("validateIncremental", [](mx::Document& doc)
+            {
+                std::string message;
+                bool res = doc.validateIncremental(&message);
+                return std::pair<bool, std::string>(res, message);
+            })
+        .def("invalidateCache", &mx::Document::invalidateCache)
+        .def("getCacheHitCount", &mx::Document::getCacheHitCount)
+        .def("getCacheRebuildCount", &mx::Document::getCacheRebuildCount);
 }
@@ -98,10 +98,17 @@ void bindPyElement(py::module& mod)
         .def("getActiveSourceUri", &mx::Element::getActiveSourceUri)
         .def("validate", [](const mx::Element& elem)
             {
+                py::gil_scoped_release release;
                 std::string message;
                 bool res = elem.validate(&message);
                 return std::pair<bool, std::string>(res, message);
             })
+        .def("validateLocal", [](const mx::Element& elem)
+            {
+                std::string message;
+                bool res = elem.validateLocal(&message);
+                return std::pair<bool, std::string>(res, message);
+            })
         .def("copyContentFrom", &mx::Element::copyContentFrom)
         .def("clearContent", &mx::Element::clearContent)
         .def("createValidChildName", &mx::Element::createValidChildName)
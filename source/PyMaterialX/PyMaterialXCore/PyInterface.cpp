@@ -8,6 +8,7 @@
 #include <MaterialXCore/Interface.h>
 
 #include <MaterialXCore/Node.h>
+#include <MaterialXCore/Util.h>
 
 namespace py = pybind11;
 namespace mx = MaterialX;
@@ -15,6 +16,141 @@ namespace mx = MaterialX;
 #define BIND_INTERFACE_TYPE_INSTANCE(NAME, T)                                                                                                           \
 .def("_setInputValue" #NAME, &mx::InterfaceElement::setInputValue<T>, py::arg("name"), py::arg("value"), py::arg("type") = mx::EMPTY_STRING)
 
+namespace
+{
+
+// Return the number of components per element of the given array type,
+// or zero if the type is not a supported numeric array type.
+size_t getArrayComponentCount(const std::string& type)
+{
+    static const std::unordered_map<std::string, size_t> COMPONENT_COUNTS =
+    {
+        { "integerarray", 1 },
+        { "floatarray", 1 },
+        { "vector2array", 2 },
+        { "vector3array", 3 },
+        { "color3array", 3 },
+        { "vector4array", 4 },
+        { "color4array", 4 }
+    };
+    auto it = COMPONENT_COUNTS.find(type);
+    return it != COMPONENT_COUNTS.end() ? it->second : 0;
+}
+
+// Set the value of an input from a buffer of shape (count) or (count, components),
+// formatting all elements in a single pass.
+mx::InputPtr setInputValueArray(mx::InterfaceElement& elem, const std::string& name, py::buffer buffer, std::string type)
+{
+    py::buffer_info info = buffer.request();
+    if (info.ndim != 1 && info.ndim != 2)
+    {
+        throw py::value_error("Expected an array of shape (count) or (count, components)");
+    }
+    size_t components = (info.ndim == 2) ? (size_t) info.shape[1] : 1;
+    if (type.empty())
+    {
+        if (components == 1)
+        {
+            bool isFloat = info.format.find_first_of("efd") != std::string::npos;
+            type = isFloat ? "floatarray" : "integerarray";
+        }
+        else
+        {
+            type = "vector" + std::to_string(components) + "array";
+        }
+    }
+    if (getArrayComponentCount(type) != components)
+    {
+        throw py::value_error("Array shape is incompatible with type '" + type + "'");
+    }
+
+    std::string valueString;
+    if (type == "integerarray")
+    {
+        std::vector<int> values = readBufferElements<int>(info);
+        for (size_t i = 0; i < values.size(); i++)
+        {
+            if (i)
+            {
+                valueString += mx::ARRAY_PREFERRED_SEPARATOR;
+            }
+            valueString += std::to_string(values[i]);
+        }
+    }
+    else
+    {
+        std::vector<float> values = readBufferElements<float>(info);
+        for (size_t i = 0; i < values.size(); i++)
+        {
+            if (i)
+            {
+                valueString += mx::ARRAY_PREFERRED_SEPARATOR;
+            }
+            valueString += mx::toValueString(values[i]);
+        }
+    }
+
+    mx::InputPtr input = elem.getInput(name);
+    if (!input)
+    {
+        input = elem.addInput(name);
+    }
+    input->setValueString(valueString);
+    input->setType(type);
+    return input;
+}
+
+// Return the value of a numeric array input as a memoryview of shape (count)
+// or (count, components), or None if the input is not found.  Integer arrays
+// are returned as int memoryviews, and all other arrays as float memoryviews.
+py::object getInputValueArray(const mx::InterfaceElement& elem, const std::string& name, const std::string& target)
+{
+    mx::InputPtr input = elem.getInput(name);
+    if (!input)
+    {
+        mx::ConstInterfaceElementPtr decl = elem.getDeclaration(target);
+        input = decl ? decl->getInput(name) : nullptr;
+    }
+    if (!input)
+    {
+        return py::none();
+    }
+    const std::string& type = input->getType();
+    size_t components = getArrayComponentCount(type);
+    if (!components)
+    {
+        throw py::type_error("Input '" + name + "' has non-numeric array type '" + type + "'");
+    }
+
+    mx::StringVec tokens = mx::splitString(input->getValueString(), mx::ARRAY_VALID_SEPARATORS);
+    if (tokens.size() % components)
+    {
+        throw mx::ExceptionTypeError("Invalid value string for type '" + type + "': " + input->getValueString());
+    }
+    std::vector<py::ssize_t> shape = { (py::ssize_t) (tokens.size() / components) };
+    if (components > 1)
+    {
+        shape.push_back((py::ssize_t) components);
+    }
+    if (type == "integerarray")
+    {
+        std::vector<int> data(tokens.size());
+        for (size_t i = 0; i < tokens.size(); i++)
+        {
+            data[i] = mx::fromValueString<int>(mx::trimSpaces(tokens[i]));
+        }
+        return createMemoryView(data.data(), shape);
+    }
+    std::vector<float> data(tokens.size());
+    for (size_t i = 0; i < tokens.size(); i++)
+    {
+        data[i] = mx::fromValueString<float>(mx::trimSpaces(tokens[i]));
+    }
+    return createMemoryView(data.data(), shape);
+}
+
+} // anonymous namespace
+
 void bindPyInterface(py::module& mod)
 {
     py::class_<mx::PortElement, mx::PortElementPtr, mx::ValueElement>(mod, "PortElement")
@@ -78,6 +214,10 @@ void bindPyInterface(py::module& mod)
         .def("getActiveValueElement", &mx::InterfaceElement::getActiveValueElement)
         .def("getActiveValueElements", &mx::InterfaceElement::getActiveValueElements)
         .def("_getInputValue", &mx::InterfaceElement::getInputValue)
+        .def("_setInputValueArray", &setInputValueArray,
+            py::arg("name"), py::arg("value"), py::arg("type") = mx::EMPTY_STRING)
+        .def("getInputValueArray", &getInputValueArray,
+            py::arg("name"), py::arg("target") = mx::EMPTY_STRING)
         .def("setTokenValue", &mx::InterfaceElement::setTokenValue)
         .def("getTokenValue", &mx::InterfaceElement::getTokenValue)
         .def("setTarget", &mx::InterfaceElement::setTarget)
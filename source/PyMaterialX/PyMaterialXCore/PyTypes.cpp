@@ -9,6 +9,7 @@
 
 #include <MaterialXCore/Value.h>
 
+#include <algorithm>
 #include <sstream>
 
 namespace py = pybind11;
@@ -16,6 +17,73 @@ namespace mx = MaterialX;
 
 using IndexPair = std::pair<size_t, size_t>;
 
+namespace
+{
+
+// Convert a buffer of shape (count, N) to a vector of N-component values.
+template <class V> std::vector<V> vectorsFromArray(py::buffer buffer)
+{
+    const size_t N = V::numElements();
+    py::buffer_info info = buffer.request();
+    if (info.ndim != 2 || (size_t) info.shape[1] != N)
+    {
+        throw py::value_error("Expected an array of shape (count, " + std::to_string(N) + ")");
+    }
+    std::vector<float> data = readBufferElements<float>(info);
+    std::vector<V> values((size_t) info.shape[0]);
+    for (size_t i = 0; i < values.size(); i++)
+    {
+        std::copy_n(data.data() + i * N, N, values[i].data());
+    }
+    return values;
+}
+
+// Convert a vector of N-component values to a float memoryview of shape (count, N).
+template <class V> py::object vectorsToArray(const std::vector<V>& values)
+{
+    const size_t N = V::numElements();
+    std::vector<float> data;
+    data.reserve(values.size() * N);
+    for (const V& value : values)
+    {
+        data.insert(data.end(), value.data(), value.data() + N);
+    }
+    return createMemoryView(data.data(), { (py::ssize_t) values.size(), (py::ssize_t) N });
+}
+
+// Convert a buffer of shape (count, N, N) to a vector of NxN matrices.
+template <class M> std::vector<M> matricesFromArray(py::buffer buffer)
+{
+    const size_t N = M::numRows();
+    py::buffer_info info = buffer.request();
+    if (info.ndim != 3 || (size_t) info.shape[1] != N || (size_t) info.shape[2] != N)
+    {
+        throw py::value_error("Expected an array of shape (count, " + std::to_string(N) + ", " + std::to_string(N) + ")");
+    }
+    std::vector<float> data = readBufferElements<float>(info);
+    std::vector<M> values((size_t) info.shape[0]);
+    for (size_t i = 0; i < values.size(); i++)
+    {
+        std::copy_n(data.data() + i * N * N, N * N, values[i].data());
+    }
+    return values;
+}
+
+// Convert a vector of NxN matrices to a float memoryview of shape (count, N, N).
+template <class M> py::object matricesToArray(const std::vector<M>& values)
+{
+    const size_t N = M::numRows();
+    std::vector<float> data;
+    data.reserve(values.size() * N * N);
+    for (const M& value : values)
+    {
+        data.insert(data.end(), value.data(), value.data() + N * N);
+    }
+    return createMemoryView(data.data(), { (py::ssize_t) values.size(), (py::ssize_t) N, (py::ssize_t) N });
+}
+
+} // anonymous namespace
+
 #define BIND_VECTOR_SUBCLASS(V, N)                                                                             \
 .def(py::init<>())                                                                                             \
 .def(py::init<float>())                                                                                        \
@@ -47,6 +115,13 @@ using IndexPair = std::pair<size_t, size_t>;
 .def("__str__", [](const V& v)                                                                                 \
     { return mx::toValueString(v); })                                                                          \
 .def("copy", [](const V& v) { return V(v); })                                                                  \
+.def_buffer([](V& v) -> py::buffer_info                                                                        \
+    { return py::buffer_info(v.data(), sizeof(float), py::format_descriptor<float>::format(),                     \
+                             1, { (py::ssize_t) N }, { (py::ssize_t) sizeof(float) }); })                      \
+.def_static("listFromArray", &vectorsFromArray<V>)                                                             \
+.def_static("listToArray", &vectorsToArray<V>)                                                                 \
+.def(py::pickle([](const V& v) { return std::vector<float>(v.data(), v.data() + N); },                       \
+                [](const std::vector<float>& data) { return V(data); }))                                       \
 .def_static("__len__", &V::numElements)
 
 #define BIND_MATRIX_SUBCLASS(M, N)                                                                             \
@@ -75,6 +150,16 @@ using IndexPair = std::pair<size_t, size_t>;
 .def("__str__", [](const M& m)                                                                                 \
     { return mx::toValueString(m); })                                                                          \
 .def("copy", [](const M& m) { return M(m); })                                                                  \
+.def_buffer([](M& m) -> py::buffer_info                                                                        \
+    { return py::buffer_info(m.data(), sizeof(float), py::format_descriptor<float>::format(), 2,               \
+                             { (py::ssize_t) N, (py::ssize_t) N },                                             \
+                             { (py::ssize_t) (sizeof(float) * N), (py::ssize_t) sizeof(float) }); })           \
+.def_static("listFromArray", &matricesFromArray<M>)                                                            \
+.def_static("listToArray", &matricesToArray<M>)                                                                \
+.def(py::pickle([](const M& m) { return std::vector<float>(m.data(), m.data() + N * N); },                  \
+                [](const std::vector<float>& data)                                                             \
+    { if (data.size() != N * N) throw std::runtime_error("Invalid matrix state");                              \
+      return M(data.data(), data.data() + N * N); }))                                                          \
 .def("isEquivalent", &M::isEquivalent)                                                                         \
 .def("getTranspose", &M::getTranspose)                                                                         \
 .def("getDeterminant", &M::getDeterminant)                                                                     \
@@ -91,36 +176,36 @@ void bindPyTypes(py::module& mod)
     py::class_<mx::VectorBase>(mod, "VectorBase");
     py::class_<mx::MatrixBase>(mod, "MatrixBase");
 
-    py::class_<mx::Vector2, mx::VectorBase>(mod, "Vector2")
+    py::class_<mx::Vector2, mx::VectorBase>(mod, "Vector2", py::buffer_protocol())
         BIND_VECTOR_SUBCLASS(mx::Vector2, 2)
         .def(py::init<float, float>())
         .def("cross", &mx::Vector2::cross)
         .def("asTuple", [](const mx::Vector2& v) { return std::make_tuple(v[0], v[1]); });
 
-    py::class_<mx::Vector3, mx::VectorBase>(mod, "Vector3")
+    py::class_<mx::Vector3, mx::VectorBase>(mod, "Vector3", py::buffer_protocol())
         BIND_VECTOR_SUBCLASS(mx::Vector3, 3)
         .def(py::init<float, float, float>())
         .def("cross", &mx::Vector3::cross)
         .def("asTuple", [](const mx::Vector3& v) { return std::make_tuple(v[0], v[1], v[2]); });
 
-    py::class_<mx::Vector4, mx::VectorBase>(mod, "Vector4")
+    py::class_<mx::Vector4, mx::VectorBase>(mod, "Vector4", py::buffer_protocol())
         BIND_VECTOR_SUBCLASS(mx::Vector4, 4)
         .def(py::init<float, float, float, float>())
         .def("asTuple", [](const mx::Vector4& v) { return std::make_tuple(v[0], v[1], v[2], v[3]); });
 
-    py::class_<mx::Color3, mx::VectorBase>(mod, "Color3")
+    py::class_<mx::Color3, mx::VectorBase>(mod, "Color3", py::buffer_protocol())
         BIND_VECTOR_SUBCLASS(mx::Color3, 3)
         .def(py::init<float, float, float>())
         .def("linearToSrgb", &mx::Color3::linearToSrgb)
         .def("srgbToLinear", &mx::Color3::srgbToLinear)
         .def("asTuple", [](const mx::Color3& v) { return std::make_tuple(v[0], v[1], v[2]); });
 
-    py::class_<mx::Color4, mx::VectorBase>(mod, "Color4")
+    py::class_<mx::Color4, mx::VectorBase>(mod, "Color4", py::buffer_protocol())
         BIND_VECTOR_SUBCLASS(mx::Color4, 4)
         .def(py::init<float, float, float, float>())
         .def("asTuple", [](const mx::Color4& v) { return std::make_tuple(v[0], v[1], v[2], v[3]); });
 
-    py::class_<mx::Matrix33, mx::MatrixBase>(mod, "Matrix33")
+    py::class_<mx::Matrix33, mx::MatrixBase>(mod, "Matrix33", py::buffer_protocol())
         BIND_MATRIX_SUBCLASS(mx::Matrix33, 3)
         .def(py::init<float, float, float,
                       float, float, float,
@@ -132,7 +217,7 @@ void bindPyTypes(py::module& mod)
         .def_static("createRotation", &mx::Matrix33::createRotation)
         .def_readonly_static("IDENTITY", &mx::Matrix33::IDENTITY);
 
-    py::class_<mx::Matrix44, mx::MatrixBase>(mod, "Matrix44")
+    py::class_<mx::Matrix44, mx::MatrixBase>(mod, "Matrix44", py::buffer_protocol())
         BIND_MATRIX_SUBCLASS(mx::Matrix44, 4)
         .def(py::init<float, float, float, float,
                       float, float, float, float,
@@ -13,6 +13,9 @@ py::class_<mx::TypedValue<T>, std::shared_ptr< mx::TypedValue<T> >, mx::Value>(m
     .def("getData", &mx::TypedValue<T>::getData)                                                            \
     .def("getValueString", &mx::TypedValue<T>::getValueString)                                              \
     .def_static("createValue", &mx::Value::createValue<T>)                                                  \
+    .def(py::pickle([](const mx::TypedValue<T>& v) { return py::cast(v.getData()); },                      \
+                    [](py::object state)                                                                    \
+        { return std::static_pointer_cast<mx::TypedValue<T>>(mx::Value::createValue<T>(state.cast<T>())); })) \
     .def_readonly_static("TYPE", &mx::TypedValue<T>::TYPE);
 
 namespace py = pybind11;
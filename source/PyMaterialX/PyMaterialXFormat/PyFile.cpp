@@ -47,6 +47,8 @@ void bindPyFile(py::module& mod)
         .def("getSubDirectories", &mx::FilePath::getSubDirectories)
         .def("createDirectory", &mx::FilePath::createDirectory,
              py::arg("recursive") = false)
+        .def("getFileSize", &mx::FilePath::getFileSize)
+        .def("getModificationTime", &mx::FilePath::getModificationTime)
         .def_static("getCurrentPath", &mx::FilePath::getCurrentPath)
         .def_static("getModulePath", &mx::FilePath::getModulePath);
 
@@ -18,11 +18,50 @@ void bindPyUtil(py::module& mod)
     mod.def("getSubdirectories", &mx::getSubdirectories);
     mod.def("loadDocuments", &mx::loadDocuments,
         py::arg("rootPath"), py::arg("searchPath"), py::arg("skipFiles"), py::arg("includeFiles"), py::arg("documents"), py::arg("documentsPaths"),
-        py::arg("readOptions") = (mx::XmlReadOptions*) nullptr, py::arg("errors") = (mx::StringVec*) nullptr);
+        py::arg("readOptions") = (mx::XmlReadOptions*) nullptr, py::arg("errors") = (mx::StringVec*) nullptr,
+        py::call_guard<py::gil_scoped_release>());
     mod.def("loadLibrary", &mx::loadLibrary,
-        py::arg("file"), py::arg("doc"), py::arg("searchPath") = mx::FileSearchPath(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr);
+        py::arg("file"), py::arg("doc"), py::arg("searchPath") = mx::FileSearchPath(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr,
+        py::call_guard<py::gil_scoped_release>());
     mod.def("loadLibraries", &mx::loadLibraries,
-        py::arg("libraryFolders"), py::arg("searchPath"), py::arg("doc"), py::arg("excludeFiles") = mx::StringSet(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr);
+        py::arg("libraryFolders"), py::arg("searchPath"), py::arg("doc"), py::arg("excludeFiles") = mx::StringSet(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr,
+        py::call_guard<py::gil_scoped_release>());
+    mod.def("getLibraryFiles", &mx::getLibraryFiles,
+        py::arg("libraryFolders"), py::arg("searchPath"), py::arg("excludeFiles") = mx::StringSet());
+    mod.def("writeLibrariesSnapshot", &mx::writeLibrariesSnapshot,
+        py::arg("libraryFolders"), py::arg("searchPath"), py::arg("snapshotFile"), py::arg("excludeFiles") = mx::StringSet(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr,
+        py::call_guard<py::gil_scoped_release>());
+    mod.def("loadLibrariesSnapshot", &mx::loadLibrariesSnapshot,
+        py::arg("libraryFolders"), py::arg("searchPath"), py::arg("doc"), py::arg("snapshotFile"), py::arg("excludeFiles") = mx::StringSet(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr,
+        py::call_guard<py::gil_scoped_release>());
+    mod.def("getSharedDataLibrary", &mx::getSharedDataLibrary,
+        py::arg("libraryFolders"), py::arg("searchPath"), py::arg("excludeFiles") = mx::StringSet(),
+        py::call_guard<py::gil_scoped_release>());
+    mod.def("clearSharedDataLibraries", &mx::clearSharedDataLibraries);
+    mod.def("writeToBinaryString", [](mx::ConstElementPtr elem)
+        {
+            std::string data;
+            {
+                py::gil_scoped_release release;
+                data = mx::writeToBinaryString(elem);
+            }
+            return py::bytes(data);
+        },
+        py::arg("elem"));
+    // A serialized document is read into the given parent and returned as the
+    // parent itself, in which case None is returned to avoid a self-referencing
+    // keep_alive; the public wrapper is defined in main.py.
+    mod.def("_readFromBinaryString", [](mx::ElementPtr parent, const py::bytes& data)
+        {
+            std::string content = data;
+            mx::ElementPtr elem;
+            {
+                py::gil_scoped_release release;
+                elem = mx::readFromBinaryString(parent, content);
+            }
+            return elem != parent ? elem : nullptr;
+        },
+        py::arg("parent"), py::arg("data"), py::keep_alive<0, 1>());
     mod.def("flattenFilenames", &mx::flattenFilenames,
         py::arg("doc"), py::arg("searchPath") = mx::FileSearchPath(), py::arg("customResolver") = (mx::StringResolverPtr) nullptr);
     mod.def("getSourceSearchPath", &mx::getSourceSearchPath);
@@ -8,9 +8,81 @@
 #include <MaterialXFormat/XmlIo.h>
 #include <MaterialXCore/Document.h>
 
+#include <exception>
+#include <ostream>
+#include <streambuf>
+
 namespace py = pybind11;
 namespace mx = MaterialX;
 
+namespace
+{
+
+// Stream buffer forwarding output in chunks to the write method of a Python
+// binary file object, acquiring the GIL for each chunk.
+class PyFileStreamBuf : public std::streambuf
+{
+  public:
+    explicit PyFileStreamBuf(py::object file) :
+        _write(file.attr("write")),
+        _buffer(1 << 16)
+    {
+        setp(_buffer.data(), _buffer.data() + _buffer.size());
+    }
+
+    std::exception_ptr getError() const
+    {
+        return _error;
+    }
+
+  protected:
+    int_type overflow(int_type c) override
+    {
+        if (!flushBuffer())
+        {
+            return traits_type::eof();
+        }
+        if (!traits_type::eq_int_type(c, traits_type::eof()))
+        {
+            *pptr() = traits_type::to_char_type(c);
+            pbump(1);
+        }
+        return traits_type::not_eof(c);
+    }
+
+    int sync() override
+    {
+        return flushBuffer() ? 0 : -1;
+    }
+
+  private:
+    bool flushBuffer()
+    {
+        size_t size = (size_t) (pptr() - pbase());
+        if (size && !_error)
+        {
+            py::gil_scoped_acquire acquire;
+            try
+            {
+                _write(py::bytes(pbase(), size));
+            }
+            catch (...)
+            {
+                _error = std::current_exception();
+            }
+        }
+        setp(_buffer.data(), _buffer.data() + _buffer.size());
+        return !_error;
+    }
+
+  private:
+    py::object _write;
+    std::vector<char> _buffer;
+    std::exception_ptr _error;
+};
+
+} // anonymous namespace
+
 void bindPyXmlIo(py::module& mod)
 {
     py::class_<mx::XmlReadOptions>(mod, "XmlReadOptions")
@@ -19,7 +91,25 @@ void bindPyXmlIo(py::module& mod)
         .def_readwrite("readComments", &mx::XmlReadOptions::readComments)
         .def_readwrite("readNewlines", &mx::XmlReadOptions::readNewlines)
         .def_readwrite("upgradeVersion", &mx::XmlReadOptions::upgradeVersion)        
-        .def_readwrite("parentXIncludes", &mx::XmlReadOptions::parentXIncludes);
+        .def_readwrite("parentXIncludes", &mx::XmlReadOptions::parentXIncludes)
+        .def_readwrite("includeCategories", &mx::XmlReadOptions::includeCategories)
+        .def_readwrite("excludeCategories", &mx::XmlReadOptions::excludeCategories)
+        .def_readwrite("maxDepth", &mx::XmlReadOptions::maxDepth)
+        .def_readwrite("skipValues", &mx::XmlReadOptions::skipValues)
+        .def_readwrite("xincludeCache", &mx::XmlReadOptions::xincludeCache);
+
+    py::class_<mx::XIncludeCache, mx::XIncludeCachePtr>(mod, "XIncludeCache")
+        .def(py::init<size_t>(), py::arg("maxSize") = mx::XIncludeCache::DEFAULT_MAX_SIZE)
+        .def_static("create", &mx::XIncludeCache::create, py::arg("maxSize") = mx::XIncludeCache::DEFAULT_MAX_SIZE)
+        .def("setMaxSize", &mx::XIncludeCache::setMaxSize)
+        .def("getMaxSize", &mx::XIncludeCache::getMaxSize)
+        .def("getSize", &mx::XIncludeCache::getSize)
+        .def("getEntryCount", &mx::XIncludeCache::getEntryCount)
+        .def("getHitCount", &mx::XIncludeCache::getHitCount)
+        .def("getMissCount", &mx::XIncludeCache::getMissCount)
+        .def("getEvictionCount", &mx::XIncludeCache::getEvictionCount)
+        .def("clear", &mx::XIncludeCache::clear)
+        .def_readonly_static("DEFAULT_MAX_SIZE", &mx::XIncludeCache::DEFAULT_MAX_SIZE);
 
     py::class_<mx::XmlWriteOptions>(mod, "XmlWriteOptions")
         .def(py::init())
@@ -27,13 +117,33 @@ void bindPyXmlIo(py::module& mod)
         .def_readwrite("elementPredicate", &mx::XmlWriteOptions::elementPredicate);
 
     mod.def("readFromXmlFileBase", &mx::readFromXmlFile,
-        py::arg("doc"), py::arg("filename"), py::arg("searchPath") = mx::FileSearchPath(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr);
+        py::arg("doc"), py::arg("filename"), py::arg("searchPath") = mx::FileSearchPath(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr,
+        py::call_guard<py::gil_scoped_release>());
     mod.def("readFromXmlString", &mx::readFromXmlString,
-        py::arg("doc"), py::arg("str"), py::arg("searchPath") = mx::FileSearchPath(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr);
+        py::arg("doc"), py::arg("str"), py::arg("searchPath") = mx::FileSearchPath(), py::arg("readOptions") = (mx::XmlReadOptions*) nullptr,
+        py::call_guard<py::gil_scoped_release>());
     mod.def("writeToXmlFile", mx::writeToXmlFile,
-        py::arg("doc"), py::arg("filename"), py::arg("writeOptions") = (mx::XmlWriteOptions*) nullptr);
+        py::arg("doc"), py::arg("filename"), py::arg("writeOptions") = (mx::XmlWriteOptions*) nullptr,
+        py::call_guard<py::gil_scoped_release>());
     mod.def("writeToXmlString", mx::writeToXmlString,
-        py::arg("doc"), py::arg("writeOptions") = nullptr);
+        py::arg("doc"), py::arg("writeOptions") = nullptr,
+        py::call_guard<py::gil_scoped_release>());
+    mod.def("writeToXmlStream", [](mx::DocumentPtr doc, py::object file, const mx::XmlWriteOptions* writeOptions)
+        {
+            PyFileStreamBuf streamBuf(file);
+            {
+                py::gil_scoped_release release;
+                std::ostream stream(&streamBuf);
+                mx::writeToXmlStream(doc, stream, writeOptions);
+                stream.flush();
+            }
+            if (streamBuf.getError())
+            {
+                std::rethrow_exception(streamBuf.getError());
+            }
+        },
+        py::arg("doc"), py::arg("file"), py::arg("writeOptions") = nullptr);
+    mod.def("isXmlFileFormatSupported", &mx::isXmlFileFormatSupported);
     mod.def("prependXInclude", mx::prependXInclude);
 
     mod.def("getEnvironmentPath", &mx::getEnvironmentPath,
@@ -43,7 +43,7 @@ void bindPyGlslShaderGenerator(py::module& mod)
 {
     py::class_<mx::GlslShaderGenerator, mx::HwShaderGenerator, mx::GlslShaderGeneratorPtr>(mod, "GlslShaderGenerator")
         .def_static("create", &GlslShaderGenerator_create)
-        .def("generate", &mx::GlslShaderGenerator::generate)
+        .def("generate", &mx::GlslShaderGenerator::generate, py::call_guard<py::gil_scoped_release>())
         .def("getTarget", &mx::GlslShaderGenerator::getTarget)
         .def("getVersion", &mx::GlslShaderGenerator::getVersion);
 }
@@ -63,7 +63,7 @@ void bindPyEsslShaderGenerator(py::module& mod)
 {
     py::class_<mx::EsslShaderGenerator, mx::GlslShaderGenerator, mx::EsslShaderGeneratorPtr>(mod, "EsslShaderGenerator")
         .def_static("create", &EsslShaderGenerator_create)
-        .def("generate", &mx::EsslShaderGenerator::generate)
+        .def("generate", &mx::EsslShaderGenerator::generate, py::call_guard<py::gil_scoped_release>())
         .def("getTarget", &mx::EsslShaderGenerator::getTarget)
         .def("getVersion", &mx::EsslShaderGenerator::getVersion);
 }
@@ -74,7 +74,7 @@ void bindPyVkShaderGenerator(py::module& mod)
 {
     py::class_<mx::VkShaderGenerator, mx::GlslShaderGenerator, mx::VkShaderGeneratorPtr>(mod, "VkShaderGenerator")
         .def_static("create", &VkShaderGenerator_create)
-        .def("generate", &mx::VkShaderGenerator::generate)
+        .def("generate", &mx::VkShaderGenerator::generate, py::call_guard<py::gil_scoped_release>())
         .def("getTarget", &mx::VkShaderGenerator::getTarget)
         .def("getVersion", &mx::VkShaderGenerator::getVersion);
 }
@@ -85,7 +85,7 @@ void bindPyWgslShaderGenerator(py::module& mod)
 {
     py::class_<mx::WgslShaderGenerator, mx::GlslShaderGenerator, mx::WgslShaderGeneratorPtr>(mod, "WgslShaderGenerator")
         .def_static("create", &WgslShaderGenerator_create)
-        .def("generate", &mx::WgslShaderGenerator::generate)
+        .def("generate", &mx::WgslShaderGenerator::generate, py::call_guard<py::gil_scoped_release>())
         .def("getTarget", &mx::WgslShaderGenerator::getTarget)
         .def("getVersion", &mx::WgslShaderGenerator::getVersion);
 }
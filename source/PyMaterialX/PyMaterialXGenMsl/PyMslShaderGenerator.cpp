@@ -29,7 +29,7 @@ void bindPyMslShaderGenerator(py::module& mod)
 {
     py::class_<mx::MslShaderGenerator, mx::HwShaderGenerator, mx::MslShaderGeneratorPtr>(mod, "MslShaderGenerator")
         .def_static("create", &MslShaderGenerator_create)
-        .def("generate", &mx::MslShaderGenerator::generate)
+        .def("generate", &mx::MslShaderGenerator::generate, py::call_guard<py::gil_scoped_release>())
         .def("getTarget", &mx::MslShaderGenerator::getTarget)
         .def("getVersion", &mx::MslShaderGenerator::getVersion);
 }
@@ -30,5 +30,5 @@ void bindPyOslShaderGenerator(py::module& mod)
     py::class_<mx::OslShaderGenerator, mx::ShaderGenerator, mx::OslShaderGeneratorPtr>(mod, "OslShaderGenerator")
         .def_static("create", &OslShaderGenerator_create)
         .def("getTarget", &mx::OslShaderGenerator::getTarget)
-        .def("generate", &mx::OslShaderGenerator::generate);
+        .def("generate", &mx::OslShaderGenerator::generate, py::call_guard<py::gil_scoped_release>());
 }
@@ -16,17 +16,33 @@ void bindPyGenContext(py::module& mod)
 
     py::class_<mx::GenContext, mx::GenContextPtr>(mod, "GenContext")
         .def(py::init<mx::ShaderGeneratorPtr>())
+        .def("fork", &mx::GenContext::fork)
         .def("getShaderGenerator", &mx::GenContext::getShaderGenerator)
         .def("getOptions", static_cast<mx::GenOptions & (mx::GenContext::*)()>(&mx::GenContext::getOptions), py::return_value_policy::reference)
         .def("getTypeDesc", &mx::GenContext::getTypeDesc)
         .def("registerSourceCodeSearchPath", static_cast<void (mx::GenContext::*)(const mx::FilePath&)>(&mx::GenContext::registerSourceCodeSearchPath))
         .def("registerSourceCodeSearchPath", static_cast<void (mx::GenContext::*)(const mx::FileSearchPath&)>(&mx::GenContext::registerSourceCodeSearchPath))
         .def("resolveSourceFile", &mx::GenContext::resolveSourceFile)
+        .def("setSourceFileCache", &mx::GenContext::setSourceFileCache)
+        .def("getSourceFileCache", &mx::GenContext::getSourceFileCache)
         .def("pushUserData", &mx::GenContext::pushUserData)
         .def("setApplicationVariableHandler", &mx::GenContext::setApplicationVariableHandler)
         .def("getApplicationVariableHandler", &mx::GenContext::getApplicationVariableHandler);
 }
 
+void bindPySourceFileCache(py::module& mod)
+{
+    py::class_<mx::SourceFileCache, mx::SourceFileCachePtr>(mod, "SourceFileCache")
+        .def(py::init<>())
+        .def_static("create", &mx::SourceFileCache::create)
+        .def_static("getShared", &mx::SourceFileCache::getShared)
+        .def("getEntryCount", &mx::SourceFileCache::getEntryCount)
+        .def("getTotalSize", &mx::SourceFileCache::getTotalSize)
+        .def("getHitCount", &mx::SourceFileCache::getHitCount)
+        .def("getMissCount", &mx::SourceFileCache::getMissCount)
+        .def("clear", &mx::SourceFileCache::clear);
+}
+
 void bindPyGenUserData(py::module& mod)
 {
     py::class_<mx::GenUserData, mx::GenUserDataPtr>(mod, "GenUserData")
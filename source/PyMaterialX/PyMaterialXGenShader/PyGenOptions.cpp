@@ -32,6 +32,7 @@ void bindPyGenOptions(py::module& mod)
         .def_readwrite("libraryPrefix", &mx::GenOptions::libraryPrefix)        
         .def_readwrite("emitColorTransforms", &mx::GenOptions::emitColorTransforms)
         .def_readwrite("elideConstantNodes", &mx::GenOptions::elideConstantNodes)
+        .def_readwrite("foldConstantNodes", &mx::GenOptions::foldConstantNodes)
         .def_readwrite("premultipliedBsdfAdd", &mx::GenOptions::premultipliedBsdfAdd)
         .def_readwrite("distributeLayerOverBsdfMix", &mx::GenOptions::distributeLayerOverBsdfMix)
         .def_readwrite("hwTransparency", &mx::GenOptions::hwTransparency)
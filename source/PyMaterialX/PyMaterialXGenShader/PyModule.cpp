@@ -10,7 +10,10 @@ namespace py = pybind11;
 void bindPyColorManagement(py::module& mod);
 void bindPyShaderPort(py::module& mod);
 void bindPyShader(py::module& mod);
+void bindPyShaderCache(py::module& mod);
+void bindPyShaderBatch(py::module& mod);
 void bindPyShaderGenerator(py::module& mod);
+void bindPySourceFileCache(py::module& mod);
 void bindPyGenContext(py::module& mod);
 void bindPyHwShaderGenerator(py::module& mod);
 void bindPyHwResourceBindingContext(py::module &mod);
@@ -29,7 +32,10 @@ PYBIND11_MODULE(PyMaterialXGenShader, mod)
     bindPyColorManagement(mod);
     bindPyShaderPort(mod);
     bindPyShader(mod);
+    bindPyShaderCache(mod);
+    bindPyShaderBatch(mod);
     bindPyShaderGenerator(mod);
+    bindPySourceFileCache(mod);
     bindPyGenContext(mod);
     bindPyHwShaderGenerator(mod);
     bindPyGenOptions(mod);
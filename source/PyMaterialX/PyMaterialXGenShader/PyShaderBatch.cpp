@@ -0,0 +1,43 @@
+//
+// Copyright Contributors to the MaterialX Project
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#include <PyMaterialX/PyMaterialX.h>
+
+#include <MaterialXGenShader/ShaderBatch.h>
+
+namespace py = pybind11;
+namespace mx = MaterialX;
+
+void bindPyShaderBatch(py::module& mod)
+{
+    py::class_<mx::ShaderPermutation, mx::ShaderPermutationPtr>(mod, "ShaderPermutation")
+        .def("getTopologyKey", &mx::ShaderPermutation::getTopologyKey)
+        .def("getShader", &mx::ShaderPermutation::getShader)
+        .def("getElementCount", &mx::ShaderPermutation::getElementCount)
+        .def("getElements", &mx::ShaderPermutation::getElements)
+        .def("getUniformValues", &mx::ShaderPermutation::getUniformValues);
+
+    py::class_<mx::ShaderBatch, mx::ShaderBatchPtr>(mod, "ShaderBatch")
+        .def_static("create", &mx::ShaderBatch::create)
+        .def("addElement", &mx::ShaderBatch::addElement, py::call_guard<py::gil_scoped_release>())
+        .def("getPermutations", &mx::ShaderBatch::getPermutations)
+        .def("getElementCount", &mx::ShaderBatch::getElementCount)
+        .def("clear", &mx::ShaderBatch::clear);
+
+    mod.def("generateShaderPermutations", &mx::generateShaderPermutations,
+        py::call_guard<py::gil_scoped_release>());
+    mod.def("updateShader", [](mx::ShaderPtr shader, const std::string& name, mx::TypedElementPtr element, mx::GenContext& context)
+        {
+            mx::UniformValueMap uniformValues;
+            mx::ShaderPtr result;
+            {
+                py::gil_scoped_release release;
+                result = mx::updateShader(shader, name, element, context, &uniformValues);
+            }
+            return std::make_pair(result, uniformValues);
+        });
+
+    mod.attr("TOPOLOGY_KEY_ATTRIBUTE") = mx::TOPOLOGY_KEY_ATTRIBUTE;
+}
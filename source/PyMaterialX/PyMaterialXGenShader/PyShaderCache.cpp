@@ -0,0 +1,36 @@
+//
+// Copyright Contributors to the MaterialX Project
+// SPDX-License-Identifier: Apache-2.0
+//
+
+#include <PyMaterialX/PyMaterialX.h>
+
+#include <MaterialXGenShader/ShaderCache.h>
+
+namespace py = pybind11;
+namespace mx = MaterialX;
+
+void bindPyShaderCache(py::module& mod)
+{
+    py::class_<mx::ShaderCache, mx::ShaderCachePtr>(mod, "ShaderCache")
+        .def_static("create", &mx::ShaderCache::create,
+                    py::arg("directory"), py::arg("maxSize") = mx::ShaderCache::DEFAULT_MAX_SIZE)
+        .def_static("computeKey", &mx::ShaderCache::computeKey)
+        .def("getDirectory", &mx::ShaderCache::getDirectory)
+        .def("setMaxSize", &mx::ShaderCache::setMaxSize)
+        .def("getMaxSize", &mx::ShaderCache::getMaxSize)
+        .def("getTotalSize", &mx::ShaderCache::getTotalSize)
+        .def("getEntryCount", &mx::ShaderCache::getEntryCount)
+        .def("getHitCount", &mx::ShaderCache::getHitCount)
+        .def("getMissCount", &mx::ShaderCache::getMissCount)
+        .def("getSourceCode", [](mx::ShaderCache& cache, const std::string& key)
+        {
+            mx::StringMap stageSourceCode;
+            cache.getSourceCode(key, stageSourceCode);
+            return stageSourceCode;
+        })
+        .def("setSourceCode", static_cast<void (mx::ShaderCache::*)(const std::string&, const mx::Shader&)>(&mx::ShaderCache::setSourceCode))
+        .def("setSourceCode", static_cast<void (mx::ShaderCache::*)(const std::string&, const mx::StringMap&)>(&mx::ShaderCache::setSourceCode))
+        .def("generate", &mx::ShaderCache::generate, py::call_guard<py::gil_scoped_release>())
+        .def("clear", &mx::ShaderCache::clear);
+}
@@ -16,7 +16,9 @@ void bindPyShaderGenerator(py::module& mod)
 {
     py::class_<mx::ShaderGenerator, mx::ShaderGeneratorPtr>(mod, "ShaderGenerator")
         .def("getTarget", &mx::ShaderGenerator::getTarget)
-        .def("generate", &mx::ShaderGenerator::generate)
+        .def("generate", &mx::ShaderGenerator::generate, py::call_guard<py::gil_scoped_release>())
+        .def("generateMany", &mx::ShaderGenerator::generateMany, py::call_guard<py::gil_scoped_release>(),
+             py::arg("elements"), py::arg("context"), py::arg("threads") = 0)
         .def("setColorManagementSystem", &mx::ShaderGenerator::setColorManagementSystem)
         .def("getColorManagementSystem", &mx::ShaderGenerator::getColorManagementSystem)
         .def("setUnitSystem", &mx::ShaderGenerator::setUnitSystem)
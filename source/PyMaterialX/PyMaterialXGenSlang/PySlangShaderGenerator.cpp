@@ -27,7 +27,7 @@ void bindPySlangShaderGenerator(py::module& mod)
 {
     py::class_<mx::SlangShaderGenerator, mx::HwShaderGenerator, mx::SlangShaderGeneratorPtr>(mod, "SlangShaderGenerator")
         .def_static("create", &SlangShaderGenerator_create)
-        .def("generate", &mx::SlangShaderGenerator::generate)
+        .def("generate", &mx::SlangShaderGenerator::generate, py::call_guard<py::gil_scoped_release>())
         .def("getTarget", &mx::SlangShaderGenerator::getTarget)
         .def("getVersion", &mx::SlangShaderGenerator::getVersion);
 }
@@ -15,6 +15,106 @@ uintptr_t getResourceBuffer(const mx::Image& image)
     return reinterpret_cast<uintptr_t>(image.getResourceBuffer());
 }
 
+namespace
+{
+
+// Buffer protocol format strings for each image base type.
+const std::vector<std::pair<mx::Image::BaseType, std::string>> BASE_TYPE_FORMATS =
+{
+    { mx::Image::BaseType::UINT8, "B" },
+    { mx::Image::BaseType::INT8, "b" },
+    { mx::Image::BaseType::UINT16, "H" },
+    { mx::Image::BaseType::INT16, "h" },
+    { mx::Image::BaseType::HALF, "e" },
+    { mx::Image::BaseType::FLOAT, "f" }
+};
+
+py::buffer_info getImageBuffer(mx::Image& image)
+{
+    if (!image.getResourceBuffer())
+    {
+        throw py::buffer_error("Image has no resource buffer");
+    }
+    std::string format;
+    for (const auto& pair : BASE_TYPE_FORMATS)
+    {
+        if (pair.first == image.getBaseType())
+        {
+            format = pair.second;
+        }
+    }
+    py::ssize_t baseStride = image.getBaseStride();
+    return py::buffer_info(
+        image.getResourceBuffer(),
+        baseStride,
+        format,
+        3,
+        { (py::ssize_t) image.getHeight(), (py::ssize_t) image.getWidth(), (py::ssize_t) image.getChannelCount() },
+        { (py::ssize_t) image.getRowStride(), baseStride * image.getChannelCount(), baseStride });
+}
+
+// Create an image that adopts the memory of the given buffer without copying,
+// holding a reference to the buffer and its exported view for the lifetime of
+// the image.
+mx::ImagePtr createImageFromArray(py::buffer buffer)
+{
+    py::buffer_info info = buffer.request(true);
+    if (info.ndim != 2 && info.ndim != 3)
+    {
+        throw py::value_error("Image arrays must have a shape of (height, width) or (height, width, channels)");
+    }
+
+    std::string format = info.format;
+    if (!format.empty() && (format[0] == '@' || format[0] == '='))
+    {
+        format = format.substr(1);
+    }
+    auto it = std::find_if(BASE_TYPE_FORMATS.begin(), BASE_TYPE_FORMATS.end(),
+                           [&format](const std::pair<mx::Image::BaseType, std::string>& pair) { return pair.second == format; });
+    if (it == BASE_TYPE_FORMATS.end())
+    {
+        throw py::value_error("Unsupported image array format: " + info.format);
+    }
+
+    unsigned int height = (unsigned int) info.shape[0];
+    unsigned int width = (unsigned int) info.shape[1];
+    unsigned int channelCount = info.ndim == 3 ? (unsigned int) info.shape[2] : 1;
+    if (channelCount < 1 || channelCount > 4)
+    {
+        throw py::value_error("Image arrays must have between one and four channels");
+    }
+    if ((info.ndim == 3 && info.strides[2] != info.itemsize) ||
+        info.strides[1] != info.itemsize * (py::ssize_t) channelCount ||
+        info.strides[0] != info.strides[1] * (py::ssize_t) width)
+    {
+        throw py::value_error("Image arrays must be C-contiguous");
+    }
+
+    mx::ImagePtr image = mx::Image::create(width, height, channelCount, it->first);
+    image->setResourceBuffer(info.ptr);
+
+    // Hold the buffer, along with the exported view that keeps its memory
+    // from being resized, and release both with the GIL held once the image
+    // is done with them.
+    struct BufferOwner
+    {
+        py::object object;
+        py::buffer_info info;
+    };
+    std::shared_ptr<BufferOwner> owner(new BufferOwner{ buffer, std::move(info) }, [](BufferOwner* bufferOwner)
+    {
+        py::gil_scoped_acquire gil;
+        delete bufferOwner;
+    });
+    image->setResourceBufferDeallocator([owner](void*) mutable
+    {
+        owner.reset();
+    });
+    return image;
+}
+
+} // anonymous namespace
+
 void bindPyImage(py::module& mod)
 {
     py::enum_<mx::Image::BaseType>(mod, "BaseType")
@@ -28,13 +128,16 @@ void bindPyImage(py::module& mod)
 
     py::class_<mx::ImageBufferDeallocator>(mod, "ImageBufferDeallocator");
 
-    py::class_<mx::Image, mx::ImagePtr>(mod, "Image")
+    py::class_<mx::Image, mx::ImagePtr>(mod, "Image", py::buffer_protocol())
+        .def_buffer(&getImageBuffer)
         .def_static("create", &mx::Image::create)
+        .def_static("fromArray", &createImageFromArray, py::arg("array"))
         .def("getWidth", &mx::Image::getWidth)
         .def("getHeight", &mx::Image::getHeight)
         .def("getChannelCount", &mx::Image::getChannelCount)
         .def("getBaseType", &mx::Image::getBaseType)
         .def("getBaseStride", &mx::Image::getBaseStride)
+        .def("getRowStride", &mx::Image::getRowStride)
         .def("getMaxMipCount", &mx::Image::getMaxMipCount)
         .def("setTexelColor", &mx::Image::setTexelColor)
         .def("getTexelColor", &mx::Image::getTexelColor)
@@ -18,6 +18,15 @@ void bindPyImageHandler(py::module& mod)
         .def_readwrite("filterType", &mx::ImageSamplingProperties::filterType)
         .def_readwrite("defaultColor", &mx::ImageSamplingProperties::defaultColor);
 
+    py::class_<mx::ImageInfo>(mod, "ImageInfo")
+        .def(py::init<>())
+        .def("isValid", &mx::ImageInfo::isValid)
+        .def_readwrite("width", &mx::ImageInfo::width)
+        .def_readwrite("height", &mx::ImageInfo::height)
+        .def_readwrite("channelCount", &mx::ImageInfo::channelCount)
+        .def_readwrite("baseType", &mx::ImageInfo::baseType)
+        .def_readwrite("colorSpace", &mx::ImageInfo::colorSpace);
+
     // Trampoline class for Python overrides
     class PyImageLoader : public mx::ImageLoader {
     public:
@@ -40,6 +49,15 @@ void bindPyImageHandler(py::module& mod)
                 filePath, image, verticalFlip
             );
         }
+        mx::ImageInfo probeImage(const mx::FilePath& filePath) override
+        {
+            PYBIND11_OVERRIDE(
+                mx::ImageInfo,
+                mx::ImageLoader,
+                probeImage,
+                filePath
+            );
+        }
         const mx::StringSet& supportedExtensions() const override {
             PYBIND11_OVERRIDE(
                 const mx::StringSet&,
@@ -66,18 +84,44 @@ void bindPyImageHandler(py::module& mod)
         .def_readonly_static("TXT_EXTENSION", &mx::ImageLoader::TXT_EXTENSION)
         .def("supportedExtensions", &mx::ImageLoader::supportedExtensions, py::return_value_policy::reference_internal)
         .def("saveImage", &mx::ImageLoader::saveImage)
-        .def("loadImage", &mx::ImageLoader::loadImage);
+        .def("loadImage", &mx::ImageLoader::loadImage)
+        .def("probeImage", &mx::ImageLoader::probeImage);
+
+    py::class_<mx::ImageFuture>(mod, "ImageFuture")
+        .def("get", [](const mx::ImageFuture& future) { return future.get(); },
+            py::call_guard<py::gil_scoped_release>())
+        .def("wait", &mx::ImageFuture::wait,
+            py::call_guard<py::gil_scoped_release>())
+        .def("ready", [](const mx::ImageFuture& future)
+            { return future.wait_for(std::chrono::seconds(0)) == std::future_status::ready; });
 
     py::class_<mx::ImageHandler, mx::ImageHandlerPtr>(mod, "ImageHandler")
         .def_static("create", &mx::ImageHandler::create)
         .def("addLoader", &mx::ImageHandler::addLoader)
         .def("saveImage", &mx::ImageHandler::saveImage,
             py::arg("filePath"), py::arg("image"), py::arg("verticalFlip") = false)
-        .def("acquireImage", &mx::ImageHandler::acquireImage,
+        .def("acquireImage", [](mx::ImageHandler& handler, const mx::FilePath& filePath, const mx::Color4& defaultColor)
+            {
+                // Wait for an asynchronous load with the GIL released, since
+                // Python image loaders on worker threads require it.
+                mx::ImageFuture future = handler.getPendingImage(filePath);
+                if (future.valid())
+                {
+                    py::gil_scoped_release release;
+                    future.wait();
+                }
+                return handler.acquireImage(filePath, defaultColor);
+            },
             py::arg("filePath"), py::arg("defaultColor") = mx::Color4(0.0f))
+        .def("acquireImagesAsync", &mx::ImageHandler::acquireImagesAsync,
+            py::arg("filePaths"), py::arg("defaultColor") = mx::Color4(0.0f))
+        .def("prefetchReferencedImages", &mx::ImageHandler::prefetchReferencedImages)
+        .def("setMaxLoadThreads", &mx::ImageHandler::setMaxLoadThreads)
+        .def("getMaxLoadThreads", &mx::ImageHandler::getMaxLoadThreads)
         .def("bindImage", &mx::ImageHandler::bindImage)
         .def("unbindImage", &mx::ImageHandler::unbindImage)
         .def("unbindImages", &mx::ImageHandler::unbindImages)
+        .def("isImageBound", &mx::ImageHandler::isImageBound)
         .def("setSearchPath", &mx::ImageHandler::setSearchPath)
         .def("getSearchPath", &mx::ImageHandler::getSearchPath)
         .def("setFilenameResolver", &mx::ImageHandler::setFilenameResolver)
@@ -86,6 +130,39 @@ void bindPyImageHandler(py::module& mod)
         .def("releaseRenderResources", &mx::ImageHandler::releaseRenderResources,
             py::arg("image") = nullptr)
         .def("clearImageCache", &mx::ImageHandler::clearImageCache)
+        .def("setImageCacheBudget", &mx::ImageHandler::setImageCacheBudget)
+        .def("getImageCacheBudget", &mx::ImageHandler::getImageCacheBudget)
+        .def("getImageCacheSize", &mx::ImageHandler::getImageCacheSize)
+        .def("pinImage", &mx::ImageHandler::pinImage)
+        .def("unpinImage", &mx::ImageHandler::unpinImage)
+        .def("isImagePinned", &mx::ImageHandler::isImagePinned)
+        .def("getImageCacheHitCount", &mx::ImageHandler::getImageCacheHitCount)
+        .def("getImageCacheMissCount", &mx::ImageHandler::getImageCacheMissCount)
+        .def("getImageCacheEvictionCount", &mx::ImageHandler::getImageCacheEvictionCount)
         .def("getZeroImage", &mx::ImageHandler::getZeroImage)
-        .def("getReferencedImages", &mx::ImageHandler::getReferencedImages);
+        .def("getReferencedImages", [](mx::ImageHandler& handler, mx::ConstDocumentPtr doc)
+            {
+                mx::ImageFutureVec futures = handler.acquireImagesAsync(handler.getReferencedFilePaths(doc));
+                {
+                    py::gil_scoped_release release;
+                    for (const mx::ImageFuture& future : futures)
+                    {
+                        future.wait();
+                    }
+                }
+                mx::ImageVec images;
+                for (const mx::ImageFuture& future : futures)
+                {
+                    if (future.get())
+                    {
+                        images.push_back(future.get());
+                    }
+                }
+                return images;
+            })
+        .def("probeImage", &mx::ImageHandler::probeImage)
+        .def("getReferencedFilePaths", &mx::ImageHandler::getReferencedFilePaths)
+        .def("getReferencedImageInfo", &mx::ImageHandler::getReferencedImageInfo);
+
+    mod.def("getMaxDimensions", py::overload_cast<const mx::ImageInfoVec&>(&mx::getMaxDimensions));
 }
@@ -16,5 +16,6 @@ void bindPyOiioImageLoader(py::module& mod)
         .def_static("create", &mx::OiioImageLoader::create)
         .def(py::init<>())
         .def("saveImage", &mx::OiioImageLoader::saveImage)
-        .def("loadImage", &mx::OiioImageLoader::loadImage);
+        .def("loadImage", &mx::OiioImageLoader::loadImage)
+        .def("probeImage", &mx::OiioImageLoader::probeImage);
 }
@@ -15,5 +15,6 @@ void bindPyStbImageLoader(py::module& mod)
     py::class_<mx::StbImageLoader, mx::ImageLoader, mx::StbImageLoaderPtr>(mod, "StbImageLoader")
         .def_static("create", &mx::StbImageLoader::create)
         .def("saveImage", &mx::StbImageLoader::saveImage)
-        .def("loadImage", &mx::StbImageLoader::loadImage);
+        .def("loadImage", &mx::StbImageLoader::loadImage)
+        .def("probeImage", &mx::StbImageLoader::probeImage);
 }
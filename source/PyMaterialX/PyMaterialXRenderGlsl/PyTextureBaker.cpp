@@ -41,7 +41,7 @@ void bindPyTextureBaker(py::module& mod)
         .def("setTextureSpaceMax", &mx::TextureBakerGlsl::setTextureSpaceMax)
         .def("getTextureSpaceMax", &mx::TextureBakerGlsl::getTextureSpaceMax)
         .def("setupUnitSystem", &mx::TextureBakerGlsl::setupUnitSystem)
-        .def("bakeMaterialToDoc", &mx::TextureBakerGlsl::bakeMaterialToDoc)
-        .def("bakeAllMaterials", &mx::TextureBakerGlsl::bakeAllMaterials)
-        .def("writeDocumentPerMaterial", &mx::TextureBakerGlsl::writeDocumentPerMaterial);
+        .def("bakeMaterialToDoc", &mx::TextureBakerGlsl::bakeMaterialToDoc, py::call_guard<py::gil_scoped_release>())
+        .def("bakeAllMaterials", &mx::TextureBakerGlsl::bakeAllMaterials, py::call_guard<py::gil_scoped_release>())
+        .def("writeDocumentPerMaterial", &mx::TextureBakerGlsl::writeDocumentPerMaterial, py::call_guard<py::gil_scoped_release>());
 }